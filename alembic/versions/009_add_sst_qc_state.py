@@ -0,0 +1,37 @@
+"""Add local SST QC state mirror
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+Adds table for:
+- sst_qc_state: QC status per SST record, synced incrementally from Airtable
+  so smart scanning can find QC-passed Media IDs without re-paginating the base
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sst_qc_state',
+        sa.Column('record_id', sa.Text(), primary_key=True),  # Airtable record ID
+        sa.Column('media_id', sa.Text(), nullable=True),
+        sa.Column('qc_status', sa.Text(), nullable=True),  # Value of the SST "QC" field
+        sa.Column('synced_at', sa.DateTime(), server_default=sa.func.current_timestamp()),
+    )
+
+    # Smart scanning filters on qc_status and anti-joins jobs on media_id
+    op.create_index('idx_sst_qc_state_status_media', 'sst_qc_state', ['qc_status', 'media_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sst_qc_state_status_media', table_name='sst_qc_state')
+    op.drop_table('sst_qc_state')
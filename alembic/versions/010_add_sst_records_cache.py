@@ -0,0 +1,36 @@
+"""Add SST record cache table
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+Adds table for:
+- sst_records: Cached Airtable SST records shared by the API, worker and
+  MCP server, keyed by record ID and Media ID
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sst_records',
+        sa.Column('record_id', sa.Text(), primary_key=True),  # Airtable record ID
+        sa.Column('media_id', sa.Text(), nullable=True),
+        sa.Column('record_json', sa.Text(), nullable=False),  # Full Airtable record
+        sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_index('idx_sst_records_media_id', 'sst_records', ['media_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sst_records_media_id', table_name='sst_records')
+    op.drop_table('sst_records')
@@ -0,0 +1,26 @@
+"""Index jobs by transcript file
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+Adds index for:
+- jobs.transcript_file: duplicate detection and the bulk queue lookup
+  used by the transcript watcher (media_id is indexed since 004)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_jobs_transcript_file', 'jobs', ['transcript_file'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_transcript_file', table_name='jobs')
@@ -0,0 +1,42 @@
+"""Add transcript file index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+
+Adds table for:
+- transcript_index: Media ID / filename -> path index over transcripts/
+  and transcripts/archive/, so the worker finds transcripts and SRTs
+  without listing the folders for every job
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'transcript_index',
+        sa.Column('path', sa.Text(), primary_key=True),  # Path as used by the worker (relative to repo root)
+        sa.Column('filename', sa.Text(), nullable=False),
+        sa.Column('media_id', sa.Text(), nullable=True),
+        sa.Column('archived', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('indexed_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_index('idx_transcript_index_media_id', 'transcript_index', ['media_id'])
+    op.create_index('idx_transcript_index_filename', 'transcript_index', ['filename'])
+    op.create_index('idx_transcript_index_indexed_at', 'transcript_index', ['indexed_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_transcript_index_indexed_at', table_name='transcript_index')
+    op.drop_index('idx_transcript_index_filename', table_name='transcript_index')
+    op.drop_index('idx_transcript_index_media_id', table_name='transcript_index')
+    op.drop_table('transcript_index')
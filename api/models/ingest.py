@@ -209,6 +209,14 @@ class IngestConfig(BaseModel):
     ignore_directories: List[str] = Field(default_factory=lambda: ["/promos/"], description="Directories to ignore")
 
 
+class PrefetchConfig(BaseModel):
+    """Transcript prefetch settings (stored in config table)."""
+
+    enabled: bool = Field(True, description="Download new transcripts after each scan")
+    max_disk_mb: int = Field(500, ge=0, description="Disk quota for prefetched transcripts")
+    concurrency: int = Field(4, ge=1, le=16, description="Simultaneous prefetch downloads")
+
+
 class IngestConfigUpdate(BaseModel):
     """Schema for updating ingest configuration (PUT /api/ingest/config)."""
 
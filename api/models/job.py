@@ -86,6 +86,9 @@ class JobCreate(BaseModel):
     transcript_file: str = Field(..., description="Path to transcript file (relative to transcripts/)")
     project_path: Optional[str] = Field(None, description="Output path (auto-generated if not provided)")
     priority: Optional[int] = Field(default=0, description="Job priority (higher = sooner)")
+    media_id: Optional[str] = Field(None, description="Media ID, if already known (used for duplicate detection)")
+    duration_minutes: Optional[float] = Field(None, description="Transcript duration, if already measured")
+    word_count: Optional[int] = Field(None, description="Transcript word count, if already measured")
 
 
 class PhaseUpdate(BaseModel):
@@ -28,7 +28,7 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy import text
 
@@ -41,10 +41,11 @@ from api.services.ingest_config import (
     update_ingest_config,
 )
 from api.services.ingest_scanner import IngestScanner
-from api.services.ingest_scheduler import configure_scheduler
+from api.services.ingest_scheduler import configure_scheduler, run_prefetch
 from api.services.screengrab_attacher import (
     get_screengrab_attacher,
 )
+from api.services.transcript_index import get_transcript_index
 
 logger = logging.getLogger(__name__)
 
@@ -265,6 +266,7 @@ async def list_available_files(
 
 @router.post("/scan", response_model=ScanResponse)
 async def trigger_scan(
+    background_tasks: BackgroundTasks,
     base_url: Optional[str] = Query(
         default=None, description="Base URL of ingest server (uses config default if not provided)"
     ),
@@ -276,7 +278,8 @@ async def trigger_scan(
     Trigger a scan of the remote ingest server.
 
     Discovers new SRT transcripts and JPG screengrabs, tracking them
-    in the database for further action.
+    in the database for further action. New transcripts are prefetched
+    in the background after the response is sent.
 
     Args:
         base_url: Base URL of the ingest server (optional, uses config if not provided)
@@ -299,6 +302,9 @@ async def trigger_scan(
         # Record scan result in config
         await record_scan_result(success=result.success)
 
+        if result.success:
+            background_tasks.add_task(run_prefetch, scanner)
+
         return ScanResponse(
             success=result.success,
             qc_passed_checked=result.qc_passed_checked,
@@ -551,7 +557,8 @@ async def attach_all_screengrabs() -> BatchAttachResponse:
     Attach all pending screengrabs that have matching SST records.
 
     SAFETY: This operation APPENDS to existing attachments, never replaces them.
-    Each screengrab is processed individually with full audit logging.
+    Screengrabs are grouped per SST record (one PATCH each), and every
+    screengrab gets its own audit log row.
 
     Returns:
         Batch results including counts of attached, skipped, and errors
@@ -676,8 +683,9 @@ async def queue_transcript(file_id: int) -> QueueTranscriptResponse:
     """
     Queue a transcript for processing.
 
-    Downloads the SRT file from the ingest server to the local transcripts/
-    folder, then creates a job for processing.
+    Moves the prefetched SRT into the local transcripts/ folder (or downloads
+    it from the ingest server if it wasn't prefetched), then creates a job
+    for processing.
 
     Args:
         file_id: ID from available_files table
@@ -685,9 +693,6 @@ async def queue_transcript(file_id: int) -> QueueTranscriptResponse:
     Returns:
         Queue result including local path and job ID
     """
-    from api.models.job import JobCreate
-    from api.services.database import create_job
-
     # Get scanner with config
     config = await get_ingest_config()
     scanner = IngestScanner(
@@ -698,6 +703,14 @@ async def queue_transcript(file_id: int) -> QueueTranscriptResponse:
     # Download the file
     download_result = await scanner.download_file(file_id)
 
+    return await _create_job_for_download(file_id, download_result)
+
+
+async def _create_job_for_download(file_id: int, download_result: dict) -> QueueTranscriptResponse:
+    """Create a job for a downloaded transcript and link it to its available_files row."""
+    from api.models.job import JobCreate
+    from api.services.database import create_job
+
     if not download_result["success"]:
         return QueueTranscriptResponse(
             success=False,
@@ -725,6 +738,7 @@ async def queue_transcript(file_id: int) -> QueueTranscriptResponse:
             transcript_file=transcript_file,
         )
         job = await create_job(job_create)
+        await get_transcript_index().add(local_path)
 
         # Update available_files with job_id
         async with get_session() as session:
@@ -769,7 +783,7 @@ async def queue_transcripts_bulk(request: BulkQueueRequest) -> BulkQueueResponse
     """
     Queue multiple transcripts for processing.
 
-    Downloads each SRT file and creates jobs for them.
+    Downloads the SRT files concurrently, then creates jobs for them.
 
     Args:
         request: BulkQueueRequest with list of file IDs
@@ -777,12 +791,20 @@ async def queue_transcripts_bulk(request: BulkQueueRequest) -> BulkQueueResponse
     Returns:
         Bulk queue results
     """
+    config = await get_ingest_config()
+    scanner = IngestScanner(
+        base_url=config.server_url,
+        directories=config.directories,
+    )
+
+    downloads = await scanner.download_files(request.file_ids)
+
     results = []
     queued = 0
     failed = 0
 
     for file_id in request.file_ids:
-        result = await queue_transcript(file_id)
+        result = await _create_job_for_download(file_id, downloads[file_id])
         results.append(result)
         if result.success:
             queued += 1
@@ -355,6 +355,7 @@ async def get_job_output(job_id: int, filename: str):
         "copy_editor_output.md",
         "recovery_analysis.md",
         "manifest.json",
+        "transcript_timing.json",
     }
 
     # Also allow versioned revision and keyword report files
@@ -3,17 +3,21 @@
 Provides CRUD operations for the job queue.
 """
 
+import asyncio
 import logging
 import os
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from api.models.job import Job, JobCreate, JobStatus, JobUpdate
+from api.models.job import Job, JobCreate, JobStatus
 from api.services import database
-from api.services.airtable import AirtableClient
-from api.services.utils import extract_media_id, get_srt_duration, parse_srt
+from api.services.srt import parse_srt_track
+from api.services.sst_enrichment import get_sst_enrichment_queue
+from api.services.transcript_artifact import read_transcript_text
+from api.services.transcript_index import get_transcript_index
+from api.services.utils import extract_media_id
 
 logger = logging.getLogger(__name__)
 
@@ -40,23 +44,20 @@ def calculate_transcript_metrics_from_file(transcript_file: str) -> Tuple[Option
         return None, None
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content, _ = read_transcript_text(file_path)
 
         if not content.strip():
             return None, None
 
         # Check if it's an SRT file
         if transcript_file.lower().endswith(".srt"):
-            captions = parse_srt(content)
+            captions = parse_srt_track(content)
             if captions:
                 # Get duration from last caption's end time
-                duration_ms = get_srt_duration(captions)
-                duration_minutes = round(duration_ms / 60000, 2)
+                duration_minutes = round(captions.duration_ms / 60000, 2)
 
                 # Count words in all captions
-                all_text = " ".join(c.text for c in captions)
-                word_count = len(all_text.split())
+                word_count = len(captions.plain_text().split())
 
                 return duration_minutes, word_count
 
@@ -74,6 +75,9 @@ def calculate_transcript_metrics_from_file(transcript_file: str) -> Tuple[Option
 
 router = APIRouter()
 
+# Maximum filenames (and media IDs) per bulk lookup request
+MAX_LOOKUP_ITEMS = 1000
+
 
 class DuplicateJobResponse(BaseModel):
     """Response when a duplicate job is detected."""
@@ -150,8 +154,11 @@ async def add_to_queue(
 ) -> Job:
     """Add a new job to the queue.
 
-    Creates a job record with status=pending and default values.
-    Returns the complete job record with generated ID.
+    Creates a job record with status=pending, the media ID and transcript
+    metrics. Returns the complete job record with generated ID.
+
+    The Airtable SST link is added in the background after the response is
+    sent; the updated job is broadcast over WebSocket when it's linked.
 
     Duplicate Detection:
     - If the transcript file has already been processed (completed) or is
@@ -172,6 +179,11 @@ async def add_to_queue(
     # Extract media ID for duplicate detection and Airtable lookup
     media_id = extract_media_id(job_create.transcript_file)
 
+    # Index the transcript so the worker finds it without scanning the folder. This
+    # happens before the duplicate check: an SRT rejected with 409 because its .txt
+    # is already queued is still needed by the timestamp phase
+    await get_transcript_index().add(os.path.join(TRANSCRIPTS_DIR, job_create.transcript_file))
+
     # Check for existing jobs with this transcript or media ID (unless force=true)
     if not force:
         # First check by exact transcript filename
@@ -213,64 +225,198 @@ async def add_to_queue(
                 },
             )
 
-    # Create the job first
-    job = await database.create_job(job_create)
+    # Calculate transcript metrics for cost analysis (file I/O, off the event loop)
+    duration_minutes, word_count = await asyncio.to_thread(
+        calculate_transcript_metrics_from_file, job_create.transcript_file
+    )
 
-    # Calculate transcript metrics for cost analysis
-    duration_minutes, word_count = calculate_transcript_metrics_from_file(job_create.transcript_file)
+    # Create the job with media ID and metrics in one insert
+    job = await database.create_job(
+        job_create.model_copy(
+            update={"media_id": media_id, "duration_minutes": duration_minutes, "word_count": word_count}
+        )
+    )
     if duration_minutes or word_count:
         logger.info(f"Job {job.id}: Transcript metrics - {duration_minutes}min, {word_count} words")
 
-    # Attempt to auto-link SST record from Airtable and store all metadata
-    try:
-        # Try to lookup SST record if Airtable is configured
-        airtable_client = AirtableClient()
-        record = await airtable_client.search_sst_by_media_id(media_id)
-
-        if record:
-            # Found matching SST record - update job with link and metrics
-            record_id = record["id"]
-            airtable_url = airtable_client.get_sst_url(record_id)
-
-            update = JobUpdate(
-                airtable_record_id=record_id,
-                airtable_url=airtable_url,
-                media_id=media_id,
-                duration_minutes=duration_minutes,
-                word_count=word_count,
+    # Link the SST record in the background; the job update is broadcast over WebSocket
+    get_sst_enrichment_queue().enqueue(job.id, media_id)
+
+    return job
+
+
+class QueueLookupRequest(BaseModel):
+    """Request for a bulk "already queued?" check."""
+
+    transcript_files: List[str] = Field(default_factory=list, max_length=MAX_LOOKUP_ITEMS)
+    media_ids: List[str] = Field(default_factory=list, max_length=MAX_LOOKUP_ITEMS)
+    include_cancelled: bool = Field(default=True, description="Count cancelled jobs as existing")
+
+
+class QueuedJobRef(BaseModel):
+    """Existing job matched by a bulk lookup."""
+
+    job_id: int
+    status: JobStatus
+    transcript_file: str
+    media_id: Optional[str] = None
+
+
+class QueueLookupResponse(BaseModel):
+    """Existing jobs keyed by the requested filenames and media IDs.
+
+    Keys with no matching job are omitted.
+    """
+
+    transcript_files: Dict[str, QueuedJobRef]
+    media_ids: Dict[str, QueuedJobRef]
+
+
+@router.post("/lookup", response_model=QueueLookupResponse)
+async def lookup_queued(lookup: QueueLookupRequest) -> QueueLookupResponse:
+    """Check which transcripts already have jobs, in one query.
+
+    A filename matches a job with the same transcript file or the same
+    media ID (catches .srt vs .txt variants), like duplicate detection in
+    POST /api/queue/. Each key maps to its newest matching job.
+
+    Args:
+        lookup: Filenames and/or media IDs to check
+
+    Returns:
+        Existing jobs for each requested filename and media ID
+    """
+    file_media_ids = {f: extract_media_id(f) for f in lookup.transcript_files}
+
+    jobs = await database.find_jobs_for_transcripts(
+        lookup.transcript_files,
+        list(file_media_ids.values()) + lookup.media_ids,
+        exclude_cancelled=not lookup.include_cancelled,
+    )
+
+    by_file, by_media_id = _index_existing_jobs(jobs)
+
+    transcript_files = {}
+    for filename, media_id in file_media_ids.items():
+        job = by_file.get(filename) or by_media_id.get(media_id)
+        if job:
+            transcript_files[filename] = _job_ref(job)
+
+    media_ids = {media_id: _job_ref(by_media_id[media_id]) for media_id in lookup.media_ids if media_id in by_media_id}
+
+    return QueueLookupResponse(transcript_files=transcript_files, media_ids=media_ids)
+
+
+class BulkQueueRequest(BaseModel):
+    """Request to queue several transcripts at once."""
+
+    jobs: List[JobCreate] = Field(..., min_length=1, max_length=MAX_LOOKUP_ITEMS)
+    force: bool = Field(default=False, description="Queue even if the transcript already has a job")
+
+
+class BulkQueueResult(BaseModel):
+    """Outcome for one transcript in a bulk queue request."""
+
+    transcript_file: str
+    queued: bool
+    job_id: Optional[int] = None
+    existing_job: Optional[QueuedJobRef] = None
+    error: Optional[str] = None
+
+
+class BulkQueueResponse(BaseModel):
+    """Response for bulk queueing."""
+
+    queued: int
+    skipped: int
+    results: List[BulkQueueResult]
+
+
+@router.post("/bulk", response_model=BulkQueueResponse)
+async def add_to_queue_bulk(request: BulkQueueRequest) -> BulkQueueResponse:
+    """Add several jobs to the queue in one request.
+
+    Bulk form of POST /api/queue/, used by the transcript watcher. Duplicate
+    detection is one query for the whole batch (same matching rules as the
+    single endpoint; cancelled jobs don't count), transcripts repeated
+    within the batch are queued once, and all jobs are created in one
+    transaction. SST linking runs in the background.
+
+    Args:
+        request: Jobs to create and the force flag
+
+    Returns:
+        Per-transcript results, in request order
+    """
+    media_ids = [job_create.media_id or extract_media_id(job_create.transcript_file) for job_create in request.jobs]
+
+    # Index every submitted file, including skipped ones: an SRT that shares
+    # its Media ID with a queued .txt is still needed by the timestamp phase
+    await get_transcript_index().add(
+        *(os.path.join(TRANSCRIPTS_DIR, job_create.transcript_file) for job_create in request.jobs)
+    )
+
+    by_file: Dict[str, Job] = {}
+    by_media_id: Dict[str, Job] = {}
+    if not request.force:
+        existing = await database.find_jobs_for_transcripts(
+            [job_create.transcript_file for job_create in request.jobs], media_ids, exclude_cancelled=True
+        )
+        by_file, by_media_id = _index_existing_jobs(existing)
+
+    results: List[Optional[BulkQueueResult]] = [None] * len(request.jobs)
+    to_create: List[Tuple[int, JobCreate]] = []
+    batch_keys = set()
+    for index, (job_create, media_id) in enumerate(zip(request.jobs, media_ids)):
+        existing_job = by_file.get(job_create.transcript_file) or by_media_id.get(media_id)
+        if existing_job:
+            results[index] = BulkQueueResult(
+                transcript_file=job_create.transcript_file, queued=False, existing_job=_job_ref(existing_job)
             )
-            job = await database.update_job(job.id, update)
-            logger.info(f"Job {job.id}: Linked to SST record {record_id} (Media ID: {media_id})")
-        else:
-            # No matching SST record found - store media_id and metrics only
-            update = JobUpdate(
-                media_id=media_id,
-                duration_minutes=duration_minutes,
-                word_count=word_count,
+        elif job_create.transcript_file in batch_keys or media_id in batch_keys:
+            results[index] = BulkQueueResult(
+                transcript_file=job_create.transcript_file, queued=False, error="Duplicate in this request"
             )
-            job = await database.update_job(job.id, update)
-            logger.warning(f"Job {job.id}: No SST record found for Media ID: {media_id}")
-
-    except ValueError as e:
-        # Airtable API key not configured - still store media_id and metrics
-        update = JobUpdate(
-            media_id=media_id,
-            duration_minutes=duration_minutes,
-            word_count=word_count,
+        else:
+            batch_keys.update(key for key in (job_create.transcript_file, media_id) if key)
+            to_create.append((index, job_create.model_copy(update={"media_id": media_id})))
+
+    if to_create:
+        # Transcript metrics for cost analysis (file I/O, off the event loop)
+        metrics = await asyncio.to_thread(
+            lambda: [calculate_transcript_metrics_from_file(job.transcript_file) for _, job in to_create]
         )
-        job = await database.update_job(job.id, update)
-        logger.warning(f"Job {job.id}: Airtable lookup skipped - {e}")
-    except Exception as e:
-        # Any other error during Airtable lookup - still store metrics
-        update = JobUpdate(
-            media_id=media_id,
-            duration_minutes=duration_minutes,
-            word_count=word_count,
+        jobs = await database.create_jobs(
+            [
+                job.model_copy(update={"duration_minutes": duration_minutes, "word_count": word_count})
+                for (_, job), (duration_minutes, word_count) in zip(to_create, metrics)
+            ]
         )
-        job = await database.update_job(job.id, update)
-        logger.warning(f"Job {job.id}: Airtable lookup failed - {e}")
 
-    return job
+        enrichment_queue = get_sst_enrichment_queue()
+        for (index, job_create), job in zip(to_create, jobs):
+            results[index] = BulkQueueResult(transcript_file=job_create.transcript_file, queued=True, job_id=job.id)
+            enrichment_queue.enqueue(job.id, job.media_id)
+        logger.info(f"Bulk queued {len(jobs)} of {len(request.jobs)} transcripts")
+
+    queued = sum(1 for result in results if result.queued)
+    return BulkQueueResponse(queued=queued, skipped=len(results) - queued, results=results)
+
+
+def _index_existing_jobs(jobs: List[Job]) -> Tuple[Dict[str, Job], Dict[str, Job]]:
+    """Index jobs (newest first) by transcript file and by media ID, keeping the newest per key."""
+    by_file: Dict[str, Job] = {}
+    by_media_id: Dict[str, Job] = {}
+    for job in jobs:
+        by_file.setdefault(job.transcript_file, job)
+        if job.media_id:
+            by_media_id.setdefault(job.media_id, job)
+    return by_file, by_media_id
+
+
+def _job_ref(job: Job) -> QueuedJobRef:
+    """Summarize a job for lookup and bulk queue responses."""
+    return QueuedJobRef(job_id=job.id, status=job.status, transcript_file=job.transcript_file, media_id=job.media_id)
 
 
 class BulkDeleteResponse(BaseModel):
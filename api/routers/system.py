@@ -4,6 +4,8 @@ Provides status and restart controls for system components:
 - API server
 - Worker process
 - Transcript watcher
+
+Also exposes Airtable request metrics for this API process.
 """
 
 import os
@@ -13,6 +15,8 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from api.services.airtable_gateway import get_airtable_gateway
+
 router = APIRouter()
 
 
@@ -110,6 +114,12 @@ async def get_system_status():
     )
 
 
+@router.get("/airtable-metrics")
+async def get_airtable_metrics():
+    """Get Airtable request, throttling and 429 counters for the API process."""
+    return get_airtable_gateway().get_metrics()
+
+
 @router.post("/worker/restart", response_model=RestartResponse)
 async def restart_worker():
     """Restart the worker process."""
@@ -4,15 +4,17 @@ Provides bulk transcript upload endpoint.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile
 from pydantic import BaseModel
 
 from api.models.job import JobCreate
 from api.services import database
-from api.services.airtable import AirtableClient
+from api.services.sst_enrichment import link_jobs_to_sst
+from api.services.transcript_index import get_transcript_index
 from api.services.utils import extract_media_id
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,7 @@ TRANSCRIPTS_DIR = Path("transcripts")
 ALLOWED_EXTENSIONS = {".txt", ".srt"}
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
 MAX_BATCH_SIZE = 20
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
 
 
 class UploadStatus(BaseModel):
@@ -45,15 +48,20 @@ class UploadResponse(BaseModel):
 
 @router.post("/transcripts", response_model=UploadResponse)
 async def upload_transcripts(
-    files: List[UploadFile] = File(..., description="Transcript files (.txt or .srt)")
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(..., description="Transcript files (.txt or .srt)"),
 ) -> UploadResponse:
     """Upload multiple transcript files and queue for processing.
 
     Accepts batch uploads of .txt or .srt files. Each file is:
     1. Validated (type, size)
-    2. Saved to transcripts/ directory
+    2. Streamed to transcripts/ directory
     3. Queued for processing
 
+    Duplicate detection runs as one query for the batch and all jobs are
+    created in one transaction. Airtable SST linking runs in the background
+    after the response is sent.
+
     Constraints:
     - Maximum batch size: 20 files
     - Maximum file size: 50 MB per file
@@ -62,6 +70,7 @@ async def upload_transcripts(
     Returns status for each file upload attempt.
 
     Args:
+        background_tasks: FastAPI background tasks (SST linking)
         files: List of transcript files to upload
 
     Returns:
@@ -79,44 +88,34 @@ async def upload_transcripts(
     # Ensure transcripts directory exists
     TRANSCRIPTS_DIR.mkdir(exist_ok=True)
 
-    results: List[UploadStatus] = []
-    uploaded_count = 0
-    failed_count = 0
+    statuses: List[Optional[UploadStatus]] = [None] * len(files)
+    saved: List[tuple[int, str, JobCreate]] = []  # (index, filename, job to create)
 
-    for file in files:
+    # Step 1: Validate and save each file
+    for index, file in enumerate(files):
+        filename = file.filename or "unknown"
         try:
             # Validate file extension
             file_ext = Path(file.filename or "").suffix.lower()
             if file_ext not in ALLOWED_EXTENSIONS:
-                results.append(
-                    UploadStatus(
-                        filename=file.filename or "unknown",
-                        success=False,
-                        error=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
-                    )
-                )
-                failed_count += 1
-                continue
-
-            # Read file content
-            content = await file.read()
-
-            # Validate file size
-            if len(content) > MAX_FILE_SIZE:
-                results.append(
-                    UploadStatus(
-                        filename=file.filename or "unknown",
-                        success=False,
-                        error=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024:.0f} MB",
-                    )
+                statuses[index] = UploadStatus(
+                    filename=filename,
+                    success=False,
+                    error=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
                 )
-                failed_count += 1
                 continue
 
             # Save file to transcripts directory
             file_path = TRANSCRIPTS_DIR / (file.filename or "")
-            file_path.write_bytes(content)
+            if not await _save_upload(file, file_path):
+                statuses[index] = UploadStatus(
+                    filename=filename,
+                    success=False,
+                    error=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024:.0f} MB",
+                )
+                continue
             logger.info(f"Saved transcript: {file_path}")
+            await get_transcript_index().add(file_path)
 
             # Queue for processing
             project_name = file_path.stem
@@ -128,60 +127,100 @@ async def upload_transcripts(
             job_create = JobCreate(
                 project_name=project_name,
                 transcript_file=file.filename or "",
+                media_id=extract_media_id(file.filename or ""),
             )
+            saved.append((index, filename, job_create))
 
-            # Check for duplicate by media ID
-            media_id = extract_media_id(job_create.transcript_file)
-            existing_jobs = await database.find_jobs_by_media_id(media_id)
-            if existing_jobs:
-                existing = existing_jobs[0]
-                results.append(
-                    UploadStatus(
-                        filename=file.filename or "unknown",
-                        success=False,
-                        error=f"Already exists as job {existing.id} ({existing.status.value})",
-                    )
-                )
-                failed_count += 1
-                logger.warning(f"Skipping {file.filename}: duplicate media ID {media_id}")
-                continue
-
-            # Create job
-            job = await database.create_job(job_create)
-
-            # Attempt auto-link to Airtable SST record
-            try:
-                airtable_client = AirtableClient()
-                record = await airtable_client.search_sst_by_media_id(media_id)
-
-                if record:
-                    from api.models.job import JobUpdate
-
-                    record_id = record["id"]
-                    airtable_url = airtable_client.get_sst_url(record_id)
-                    update = JobUpdate(
-                        airtable_record_id=record_id,
-                        airtable_url=airtable_url,
-                        media_id=media_id,
-                    )
-                    job = await database.update_job(job.id, update)
-                    logger.info(f"Job {job.id}: Linked to SST record {record_id}")
-                else:
-                    from api.models.job import JobUpdate
-
-                    update = JobUpdate(media_id=media_id)
-                    job = await database.update_job(job.id, update)
-                    logger.warning(f"Job {job.id}: No SST record found for {media_id}")
-            except Exception as e:
-                logger.warning(f"Job {job.id}: Airtable lookup failed - {e}")
-
-            results.append(UploadStatus(filename=file.filename or "unknown", success=True, job_id=job.id))
-            uploaded_count += 1
-            logger.info(f"Queued job {job.id} for {file.filename}")
+        except Exception as e:
+            logger.error(f"Failed to upload {filename}: {e}")
+            statuses[index] = UploadStatus(filename=filename, success=False, error=str(e))
+
+    # Step 2: Check for duplicates by media ID (one query for the batch)
+    to_create: List[tuple[int, str, JobCreate]] = []
+    try:
+        existing_jobs = await database.find_jobs_by_media_ids([job.media_id for _, _, job in saved])
+    except Exception as e:
+        logger.error(f"Duplicate check failed: {e}")
+        existing_jobs = None
+
+    batch_media_ids = set()
+    for index, filename, job_create in saved:
+        if existing_jobs is None:
+            statuses[index] = UploadStatus(filename=filename, success=False, error="Duplicate check failed")
+        elif job_create.media_id in existing_jobs:
+            existing = existing_jobs[job_create.media_id][0]
+            statuses[index] = UploadStatus(
+                filename=filename,
+                success=False,
+                error=f"Already exists as job {existing.id} ({existing.status.value})",
+            )
+            logger.warning(f"Skipping {filename}: duplicate media ID {job_create.media_id}")
+        elif job_create.media_id in batch_media_ids:
+            statuses[index] = UploadStatus(
+                filename=filename,
+                success=False,
+                error=f"Duplicate media ID {job_create.media_id} in this upload",
+            )
+            logger.warning(f"Skipping {filename}: duplicate media ID {job_create.media_id} in batch")
+        else:
+            batch_media_ids.add(job_create.media_id)
+            to_create.append((index, filename, job_create))
 
+    # Step 3: Create jobs in one transaction
+    if to_create:
+        try:
+            jobs = await database.create_jobs([job_create for _, _, job_create in to_create])
         except Exception as e:
-            logger.error(f"Failed to upload {file.filename}: {e}")
-            results.append(UploadStatus(filename=file.filename or "unknown", success=False, error=str(e)))
-            failed_count += 1
+            logger.error(f"Failed to create jobs for upload: {e}")
+            for index, filename, _ in to_create:
+                statuses[index] = UploadStatus(filename=filename, success=False, error=str(e))
+        else:
+            for (index, filename, _), job in zip(to_create, jobs):
+                statuses[index] = UploadStatus(filename=filename, success=True, job_id=job.id)
+                logger.info(f"Queued job {job.id} for {filename}")
+
+            # Step 4: Auto-link to Airtable SST records after responding
+            background_tasks.add_task(
+                link_jobs_to_sst,
+                [(job.id, job_create.media_id) for (_, _, job_create), job in zip(to_create, jobs)],
+            )
+
+    results = [status for status in statuses if status is not None]
+    uploaded_count = sum(1 for status in results if status.success)
+    return UploadResponse(uploaded=uploaded_count, failed=len(results) - uploaded_count, files=results)
+
+
+async def _save_upload(file: UploadFile, file_path: Path) -> bool:
+    """Stream an upload to disk in chunks, stopping once it exceeds MAX_FILE_SIZE.
 
-    return UploadResponse(uploaded=uploaded_count, failed=failed_count, files=results)
+    Writes to a .part file and renames it into place, so the transcript
+    watcher never sees a partial file.
+
+    Args:
+        file: Uploaded file
+        file_path: Destination path
+
+    Returns:
+        True if saved, False if the file is over the size limit
+    """
+    # Reject early when the client declared the size
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        return False
+
+    part_path = file_path.with_name(file_path.name + ".part")
+    total = 0
+    try:
+        with open(part_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > MAX_FILE_SIZE:
+                    break
+                f.write(chunk)
+        if total > MAX_FILE_SIZE:
+            part_path.unlink(missing_ok=True)
+            return False
+        os.replace(part_path, file_path)
+        return True
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
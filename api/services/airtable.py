@@ -2,6 +2,8 @@
 Airtable API Service - READ-ONLY
 
 Provides read-only access to the PBS Wisconsin SST (Single Source of Truth) table.
+Single-record and batched enrichment lookups are served through the shared SST cache (see sst_cache.py),
+and every request goes through the rate-limited Airtable gateway (airtable_gateway.py).
 
 CRITICAL: This service is intentionally READ-ONLY. No write operations are permitted.
 """
@@ -13,6 +15,9 @@ from typing import Optional
 
 import httpx
 
+from api.services.airtable_gateway import get_airtable_gateway
+from api.services.sst_cache import get_sst_cache
+
 # Load secrets from Keychain (the-lodge shared utility)
 sys.path.insert(0, str(Path.home() / "Developer/the-lodge/scripts"))
 try:
@@ -82,12 +87,30 @@ class AirtableClient:
             "Content-Type": "application/json",
         }
 
-    async def search_sst_by_media_id(self, media_id: str) -> Optional[dict]:
+    async def search_sst_by_media_id(self, media_id: str, max_age_seconds: Optional[int] = None) -> Optional[dict]:
         """
-        Search SST table by Media ID field.
+        Search SST table by Media ID field, using the shared SST cache.
 
         Args:
             media_id: The Media ID to search for (e.g., "3092977804")
+            max_age_seconds: Max age of a cached record to accept. None uses the
+                cache's TTL with stale-while-revalidate; 0 forces a live lookup.
+
+        Returns:
+            Record dict if found, None if not found.
+            Record format: {"id": "rec...", "fields": {...}, "createdTime": "..."}
+
+        Raises:
+            httpx.HTTPError: On network or API errors with no cached copy
+        """
+        return await get_sst_cache().get_by_media_id(media_id, self._fetch_sst_by_media_id, max_age_seconds)
+
+    async def _fetch_sst_by_media_id(self, media_id: str) -> Optional[dict]:
+        """
+        Search SST table by Media ID field (live Airtable request).
+
+        Args:
+            media_id: The Media ID to search for
 
         Returns:
             Record dict if found, None if not found or on error.
@@ -107,34 +130,45 @@ class AirtableClient:
             "maxRecords": 1,  # We only expect one match
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-
-                data = response.json()
-                records = data.get("records", [])
+        try:
+            response = await get_airtable_gateway().get(url, headers=self.headers, params=params, timeout=30.0)
+            response.raise_for_status()
 
-                if records:
-                    return records[0]
-                return None
+            data = response.json()
+            records = data.get("records", [])
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
-            except httpx.HTTPError:
-                raise
+            if records:
+                return records[0]
+            return None
 
-    async def batch_search_sst_by_media_ids(self, media_ids: list[str]) -> dict[str, dict]:
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+        except httpx.HTTPError:
+            raise
+
+    async def batch_search_sst_by_media_ids(
+        self,
+        media_ids: list[str],
+        fields: Optional[list[str]] = None,
+        raise_errors: bool = False,
+        all_fields: bool = False,
+    ) -> dict[str, dict]:
         """
         Batch search SST table by multiple Media IDs.
 
         Makes a single Airtable API call with an OR formula to fetch multiple
         records efficiently. Much faster than N individual lookups.
 
+        Results are live (not cached) and field-limited unless all_fields is set.
+
         Args:
             media_ids: List of Media IDs to search for (max ~100 per batch)
+            fields: Fields to fetch (defaults to Media ID, Title and Project)
+            raise_errors: Raise on a failed batch instead of logging and skipping it,
+                so callers can tell "not found" from "lookup failed"
+            all_fields: Fetch full records (ignores fields)
 
         Returns:
             Dict mapping media_id -> record dict for found records.
@@ -150,45 +184,102 @@ class AirtableClient:
 
         url = f"{self.API_BASE_URL}/{self.BASE_ID}/{self.TABLE_ID}"
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for i in range(0, len(media_ids), batch_size):
-                batch = media_ids[i : i + batch_size]
+        gateway = get_airtable_gateway()
 
-                # Build OR formula for this batch
-                conditions = [f"{{{self.MEDIA_ID_FIELD}}}='{mid}'" for mid in batch]
-                formula = f"OR({','.join(conditions)})"
+        for i in range(0, len(media_ids), batch_size):
+            batch = media_ids[i : i + batch_size]
 
-                params = {
-                    "filterByFormula": formula,
-                    "maxRecords": len(batch),
-                    "fields[]": ["Media ID", "Title", "Project"],  # Only fetch needed fields
-                }
+            # Build OR formula for this batch
+            conditions = [f"{{{self.MEDIA_ID_FIELD}}}='{mid}'" for mid in batch]
+            formula = f"OR({','.join(conditions)})"
 
-                try:
-                    response = await client.get(url, headers=self.headers, params=params)
-                    response.raise_for_status()
+            params = {
+                "filterByFormula": formula,
+                "maxRecords": len(batch),
+            }
+            if not all_fields:
+                params["fields[]"] = fields or ["Media ID", "Title", "Project"]  # Only fetch needed fields
 
-                    data = response.json()
-                    for record in data.get("records", []):
-                        mid = record.get("fields", {}).get(self.MEDIA_ID_FIELD)
-                        if mid:
-                            results[mid] = record
+            try:
+                response = await gateway.get(url, headers=self.headers, params=params, timeout=60.0)
+                response.raise_for_status()
+
+                data = response.json()
+                for record in data.get("records", []):
+                    mid = record.get("fields", {}).get(self.MEDIA_ID_FIELD)
+                    if mid:
+                        results[mid] = record
 
-                except httpx.HTTPError as e:
-                    # Log but don't fail the whole batch
-                    import logging
+            except httpx.HTTPError as e:
+                if raise_errors:
+                    raise
+                # Log but don't fail the whole batch
+                import logging
 
-                    logging.getLogger(__name__).warning(f"Batch SST lookup failed: {e}")
-                    continue
+                logging.getLogger(__name__).warning(f"Batch SST lookup failed: {e}")
+                continue
 
         return results
 
-    async def get_sst_record(self, record_id: str) -> Optional[dict]:
+    async def batch_get_sst_by_media_ids(self, media_ids: list[str]) -> dict[str, dict]:
         """
-        Fetch a specific SST record by Airtable record ID.
+        Look up SST records for several Media IDs, using the shared SST cache.
+
+        Media IDs the cache answers (fresh records and recent misses) cost no
+        request; the rest are fetched as full records in one batched search and
+        written back to the cache, so later single-record lookups hit it too.
+
+        Args:
+            media_ids: Media IDs to look up
+
+        Returns:
+            Dict mapping media_id -> record dict for found records
+
+        Raises:
+            httpx.HTTPError: On network or API errors
+        """
+        cache = get_sst_cache()
+        results: dict[str, dict] = {}
+        to_fetch: list[str] = []
+        for media_id in dict.fromkeys(media_ids):
+            known, record = await cache.peek_by_media_id(media_id)
+            if not known:
+                to_fetch.append(media_id)
+            elif record:
+                results[media_id] = record
+
+        if to_fetch:
+            fetched = await self.batch_search_sst_by_media_ids(to_fetch, raise_errors=True, all_fields=True)
+            for media_id in to_fetch:
+                await cache.record_media_id_lookup(media_id, fetched.get(media_id))
+            results.update(fetched)
+
+        return results
+
+    async def get_sst_record(self, record_id: str, max_age_seconds: Optional[int] = None) -> Optional[dict]:
+        """
+        Fetch a specific SST record by Airtable record ID, using the shared SST cache.
 
         Args:
             record_id: Airtable record ID (e.g., "recXXXXXXXXXXXXXX")
+            max_age_seconds: Max age of a cached record to accept. None uses the
+                cache's TTL with stale-while-revalidate; 0 forces a live lookup.
+
+        Returns:
+            Record dict if found, None if not found.
+            Record format: {"id": "rec...", "fields": {...}, "createdTime": "..."}
+
+        Raises:
+            httpx.HTTPError: On network or API errors with no cached copy
+        """
+        return await get_sst_cache().get_record(record_id, self._fetch_sst_record, max_age_seconds)
+
+    async def _fetch_sst_record(self, record_id: str) -> Optional[dict]:
+        """
+        Fetch a specific SST record by Airtable record ID (live Airtable request).
+
+        Args:
+            record_id: Airtable record ID
 
         Returns:
             Record dict if found, None if not found.
@@ -199,18 +290,17 @@ class AirtableClient:
         """
         url = f"{self.API_BASE_URL}/{self.BASE_ID}/{self.TABLE_ID}/{record_id}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
-            except httpx.HTTPError:
-                raise
+        try:
+            response = await get_airtable_gateway().get(url, headers=self.headers, timeout=30.0)
+            response.raise_for_status()
+            return response.json()
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+        except httpx.HTTPError:
+            raise
 
     def get_sst_url(self, record_id: str) -> str:
         """
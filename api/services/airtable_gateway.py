@@ -0,0 +1,270 @@
+"""
+Airtable Request Gateway
+
+Single path for every Airtable API request made by this process. Airtable
+allows 5 requests per second per base and answers bursts with 429s, which
+used to surface as "no SST record" during bulk queue or attach-all runs.
+
+The gateway provides:
+- Token bucket rate limiting (default 5 req/s, AIRTABLE_REQUESTS_PER_SECOND)
+- 429 handling: honors Retry-After, pauses all callers, then retries
+- Coalescing of identical in-flight GET requests
+- Request metrics (see get_metrics)
+
+The limit is enforced per process. The API and worker each get the full
+budget, so set AIRTABLE_REQUESTS_PER_SECOND lower if both run bulk work at once.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Airtable documents a 5 requests/second limit per base
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+
+# Airtable asks clients to wait 30 seconds after a 429
+DEFAULT_RETRY_AFTER_SECONDS = 30.0
+
+
+class AirtableGateway:
+    """
+    Rate-limited, coalescing executor for Airtable HTTP requests.
+
+    Use request() in place of httpx calls. It returns the httpx.Response so
+    callers keep their own status and JSON handling.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: Optional[int] = None,
+        max_retries: int = 3,
+        default_retry_after: float = DEFAULT_RETRY_AFTER_SECONDS,
+    ):
+        """
+        Initialize gateway.
+
+        Args:
+            requests_per_second: Sustained request rate
+            burst: Bucket capacity (defaults to one second of requests)
+            max_retries: Retries after a 429 before returning it to the caller
+            default_retry_after: Wait used when a 429 has no Retry-After header
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst or max(1, int(requests_per_second))
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0  # Monotonic time before which no request may start
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+        self._metrics: Dict[str, Any] = {
+            "requests": 0,
+            "responses_by_status": {},
+            "rate_limited": 0,
+            "retries": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "throttle_wait_seconds": 0.0,
+        }
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        timeout: float = 30.0,
+    ) -> httpx.Response:
+        """
+        Send an Airtable request under the shared rate limit.
+
+        Identical GET requests already in flight are coalesced: callers share
+        the one response.
+
+        Args:
+            method: HTTP method ("GET", "PATCH", ...)
+            url: Full Airtable API URL
+            headers: Request headers (auth)
+            params: Query parameters
+            json: JSON body
+            timeout: Request timeout in seconds
+
+        Returns:
+            The httpx.Response (a 429 is returned only after retries run out)
+
+        Raises:
+            httpx.HTTPError: On network errors
+        """
+        self._ensure_loop_state()
+
+        if method.upper() != "GET":
+            return await self._send_with_retries(method, url, headers, params, json, timeout)
+
+        key = (url, self._freeze(params))
+        task = self._inflight.get(key)
+        if task is not None:
+            self._metrics["coalesced"] += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(self._send_with_retries(method, url, headers, params, json, timeout))
+        self._inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def get(self, url: str, headers: Optional[dict] = None, params: Optional[dict] = None, timeout: float = 30.0):
+        """Send a GET request through the gateway."""
+        return await self.request("GET", url, headers=headers, params=params, timeout=timeout)
+
+    async def patch(self, url: str, headers: Optional[dict] = None, json: Optional[dict] = None, timeout: float = 60.0):
+        """Send a PATCH request through the gateway."""
+        return await self.request("PATCH", url, headers=headers, json=json, timeout=timeout)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of request metrics for this process."""
+        metrics = dict(self._metrics)
+        metrics["responses_by_status"] = dict(self._metrics["responses_by_status"])
+        metrics["throttle_wait_seconds"] = round(self._metrics["throttle_wait_seconds"], 3)
+        metrics["requests_per_second"] = self.requests_per_second
+        metrics["inflight"] = len(self._inflight)
+        return metrics
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict],
+        params: Optional[dict],
+        json: Optional[dict],
+        timeout: float,
+    ) -> httpx.Response:
+        """Send a request, waiting out 429s up to max_retries times."""
+        attempt = 0
+        while True:
+            await self._acquire()
+            response = await self._send(method, url, headers, params, json, timeout)
+
+            if response.status_code != 429:
+                return response
+
+            self._metrics["rate_limited"] += 1
+            retry_after = self._parse_retry_after(response)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+            if attempt >= self.max_retries:
+                logger.warning(f"Airtable rate limit persisted after {attempt} retries: {method} {url}")
+                return response
+
+            attempt += 1
+            self._metrics["retries"] += 1
+            logger.warning(f"Airtable 429, retrying in {retry_after:.1f}s (attempt {attempt}/{self.max_retries})")
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict],
+        params: Optional[dict],
+        json: Optional[dict],
+        timeout: float,
+    ) -> httpx.Response:
+        """Perform one HTTP request."""
+        kwargs: Dict[str, Any] = {"headers": headers}
+        if params is not None:
+            kwargs["params"] = params
+        if json is not None:
+            kwargs["json"] = json
+
+        self._metrics["requests"] += 1
+        try:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                response = await getattr(client, method.lower())(url, **kwargs)
+        except Exception:
+            self._metrics["errors"] += 1
+            raise
+
+        status = getattr(response, "status_code", None)
+        by_status = self._metrics["responses_by_status"]
+        by_status[status] = by_status.get(status, 0) + 1
+        return response
+
+    async def _acquire(self) -> None:
+        """Wait for a token (and for any 429 pause) before sending."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    elapsed = now - self._last_refill
+                    self._tokens = min(self.burst, self._tokens + elapsed * self.requests_per_second)
+                    self._last_refill = now
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.requests_per_second
+
+                self._metrics["throttle_wait_seconds"] += wait
+                await asyncio.sleep(wait)
+
+    def _parse_retry_after(self, response: httpx.Response) -> float:
+        """Read Retry-After (seconds) from a 429, falling back to the default."""
+        value = response.headers.get("Retry-After") if response.headers is not None else None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return self.default_retry_after
+
+    def _ensure_loop_state(self) -> None:
+        """Recreate loop-bound state if called from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._inflight = {}
+
+    @staticmethod
+    def _freeze(params: Optional[dict]) -> tuple:
+        """Build a hashable key from query params (list values preserved in order)."""
+        if not params:
+            return ()
+        return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+
+
+# Global gateway instance
+_airtable_gateway: Optional[AirtableGateway] = None
+
+
+def get_airtable_gateway() -> AirtableGateway:
+    """Get or create global Airtable gateway instance."""
+    global _airtable_gateway
+    if _airtable_gateway is None:
+        rate = float(os.getenv("AIRTABLE_REQUESTS_PER_SECOND", DEFAULT_REQUESTS_PER_SECOND))
+        _airtable_gateway = AirtableGateway(requests_per_second=rate)
+    return _airtable_gateway
@@ -0,0 +1,329 @@
+"""
+Transcript Alignment
+
+Deterministic alignment of formatted transcript text back to caption
+timecodes. The formatter rewrites captions into paragraphs with speaker
+labels and cleaned-up prose, so its output carries no timing; this module
+recovers it without another LLM call.
+
+Alignment works on normalized word tokens using anchor n-grams:
+1. Every word trigram that occurs exactly once in the captions and once in
+   the formatted text is a candidate anchor
+2. The longest chain of anchors that moves forward in both texts is kept
+   (longest increasing subsequence), which drops anchors matching repeated
+   phrases out of order
+3. Each formatted paragraph takes its time range from the captions its
+   anchors fall in; paragraphs with no anchors (headings, notes) are given
+   the gap between their neighbours
+
+The result is stored per project as a timing sidecar,
+transcript_timing.json, so the MCP editing tools can resolve any paragraph
+of the formatted transcript to milliseconds. The sidecar is also served with
+the job's other output files.
+"""
+
+import json
+import logging
+import os
+import re
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from api.services.srt import CaptionTrack
+
+logger = logging.getLogger(__name__)
+
+TIMING_FILENAME = "transcript_timing.json"
+TIMING_VERSION = 1
+
+ANCHOR_SIZE = 3
+
+TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+TOKEN_ANY_CASE = re.compile(TOKEN.pattern, re.IGNORECASE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, ignoring punctuation and markup."""
+    return TOKEN.findall(text.lower())
+
+
+def tokenize_with_offsets(text: str) -> List[Tuple[str, int, int]]:
+    """Lowercase word tokens with their (start, end) character offsets in text."""
+    return [(m.group().lower(), m.start(), m.end()) for m in TOKEN_ANY_CASE.finditer(text)]
+
+
+def find_anchors(source: Sequence[str], output: Sequence[str], size: int = ANCHOR_SIZE) -> List[Tuple[int, int]]:
+    """
+    Match positions in two token sequences by shared unique n-grams.
+
+    Args:
+        source: Source tokens
+        output: Output tokens
+        size: N-gram length
+
+    Returns:
+        (output_position, source_position) pairs of n-gram starts, increasing
+        in both positions
+    """
+    source_grams = _unique_grams(source, size)
+    output_grams = _unique_grams(output, size)
+    pairs = sorted(
+        (output_position, source_grams[gram]) for gram, output_position in output_grams.items() if gram in source_grams
+    )
+    return _increasing_chain(pairs)
+
+
+def _unique_grams(tokens: Sequence[str], size: int) -> Dict[Tuple[str, ...], int]:
+    """N-grams occurring exactly once, with their start positions."""
+    positions: Dict[Tuple[str, ...], int] = {}
+    repeated = set()
+    for i in range(len(tokens) - size + 1):
+        gram = tuple(tokens[i : i + size])
+        if gram in positions:
+            repeated.add(gram)
+        else:
+            positions[gram] = i
+    for gram in repeated:
+        del positions[gram]
+    return positions
+
+
+def _increasing_chain(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Longest subsequence of pairs (sorted by first item) with increasing second items."""
+    tails: List[int] = []  # smallest source position ending a chain of each length
+    tail_index: List[int] = []
+    previous: List[int] = []
+    for i, (_, source_position) in enumerate(pairs):
+        length = bisect_left(tails, source_position)
+        if length == len(tails):
+            tails.append(source_position)
+            tail_index.append(i)
+        else:
+            tails[length] = source_position
+            tail_index[length] = i
+        previous.append(tail_index[length - 1] if length else -1)
+
+    chain = []
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        chain.append(pairs[i])
+        i = previous[i]
+    return chain[::-1]
+
+
+# =============================================================================
+# Formatted transcript paragraphs
+# =============================================================================
+
+
+def split_paragraphs(formatted: str) -> List[str]:
+    """
+    Split formatter output into body paragraphs.
+
+    Drops HTML comments (provenance, review notes), the metadata header
+    before the first --- separator, separator lines, and the Status footer.
+    """
+    text = re.sub(r"<!--.*?-->", "", formatted, flags=re.DOTALL)
+    parts = re.split(r"^---+\s*$", text, maxsplit=1, flags=re.MULTILINE)
+    if len(parts) > 1:
+        text = parts[1]
+
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", text):
+        block = block.strip()
+        if not block or re.fullmatch(r"-{3,}", block) or re.match(r"^\*{0,2}Status(:\*{0,2}|\*{0,2}:)", block):
+            continue
+        paragraphs.append(block)
+    return paragraphs
+
+
+# =============================================================================
+# Timing sidecar
+# =============================================================================
+
+
+@dataclass
+class ParagraphTiming:
+    """Time range of one formatted paragraph."""
+
+    index: int
+    start_ms: int
+    end_ms: int
+    text: str
+    first_caption: Optional[int] = None
+    last_caption: Optional[int] = None
+    confidence: float = 0.0  # share of the paragraph's words covered by anchors; 0 if interpolated
+
+
+@dataclass
+class TranscriptTiming:
+    """Paragraph-level timing for a formatted transcript."""
+
+    source: str
+    paragraphs: List[ParagraphTiming] = field(default_factory=list)
+    version: int = TIMING_VERSION
+
+    @property
+    def coverage(self) -> float:
+        """Share of paragraphs aligned from anchors rather than interpolated."""
+        if not self.paragraphs:
+            return 0.0
+        return sum(1 for p in self.paragraphs if p.confidence > 0) / len(self.paragraphs)
+
+    def resolve(self, index: int) -> Optional[ParagraphTiming]:
+        """Timing of paragraph index (0-based), or None if out of range."""
+        if 0 <= index < len(self.paragraphs):
+            return self.paragraphs[index]
+        return None
+
+    def find(self, text: str) -> Optional[ParagraphTiming]:
+        """First paragraph containing text (case- and punctuation-insensitive)."""
+        needle = " ".join(tokenize(text))
+        if not needle:
+            return None
+        for paragraph in self.paragraphs:
+            if needle in " ".join(tokenize(paragraph.text)):
+                return paragraph
+        return None
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TranscriptTiming":
+        """Deserialize from to_dict() output."""
+        return cls(
+            source=data["source"],
+            paragraphs=[ParagraphTiming(**p) for p in data.get("paragraphs", [])],
+            version=data.get("version", 0),
+        )
+
+
+def align_formatted_transcript(
+    formatted: str, track: CaptionTrack, source: str = "formatter_output.md"
+) -> TranscriptTiming:
+    """
+    Align formatted transcript paragraphs to caption times.
+
+    Args:
+        formatted: Formatter output (markdown)
+        track: Captions the transcript was formatted from
+        source: Name of the formatted file, recorded in the sidecar
+
+    Returns:
+        Timing for every body paragraph
+    """
+    paragraphs = split_paragraphs(formatted)
+    timing = TranscriptTiming(source=source)
+    if not paragraphs or not len(track):
+        return timing
+
+    source_tokens: List[str] = []
+    caption_of: List[int] = []
+    for caption_index, caption_text in enumerate(track.texts()):
+        tokens = tokenize(caption_text)
+        source_tokens.extend(tokens)
+        caption_of.extend([caption_index] * len(tokens))
+
+    output_tokens: List[str] = []
+    paragraph_bounds: List[Tuple[int, int]] = []
+    for paragraph in paragraphs:
+        start = len(output_tokens)
+        output_tokens.extend(tokenize(paragraph))
+        paragraph_bounds.append((start, len(output_tokens)))
+
+    anchors = find_anchors(source_tokens, output_tokens)
+    anchor_outputs = [output_position for output_position, _ in anchors]
+    anchor_ranges = [
+        (bisect_left(anchor_outputs, start), bisect_left(anchor_outputs, stop)) for start, stop in paragraph_bounds
+    ]
+
+    aligned: List[Optional[ParagraphTiming]] = []
+    floor = 0  # first source token not claimed by an earlier paragraph
+    for index, ((start, stop), (lo, hi)) in enumerate(zip(paragraph_bounds, anchor_ranges)):
+        if lo == hi:
+            aligned.append(None)
+            continue
+
+        # Extend from the outer anchors to the paragraph edges, without
+        # crossing into the anchors of neighbouring paragraphs
+        first_output, first_source = anchors[lo]
+        last_output, last_source = anchors[hi - 1]
+        ceiling = len(source_tokens) - 1
+        if hi < len(anchors):
+            ceiling = max(last_source + ANCHOR_SIZE - 1, anchors[hi][1] - 1)
+        source_start = max(floor, first_source - (first_output - start))
+        source_stop = min(ceiling, last_source + max(ANCHOR_SIZE - 1, stop - 1 - last_output))
+        floor = source_stop + 1
+
+        first_caption = caption_of[source_start]
+        last_caption = caption_of[source_stop]
+
+        covered = set()
+        for output_position in anchor_outputs[lo:hi]:
+            covered.update(range(output_position, min(output_position + ANCHOR_SIZE, stop)))
+
+        aligned.append(
+            ParagraphTiming(
+                index=index,
+                start_ms=track.starts[first_caption],
+                end_ms=track.ends[last_caption],
+                text=paragraphs[index],
+                first_caption=first_caption,
+                last_caption=last_caption,
+                confidence=round(len(covered) / (stop - start), 3),
+            )
+        )
+
+    timing.paragraphs = _fill_gaps(aligned, paragraphs, track)
+    return timing
+
+
+def _fill_gaps(
+    aligned: List[Optional[ParagraphTiming]], paragraphs: List[str], track: CaptionTrack
+) -> List[ParagraphTiming]:
+    """Give unaligned paragraphs the span between their aligned neighbours."""
+    filled: List[ParagraphTiming] = []
+    for index, timing in enumerate(aligned):
+        if timing is not None:
+            filled.append(timing)
+            continue
+
+        previous_end = filled[-1].end_ms if filled else track.starts[0]
+        next_start = next((t.start_ms for t in aligned[index + 1 :] if t is not None), None)
+        if next_start is None:
+            next_start = max(previous_end, track.duration_ms)
+        filled.append(
+            ParagraphTiming(
+                index=index,
+                start_ms=previous_end,
+                end_ms=max(previous_end, next_start),
+                text=paragraphs[index],
+            )
+        )
+    return filled
+
+
+def load_timing(project_path: Path) -> Optional[TranscriptTiming]:
+    """Load a project's timing sidecar, or None if missing or unreadable."""
+    timing_file = project_path / TIMING_FILENAME
+    if not timing_file.exists():
+        return None
+    try:
+        return TranscriptTiming.from_dict(json.loads(timing_file.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable timing sidecar {timing_file}: {e}")
+        return None
+
+
+def save_timing(project_path: Path, timing: TranscriptTiming) -> None:
+    """Write a project's timing sidecar."""
+    timing_file = project_path / TIMING_FILENAME
+    tmp_file = timing_file.with_name(timing_file.name + ".tmp")
+    tmp_file.write_text(json.dumps(timing.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_file, timing_file)
@@ -4,12 +4,20 @@ Detects when an LLM has truncated a long transcript by comparing
 the formatter output word count against the source transcript word count.
 This catches the common failure mode where models silently stop generating
 mid-transcript and report success.
+
+Beyond the overall ratio, source and output are aligned on shared word
+n-grams (see alignment.find_anchors) to locate the source spans that have
+no counterpart in the output. The worker re-formats just those spans and
+splices them back in with splice_spans, instead of rerunning the whole
+formatter.
 """
 
 import logging
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.services.alignment import ANCHOR_SIZE, find_anchors, tokenize_with_offsets
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,40 @@ DEFAULT_COVERAGE_THRESHOLD = 0.70
 # misleading ratios and are unlikely truncation targets.
 MIN_SOURCE_WORDS_FOR_CHECK = 500
 
+# Smallest run of source words reported as a missing span. Shorter gaps
+# are ordinary filler removal and rephrasing.
+MIN_MISSING_SPAN_WORDS = 40
+
+# A source gap counts as missing when the output between the same anchors
+# has fewer than this share of its words (speaker labels, a stray heading).
+MAX_GAP_OUTPUT_RATIO = 0.2
+
+PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+
+
+@dataclass
+class MissingSpan:
+    """A run of source words with no counterpart in the formatter output."""
+
+    source_start: int  # word index in the source dialogue
+    source_stop: int
+    output_position: int  # output word index the span belongs before (output length if at the end)
+    text: str
+
+    @property
+    def word_count(self) -> int:
+        return self.source_stop - self.source_start
+
+    def to_dict(self) -> Dict[str, Any]:
+        preview = self.text if len(self.text) <= 80 else self.text[:77] + "..."
+        return {
+            "source_start": self.source_start,
+            "source_stop": self.source_stop,
+            "output_position": self.output_position,
+            "word_count": self.word_count,
+            "preview": preview,
+        }
+
 
 @dataclass
 class CompletenessResult:
@@ -36,6 +78,11 @@ class CompletenessResult:
     threshold: float
     reason: str
     skipped: bool = False
+    missing_spans: List[MissingSpan] = field(default_factory=list)
+
+    @property
+    def missing_word_count(self) -> int:
+        return sum(span.word_count for span in self.missing_spans)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -46,6 +93,8 @@ class CompletenessResult:
             "threshold": self.threshold,
             "reason": self.reason,
             "skipped": self.skipped,
+            "missing_spans": [span.to_dict() for span in self.missing_spans],
+            "missing_word_count": self.missing_word_count,
         }
 
 
@@ -83,8 +132,8 @@ def count_content_words(text: str) -> int:
     return len(text.split())
 
 
-def count_source_words(transcript_content: str, is_srt: bool = False) -> int:
-    """Count dialogue words in the source transcript.
+def source_dialogue(transcript_content: str, is_srt: bool = False) -> str:
+    """Spoken content of the source transcript.
 
     For SRT files, strips timecodes and index numbers so we compare
     only the actual spoken content — matching what the formatter
@@ -94,9 +143,130 @@ def count_source_words(transcript_content: str, is_srt: bool = False) -> int:
         # Remove SRT index numbers (standalone digits on their own line)
         text = re.sub(r"^\d+\s*$", "", transcript_content, flags=re.MULTILINE)
         # Remove SRT timecodes (00:01:23,456 --> 00:01:25,789)
-        text = re.sub(r"\d{1,2}:\d{2}:\d{2}[,.]\d{3}\s*-->\s*\d{1,2}:\d{2}:\d{2}[,.]\d{3}", "", text)
-        return len(text.split())
-    return len(transcript_content.split())
+        return re.sub(r"\d{1,2}:\d{2}:\d{2}[,.]\d{3}\s*-->\s*\d{1,2}:\d{2}:\d{2}[,.]\d{3}", "", text)
+    return transcript_content
+
+
+def count_source_words(transcript_content: str, is_srt: bool = False) -> int:
+    """Count dialogue words in the source transcript (see source_dialogue)."""
+    return len(source_dialogue(transcript_content, is_srt).split())
+
+
+def _body_bounds(formatter_output: str) -> Tuple[str, int, int]:
+    """Formatter output with comments blanked, and the character range of its body.
+
+    Comments are replaced by spaces rather than removed so that offsets into
+    the returned text are offsets into formatter_output. The body runs from
+    after the first --- separator (if any) to the Status footer (if any).
+    """
+    masked = re.sub(r"<!--.*?-->", lambda m: " " * len(m.group()), formatter_output, flags=re.DOTALL)
+    start = 0
+    separator = re.search(r"^---+\s*$", masked, flags=re.MULTILINE)
+    if separator:
+        start = separator.end()
+    end = len(masked)
+    footer = re.compile(r"^\*{0,2}Status(:\*{0,2}|\*{0,2}:)", re.MULTILINE).search(masked, start)
+    if footer:
+        end = footer.start()
+    return masked, start, end
+
+
+def _output_tokens(formatter_output: str) -> Tuple[str, int, int, List[Tuple[str, int, int]]]:
+    """Body bounds plus the body's word tokens with absolute offsets."""
+    masked, start, end = _body_bounds(formatter_output)
+    tokens = [(word, start + a, start + b) for word, a, b in tokenize_with_offsets(masked[start:end])]
+    return masked, start, end, tokens
+
+
+def find_missing_spans(
+    formatter_output: str,
+    source_text: str,
+    min_span_words: int = MIN_MISSING_SPAN_WORDS,
+) -> List[MissingSpan]:
+    """Locate source spans the formatter output skipped.
+
+    Anchors are word trigrams unique to both texts, chained in order. Each
+    stretch of source between consecutive anchors (plus the stretches before
+    the first and after the last) is compared with the output between the
+    same anchors; a long source stretch with almost no output is missing.
+
+    Args:
+        formatter_output: The formatter_output.md content
+        source_text: Source dialogue (see source_dialogue)
+        min_span_words: Smallest gap reported
+
+    Returns:
+        Missing spans in source order
+    """
+    source = tokenize_with_offsets(source_text)
+    if len(source) < min_span_words:
+        return []
+    output = _output_tokens(formatter_output)[3]
+
+    anchors = find_anchors([t[0] for t in source], [t[0] for t in output])
+    points = [(-ANCHOR_SIZE, -ANCHOR_SIZE)] + anchors + [(len(output), len(source))]
+
+    spans: List[MissingSpan] = []
+    for (prev_output, prev_source), (next_output, next_source) in zip(points, points[1:]):
+        source_start = prev_source + ANCHOR_SIZE
+        source_gap = next_source - source_start
+        output_gap = next_output - (prev_output + ANCHOR_SIZE)
+        if source_gap < min_span_words or output_gap >= source_gap * MAX_GAP_OUTPUT_RATIO:
+            continue
+        text = source_text[source[source_start][1] : source[next_source - 1][2]]
+        spans.append(MissingSpan(source_start, next_source, next_output, " ".join(text.split())))
+    return spans
+
+
+def paragraph_before(formatter_output: str, output_position: int) -> str:
+    """The output paragraph holding the word just before output_position ("" if none)."""
+    masked, body_start, body_end, tokens = _output_tokens(formatter_output)
+    if output_position <= 0 or not tokens:
+        return ""
+    previous_start, previous_end = tokens[min(output_position, len(tokens)) - 1][1:]
+    breaks = [m.end() for m in PARAGRAPH_BREAK.finditer(masked, body_start, previous_start)]
+    start = breaks[-1] if breaks else body_start
+    match = PARAGRAPH_BREAK.search(masked, previous_end, body_end)
+    return masked[start : match.start() if match else body_end].strip()
+
+
+def splice_spans(formatter_output: str, repairs: List[Tuple[MissingSpan, str]]) -> str:
+    """Insert re-formatted text for missing spans into the formatter output.
+
+    Each repair becomes its own paragraph(s) at the nearest paragraph break
+    before the output word it belongs in front of, so spans dropped mid
+    paragraph land at the end of that paragraph.
+
+    Args:
+        formatter_output: The formatter output the spans were found in
+        repairs: (span, formatted text) pairs
+
+    Returns:
+        The formatter output with every repair inserted
+    """
+    masked, body_start, body_end, tokens = _output_tokens(formatter_output)
+
+    insertions = []
+    for span, formatted in repairs:
+        formatted = formatted.strip()
+        if not formatted:
+            continue
+        if span.output_position <= 0 or not tokens:
+            # Before the first paragraph
+            first = tokens[0][1] if tokens else body_end
+            breaks = [m.end() for m in PARAGRAPH_BREAK.finditer(masked, body_start, first)]
+            position = breaks[-1] if breaks else first
+            insertions.append((position, span.source_start, formatted + "\n\n"))
+            continue
+        previous_end = tokens[min(span.output_position, len(tokens)) - 1][2]
+        match = PARAGRAPH_BREAK.search(masked, previous_end, body_end)
+        position = match.start() if match else len(masked[:body_end].rstrip())
+        insertions.append((position, span.source_start, "\n\n" + formatted))
+
+    text = formatter_output
+    for position, _, insert in sorted(insertions, reverse=True):
+        text = text[:position] + insert + text[position:]
+    return text
 
 
 def check_completeness(
@@ -149,8 +319,14 @@ def check_completeness(
 
     is_complete = coverage >= threshold
 
+    # Locate the skipped regions for targeted repair
+    missing_spans = find_missing_spans(formatter_output, source_dialogue(source_transcript, is_srt))
+
     if is_complete:
         reason = f"Coverage {coverage:.1%} meets threshold {threshold:.0%}"
+        if missing_spans:
+            missing = sum(span.word_count for span in missing_spans)
+            reason += f", but {len(missing_spans)} source span(s) (~{missing:,} words) are missing"
     else:
         missing_words = src_words - out_words
         missing_pct = (1 - coverage) * 100
@@ -169,4 +345,5 @@ def check_completeness(
         coverage_ratio=coverage,
         threshold=threshold,
         reason=reason,
+        missing_spans=missing_spans,
     )
@@ -9,7 +9,7 @@ import json
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy import (
     Column,
@@ -24,6 +24,7 @@ from sqlalchemy import (
     delete,
     desc,
     func,
+    or_,
     select,
     update,
 )
@@ -267,57 +268,83 @@ async def create_job(job: JobCreate) -> Job:
     Returns:
         Complete Job record with generated ID and defaults
     """
-    async with get_session() as session:
-        # Initialize phases - automated pipeline phases (manager is QA, copy_editor is interactive)
-        default_phases = ["analyst", "formatter", "seo", "manager"]
-        initial_phases = [JobPhase(name=name, status=PhaseStatus.pending).model_dump() for name in default_phases]
-
-        # Derive project_path from project_name if not provided
-        project_path = job.project_path
-        if project_path is None:
-            # Sanitize project name for filesystem using helper function
-            safe_name = sanitize_path_component(job.project_name)
-            output_dir = os.getenv("OUTPUT_DIR", "OUTPUT")
-            project_path = f"{output_dir}/{safe_name}"
-
-        # Prepare values
-        # Note: agent_phases is a legacy field, phases is the new structured format
-        values = {
-            "project_path": project_path,
-            "transcript_file": job.transcript_file,
-            "priority": job.priority or 0,
-            "status": JobStatus.pending.value,
-            "queued_at": datetime.now(timezone.utc),
-            "estimated_cost": 0.0,
-            "actual_cost": 0.0,
-            "agent_phases": json.dumps(default_phases),  # Legacy field
-            "phases": json.dumps(initial_phases),
-            "retry_count": 0,
-            "max_retries": 3,
-        }
+    return (await create_jobs([job]))[0]
 
-        # Insert job
-        stmt = jobs_table.insert().values(**values)
-        result = await session.execute(stmt)
-        job_id = result.inserted_primary_key[0]
 
-        # Fetch and return complete job (within same session)
-        stmt = select(jobs_table).where(jobs_table.c.id == job_id)
+async def create_jobs(jobs: List[JobCreate]) -> List[Job]:
+    """Create several jobs in one transaction.
+
+    Args:
+        jobs: Job creation schemas
+
+    Returns:
+        Complete Job records, in the same order as jobs
+    """
+    if not jobs:
+        return []
+
+    async with get_session() as session:
+        job_ids = []
+        for job in jobs:
+            stmt = jobs_table.insert().values(**_new_job_values(job))
+            result = await session.execute(stmt)
+            job_ids.append(result.inserted_primary_key[0])
+
+        # Fetch and return complete jobs (within same session)
+        stmt = select(jobs_table).where(jobs_table.c.id.in_(job_ids))
         result = await session.execute(stmt)
-        row = result.fetchone()
+        rows_by_id = {row.id: row for row in result.fetchall()}
 
-        job = _row_to_job(row)
+    created = [_row_to_job(rows_by_id[job_id]) for job_id in job_ids]
 
-        # Broadcast job creation to WebSocket clients
-        try:
-            from api.routers.websocket import broadcast_job_update
+    # Broadcast job creation to WebSocket clients
+    try:
+        from api.routers.websocket import broadcast_job_update
 
+        for job in created:
             await broadcast_job_update(job, event_type="job_created")
-        except Exception:
-            # Don't fail job creation if broadcast fails
-            pass
-
-        return job
+    except Exception:
+        # Don't fail job creation if broadcast fails
+        pass
+
+    return created
+
+
+def _new_job_values(job: JobCreate) -> dict:
+    """Build insert values for a new job."""
+    # Initialize phases - automated pipeline phases (manager is QA, copy_editor is interactive)
+    default_phases = ["analyst", "formatter", "seo", "manager"]
+    initial_phases = [JobPhase(name=name, status=PhaseStatus.pending).model_dump() for name in default_phases]
+
+    # Derive project_path from project_name if not provided
+    project_path = job.project_path
+    if project_path is None:
+        # Sanitize project name for filesystem using helper function
+        safe_name = sanitize_path_component(job.project_name)
+        output_dir = os.getenv("OUTPUT_DIR", "OUTPUT")
+        project_path = f"{output_dir}/{safe_name}"
+
+    # Note: agent_phases is a legacy field, phases is the new structured format
+    values = {
+        "project_path": project_path,
+        "transcript_file": job.transcript_file,
+        "priority": job.priority or 0,
+        "status": JobStatus.pending.value,
+        "queued_at": datetime.now(timezone.utc),
+        "estimated_cost": 0.0,
+        "actual_cost": 0.0,
+        "agent_phases": json.dumps(default_phases),  # Legacy field
+        "phases": json.dumps(initial_phases),
+        "retry_count": 0,
+        "max_retries": 3,
+    }
+    if job.media_id:
+        values["media_id"] = job.media_id
+    if job.duration_minutes is not None:
+        values["duration_minutes"] = job.duration_minutes
+    if job.word_count is not None:
+        values["word_count"] = job.word_count
+    return values
 
 
 async def get_job(job_id: int) -> Optional[Job]:
@@ -402,6 +429,84 @@ async def find_jobs_by_media_id(
         return [_row_to_job(row) for row in rows]
 
 
+async def find_jobs_by_media_ids(
+    media_ids: List[str],
+    exclude_cancelled: bool = True,
+) -> Dict[str, List[Job]]:
+    """Find existing jobs for several media IDs in one query.
+
+    Batch form of find_jobs_by_media_id for bulk duplicate detection.
+
+    Args:
+        media_ids: Media IDs to search for
+        exclude_cancelled: Whether to exclude cancelled jobs (default: True)
+
+    Returns:
+        Dict mapping media ID -> matching jobs (newest first). Media IDs
+        with no jobs are omitted.
+    """
+    media_ids = [m for m in dict.fromkeys(media_ids) if m]
+    if not media_ids:
+        return {}
+
+    async with get_session() as session:
+        stmt = select(jobs_table).where(jobs_table.c.media_id.in_(media_ids))
+
+        if exclude_cancelled:
+            stmt = stmt.where(jobs_table.c.status != JobStatus.cancelled.value)
+
+        # Order by newest first
+        stmt = stmt.order_by(jobs_table.c.queued_at.desc())
+
+        result = await session.execute(stmt)
+        rows = result.fetchall()
+
+    jobs_by_media_id: Dict[str, List[Job]] = {}
+    for row in rows:
+        jobs_by_media_id.setdefault(row.media_id, []).append(_row_to_job(row))
+    return jobs_by_media_id
+
+
+async def find_jobs_for_transcripts(
+    transcript_files: List[str],
+    media_ids: List[str],
+    exclude_cancelled: bool = False,
+) -> List[Job]:
+    """Find jobs matching any of several transcript files or media IDs in one query.
+
+    Used by the bulk queue lookup. Both columns are indexed, so the query
+    cost depends on the number of matches, not the size of the jobs table.
+
+    Args:
+        transcript_files: Transcript filenames to match exactly
+        media_ids: Media IDs to match
+        exclude_cancelled: Whether to exclude cancelled jobs (default: False)
+
+    Returns:
+        Matching Job records, newest first
+    """
+    transcript_files = [f for f in dict.fromkeys(transcript_files) if f]
+    media_ids = [m for m in dict.fromkeys(media_ids) if m]
+    if not transcript_files and not media_ids:
+        return []
+
+    async with get_session() as session:
+        stmt = select(jobs_table).where(
+            or_(jobs_table.c.transcript_file.in_(transcript_files), jobs_table.c.media_id.in_(media_ids))
+        )
+
+        if exclude_cancelled:
+            stmt = stmt.where(jobs_table.c.status != JobStatus.cancelled.value)
+
+        # Order by newest first
+        stmt = stmt.order_by(jobs_table.c.queued_at.desc())
+
+        result = await session.execute(stmt)
+        rows = result.fetchall()
+
+        return [_row_to_job(row) for row in rows]
+
+
 async def list_jobs(
     status: Optional[JobStatus] = None,
     limit: int = 50,
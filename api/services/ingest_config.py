@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from api.models.ingest import IngestConfig, IngestConfigUpdate
+from api.models.ingest import IngestConfig, IngestConfigUpdate, PrefetchConfig
 from api.services.database import get_config, set_config
 
 logger = logging.getLogger(__name__)
@@ -31,6 +31,10 @@ KEY_LAST_SCAN_SUCCESS = f"{INGEST_PREFIX}last_scan_success"
 KEY_SERVER_URL = f"{INGEST_PREFIX}server_url"
 KEY_DIRECTORIES = f"{INGEST_PREFIX}directories"
 KEY_IGNORE_DIRECTORIES = f"{INGEST_PREFIX}ignore_directories"
+KEY_QC_SYNC_CURSOR = f"{INGEST_PREFIX}qc_sync_cursor"
+KEY_PREFETCH_ENABLED = f"{INGEST_PREFIX}prefetch_enabled"
+KEY_PREFETCH_MAX_DISK_MB = f"{INGEST_PREFIX}prefetch_max_disk_mb"
+KEY_PREFETCH_CONCURRENCY = f"{INGEST_PREFIX}prefetch_concurrency"
 
 
 # =============================================================================
@@ -176,6 +180,50 @@ async def record_scan_result(success: bool) -> None:
     )
 
 
+async def get_qc_sync_cursor() -> Optional[str]:
+    """Get the cursor for incremental Airtable QC state syncs.
+
+    Returns:
+        ISO 8601 timestamp of the last successful sync, or None if the
+        local QC state has never been synced
+    """
+    item = await get_config(KEY_QC_SYNC_CURSOR)
+    return item.value if item and item.value else None
+
+
+async def set_qc_sync_cursor(cursor: Optional[str]) -> None:
+    """Store the cursor for incremental Airtable QC state syncs.
+
+    Args:
+        cursor: ISO 8601 timestamp to resume from, or None to force a full sync
+    """
+    await set_config(
+        KEY_QC_SYNC_CURSOR,
+        cursor or "",
+        value_type="string",
+        description="Last-modified cursor for incremental SST QC sync",
+    )
+
+
+async def get_prefetch_config() -> PrefetchConfig:
+    """Get transcript prefetch settings.
+
+    Returns:
+        PrefetchConfig: Current settings with defaults for missing values
+    """
+    defaults = PrefetchConfig()
+
+    enabled_item = await get_config(KEY_PREFETCH_ENABLED)
+    max_disk_item = await get_config(KEY_PREFETCH_MAX_DISK_MB)
+    concurrency_item = await get_config(KEY_PREFETCH_CONCURRENCY)
+
+    return PrefetchConfig(
+        enabled=enabled_item.get_typed_value() if enabled_item else defaults.enabled,
+        max_disk_mb=max_disk_item.get_typed_value() if max_disk_item else defaults.max_disk_mb,
+        concurrency=concurrency_item.get_typed_value() if concurrency_item else defaults.concurrency,
+    )
+
+
 async def ensure_defaults() -> None:
     """Ensure default configuration values exist in the database.
 
@@ -9,19 +9,24 @@ File type routing:
 - .jpg/.jpeg/.png files -> auto-attached to SST records (screengrabs)
 """
 
+import asyncio
+import hashlib
 import logging
+import os
 import re
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import List, Optional
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 from urllib.parse import unquote, urljoin
 
 import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy import text
 
+from api.services.airtable_gateway import get_airtable_gateway
 from api.services.database import get_session
-from api.services.utils import sanitize_duplicate_filename
+from api.services.utils import parse_iso_datetime, sanitize_duplicate_filename
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +44,20 @@ class RemoteFile:
     modified_at: Optional[datetime] = None
 
 
+@dataclass
+class DirectoryListing:
+    """Cached listing of one ingest server directory, indexed by Media ID."""
+
+    directory_path: str
+    fetched_at: float  # Unix timestamp of the listing
+    files_by_media_id: Dict[str, List[RemoteFile]] = field(default_factory=dict)
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since this listing was fetched."""
+        return time.time() - self.fetched_at
+
+
 @dataclass
 class ScanResult:
     """Result of scanning the remote server."""
@@ -53,6 +72,24 @@ class ScanResult:
     new_screengrabs: int = 0
 
 
+@dataclass
+class PrefetchResult:
+    """Result of prefetching new transcripts ahead of queueing."""
+
+    candidates: int  # New transcripts without a local copy
+    downloaded: int = 0
+    failed: int = 0
+    skipped_quota: int = 0
+    pruned: int = 0  # Local copies removed (file ignored or no longer new)
+    bytes_used: int = 0
+
+
+# Prefetched transcripts live in a hidden subfolder: watch_transcripts.py
+# auto-queues files at the top level of transcripts/, and prefetching must not
+# queue anything. Queueing moves a file from here into transcripts/.
+PREFETCH_DIR = "transcripts/.prefetch"
+
+
 class IngestScanner:
     """
     Monitors remote ingest server for new SRT and JPG files.
@@ -69,12 +106,27 @@ class IngestScanner:
     TRANSCRIPT_EXTENSIONS = {".srt", ".txt"}
     SCREENGRAB_EXTENSIONS = {".jpg", ".jpeg", ".png"}
 
+    # SST "QC" single-select value that marks a record ready for ingest
+    QC_PASSED_STATUS = "Passed"
+
+    # Re-fetch records modified slightly before the cursor to absorb clock skew
+    QC_SYNC_OVERLAP_SECONDS = 120
+
+    # Transcript downloads
+    DOWNLOAD_CONCURRENCY = 8
+    DOWNLOAD_MAX_ATTEMPTS = 4
+
+    # Quota charge for a transcript whose listing shows no size
+    PREFETCH_SIZE_ESTIMATE = 256 * 1024
+
     def __init__(
         self,
         base_url: str = "https://mmingest.pbswi.wisc.edu/",
         directories: Optional[List[str]] = None,
         timeout_seconds: int = 30,
         auth: Optional[tuple] = None,
+        index_max_age_seconds: int = 3600,
+        miss_refresh_seconds: int = 300,
     ):
         """
         Initialize scanner.
@@ -84,120 +136,303 @@ class IngestScanner:
             directories: List of directory paths to scan (e.g., ["/exports/", "/images/"])
             timeout_seconds: HTTP request timeout
             auth: Optional (username, password) tuple for basic auth
+            index_max_age_seconds: Max age of a cached directory listing before it
+                is re-fetched for Media ID lookups
+            miss_refresh_seconds: Min age of a cached listing before a lookup miss
+                triggers a re-fetch of that directory
         """
         self.base_url = base_url.rstrip("/")
         self.directories = directories or ["/"]
         self.timeout = timeout_seconds
         self.auth = auth
+        self.index_max_age_seconds = index_max_age_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+
+        # Media ID index: directory path -> listing from the latest scan
+        self._directory_index: Dict[str, DirectoryListing] = {}
+        self._index_seeded = False
 
     async def get_qc_passed_media_ids(self) -> List[str]:
         """
-        Query Airtable SST for QC-passed Media IDs that don't have existing jobs.
+        Find QC-passed Media IDs that don't have existing jobs.
 
         This is Step 1 of the "smart scanning" approach: determine which Media IDs
         we should look for on the ingest server.
 
+        QC state is read from the local sst_qc_state mirror, which is brought
+        up to date with a delta fetch of recently modified SST records first.
+        If the sync fails, the last synced state is used.
+
         Returns:
             List of Media IDs that passed QC and don't have jobs yet
         """
-        from sqlalchemy import text
-
-        from api.services.airtable import AirtableClient
+        try:
+            await self.sync_qc_state()
+        except Exception as e:
+            logger.warning(f"SST QC sync failed, using last synced state: {e}")
 
         try:
-            client = AirtableClient()
+            async with get_session() as session:
+                # Anti-join against jobs instead of binding one parameter per Media ID
+                query = text(
+                    """
+                    SELECT DISTINCT q.media_id
+                    FROM sst_qc_state q
+                    WHERE q.qc_status = :passed
+                      AND q.media_id IS NOT NULL
+                      AND NOT EXISTS (
+                          SELECT 1 FROM jobs j WHERE j.media_id = q.media_id
+                      )
+                    ORDER BY q.media_id
+                """
+                )
+                result = await session.execute(query, {"passed": self.QC_PASSED_STATUS})
+                media_ids = [row.media_id for row in result.fetchall()]
 
-            # Query SST for records where QC field indicates passed status
-            # The "QC" field is a dropdown with status values
-            url = f"{client.API_BASE_URL}/{client.BASE_ID}/{client.TABLE_ID}"
+            logger.info(f"Found {len(media_ids)} QC-passed Media IDs without jobs")
+            return media_ids
 
-            # Airtable formula to find QC-passed records
-            # "QC" is a single-select dropdown field
-            formula = "{QC} = 'Passed'"
+        except Exception as e:
+            logger.error(f"Failed to query QC-passed Media IDs: {e}")
+            return []
 
-            params = {
-                "filterByFormula": formula,
-                "fields[]": ["Media ID"],  # Only fetch Media ID field
-                "pageSize": 100,  # Fetch in batches
-            }
+    async def sync_qc_state(self, full: bool = False) -> int:
+        """
+        Sync the local sst_qc_state table from Airtable.
 
-            media_ids = []
-            offset = None
+        Without a stored cursor (or with full=True) this pages through all
+        QC-passed records and replaces the table. Otherwise only records whose
+        QC or Media ID field changed since the cursor are fetched and upserted,
+        which also picks up records that left the Passed state.
 
-            async with httpx.AsyncClient(timeout=60.0) as http_client:
-                while True:
-                    if offset:
-                        params["offset"] = offset
+        Args:
+            full: Force a full resync instead of a delta fetch
 
-                    response = await http_client.get(url, headers=client.headers, params=params)
-                    response.raise_for_status()
+        Returns:
+            Number of SST records fetched from Airtable
+        """
+        from api.services.airtable import AirtableClient
+        from api.services.ingest_config import get_qc_sync_cursor, set_qc_sync_cursor
 
-                    data = response.json()
-                    records = data.get("records", [])
+        cursor = None if full else await get_qc_sync_cursor()
+        sync_started_at = datetime.now(timezone.utc)
 
-                    for record in records:
-                        media_id = record.get("fields", {}).get("Media ID")
-                        if media_id:
-                            media_ids.append(media_id)
+        if cursor:
+            since = parse_iso_datetime(cursor) - timedelta(seconds=self.QC_SYNC_OVERLAP_SECONDS)
+            since_str = since.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            formula = f"IS_AFTER(LAST_MODIFIED_TIME({{QC}}, {{Media ID}}), '{since_str}')"
+        else:
+            formula = f"{{QC}} = '{self.QC_PASSED_STATUS}'"
+
+        client = AirtableClient()
+        url = f"{client.API_BASE_URL}/{client.BASE_ID}/{client.TABLE_ID}"
+        params = {
+            "filterByFormula": formula,
+            "fields[]": ["Media ID", "QC"],  # Only fetch the fields we mirror
+            "pageSize": 100,  # Fetch in batches
+        }
 
-                    # Check for pagination
-                    offset = data.get("offset")
-                    if not offset:
-                        break
+        rows = []
+        offset = None
 
-            # Filter out Media IDs that already have jobs in our database
-            async with get_session() as session:
-                if media_ids:
-                    placeholders = ",".join([f":id{i}" for i in range(len(media_ids))])
-                    query = text(
-                        f"""
-                        SELECT DISTINCT media_id
-                        FROM jobs
-                        WHERE media_id IN ({placeholders})
-                    """
-                    )
+        gateway = get_airtable_gateway()
 
-                    params_dict = {f"id{i}": mid for i, mid in enumerate(media_ids)}
-                    result = await session.execute(query, params_dict)
-                    existing_media_ids = {row.media_id for row in result.fetchall()}
+        while True:
+            if offset:
+                params["offset"] = offset
 
-                    # Return only those without existing jobs
-                    media_ids = [mid for mid in media_ids if mid not in existing_media_ids]
+            response = await gateway.get(url, headers=client.headers, params=params, timeout=60.0)
+            response.raise_for_status()
 
-            logger.info(f"Found {len(media_ids)} QC-passed Media IDs without jobs")
-            return media_ids
+            data = response.json()
+            for record in data.get("records", []):
+                fields = record.get("fields", {})
+                rows.append(
+                    {
+                        "record_id": record["id"],
+                        "media_id": fields.get("Media ID"),
+                        "qc_status": fields.get("QC"),
+                        "synced_at": sync_started_at.isoformat(),
+                    }
+                )
 
-        except Exception as e:
-            logger.error(f"Failed to query QC-passed Media IDs: {e}")
-            return []
+            # Check for pagination
+            offset = data.get("offset")
+            if not offset:
+                break
+
+        async with get_session() as session:
+            if not cursor:
+                await session.execute(text("DELETE FROM sst_qc_state"))
+
+            if rows:
+                upsert_query = text(
+                    """
+                    INSERT INTO sst_qc_state (record_id, media_id, qc_status, synced_at)
+                    VALUES (:record_id, :media_id, :qc_status, :synced_at)
+                    ON CONFLICT(record_id) DO UPDATE SET
+                        media_id = excluded.media_id,
+                        qc_status = excluded.qc_status,
+                        synced_at = excluded.synced_at
+                """
+                )
+                await session.execute(upsert_query, rows)
+
+        await set_qc_sync_cursor(sync_started_at.isoformat())
+
+        logger.info(f"SST QC sync ({'delta' if cursor else 'full'}): {len(rows)} records updated")
+        return len(rows)
 
     async def check_ingest_server_for_media_id(self, media_id: str) -> List[RemoteFile]:
         """
         Check if files exist on ingest server for a specific Media ID.
 
+        Answers from the in-memory Media ID index, which is built from the
+        latest scan (or seeded from recently seen available_files rows), so
+        checking many Media IDs doesn't re-crawl the server for each one.
+        Listings older than index_max_age_seconds are re-fetched. On a miss,
+        only directories whose listing is older than miss_refresh_seconds are
+        re-fetched, stopping at the first one that has the Media ID.
+
         Args:
             media_id: Media ID to search for (e.g., "2WLI1209HD")
 
         Returns:
             List of RemoteFile objects matching this Media ID
         """
+        await self._seed_index_from_db()
+
         matching_files: List[RemoteFile] = []
+        attempted: set = set()
 
-        # Scan configured directories for files matching this Media ID
         for directory in self.directories:
-            try:
-                dir_url = f"{self.base_url}{directory}"
-                all_files = await self._scan_directory(dir_url, directory)
+            listing = self._directory_index.get(directory)
+            if listing is None or listing.age_seconds > self.index_max_age_seconds:
+                attempted.add(directory)
+                try:
+                    listing = await self._refresh_directory(directory)
+                except Exception as e:
+                    logger.warning(f"Failed to scan directory {directory} for {media_id}: {e}")
+                    continue
+            matching_files.extend(listing.files_by_media_id.get(media_id, []))
 
-                # Filter to files matching this Media ID
-                for remote_file in all_files:
-                    if remote_file.media_id == media_id:
-                        matching_files.append(remote_file)
+        if matching_files:
+            return matching_files
 
+        # Miss: the file may have appeared since the listing was cached
+        for directory in self.directories:
+            if directory in attempted:
+                continue
+            listing = self._directory_index.get(directory)
+            if listing is not None and listing.age_seconds < self.miss_refresh_seconds:
+                continue
+            try:
+                listing = await self._refresh_directory(directory)
             except Exception as e:
-                logger.warning(f"Failed to scan directory {directory} for {media_id}: {e}")
+                logger.warning(f"Failed to refresh directory {directory} for {media_id}: {e}")
+                continue
+            found = listing.files_by_media_id.get(media_id)
+            if found:
+                return list(found)
+
+        return []
 
-        return matching_files
+    def _index_directory(
+        self,
+        directory_path: str,
+        files: List[RemoteFile],
+        fetched_at: Optional[float] = None,
+    ) -> DirectoryListing:
+        """Replace the cached listing for a directory with the given files."""
+        listing = DirectoryListing(
+            directory_path=directory_path,
+            fetched_at=fetched_at if fetched_at is not None else time.time(),
+        )
+        for remote_file in files:
+            if remote_file.media_id:
+                listing.files_by_media_id.setdefault(remote_file.media_id, []).append(remote_file)
+        self._directory_index[directory_path] = listing
+        return listing
+
+    async def _refresh_directory(self, directory: str) -> DirectoryListing:
+        """Re-fetch a single directory listing and update the index."""
+        dir_url = f"{self.base_url}{directory}"
+        files = await self._scan_directory(dir_url, directory)
+        return self._index_directory(directory, files)
+
+    async def _seed_index_from_db(self) -> None:
+        """
+        Seed the Media ID index from available_files on first use.
+
+        Only rows seen by the most recent scan of each configured directory,
+        and within index_max_age_seconds, are used. Directories without
+        fresh rows are left out and get fetched from the server on demand.
+        """
+        if self._index_seeded:
+            return
+        self._index_seeded = True
+
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.index_max_age_seconds)
+
+        try:
+            async with get_session() as session:
+                query = text(
+                    """
+                    SELECT remote_url, filename, directory_path, file_type, media_id,
+                           file_size_bytes, remote_modified_at, last_seen_at
+                    FROM available_files
+                    WHERE media_id IS NOT NULL
+                      AND last_seen_at >= :cutoff
+                """
+                )
+                result = await session.execute(query, {"cutoff": cutoff.isoformat()})
+                rows = result.fetchall()
+        except Exception as e:
+            logger.debug(f"Could not seed Media ID index from database: {e}")
+            return
+
+        rows_by_directory: Dict[str, list] = {}
+        for row in rows:
+            if row.directory_path in self.directories and row.directory_path not in self._directory_index:
+                rows_by_directory.setdefault(row.directory_path, []).append(row)
+
+        for directory, dir_rows in rows_by_directory.items():
+            # Rows not touched by the latest scan of this directory are gone from the server
+            latest_seen = max(str(row.last_seen_at) for row in dir_rows)
+            files = [
+                RemoteFile(
+                    filename=row.filename,
+                    url=row.remote_url,
+                    directory_path=row.directory_path,
+                    file_type=row.file_type,
+                    media_id=row.media_id,
+                    file_size_bytes=row.file_size_bytes,
+                    modified_at=self._parse_db_datetime(row.remote_modified_at),
+                )
+                for row in dir_rows
+                if str(row.last_seen_at) == latest_seen
+            ]
+            fetched_at = self._parse_db_datetime(latest_seen)
+            self._index_directory(
+                directory,
+                files,
+                fetched_at=fetched_at.timestamp() if fetched_at else None,
+            )
+
+        if rows_by_directory:
+            logger.info(f"Seeded Media ID index for {len(rows_by_directory)} directories from available_files")
+
+    @staticmethod
+    def _parse_db_datetime(value) -> Optional[datetime]:
+        """Parse a datetime column that may come back as a string or datetime."""
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        try:
+            return parse_iso_datetime(str(value))
+        except ValueError:
+            return None
 
     async def scan(self) -> ScanResult:
         """
@@ -212,8 +447,6 @@ class IngestScanner:
         Returns:
             ScanResult with scan statistics
         """
-        import time
-
         start_time = time.time()
 
         result = ScanResult(
@@ -233,6 +466,7 @@ class IngestScanner:
                 try:
                     files = await self._scan_directory(dir_url, directory)
                     all_files.extend(files)
+                    self._index_directory(directory, files)
                 except Exception as e:
                     logger.warning(f"Failed to scan {directory}: {e}")
                     continue
@@ -267,7 +501,7 @@ class IngestScanner:
         Instead of N individual queries, uses:
         1. One SELECT to get all existing URLs
         2. One bulk INSERT for new files
-        3. One bulk UPDATE for existing files (update last_seen_at)
+        3. Batched UPDATEs for existing files (update last_seen_at)
 
         Args:
             files: List of RemoteFile objects to track
@@ -337,23 +571,22 @@ class IngestScanner:
                 else:
                     new_screengrabs += 1
 
-            # Step 3: Update last_seen_at for existing files (single UPDATE)
-            if existing_urls:
-                update_query = text(
-                    """
-                    UPDATE available_files
-                    SET last_seen_at = :now
-                    WHERE remote_url IN (SELECT remote_url FROM available_files WHERE 1=1)
-                """
-                )
-                # Actually, let's just update all records to current timestamp
-                # This is simpler and still fast
+            # Step 3: Update last_seen_at for files seen in this scan (batched UPDATEs)
+            # Only touch files actually seen, so last_seen_at tells which files
+            # the latest scan found (used to seed the Media ID index)
+            seen_urls = list(existing_urls)
+            for i in range(0, len(seen_urls), batch_size):
+                batch_urls = seen_urls[i : i + batch_size]
+                placeholders = ",".join([f":url{j}" for j in range(len(batch_urls))])
                 update_query = text(
-                    """
+                    f"""
                     UPDATE available_files SET last_seen_at = :now
+                    WHERE remote_url IN ({placeholders})
                 """
                 )
-                await session.execute(update_query, {"now": now})
+                params = {f"url{j}": url for j, url in enumerate(batch_urls)}
+                params["now"] = now
+                await session.execute(update_query, params)
 
             await session.commit()
 
@@ -672,87 +905,389 @@ class IngestScanner:
             - success: bool
             - local_path: Path where file was saved (if successful)
             - media_id: Media ID from the file
+            - sha256: Checksum of the downloaded file (if successful)
             - error: Error message (if failed)
         """
+        results = await self.download_files([file_id], destination_dir)
+        return results[file_id]
+
+    async def download_files(
+        self,
+        file_ids: List[int],
+        destination_dir: str = "transcripts",
+        max_concurrency: Optional[int] = None,
+        mark_queued: bool = True,
+    ) -> Dict[int, dict]:
+        """
+        Download several transcripts concurrently over one HTTP connection pool.
+
+        Each file is streamed to a .part file, resumed with a Range request if
+        the connection drops, verified against the response size and the
+        listing's file size, then atomically renamed into place.
+
+        Files that already have a local copy (e.g. from prefetch_transcripts)
+        are moved into destination_dir instead of being downloaded again.
+
+        Args:
+            file_ids: IDs from available_files table
+            destination_dir: Local directory to save files (default: transcripts/)
+            max_concurrency: Max simultaneous downloads (default: DOWNLOAD_CONCURRENCY)
+            mark_queued: Set status to 'queued' (False only records the local copy)
+
+        Returns:
+            Dict mapping file_id -> download result (see download_file)
+        """
         from pathlib import Path
 
-        # Get file record from database
+        file_ids = list(dict.fromkeys(file_ids))
+        if not file_ids:
+            return {}
+
+        # Get file records from database
         async with get_session() as session:
+            placeholders = ", ".join(f":id{i}" for i in range(len(file_ids)))
             query = text(
-                """
-                SELECT id, remote_url, filename, media_id, file_type, status
+                f"""
+                SELECT id, remote_url, filename, media_id, file_type, status, file_size_bytes, local_path
                 FROM available_files
-                WHERE id = :file_id
+                WHERE id IN ({placeholders})
             """
             )
-            result = await session.execute(query, {"file_id": file_id})
-            row = result.fetchone()
+            result = await session.execute(query, {f"id{i}": fid for i, fid in enumerate(file_ids)})
+            rows = {row.id: row for row in result.fetchall()}
 
+        results: Dict[int, dict] = {}
+        to_download = []
+        for file_id in file_ids:
+            row = rows.get(file_id)
             if not row:
-                return {"success": False, "error": f"File {file_id} not found"}
-
-            if row.file_type != "transcript":
-                return {"success": False, "error": f"File {file_id} is not a transcript"}
+                results[file_id] = {"success": False, "error": f"File {file_id} not found"}
+            elif row.file_type != "transcript":
+                results[file_id] = {"success": False, "error": f"File {file_id} is not a transcript"}
+            else:
+                to_download.append(row)
 
         # Create destination directory if needed
         dest_path = Path(destination_dir)
-        dest_path.mkdir(parents=True, exist_ok=True)
+        if to_download:
+            dest_path.mkdir(parents=True, exist_ok=True)
 
-        # Build local filename (use original filename)
-        local_filename = row.filename
-        local_path = dest_path / local_filename
+        # Use existing local copies without touching the network
+        for row in list(to_download):
+            if not row.local_path or not Path(row.local_path).is_file():
+                continue
+            local_path = dest_path / row.filename
+            if Path(row.local_path) != local_path:
+                try:
+                    os.replace(row.local_path, local_path)
+                except OSError as e:
+                    logger.warning(f"Could not move local copy of {row.filename}, downloading instead: {e}")
+                    continue
+            logger.info(f"Using local copy of {row.filename} at {local_path}")
+            results[row.id] = {
+                "success": True,
+                "local_path": str(local_path),
+                "media_id": row.media_id,
+                "filename": row.filename,
+                "sha256": self._file_sha256(local_path),
+            }
+            to_download.remove(row)
 
-        # Download the file
-        try:
-            async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-                auth = None
-                if self.auth:
-                    auth = httpx.BasicAuth(self.auth[0], self.auth[1])
+        if to_download:
+            semaphore = asyncio.Semaphore(max_concurrency or self.DOWNLOAD_CONCURRENCY)
+            auth = httpx.BasicAuth(self.auth[0], self.auth[1]) if self.auth else None
 
-                response = await client.get(row.remote_url, auth=auth)
-                response.raise_for_status()
+            async with httpx.AsyncClient(timeout=60.0, follow_redirects=True, auth=auth) as client:
 
-                # Write to local file
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
+                async def download(row) -> None:
+                    # Build local filename (use original filename)
+                    local_path = dest_path / row.filename
+                    async with semaphore:
+                        try:
+                            size, sha256 = await self._stream_download(
+                                client, row.remote_url, local_path, listed_size=row.file_size_bytes
+                            )
+                        except httpx.HTTPStatusError as e:
+                            error_msg = f"HTTP error downloading {row.filename}: {e.response.status_code}"
+                            logger.error(error_msg)
+                            results[row.id] = {"success": False, "error": error_msg}
+                            return
+                        except Exception as e:
+                            error_msg = f"Error downloading {row.filename}: {e}"
+                            logger.error(error_msg)
+                            results[row.id] = {"success": False, "error": error_msg}
+                            return
+
+                    logger.info(f"Downloaded {row.filename} to {local_path} ({size} bytes)")
+                    results[row.id] = {
+                        "success": True,
+                        "local_path": str(local_path),
+                        "media_id": row.media_id,
+                        "filename": row.filename,
+                        "sha256": sha256,
+                    }
+
+                await asyncio.gather(*(download(row) for row in to_download))
 
-                logger.info(f"Downloaded {row.filename} to {local_path}")
+        # Update file status in database
+        downloaded = [{"file_id": fid, "local_path": r["local_path"]} for fid, r in results.items() if r["success"]]
+        if downloaded:
+            now = datetime.now(timezone.utc).isoformat()
+            status_clause = "status = 'queued'," if mark_queued else ""
+            async with get_session() as session:
+                update_query = text(
+                    f"""
+                    UPDATE available_files
+                    SET {status_clause}
+                        local_path = :local_path,
+                        downloaded_at = COALESCE(downloaded_at, :now)
+                    WHERE id = :file_id
+                """
+                )
+                await session.execute(update_query, [{**params, "now": now} for params in downloaded])
 
-        except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP error downloading {row.filename}: {e.response.status_code}"
-            logger.error(error_msg)
-            return {"success": False, "error": error_msg}
-        except Exception as e:
-            error_msg = f"Error downloading {row.filename}: {e}"
-            logger.error(error_msg)
-            return {"success": False, "error": error_msg}
+        return {file_id: results[file_id] for file_id in file_ids}
+
+    async def _stream_download(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        local_path,
+        listed_size: Optional[int] = None,
+    ) -> tuple[int, str]:
+        """
+        Stream a URL to local_path via a .part file, resuming after dropped connections.
+
+        A partial file is resumed with a Range request. If-Range (the ETag or
+        Last-Modified seen when the partial was started, kept in a sidecar file)
+        makes the server send the whole file instead if it has changed since.
+
+        The result must match the size the server reported. When the server
+        reported none, it must match the directory listing's size instead
+        (a listing mismatch alongside a server-confirmed size only means the
+        file changed since the last scan, and is logged).
+
+        Args:
+            client: Shared HTTP client
+            url: Remote file URL
+            local_path: Final destination path
+            listed_size: File size from the directory listing, if known
+
+        Returns:
+            (size_bytes, sha256_hex) of the downloaded file
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP errors
+            httpx.TransportError: If the connection keeps failing
+            ValueError: If the downloaded size doesn't match
+        """
+        part_path = local_path.with_name(local_path.name + ".part")
+        validator_path = local_path.with_name(local_path.name + ".part.validator")
+
+        last_error: Optional[Exception] = None
+        for attempt in range(self.DOWNLOAD_MAX_ATTEMPTS):
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            validator = validator_path.read_text().strip() if offset and validator_path.exists() else None
+
+            headers = {}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                if validator:
+                    headers["If-Range"] = validator
+
+            try:
+                async with client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 416:
+                        # Partial no longer matches the remote file; start over
+                        part_path.unlink(missing_ok=True)
+                        continue
+                    response.raise_for_status()
+
+                    if response.status_code != 206:
+                        offset = 0  # Full body: server ignored or rejected the Range
+                        new_validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                        if new_validator:
+                            validator_path.write_text(new_validator)
+                        else:
+                            validator_path.unlink(missing_ok=True)
+
+                    expected_size = self._expected_download_size(response, offset)
+
+                    with open(part_path, "ab" if offset else "wb") as f:
+                        # Unchunked, so every received byte hits disk before a drop
+                        async for chunk in response.aiter_bytes():
+                            f.write(chunk)
+                break
+
+            except httpx.TransportError as e:
+                last_error = e
+                logger.warning(
+                    f"Download of {url} interrupted ({e}); resuming "
+                    f"(attempt {attempt + 1}/{self.DOWNLOAD_MAX_ATTEMPTS})"
+                )
+                await asyncio.sleep(min(2**attempt, 10))
+        else:
+            raise last_error or RuntimeError(f"Download of {url} failed")
+
+        size = part_path.stat().st_size
+        listing_matches = self._size_matches_listing(size, listed_size)
+        if expected_size is not None and size != expected_size:
+            mismatch = f"got {size} bytes, server reported {expected_size}"
+        elif expected_size is None and not listing_matches:
+            mismatch = f"got {size} bytes, listing shows {listed_size}"
+        else:
+            mismatch = None
+
+        if mismatch:
+            part_path.unlink(missing_ok=True)
+            validator_path.unlink(missing_ok=True)
+            raise ValueError(f"size mismatch: {mismatch}")
+        if not listing_matches:
+            logger.warning(f"{local_path.name} is {size} bytes but listing shows {listed_size}; changed since scan")
+
+        sha256 = self._file_sha256(part_path)
+        os.replace(part_path, local_path)
+        validator_path.unlink(missing_ok=True)
+        return size, sha256
+
+    @staticmethod
+    def _file_sha256(path) -> str:
+        """SHA-256 hex digest of a local file."""
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(block)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def _expected_download_size(response: httpx.Response, offset: int) -> Optional[int]:
+        """Total file size from Content-Range or Content-Length, if the server sent one."""
+        content_range = response.headers.get("Content-Range", "")
+        if "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            if total.isdigit():
+                return int(total)
+
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and "Content-Encoding" not in response.headers:
+            return offset + int(content_length)
+        return None
+
+    @staticmethod
+    def _size_matches_listing(size: int, listed_size: Optional[int]) -> bool:
+        """
+        Check a size against the one shown in the directory listing.
+
+        Listing sizes are rounded ("45K", "1.2M"), so sizes of 1K and up only
+        need to agree to within the listing's rounding.
+        """
+        if listed_size is None:
+            return True
+        tolerance = 0 if listed_size < 1024 else max(1024, int(listed_size * 0.1))
+        return abs(size - listed_size) <= tolerance
+
+    async def prefetch_transcripts(
+        self,
+        prefetch_dir: str = PREFETCH_DIR,
+        max_bytes: int = 500 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> PrefetchResult:
+        """
+        Download new transcripts before anyone queues them.
+
+        The ingest server is trimmed regularly, so transcripts are copied locally
+        as soon as a scan finds them. Files keep status 'new'; queueing later
+        moves the local copy into transcripts/ without a network request.
+        Oldest files are fetched first since they are closest to being trimmed.
+
+        Args:
+            prefetch_dir: Local directory for prefetched files
+            max_bytes: Disk quota for prefetch_dir
+            max_concurrency: Max simultaneous downloads
+
+        Returns:
+            PrefetchResult with counts
+        """
+        from pathlib import Path
+
+        prefetch_path = Path(prefetch_dir)
+        pruned = await self._prune_prefetch_dir(prefetch_path)
 
-        # Update file status in database
         async with get_session() as session:
-            update_query = text(
+            query = text(
                 """
-                UPDATE available_files
-                SET status = 'queued',
-                    local_path = :local_path,
-                    downloaded_at = :now
-                WHERE id = :file_id
+                SELECT id, file_size_bytes, local_path
+                FROM available_files
+                WHERE file_type = 'transcript'
+                  AND status = 'new'
+                ORDER BY first_seen_at ASC
             """
             )
-            await session.execute(
-                update_query,
-                {
-                    "file_id": file_id,
-                    "local_path": str(local_path),
-                    "now": datetime.now(timezone.utc).isoformat(),
-                },
+            result = await session.execute(query)
+            rows = [row for row in result.fetchall() if not row.local_path or not Path(row.local_path).is_file()]
+
+        prefetch = PrefetchResult(candidates=len(rows), pruned=pruned)
+
+        # Pick files that fit in the quota
+        bytes_planned = self._dir_size(prefetch_path)
+        selected = []
+        for row in rows:
+            size = row.file_size_bytes or self.PREFETCH_SIZE_ESTIMATE
+            if bytes_planned + size > max_bytes:
+                prefetch.skipped_quota += 1
+                continue
+            bytes_planned += size
+            selected.append(row.id)
+
+        if selected:
+            downloads = await self.download_files(
+                selected,
+                destination_dir=prefetch_dir,
+                max_concurrency=max_concurrency,
+                mark_queued=False,
             )
+            prefetch.downloaded = sum(1 for r in downloads.values() if r["success"])
+            prefetch.failed = len(downloads) - prefetch.downloaded
 
-        return {
-            "success": True,
-            "local_path": str(local_path),
-            "media_id": row.media_id,
-            "filename": row.filename,
-        }
+        prefetch.bytes_used = self._dir_size(prefetch_path)
+        if prefetch.skipped_quota:
+            logger.warning(f"Prefetch quota reached: {prefetch.skipped_quota} transcripts not prefetched")
+        return prefetch
+
+    async def _prune_prefetch_dir(self, prefetch_path) -> int:
+        """Delete prefetched files that no longer belong to a 'new' transcript."""
+        if not prefetch_path.is_dir():
+            return 0
+
+        async with get_session() as session:
+            query = text(
+                """
+                SELECT local_path
+                FROM available_files
+                WHERE file_type = 'transcript'
+                  AND status = 'new'
+                  AND local_path IS NOT NULL
+            """
+            )
+            result = await session.execute(query)
+            keep = {os.path.abspath(row.local_path) for row in result.fetchall()}
+
+        pruned = 0
+        for path in prefetch_path.iterdir():
+            # Leave partial downloads for resume
+            if not path.is_file() or ".part" in path.suffixes:
+                continue
+            if os.path.abspath(path) not in keep:
+                path.unlink(missing_ok=True)
+                pruned += 1
+        return pruned
+
+    @staticmethod
+    def _dir_size(path) -> int:
+        """Total size in bytes of the files in a directory (0 if missing)."""
+        if not path.is_dir():
+            return 0
+        return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
 
     async def get_pending_screengrabs(self) -> List[dict]:
         """
@@ -1,7 +1,9 @@
 """Ingest scanner scheduler for Sprint 11.1.
 
 Manages scheduled scanning of the ingest server using APScheduler.
-Configures scan timing based on database config values.
+Configures scan timing based on database config values. Each successful
+scan is followed by a transcript prefetch, so new SRT files are copied
+locally before the ingest server trims them.
 """
 
 import logging
@@ -12,10 +14,11 @@ from apscheduler.triggers.cron import CronTrigger
 
 from api.services.ingest_config import (
     get_ingest_config,
+    get_prefetch_config,
     parse_scan_time,
     record_scan_result,
 )
-from api.services.ingest_scanner import get_ingest_scanner
+from api.services.ingest_scanner import IngestScanner, get_ingest_scanner
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +63,7 @@ async def run_scheduled_scan():
                 f"found {result.new_files_found} new files "
                 f"({result.new_transcripts} transcripts, {result.new_screengrabs} screengrabs)"
             )
+            await run_prefetch(scanner)
         else:
             logger.error(f"Scheduled scan failed: {result.error_message}")
 
@@ -68,6 +72,30 @@ async def run_scheduled_scan():
         await record_scan_result(success=False)
 
 
+async def run_prefetch(scanner: IngestScanner) -> None:
+    """Download new transcripts found by a scan, within the prefetch quota.
+
+    Failures are logged and never fail the scan; files not prefetched are
+    still downloaded when queued.
+    """
+    try:
+        prefetch_config = await get_prefetch_config()
+        if not prefetch_config.enabled:
+            return
+
+        result = await scanner.prefetch_transcripts(
+            max_bytes=prefetch_config.max_disk_mb * 1024 * 1024,
+            max_concurrency=prefetch_config.concurrency,
+        )
+        logger.info(
+            f"Transcript prefetch: {result.downloaded} downloaded, {result.failed} failed, "
+            f"{result.skipped_quota} over quota, {result.pruned} pruned "
+            f"({result.bytes_used / (1024 * 1024):.1f} MB used)"
+        )
+    except Exception as e:
+        logger.error(f"Transcript prefetch error: {e}", exc_info=True)
+
+
 async def configure_scheduler():
     """Configure or reconfigure the scheduler based on current database config.
 
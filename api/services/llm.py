@@ -10,13 +10,14 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from api.models.events import EventCreate, EventData, EventType
 from api.services.database import log_event
 from api.services.langfuse_client import get_langfuse_client
+from api.services.tier_history import TierHistory, choose_start_tier
 
 # Cost cap and safety configuration - can be overridden via environment
 DEFAULT_RUN_COST_CAP = 1.0  # $1 per run max
@@ -73,6 +74,57 @@ MODEL_PRICING: Dict[str, Dict[str, float]] = {
     "gemini-1.5-pro": {"input": 1.25, "output": 5.00},
 }
 
+# Context window and maximum output tokens per model (approximate).
+# Backends can override with context_tokens / max_output_tokens in config.
+MODEL_LIMITS: Dict[str, Tuple[int, int]] = {
+    # OpenRouter models
+    "google/gemini-2.0-flash-exp": (1_048_576, 8_192),
+    "google/gemini-2.5-flash": (1_048_576, 65_536),
+    "google/gemini-3-flash-preview": (1_048_576, 65_536),
+    "google/gemini-3-pro-preview": (1_048_576, 65_536),
+    "anthropic/claude-3.5-sonnet": (200_000, 8_192),
+    "anthropic/claude-sonnet-4.5": (200_000, 64_000),
+    "anthropic/claude-opus-4.5": (200_000, 64_000),
+    "openai/gpt-4o": (128_000, 16_384),
+    "openai/gpt-4o-mini": (128_000, 16_384),
+    "openai/gpt-5.1-codex": (400_000, 128_000),
+    "openai/gpt-5.1-codex-mini": (400_000, 128_000),
+    "openai/gpt-oss-120b": (131_072, 32_768),
+    "moonshotai/kimi-k2-0711": (131_072, 16_384),
+    "nvidia/nemotron-nano-12b-v2-vl": (128_000, 16_384),
+    # Direct API models
+    "gpt-4o": (128_000, 16_384),
+    "gpt-4o-mini": (128_000, 16_384),
+    "claude-3-5-sonnet-latest": (200_000, 8_192),
+    "gemini-1.5-flash": (1_048_576, 8_192),
+    "gemini-1.5-flash-8b": (1_048_576, 8_192),
+    "gemini-1.5-pro": (2_097_152, 8_192),
+    # Local models
+    "qwen2.5:14b": (32_768, 8_192),
+}
+
+# Limits assumed for models not in MODEL_LIMITS
+DEFAULT_MODEL_LIMITS: Tuple[int, int] = (128_000, 8_192)
+
+
+# Finish reasons meaning the model stopped at its output token limit
+# (OpenAI/OpenRouter "length", Anthropic "max_tokens", Gemini "MAX_TOKENS")
+LENGTH_FINISH_REASONS = frozenset({"length", "max_tokens", "MAX_TOKENS"})
+
+
+def join_continuation(partial: str, continuation: str, min_overlap: int = 8, max_overlap: int = 300) -> str:
+    """Append a continuation to truncated output, dropping text the model repeated.
+
+    Models resuming from a quoted tail often restate its last few words. The
+    longest prefix of the continuation (up to max_overlap characters) that the
+    partial output already ends with is removed; overlaps shorter than
+    min_overlap are treated as coincidence and kept.
+    """
+    for size in range(min(len(partial), len(continuation), max_overlap), min_overlap - 1, -1):
+        if partial.endswith(continuation[:size]):
+            return partial + continuation[size:]
+    return partial + continuation
+
 
 @dataclass
 class LLMResponse:
@@ -87,6 +139,12 @@ class LLMResponse:
     duration_ms: int
     backend: str
     raw_response: Optional[Dict[str, Any]] = None
+    finish_reason: Optional[str] = None
+
+    @property
+    def truncated(self) -> bool:
+        """Whether generation stopped at the output token limit."""
+        return self.finish_reason in LENGTH_FINISH_REASONS
 
 
 @dataclass
@@ -241,6 +299,9 @@ class LLMClient:
         self.active_model: Optional[str] = None
         self.active_preset: Optional[str] = None
 
+        # Historical tier outcomes for history-driven routing (set by the worker)
+        self._tier_history: Optional[TierHistory] = None
+
         # Load safety guards from env/config
         self._load_safety_config()
 
@@ -380,6 +441,47 @@ class LLMClient:
 
         return backends[backend_name]
 
+    def get_context_limits(self, backend_name: Optional[str] = None) -> Tuple[int, int]:
+        """Get the context window and maximum output tokens for a backend.
+
+        Uses the backend's context_tokens / max_output_tokens if configured,
+        otherwise the smallest limits among the models it can route to (an
+        OpenRouter preset's model list plus its model or fallback model).
+
+        Args:
+            backend_name: Backend name, or None for primary backend
+
+        Returns:
+            (context_tokens, max_output_tokens)
+        """
+        backend_config = self.get_backend_config(backend_name)
+        models = []
+        preset = backend_config.get("preset")
+        if preset and backend_config.get("type") == "openrouter":
+            models.extend(self.config.get("openrouter_presets", {}).get(preset, {}).get("models", []))
+        models.extend(m for m in (backend_config.get("model"), backend_config.get("fallback_model")) if m)
+
+        known = [MODEL_LIMITS[m] for m in models if m in MODEL_LIMITS]
+        if known:
+            context_tokens = min(limits[0] for limits in known)
+            output_tokens = min(limits[1] for limits in known)
+        else:
+            context_tokens, output_tokens = DEFAULT_MODEL_LIMITS
+        return (
+            backend_config.get("context_tokens", context_tokens),
+            backend_config.get("max_output_tokens", output_tokens),
+        )
+
+    def supports_structured_outputs(self, backend_name: Optional[str] = None) -> bool:
+        """Whether a backend accepts a JSON schema response_format.
+
+        OpenAI-compatible backends (openrouter, openai) do unless their
+        config sets structured_outputs to false; other backends only get the
+        schema in the prompt.
+        """
+        backend_config = self.get_backend_config(backend_name)
+        return backend_config.get("structured_outputs", backend_config.get("type") in ("openrouter", "openai"))
+
     def get_backend_for_phase(
         self, phase: str, context: Optional[Dict[str, Any]] = None, tier_override: Optional[int] = None
     ) -> str:
@@ -451,9 +553,23 @@ class LLMClient:
         tier, _ = self.get_tier_for_phase_with_reason(phase, context)
         return tier
 
+    @property
+    def tier_history(self) -> Optional[TierHistory]:
+        """Historical tier outcomes currently used for routing, if loaded."""
+        return self._tier_history
+
+    def set_tier_history(self, history: Optional[TierHistory]) -> None:
+        """Set the historical tier outcomes used when routing.tier_selection.mode is "history"."""
+        self._tier_history = history
+
     def get_tier_for_phase_with_reason(self, phase: str, context: Optional[Dict[str, Any]] = None) -> tuple:
         """Get the calculated tier index and reason for a phase.
 
+        The tier comes from the static duration thresholds. In "history" mode
+        (routing.tier_selection) with tier history loaded, that choice is
+        refined by expected cost including escalation; see
+        tier_history.choose_start_tier.
+
         Args:
             phase: Phase name
             context: Optional context dict with transcript_metrics
@@ -461,6 +577,28 @@ class LLMClient:
         Returns:
             Tuple of (tier index, reason string)
         """
+        tier, reason = self._duration_tier_for_phase(phase, context)
+
+        routing_config = self.config.get("routing", {})
+        settings = routing_config.get("tier_selection", {})
+        if settings.get("mode", "static") != "history" or self._tier_history is None or not context:
+            return tier, reason
+
+        tiers = routing_config.get("tiers", ["openrouter-cheapskate", "openrouter", "openrouter-big-brain"])
+        return choose_start_tier(
+            self._tier_history,
+            phase,
+            duration_minutes=context.get("transcript_metrics", {}).get("estimated_duration_minutes", 0),
+            static_tier=tier,
+            static_reason=reason,
+            base_tier=routing_config.get("phase_base_tiers", {}).get(phase, 0),
+            max_tier=len(tiers) - 1,
+            tier_labels=routing_config.get("tier_labels", ["cheapskate", "default", "big-brain"]),
+            settings=settings,
+        )
+
+    def _duration_tier_for_phase(self, phase: str, context: Optional[Dict[str, Any]] = None) -> Tuple[int, str]:
+        """Tier and reason for a phase from phase_base_tiers and duration_thresholds."""
         routing_config = self.config.get("routing", {})
         tiers = routing_config.get("tiers", ["openrouter-cheapskate", "openrouter", "openrouter-big-brain"])
 
@@ -526,6 +664,22 @@ class LLMClient:
             },
         )
 
+    def get_continuation_config(self) -> Dict[str, Any]:
+        """Get continuation configuration for length-truncated responses.
+
+        Returns:
+            Dict with continuation settings (enabled, max_continuations, tail_chars)
+        """
+        routing_config = self.config.get("routing", {})
+        return routing_config.get(
+            "continuation",
+            {
+                "enabled": True,
+                "max_continuations": 3,
+                "tail_chars": 2000,
+            },
+        )
+
     def get_api_key(self, backend_config: Dict[str, Any]) -> Optional[str]:
         """Get API key for a backend from environment."""
         key_env = backend_config.get("api_key_env")
@@ -710,6 +864,7 @@ class LLMClient:
 
         # Extract content
         content = data["choices"][0]["message"]["content"]
+        finish_reason = data["choices"][0].get("finish_reason")
         actual_model = data.get("model", model)
 
         return LLMResponse(
@@ -722,6 +877,7 @@ class LLMClient:
             duration_ms=0,  # Set by caller
             backend="openrouter",
             raw_response=data,
+            finish_reason=finish_reason,
         )
 
     async def _call_openai(
@@ -762,6 +918,7 @@ class LLMClient:
 
         cost = calculate_cost(model, input_tokens, output_tokens)
         content = data["choices"][0]["message"]["content"]
+        finish_reason = data["choices"][0].get("finish_reason")
 
         return LLMResponse(
             content=content,
@@ -773,6 +930,7 @@ class LLMClient:
             duration_ms=0,
             backend="openai",
             raw_response=data,
+            finish_reason=finish_reason,
         )
 
     async def _call_anthropic(
@@ -836,6 +994,7 @@ class LLMClient:
             duration_ms=0,
             backend="anthropic",
             raw_response=data,
+            finish_reason=data.get("stop_reason"),
         )
 
     async def _call_gemini(
@@ -886,6 +1045,7 @@ class LLMClient:
 
         cost = calculate_cost(model, input_tokens, output_tokens)
         content = data["candidates"][0]["content"]["parts"][0]["text"]
+        finish_reason = data["candidates"][0].get("finishReason")
 
         return LLMResponse(
             content=content,
@@ -897,6 +1057,7 @@ class LLMClient:
             duration_ms=0,
             backend="gemini",
             raw_response=data,
+            finish_reason=finish_reason,
         )
 
     def get_status(self) -> Dict[str, Any]:
@@ -0,0 +1,220 @@
+"""
+Prompt Budget
+
+Fits the large inputs of a phase prompt (transcript, analyst output,
+formatted transcript, SEO output) into the backend's context window.
+
+Each phase declares its sections in PHASE_SECTIONS with:
+- priority: lower is more important; sections are trimmed from the highest
+  priority number down, and KEEP sections are never trimmed
+- rule: how a section shrinks - KEEP, EXCERPT (opening and closing),
+  TRUNCATE (opening only), SUMMARIZE (lead sentence of each paragraph)
+  or DROP
+- cap: optional token ceiling applied even when the window has room, so
+  reference material doesn't inflate every call
+
+Token counts are estimated at CHARS_PER_TOKEN characters per token, and a
+share of the window is held back for estimate error. Every trim is
+recorded so the worker can store it in phase metadata.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+CHARS_PER_TOKEN = 4
+
+# Share of the context window left unallocated to absorb estimate error
+SAFETY_MARGIN = 0.1
+
+# Sections squeezed below this are dropped rather than kept as a stub
+MIN_SECTION_TOKENS = 200
+
+KEEP = "keep"
+EXCERPT = "excerpt"
+TRUNCATE = "truncate"
+SUMMARIZE = "summarize"
+DROP = "drop"
+
+
+@dataclass(frozen=True)
+class SectionRule:
+    """How one prompt section is budgeted."""
+
+    key: str  # context key holding the section text
+    priority: int
+    rule: str
+    cap: Optional[int] = None  # token ceiling regardless of window
+
+
+@dataclass
+class Trim:
+    """Record of one section shortened to fit."""
+
+    section: str
+    rule: str
+    reason: str  # "cap" or "window"
+    original_tokens: int
+    kept_tokens: int
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "section": self.section,
+            "rule": self.rule,
+            "reason": self.reason,
+            "original_tokens": self.original_tokens,
+            "kept_tokens": self.kept_tokens,
+        }
+
+
+# Sections per phase. prompt_transcript is the transcript as sent to the model
+# (see JobWorker._prompt_transcript).
+PHASE_SECTIONS: Dict[str, List[SectionRule]] = {
+    "analyst": [SectionRule("prompt_transcript", 0, EXCERPT)],
+    "analyst_seo": [SectionRule("prompt_transcript", 0, EXCERPT)],
+    "formatter": [
+        SectionRule("prompt_transcript", 0, KEEP),
+        SectionRule("analyst_output", 1, SUMMARIZE),
+    ],
+    "seo": [
+        SectionRule("analyst_output", 0, SUMMARIZE),
+        SectionRule("formatter_output", 1, TRUNCATE, cap=500),
+    ],
+    "copy_editor": [SectionRule("formatter_output", 0, KEEP)],
+    "manager": [
+        SectionRule("seo_output", 0, KEEP),
+        SectionRule("analyst_output", 1, SUMMARIZE),
+        SectionRule("formatter_output", 2, EXCERPT),
+        SectionRule("prompt_transcript", 3, TRUNCATE, cap=750),
+    ],
+    "timestamp": [SectionRule("analyst_output", 0, TRUNCATE, cap=1000)],
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """Opening of text, cut at a line or word break where possible."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[: max(max_chars - 3, 0)]
+    for separator in ("\n", " "):
+        index = cut.rfind(separator)
+        if index > max_chars * 0.8:
+            cut = cut[:index]
+            break
+    return cut.rstrip() + "..."
+
+
+def excerpt(text: str, max_chars: int) -> str:
+    """Opening and closing of text, with a marker for the omitted middle."""
+    if len(text) <= max_chars:
+        return text
+    half = max(max_chars // 2 - 40, 0)
+    omitted = len(text) - 2 * half
+    return f"{text[:half].rstrip()}\n\n[... {omitted:,} characters omitted ...]\n\n{text[-half:].lstrip()}"
+
+
+def summarize(text: str, max_chars: int) -> str:
+    """Extractive summary: headings and the lead sentence of each paragraph, in order."""
+    if len(text) <= max_chars:
+        return text
+    leads = []
+    for block in re.split(r"\n\s*\n", text):
+        block = block.strip()
+        if not block:
+            continue
+        if block.startswith("#"):
+            leads.append(block.splitlines()[0])
+            continue
+        lead = re.split(r"(?<=[.!?])\s", block, maxsplit=1)[0]
+        leads.append(lead.splitlines()[0] if "\n" in lead else lead)
+    return truncate("\n\n".join(leads), max_chars)
+
+
+def apply_rule(text: str, rule: str, max_tokens: int) -> str:
+    """Shrink text to about max_tokens using a section rule."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if rule == KEEP or len(text) <= max_chars:
+        return text
+    if rule == DROP or max_tokens < MIN_SECTION_TOKENS:
+        return ""
+    if rule == EXCERPT:
+        return excerpt(text, max_chars)
+    if rule == SUMMARIZE:
+        return summarize(text, max_chars)
+    return truncate(text, max_chars)
+
+
+@dataclass
+class PromptBudget:
+    """Token budget for one call: the backend's window less room for output."""
+
+    context_tokens: int
+    output_tokens: int
+
+    def available(self, fixed_tokens: int) -> int:
+        """Tokens left for budgeted sections after output, margin and fixed prompt text."""
+        return int(self.context_tokens * (1 - SAFETY_MARGIN)) - self.output_tokens - fixed_tokens
+
+    def fit(
+        self, sections: Dict[str, str], rules: List[SectionRule], fixed_tokens: int = 0
+    ) -> Tuple[Dict[str, str], List[Trim]]:
+        """
+        Shrink sections to fit the budget.
+
+        Args:
+            sections: Section text by key
+            rules: Budget rules for the sections
+            fixed_tokens: Tokens of the system prompt and prompt scaffolding
+
+        Returns:
+            (fitted sections, trims applied)
+        """
+        return fit_sections(sections, rules, self.available(fixed_tokens))
+
+
+def fit_sections(
+    sections: Dict[str, str], rules: List[SectionRule], available: Optional[int] = None
+) -> Tuple[Dict[str, str], List[Trim]]:
+    """
+    Apply section caps, then trim by priority until the sections fit.
+
+    Args:
+        sections: Section text by key (keys without a rule are left alone)
+        rules: Budget rules for the sections
+        available: Tokens available for all sections, or None to apply caps only
+
+    Returns:
+        (fitted sections, trims applied)
+    """
+    fitted = dict(sections)
+    trims: List[Trim] = []
+    present = [rule for rule in rules if fitted.get(rule.key)]
+
+    for rule in present:
+        tokens = estimate_tokens(fitted[rule.key])
+        if rule.cap is not None and tokens > rule.cap:
+            fitted[rule.key] = apply_rule(fitted[rule.key], rule.rule, rule.cap)
+            trims.append(Trim(rule.key, rule.rule, "cap", tokens, estimate_tokens(fitted[rule.key])))
+
+    if available is None:
+        return fitted, trims
+
+    over = sum(estimate_tokens(fitted[rule.key]) for rule in present) - available
+    for rule in sorted(present, key=lambda r: -r.priority):
+        if over <= 0:
+            break
+        if rule.rule == KEEP:
+            continue
+        tokens = estimate_tokens(fitted[rule.key])
+        fitted[rule.key] = apply_rule(fitted[rule.key], rule.rule, max(tokens - over, 0))
+        kept = estimate_tokens(fitted[rule.key])
+        over -= tokens - kept
+        trims.append(Trim(rule.key, rule.rule if kept else DROP, "window", tokens, kept))
+
+    return fitted, trims
@@ -0,0 +1,251 @@
+"""Deterministic QA checks.
+
+Mechanical checks from the manager's QA checklist, run locally in
+milliseconds before the manager phase:
+- Formatter: speaker labels carry no honorifics, review notes sit only in
+  the header at the top, the completeness check passed
+- SEO: title under 60 characters, 10-15 tags
+
+Results go to the manager as a structured checklist with excerpts of what
+failed, so its prompt no longer needs every output in full. When every
+check passes on short content, the worker can skip the manager call and
+record the local report instead.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from api.services.structured_output import extract_json
+
+TITLE_MAX_CHARS = 60
+MIN_TAGS = 10
+MAX_TAGS = 15
+
+PASS = "pass"
+FAIL = "fail"
+SKIP = "skip"  # could not be evaluated (missing or unrecognized output)
+
+HONORIFIC = re.compile(
+    r"^(dr|mr|mrs|ms|mx|miss|prof|professor|rev|reverend|sen|senator|rep|gov|governor|hon|judge|sgt|capt)\.?\s",
+    re.IGNORECASE,
+)
+
+# **Name:** / **Name**: / NAME: at the start of a line
+SPEAKER_LABEL = re.compile(r"^\s*(?:\*\*([^*\n:]{1,60}?)(?::\*\*|\*\*:)|([A-Z][A-Z .'\-]{0,59}):)", re.MULTILINE)
+
+FIELD_LINE = r"^\s*(?:[-*]\s+)?\*{{0,2}}{name}\*{{0,2}}\s*(?:\([^)\n]*\))?\s*:\s*\*{{0,2}}\s*(.*)$"
+FIELD_HEADING = r"^#{{1,6}}\s*{name}\b[^\n]*\n+((?:(?!#).*\n?)+)"
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one deterministic check."""
+
+    name: str
+    target: str  # phase whose output was checked
+    status: str  # PASS, FAIL or SKIP
+    detail: str
+    excerpts: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return self.status == PASS
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "target": self.target,
+            "status": self.status,
+            "detail": self.detail,
+            "excerpts": self.excerpts,
+        }
+
+
+@dataclass
+class QAReport:
+    """Results of all deterministic checks for a job."""
+
+    checks: List[CheckResult] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """Whether every check ran and passed."""
+        return all(check.passed for check in self.checks)
+
+    @property
+    def failures(self) -> List[CheckResult]:
+        return [check for check in self.checks if check.status == FAIL]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"passed": self.passed, "checks": [check.to_dict() for check in self.checks]}
+
+    def render(self) -> str:
+        """Markdown checklist, with excerpts under failed checks."""
+        lines = []
+        for check in self.checks:
+            lines.append(f"- [{check.status.upper()}] {check.target}: {check.name} - {check.detail}")
+            for excerpt in check.excerpts:
+                lines.append(f"    > {excerpt}")
+        return "\n".join(lines)
+
+
+# =============================================================================
+# Formatter checks
+# =============================================================================
+
+
+def _formatter_body(formatted: str) -> str:
+    """Formatter output after the header (leading comments and everything before the first ---)."""
+    parts = re.split(r"^---+\s*$", formatted, maxsplit=1, flags=re.MULTILINE)
+    if len(parts) > 1:
+        return parts[1]
+    return re.sub(r"^(\s*<!--.*?-->)*", "", formatted, count=1, flags=re.DOTALL)
+
+
+def speaker_labels(formatted: str) -> List[str]:
+    """Distinct speaker labels in the transcript body, in order of appearance."""
+    labels: Dict[str, None] = {}
+    for match in SPEAKER_LABEL.finditer(_formatter_body(formatted)):
+        label = (match.group(1) or match.group(2)).strip()
+        if label and not label.lower().startswith("status"):
+            labels.setdefault(label)
+    return list(labels)
+
+
+def check_speaker_honorifics(formatted: str) -> CheckResult:
+    """Speaker labels use names only, without titles like Dr./Mr./Ms."""
+    labels = speaker_labels(formatted)
+    if not labels:
+        return CheckResult("speaker labels", "formatter", SKIP, "no speaker labels found")
+    offending = [label for label in labels if HONORIFIC.match(label)]
+    if offending:
+        return CheckResult(
+            "speaker labels",
+            "formatter",
+            FAIL,
+            f"{len(offending)} of {len(labels)} labels use honorifics",
+            excerpts=offending,
+        )
+    return CheckResult("speaker labels", "formatter", PASS, f"{len(labels)} labels, no honorifics")
+
+
+def check_review_notes_at_top(formatted: str) -> CheckResult:
+    """Review notes (HTML comments) appear only in the header, not the transcript body."""
+    comments = re.findall(r"<!--(.*?)-->", _formatter_body(formatted), flags=re.DOTALL)
+    if comments:
+        excerpts = [" ".join(comment.split())[:120] for comment in comments[:5]]
+        return CheckResult(
+            "review notes at top", "formatter", FAIL, f"{len(comments)} note(s) inside the transcript body", excerpts
+        )
+    return CheckResult("review notes at top", "formatter", PASS, "no notes in the transcript body")
+
+
+def check_completeness_result(completeness: Optional[Dict[str, Any]]) -> CheckResult:
+    """The automated completeness check passed with no missing spans."""
+    if not completeness:
+        return CheckResult("completeness", "formatter", SKIP, "completeness check did not run")
+    if completeness.get("skipped"):
+        return CheckResult("completeness", "formatter", PASS, completeness.get("reason", "skipped (short source)"))
+    missing = completeness.get("missing_spans") or []
+    if not completeness.get("is_complete") or missing:
+        excerpts = [span.get("preview", "") for span in missing[:5]]
+        return CheckResult("completeness", "formatter", FAIL, completeness.get("reason", "incomplete"), excerpts)
+    return CheckResult("completeness", "formatter", PASS, completeness.get("reason", "complete"))
+
+
+# =============================================================================
+# SEO checks
+# =============================================================================
+
+
+def _clean_value(value: str) -> str:
+    """Strip markdown emphasis, quotes and trailing (NN chars) annotations from a field value."""
+    value = re.sub(r"\s*\(\d+\s*char(?:acter)?s?\)\s*$", "", value.strip(), flags=re.IGNORECASE)
+    return value.strip().strip("*_`").strip().strip("\"'“”").strip()
+
+
+def _markdown_field(seo_output: str, name: str) -> Optional[str]:
+    """Value of a markdown field given as 'Name: value' or under a '## Name' heading."""
+    match = re.search(FIELD_LINE.format(name=name), seo_output, flags=re.IGNORECASE | re.MULTILINE)
+    if match and _clean_value(match.group(1)):
+        return _clean_value(match.group(1))
+    match = re.search(FIELD_HEADING.format(name=name), seo_output, flags=re.IGNORECASE | re.MULTILINE)
+    if match:
+        return match.group(1).strip()
+    return None
+
+
+def extract_seo_fields(seo_output: str) -> Dict[str, Any]:
+    """
+    Pull the title and tags out of SEO output (JSON or markdown report).
+
+    Returns:
+        Dict with "title" (str or None) and "tags" (list of str or None)
+    """
+    data = extract_json(seo_output)
+    if data is not None:
+        title = data.get("title")
+        tags = data.get("tags")
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        return {"title": title if isinstance(title, str) else None, "tags": tags if isinstance(tags, list) else None}
+
+    title = _markdown_field(seo_output, r"(?:seo |streaming |episode )?title")
+    if title:
+        title = _clean_value(next((line for line in title.splitlines() if line.strip()), ""))
+
+    tags = None
+    raw_tags = _markdown_field(seo_output, r"(?:tags|keywords)")
+    if raw_tags:
+        bullets = re.findall(r"^\s*(?:[-*]|\d+\.)\s+(.+)$", raw_tags, flags=re.MULTILINE)
+        items = bullets or raw_tags.splitlines()[0].split(",")
+        tags = [_clean_value(item) for item in items if _clean_value(item)]
+
+    return {"title": title or None, "tags": tags}
+
+
+def check_title_length(fields: Dict[str, Any], max_chars: int = TITLE_MAX_CHARS) -> CheckResult:
+    """SEO title is under the character limit."""
+    title = fields.get("title")
+    if not title:
+        return CheckResult("title length", "seo", SKIP, "no title found in SEO output")
+    if len(title) > max_chars:
+        return CheckResult("title length", "seo", FAIL, f"{len(title)} chars (max {max_chars})", [title])
+    return CheckResult("title length", "seo", PASS, f"{len(title)} chars (max {max_chars})")
+
+
+def check_tag_count(fields: Dict[str, Any], minimum: int = MIN_TAGS, maximum: int = MAX_TAGS) -> CheckResult:
+    """SEO output has the expected number of tags."""
+    tags = fields.get("tags")
+    if not tags:
+        return CheckResult("tag count", "seo", SKIP, "no tags found in SEO output")
+    if not minimum <= len(tags) <= maximum:
+        return CheckResult(
+            "tag count", "seo", FAIL, f"{len(tags)} tags (expected {minimum}-{maximum})", [", ".join(tags)]
+        )
+    return CheckResult("tag count", "seo", PASS, f"{len(tags)} tags")
+
+
+def run_qa_checks(context: Dict[str, Any]) -> QAReport:
+    """
+    Run every deterministic check against the outputs in a worker context.
+
+    Args:
+        context: Worker context with formatter_output, seo_output and
+            (optionally) completeness_check
+
+    Returns:
+        QAReport with one result per check
+    """
+    formatted = context.get("formatter_output", "")
+    fields = extract_seo_fields(context.get("seo_output", ""))
+    return QAReport(
+        checks=[
+            check_completeness_result(context.get("completeness_check")),
+            check_speaker_honorifics(formatted),
+            check_review_notes_at_top(formatted),
+            check_title_length(fields),
+            check_tag_count(fields),
+        ]
+    )
@@ -0,0 +1,119 @@
+"""
+Recovery Policy
+
+Deterministic recovery decisions for job failures whose cause is clear
+from the error message alone: timeouts, rate limits, provider outages,
+missing inputs, safety-guard and configuration errors, oversized prompts
+and malformed structured output. The worker applies these immediately;
+only errors that don't match a rule (typically content problems) go to
+the manager for an LLM recovery analysis.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Pattern, Tuple
+
+RETRY = "RETRY"
+ESCALATE = "ESCALATE"
+FAIL = "FAIL"
+
+
+@dataclass(frozen=True)
+class RecoveryDecision:
+    """Recovery action chosen by rule for a classified error."""
+
+    error_class: str
+    action: str  # RETRY, ESCALATE or FAIL
+    reason: str
+    retry_delay: bool = False  # wait before retrying (rate limits)
+
+
+# (error class, pattern, action, reason, retry_delay), checked in order
+_RULES: List[Tuple[str, Pattern[str], str, str, bool]] = [
+    (
+        "cost_cap",
+        re.compile(r"has reached cap of|cost cap", re.IGNORECASE),
+        FAIL,
+        "Run cost cap reached; retrying would only add cost",
+        False,
+    ),
+    (
+        "model_guard",
+        re.compile(r"not in allowlist|/1K tokens, exceeds limit", re.IGNORECASE),
+        FAIL,
+        "Model blocked by safety guards; fix the model allowlist or pricing limits",
+        False,
+    ),
+    (
+        "missing_input",
+        re.compile(r"transcript not found|no such file|not found: ", re.IGNORECASE),
+        FAIL,
+        "Input file is missing; re-queue once it is available",
+        False,
+    ),
+    (
+        "configuration",
+        re.compile(
+            r"unknown backend|unsupported backend type|api key|\b401\b|\b403\b|unauthorized|forbidden",
+            re.IGNORECASE,
+        ),
+        FAIL,
+        "Backend configuration or credentials problem; retrying will not help",
+        False,
+    ),
+    (
+        "context_length",
+        re.compile(r"context length|context window|maximum context|too many tokens|\b413\b", re.IGNORECASE),
+        ESCALATE,
+        "Prompt exceeds the model's context window; a higher tier has a larger one",
+        False,
+    ),
+    (
+        "schema_validation",
+        re.compile(r"failed schema validation", re.IGNORECASE),
+        ESCALATE,
+        "Output still malformed after a repair attempt; a more capable model should follow the schema",
+        False,
+    ),
+    (
+        "rate_limit",
+        re.compile(r"\b429\b|rate.?limit|too many requests", re.IGNORECASE),
+        RETRY,
+        "Provider rate limit; retry at the same tier after a pause",
+        True,
+    ),
+    (
+        "timeout",
+        re.compile(r"timeout|timed out", re.IGNORECASE),
+        RETRY,
+        "Transient timeout; retry at the same tier",
+        False,
+    ),
+    (
+        "provider_error",
+        re.compile(
+            r"server error|\b50[0234]\b|connection|connecterror|readerror|remoteprotocolerror|overloaded",
+            re.IGNORECASE,
+        ),
+        RETRY,
+        "Transient provider or network error; retry at the same tier",
+        False,
+    ),
+]
+
+
+def classify_error(error: str) -> Optional[RecoveryDecision]:
+    """
+    Match a job error against the recovery rules.
+
+    Args:
+        error: Error message the job failed with
+
+    Returns:
+        RecoveryDecision for a recognized error, or None when the manager
+        should analyze it
+    """
+    for error_class, pattern, action, reason, retry_delay in _RULES:
+        if pattern.search(error):
+            return RecoveryDecision(error_class, action, reason, retry_delay)
+    return None
@@ -13,15 +13,16 @@ SAFETY GUARANTEES:
 - IDEMPOTENT: Re-running on same file won't duplicate attachments
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
-
-import httpx
+from typing import Dict, List, Optional, Tuple
 
 from api.services.airtable import AirtableClient, get_secret
+from api.services.airtable_gateway import get_airtable_gateway
 from api.services.database import get_session
+from api.services.sst_cache import get_sst_cache
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,10 @@ class ScreengrabAttacher:
     API_BASE_URL = "https://api.airtable.com/v0"
     BASE_ID = "appZ2HGwhiifQToB6"
 
+    # attach_all_pending: Media IDs per Airtable lookup, SST records patched at once
+    BATCH_SIZE = 50
+    MAX_CONCURRENT_RECORDS = 5
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with Airtable API key."""
         self.api_key = api_key or get_secret("AIRTABLE_API_KEY")
@@ -108,7 +113,9 @@ class ScreengrabAttacher:
 
         try:
             # Step 1: Find SST record by Media ID
-            sst_record = await self._airtable_client.search_sst_by_media_id(media_id)
+            # Always a live lookup: the PATCH below must list every existing
+            # attachment, so a cached copy could drop recently added ones
+            sst_record = await self._airtable_client.search_sst_by_media_id(media_id, max_age_seconds=0)
             if not sst_record:
                 result.error_message = f"No SST record found for Media ID: {media_id}"
                 await self._log_attachment(result, available_file_id, image_url)
@@ -221,6 +228,13 @@ class ScreengrabAttacher:
         """
         Attach all pending screengrabs that have matching SST records.
 
+        Works through pending screengrabs in batches of BATCH_SIZE Media IDs.
+        Each batch is resolved with one live Airtable lookup and grouped by SST
+        record, so a record gets a single additive PATCH carrying all of its new
+        attachments. Records are patched concurrently (the Airtable gateway
+        enforces the rate limit) and each batch's audit rows and status updates
+        are written in one transaction.
+
         Returns:
             BatchAttachResult with summary of operations
         """
@@ -249,28 +263,27 @@ class ScreengrabAttacher:
             result = await session.execute(query)
             rows = result.fetchall()
 
+        rows_by_media_id: Dict[str, list] = {}
         for row in rows:
-            batch_result.total_processed += 1
-
-            attach_result = await self.attach_screengrab(
-                media_id=row.media_id,
-                filename=row.filename,
-                image_url=row.remote_url,
-                available_file_id=row.id,
-            )
-
-            if attach_result.success:
-                if attach_result.skipped_duplicate:
-                    batch_result.skipped_duplicate += 1
+            rows_by_media_id.setdefault(row.media_id, []).append(row)
+        media_ids = list(rows_by_media_id)
+
+        for i in range(0, len(media_ids), self.BATCH_SIZE):
+            batch_rows = [row for mid in media_ids[i : i + self.BATCH_SIZE] for row in rows_by_media_id[mid]]
+            outcomes = await self._attach_batch(batch_rows)
+            await self._record_outcomes(outcomes)
+
+            for row, attach_result in outcomes:
+                batch_result.total_processed += 1
+                if attach_result.success:
+                    if attach_result.skipped_duplicate:
+                        batch_result.skipped_duplicate += 1
+                    else:
+                        batch_result.attached += 1
+                elif "No SST record found" in (attach_result.error_message or ""):
+                    batch_result.skipped_no_match += 1
                 else:
-                    batch_result.attached += 1
-            elif "No SST record found" in (attach_result.error_message or ""):
-                batch_result.skipped_no_match += 1
-            else:
-                batch_result.errors.append(f"{row.filename}: {attach_result.error_message}")
-
-            # Update available_files status
-            await self._update_available_file_status(row.id, attach_result)
+                    batch_result.errors.append(f"{row.filename}: {attach_result.error_message}")
 
         logger.info(
             f"Batch attach complete: {batch_result.attached} attached, "
@@ -281,6 +294,136 @@ class ScreengrabAttacher:
 
         return batch_result
 
+    async def _attach_batch(self, rows: list) -> List[Tuple[object, AttachResult]]:
+        """
+        Attach one batch of pending screengrabs.
+
+        Args:
+            rows: available_files rows (id, remote_url, filename, media_id)
+
+        Returns:
+            (row, AttachResult) pairs, one per row
+        """
+        media_ids = sorted({row.media_id for row in rows})
+
+        # Live lookup that includes Screen Grab: each PATCH must list every
+        # existing attachment, so cached or field-limited records won't do
+        try:
+            records = await self._airtable_client.batch_search_sst_by_media_ids(
+                media_ids,
+                fields=["Media ID", self.SCREEN_GRAB_FIELD],
+                raise_errors=True,
+            )
+        except Exception as e:
+            logger.error(f"SST lookup failed for {len(media_ids)} Media IDs: {e}")
+            return [
+                (row, AttachResult(success=False, media_id=row.media_id, filename=row.filename, error_message=str(e)))
+                for row in rows
+            ]
+
+        outcomes: List[Tuple[object, AttachResult]] = []
+        by_record: Dict[str, Tuple[dict, list]] = {}
+        for row in rows:
+            record = records.get(row.media_id)
+            if not record:
+                result = AttachResult(
+                    success=False,
+                    media_id=row.media_id,
+                    filename=row.filename,
+                    error_message=f"No SST record found for Media ID: {row.media_id}",
+                )
+                outcomes.append((row, result))
+                continue
+            by_record.setdefault(record["id"], (record, []))[1].append(row)
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_RECORDS)
+
+        async def attach(record: dict, record_rows: list) -> List[Tuple[object, AttachResult]]:
+            async with semaphore:
+                return await self._attach_to_record(record, record_rows)
+
+        for record_outcomes in await asyncio.gather(*(attach(r, rr) for r, rr in by_record.values())):
+            outcomes.extend(record_outcomes)
+
+        return outcomes
+
+    async def _attach_to_record(self, sst_record: dict, rows: list) -> List[Tuple[object, AttachResult]]:
+        """
+        Attach all of a record's pending screengrabs with one additive PATCH.
+
+        SAFETY: Existing attachments are carried over by id; new ones are appended.
+
+        Args:
+            sst_record: SST record including the Screen Grab field
+            rows: available_files rows matching this record
+
+        Returns:
+            (row, AttachResult) pairs, one per row
+        """
+        record_id = sst_record["id"]
+        existing_attachments = sst_record.get("fields", {}).get(self.SCREEN_GRAB_FIELD, []) or []
+
+        new_attachments = [{"id": att["id"]} for att in existing_attachments]
+        attached_filenames = {att.get("filename") for att in existing_attachments}
+
+        outcomes: List[Tuple[object, AttachResult]] = []
+        pending: List[AttachResult] = []
+        for row in rows:
+            result = AttachResult(
+                success=False,
+                media_id=row.media_id,
+                filename=row.filename,
+                sst_record_id=record_id,
+                attachments_before=len(existing_attachments),
+            )
+            if row.filename in attached_filenames:
+                result.success = True
+                result.skipped_duplicate = True
+                result.attachments_after = result.attachments_before
+                logger.info(f"Skipped duplicate screengrab: {row.filename} for {row.media_id}")
+            else:
+                attached_filenames.add(row.filename)
+                new_attachments.append({"url": row.remote_url, "filename": row.filename})
+                pending.append(result)
+            outcomes.append((row, result))
+
+        if not pending:
+            return outcomes
+
+        try:
+            # CONTROLLED WRITE
+            await self._update_screengrab_field(record_id, new_attachments)
+            for result in pending:
+                result.success = True
+                result.attachments_after = len(new_attachments)
+            logger.info(
+                f"Attached {len(pending)} screengrab(s) to record {record_id}: "
+                f"{len(existing_attachments)} -> {len(new_attachments)}"
+            )
+        except Exception as e:
+            for result in pending:
+                result.error_message = str(e)
+            logger.error(f"Failed to attach {len(pending)} screengrab(s) to record {record_id}: {e}")
+
+        return outcomes
+
+    async def _record_outcomes(self, outcomes: List[Tuple[object, AttachResult]]) -> None:
+        """Write audit rows and available_files status updates in one transaction."""
+        if not outcomes:
+            return
+
+        from sqlalchemy import text
+
+        async with get_session() as session:
+            await session.execute(
+                text(self._AUDIT_INSERT_SQL),
+                [self._audit_params(result, row.id, row.remote_url) for row, result in outcomes],
+            )
+            await session.execute(
+                text(self._STATUS_UPDATE_SQL),
+                [self._status_params(row.id, result) for row, result in outcomes],
+            )
+
     async def _update_screengrab_field(
         self,
         record_id: str,
@@ -299,9 +442,18 @@ class ScreengrabAttacher:
 
         payload = {"fields": {self.SCREEN_GRAB_FIELD: attachments}}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.patch(url, headers=self.headers, json=payload)
-            response.raise_for_status()
+        response = await get_airtable_gateway().patch(url, headers=self.headers, json=payload, timeout=60.0)
+        response.raise_for_status()
+
+        # PATCH returns the full updated record; keep the shared SST cache current
+        try:
+            updated = response.json()
+        except ValueError:
+            updated = None
+        if isinstance(updated, dict) and updated.get("id"):
+            await get_sst_cache().store(updated)
+        else:
+            await get_sst_cache().invalidate(record_id=record_id)
 
     def _is_duplicate(self, existing: List[dict], filename: str) -> bool:
         """Check if filename is already attached."""
@@ -310,6 +462,24 @@ class ScreengrabAttacher:
                 return True
         return False
 
+    _AUDIT_INSERT_SQL = """
+        INSERT INTO screengrab_attachments
+        (available_file_id, sst_record_id, media_id, filename, remote_url,
+         attached_at, attachments_before, attachments_after, success, error_message)
+        VALUES
+        (:available_file_id, :sst_record_id, :media_id, :filename, :remote_url,
+         :attached_at, :attachments_before, :attachments_after, :success, :error_message)
+    """
+
+    _STATUS_UPDATE_SQL = """
+        UPDATE available_files
+        SET status = :status,
+            status_changed_at = :changed_at,
+            airtable_record_id = :record_id,
+            attached_at = :attached_at
+        WHERE id = :file_id
+    """
+
     async def _log_attachment(
         self,
         result: AttachResult,
@@ -320,31 +490,9 @@ class ScreengrabAttacher:
         from sqlalchemy import text
 
         async with get_session() as session:
-            query = text(
-                """
-                INSERT INTO screengrab_attachments
-                (available_file_id, sst_record_id, media_id, filename, remote_url,
-                 attached_at, attachments_before, attachments_after, success, error_message)
-                VALUES
-                (:available_file_id, :sst_record_id, :media_id, :filename, :remote_url,
-                 :attached_at, :attachments_before, :attachments_after, :success, :error_message)
-            """
-            )
-
             await session.execute(
-                query,
-                {
-                    "available_file_id": available_file_id,
-                    "sst_record_id": result.sst_record_id or "",
-                    "media_id": result.media_id,
-                    "filename": result.filename,
-                    "remote_url": remote_url,
-                    "attached_at": datetime.now(timezone.utc).isoformat(),
-                    "attachments_before": result.attachments_before,
-                    "attachments_after": result.attachments_after,
-                    "success": result.success,
-                    "error_message": result.error_message,
-                },
+                text(self._AUDIT_INSERT_SQL),
+                self._audit_params(result, available_file_id, remote_url),
             )
 
     async def _update_available_file_status(
@@ -355,6 +503,28 @@ class ScreengrabAttacher:
         """Update available_files status after attachment attempt."""
         from sqlalchemy import text
 
+        async with get_session() as session:
+            await session.execute(text(self._STATUS_UPDATE_SQL), self._status_params(file_id, result))
+
+    @staticmethod
+    def _audit_params(result: AttachResult, available_file_id: Optional[int], remote_url: str) -> dict:
+        """Build screengrab_attachments insert parameters."""
+        return {
+            "available_file_id": available_file_id,
+            "sst_record_id": result.sst_record_id or "",
+            "media_id": result.media_id,
+            "filename": result.filename,
+            "remote_url": remote_url,
+            "attached_at": datetime.now(timezone.utc).isoformat(),
+            "attachments_before": result.attachments_before,
+            "attachments_after": result.attachments_after,
+            "success": result.success,
+            "error_message": result.error_message,
+        }
+
+    @staticmethod
+    def _status_params(file_id: int, result: AttachResult) -> dict:
+        """Build available_files status update parameters for an attachment attempt."""
         # Determine new status
         if result.success:
             new_status = "attached"
@@ -363,28 +533,13 @@ class ScreengrabAttacher:
         else:
             new_status = "new"  # Keep as new for retry on transient errors
 
-        async with get_session() as session:
-            query = text(
-                """
-                UPDATE available_files
-                SET status = :status,
-                    status_changed_at = :changed_at,
-                    airtable_record_id = :record_id,
-                    attached_at = :attached_at
-                WHERE id = :file_id
-            """
-            )
-
-            await session.execute(
-                query,
-                {
-                    "status": new_status,
-                    "changed_at": datetime.now(timezone.utc).isoformat(),
-                    "record_id": result.sst_record_id,
-                    "attached_at": datetime.now(timezone.utc).isoformat() if result.success else None,
-                    "file_id": file_id,
-                },
-            )
+        return {
+            "status": new_status,
+            "changed_at": datetime.now(timezone.utc).isoformat(),
+            "record_id": result.sst_record_id,
+            "attached_at": datetime.now(timezone.utc).isoformat() if result.success else None,
+            "file_id": file_id,
+        }
 
 
 # Factory function
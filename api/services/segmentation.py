@@ -0,0 +1,255 @@
+"""
+Topic Segmentation
+
+Local chapter-candidate detection for the timestamp phase. Instead of
+sending the model raw captions (which only ever covered the start of long
+programs), the worker computes 3-8 topic boundaries over the whole caption
+track and sends a short summary of each candidate chapter.
+
+The method is TextTiling-style lexical cohesion:
+1. Captions are merged into timed paragraphs (transcript_encoding), the
+   units a boundary can fall between
+2. Each paragraph becomes a TF-IDF vector over its content words
+3. At every gap, the similarity of the windows on either side is scored;
+   a topic shift shows up as a valley, measured by its depth relative to
+   the peaks on both sides
+4. The deepest valleys, spaced at least a minimum chapter length apart,
+   become boundaries
+
+Boundaries always fall on a paragraph start, so every candidate carries the
+exact start time of a caption. Pure Python; a 3-hour track segments in well
+under a second.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from api.services.srt import CaptionTrack
+from api.services.transcript_encoding import Paragraph, encode_captions
+from api.services.utils import ms_to_display_timecode
+
+MIN_CHAPTERS = 3
+MAX_CHAPTERS = 8
+
+# Roughly one chapter per this many minutes, within MIN/MAX_CHAPTERS
+MINUTES_PER_CHAPTER = 6
+
+# Paragraphs compared on each side of a gap
+WINDOW_PARAGRAPHS = 3
+
+WORD = re.compile(r"[a-z][a-z']+")
+
+STOPWORDS = frozenset("""
+    a about above after again against all also am an and any are aren't as at be because been before being
+    below between both but by can can't could couldn't did didn't do does doesn't doing don't down during each
+    few for from further get got had hadn't has hasn't have haven't having he he'd he'll he's her here here's hers
+    herself him himself his how how's i i'd i'll i'm i've if in into is isn't it it's its itself just know let's
+    like me more most much must mustn't my myself no nor not now of off on once one only or other ought our ours
+    ourselves out over own really right same say said see she she'd she'll she's should shouldn't so some such
+    than that that's the their theirs them themselves then there there's these they they'd they'll they're
+    they've thing things think this those through to too under until up us very was wasn't way we we'd we'll
+    we're we've well were weren't what what's when when's where where's which while who who's whom why why's
+    will with won't would wouldn't yeah yes you you'd you'll you're you've your yours yourself yourselves going
+    gonna okay oh um uh
+    """.split())
+
+
+@dataclass
+class ChapterCandidate:
+    """A proposed chapter: exact caption start, end, and what it is about."""
+
+    start_ms: int
+    end_ms: int
+    keywords: List[str]
+    opening: str
+    score: float = 0.0  # depth of the topic shift at the start (0 for the first chapter)
+
+    @property
+    def start_timecode(self) -> str:
+        """Exact start as H:MM:SS.mmm."""
+        return format_exact_timecode(self.start_ms)
+
+    @property
+    def end_timecode(self) -> str:
+        """Exact end as H:MM:SS.mmm."""
+        return format_exact_timecode(self.end_ms)
+
+    def summary(self) -> str:
+        """One-line description for prompts."""
+        return (
+            f"{self.start_timecode} - {self.end_timecode} | keywords: {', '.join(self.keywords)} "
+            f'| opens: "{self.opening}"'
+        )
+
+
+def format_exact_timecode(ms: int) -> str:
+    """Format milliseconds as H:MM:SS.mmm."""
+    return f"{ms_to_display_timecode(ms, include_hours=True)}.{max(ms, 0) % 1000:03d}"
+
+
+def chapter_count_for(duration_ms: int) -> int:
+    """Target number of chapters for a program length."""
+    chapters = round(duration_ms / 60000 / MINUTES_PER_CHAPTER)
+    return max(MIN_CHAPTERS, min(MAX_CHAPTERS, chapters))
+
+
+def segment_captions(
+    track: CaptionTrack,
+    chapters: Optional[int] = None,
+    window: int = WINDOW_PARAGRAPHS,
+    keyword_count: int = 6,
+    opening_words: int = 25,
+) -> List[ChapterCandidate]:
+    """
+    Propose chapters for a caption track.
+
+    Args:
+        track: Captions in time order
+        chapters: Number of chapters to propose (default: from duration, 3-8)
+        window: Paragraphs compared on each side of a candidate boundary
+        keyword_count: Keywords listed per chapter
+        opening_words: Words of opening text quoted per chapter
+
+    Returns:
+        Chapter candidates in time order, covering the whole track (empty
+        if the track has fewer paragraphs than chapters requested)
+    """
+    paragraphs = encode_captions(track).paragraphs
+    if not paragraphs:
+        return []
+
+    duration_ms = paragraphs[-1].end_ms - paragraphs[0].start_ms
+    chapters = chapters or chapter_count_for(duration_ms)
+    if len(paragraphs) < chapters:
+        return []
+
+    vectors = _tfidf([_terms(p.text) for p in paragraphs])
+    depths = _depth_scores(_gap_similarities(vectors, window))
+
+    # Chapters at least half the average length apart
+    min_spacing_ms = duration_ms / chapters / 2
+    boundaries = _pick_boundaries(paragraphs, depths, chapters - 1, min_spacing_ms)
+
+    starts = [0] + boundaries
+    stops = boundaries + [len(paragraphs)]
+    candidates = []
+    for first, stop in zip(starts, stops):
+        segment = paragraphs[first:stop]
+        keywords = _top_terms(vectors[first:stop], keyword_count)
+        opening = " ".join(" ".join(p.text for p in segment[:2]).split()[:opening_words])
+        candidates.append(
+            ChapterCandidate(
+                start_ms=segment[0].start_ms,
+                end_ms=segment[-1].end_ms,
+                keywords=keywords,
+                opening=opening,
+                score=round(depths[first - 1], 3) if first else 0.0,
+            )
+        )
+    return candidates
+
+
+def _terms(text: str) -> Counter:
+    """Content-word counts for a paragraph."""
+    return Counter(word for word in WORD.findall(text.lower()) if len(word) > 2 and word not in STOPWORDS)
+
+
+def _tfidf(term_counts: List[Counter]) -> List[Dict[str, float]]:
+    """L2-normalized TF-IDF vectors."""
+    document_frequency: Counter = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+
+    total = len(term_counts)
+    idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    vectors = []
+    for counts in term_counts:
+        vector = {term: (1 + math.log(count)) * idf[term] for term, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({term: weight / norm for term, weight in vector.items()})
+    return vectors
+
+
+def _window_sum(vectors: List[Dict[str, float]]) -> Dict[str, float]:
+    """Sum of vectors."""
+    total: Dict[str, float] = {}
+    for vector in vectors:
+        for term, weight in vector.items():
+            total[term] = total.get(term, 0.0) + weight
+    return total
+
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Cosine similarity of sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(weight * b.get(term, 0.0) for term, weight in a.items())
+    norm = math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values()))
+    return dot / norm if norm else 0.0
+
+
+def _gap_similarities(vectors: List[Dict[str, float]], window: int) -> List[float]:
+    """Similarity across each gap; gap i lies between paragraphs i and i+1."""
+    return [
+        _cosine(_window_sum(vectors[max(0, i + 1 - window) : i + 1]), _window_sum(vectors[i + 1 : i + 1 + window]))
+        for i in range(len(vectors) - 1)
+    ]
+
+
+def _depth_scores(similarities: List[float]) -> List[float]:
+    """How far each gap's similarity dips below the nearest peaks on both sides."""
+    depths = []
+    for i, similarity in enumerate(similarities):
+        left = similarity
+        for j in range(i - 1, -1, -1):
+            if similarities[j] < left:
+                break
+            left = similarities[j]
+        right = similarity
+        for j in range(i + 1, len(similarities)):
+            if similarities[j] < right:
+                break
+            right = similarities[j]
+        depths.append((left - similarity) + (right - similarity))
+    return depths
+
+
+def _pick_boundaries(paragraphs: List[Paragraph], depths: List[float], count: int, min_spacing_ms: float) -> List[int]:
+    """
+    Choose the deepest gaps as boundaries, keeping chapters apart.
+
+    Returns:
+        Paragraph indices that start a new chapter, ascending
+    """
+    start_ms = paragraphs[0].start_ms
+    end_ms = paragraphs[-1].end_ms
+    chosen: List[int] = []
+
+    for spacing in (min_spacing_ms, min_spacing_ms / 2, 0):
+        # Deepest first; ties go to the earlier gap
+        for gap in sorted(range(len(depths)), key=lambda g: (-depths[g], g)):
+            if len(chosen) == count:
+                break
+            boundary = gap + 1
+            boundary_ms = paragraphs[boundary].start_ms
+            if boundary in chosen:
+                continue
+            if boundary_ms - start_ms < spacing or end_ms - boundary_ms < spacing:
+                continue
+            if any(abs(boundary_ms - paragraphs[b].start_ms) < spacing for b in chosen):
+                continue
+            chosen.append(boundary)
+        if len(chosen) == count:
+            break
+
+    return sorted(chosen)
+
+
+def _top_terms(vectors: List[Dict[str, float]], count: int) -> List[str]:
+    """Highest-weighted terms across a segment."""
+    total = _window_sum(vectors)
+    return [term for term, _ in sorted(total.items(), key=lambda item: (-item[1], item[0]))[:count]]
@@ -0,0 +1,360 @@
+"""
+SRT Caption Engine
+
+Array-backed caption storage for long SRT files. utils.parse_srt builds one
+SRTCaption object per caption, which is convenient for small edits but slow
+and memory-hungry for multi-hour programs. A CaptionTrack keeps the same
+data in columns:
+- starts / ends: int64 arrays of millisecond timecodes
+- text: all caption text in one string, sliced by a text offset array
+
+Parsing is one pass over the lines with a single compiled timecode pattern,
+so it works the same on an in-memory string or a file handle. Cleaning,
+time lookup and SRT/VTT output all work on the columns without creating
+per-caption objects.
+
+The output matches the utils functions: parse_srt_track(content) holds the
+captions parse_srt(content) returns, track.cleaned() the captions
+clean_srt_captions() returns, and to_srt()/to_vtt() the text of
+generate_srt()/generate_vtt().
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from api.services.utils import SRTCaption, ms_to_srt_timecode
+
+# "HH:MM:SS,mmm --> HH:MM:SS,mmm" (either , or . before milliseconds)
+TIMECODE_LINE = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d{1,2}):(\d{2}):(\d{2})[,.](\d{3})")
+
+
+class CaptionTrack:
+    """
+    Captions stored as parallel arrays.
+
+    Caption i runs from starts[i] to ends[i] (milliseconds) with text
+    text[offsets[i]:offsets[i + 1]]. Tracks are built by the parsers or
+    from_captions() and are not modified in place; cleaned() returns a new
+    track. Time lookups assume captions are in start-time order, as they are
+    in SRT files.
+    """
+
+    __slots__ = ("starts", "ends", "offsets", "text")
+
+    def __init__(self, starts: array, ends: array, offsets: array, text: str):
+        """
+        Initialize track from columns.
+
+        Args:
+            starts: Start times in ms
+            ends: End times in ms
+            offsets: Text offsets, one more than the number of captions
+            text: Concatenated caption text
+        """
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.text = text
+
+    @classmethod
+    def from_columns(cls, starts: Iterable[int], ends: Iterable[int], texts: Iterable[str]) -> "CaptionTrack":
+        """Build a track from start, end and text sequences."""
+        texts = list(texts)
+        offsets = array("q", [0])
+        position = 0
+        for caption_text in texts:
+            position += len(caption_text)
+            offsets.append(position)
+        return cls(array("q", starts), array("q", ends), offsets, "".join(texts))
+
+    @classmethod
+    def from_captions(cls, captions: Iterable[SRTCaption]) -> "CaptionTrack":
+        """Build a track from SRTCaption objects."""
+        captions = list(captions)
+        return cls.from_columns(
+            (c.start_ms for c in captions), (c.end_ms for c in captions), (c.text for c in captions)
+        )
+
+    # =========================================================================
+    # Access
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CaptionTrack):
+            return NotImplemented
+        return (self.starts, self.ends, self.offsets, self.text) == (
+            other.starts,
+            other.ends,
+            other.offsets,
+            other.text,
+        )
+
+    def text_at(self, index: int) -> str:
+        """Text of caption index."""
+        return self.text[self.offsets[index] : self.offsets[index + 1]]
+
+    def texts(self) -> List[str]:
+        """Text of every caption, in order."""
+        text, offsets = self.text, self.offsets
+        return [text[offsets[i] : offsets[i + 1]] for i in range(len(self.starts))]
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str]]:
+        """Iterate (start_ms, end_ms, text) tuples."""
+        return zip(self.starts, self.ends, self.texts())
+
+    def caption(self, index: int) -> SRTCaption:
+        """Caption index as an SRTCaption (numbered from 1)."""
+        return SRTCaption(
+            index=index + 1, start_ms=self.starts[index], end_ms=self.ends[index], text=self.text_at(index)
+        )
+
+    def to_captions(self) -> List[SRTCaption]:
+        """All captions as SRTCaption objects, numbered from 1."""
+        return [
+            SRTCaption(index=i, start_ms=start, end_ms=end, text=caption_text)
+            for i, (start, end, caption_text) in enumerate(self, 1)
+        ]
+
+    @property
+    def duration_ms(self) -> int:
+        """End time of the last-ending caption (as get_srt_duration)."""
+        return max(self.ends) if self.ends else 0
+
+    def plain_text(self, separator: str = " ") -> str:
+        """All caption text joined with separator."""
+        return separator.join(self.texts())
+
+    # =========================================================================
+    # Time lookup
+    # =========================================================================
+
+    def index_at(self, ms: int) -> Optional[int]:
+        """
+        Find the caption showing at a time.
+
+        Args:
+            ms: Time in milliseconds
+
+        Returns:
+            Index of the caption with start <= ms < end, or None between captions
+        """
+        index = bisect_right(self.starts, ms) - 1
+        if index >= 0 and ms < self.ends[index]:
+            return index
+        return None
+
+    def index_before(self, ms: int) -> Optional[int]:
+        """Index of the last caption starting at or before ms, or None if ms precedes the track."""
+        index = bisect_right(self.starts, ms) - 1
+        return index if index >= 0 else None
+
+    def span(self, start_ms: int, end_ms: int) -> Tuple[int, int]:
+        """
+        Index range of captions starting within [start_ms, end_ms).
+
+        Returns:
+            (first, stop) suitable for range() or slicing
+        """
+        return bisect_left(self.starts, start_ms), bisect_left(self.starts, end_ms)
+
+    def slice(self, first: int, stop: int) -> "CaptionTrack":
+        """Captions first..stop-1 as a new track."""
+        count = len(self.starts)
+        first = max(0, min(first, count))
+        stop = max(first, min(stop, count))
+        base = self.offsets[first]
+        offsets = array("q", (offset - base for offset in self.offsets[first : stop + 1]))
+        return CaptionTrack(
+            self.starts[first:stop], self.ends[first:stop], offsets, self.text[base : self.offsets[stop]]
+        )
+
+    # =========================================================================
+    # Cleaning
+    # =========================================================================
+
+    def cleaned(
+        self, min_gap_ms: int = 50, max_duration_ms: int = 7000, merge_threshold_ms: int = 1000
+    ) -> "CaptionTrack":
+        """
+        Clean and normalize captions, as clean_srt_captions() does.
+
+        Drops empty and repeated captions, fixes non-positive durations and
+        overlaps, and merges very short captions into the previous one. One
+        pass over the columns; the track itself is not changed.
+
+        Args:
+            min_gap_ms: Minimum gap between captions (default 50ms)
+            max_duration_ms: Maximum caption duration (default 7000ms, unused as in clean_srt_captions)
+            merge_threshold_ms: Merge captions shorter than this (default 1000ms)
+
+        Returns:
+            New cleaned track
+        """
+        starts: List[int] = []
+        ends: List[int] = []
+        texts: List[str] = []
+
+        prev_start = prev_end = 0
+        prev_text = prev_key = None
+
+        for start, end, caption_text in zip(self.starts, self.ends, self.texts()):
+            key = caption_text.strip()
+            if not key:
+                continue
+
+            if prev_text is not None:
+                # Repeated caption: extend the previous one
+                if key == prev_key:
+                    if end > prev_end:
+                        prev_end = end
+                    continue
+
+            if end <= start:
+                end = start + 1000
+
+            if prev_text is not None:
+                if start < prev_end + min_gap_ms:
+                    start = prev_end + min_gap_ms
+
+                # Very short caption close to the previous one: merge
+                if end - start < merge_threshold_ms and start - prev_end < 500:
+                    prev_text = prev_text + "\n" + caption_text
+                    prev_key = prev_text.strip()
+                    prev_end = end
+                    continue
+
+                starts.append(prev_start)
+                ends.append(prev_end)
+                texts.append(prev_text)
+
+            prev_start, prev_end, prev_text, prev_key = start, end, caption_text, key
+
+        if prev_text is not None:
+            starts.append(prev_start)
+            ends.append(prev_end)
+            texts.append(prev_text)
+
+        return CaptionTrack.from_columns(starts, ends, texts)
+
+    # =========================================================================
+    # Output
+    # =========================================================================
+
+    def to_srt(self) -> str:
+        """SRT file content, numbered from 1 (as generate_srt)."""
+        return "\n".join(
+            f"{i}\n{start} --> {end}\n{caption_text}\n"
+            for i, (start, end, caption_text) in enumerate(self._timecoded(","), 1)
+        )
+
+    def to_vtt(self) -> str:
+        """WebVTT file content (as generate_vtt)."""
+        parts = ["WEBVTT", ""]
+        parts.extend(f"{start} --> {end}\n{caption_text}\n" for start, end, caption_text in self._timecoded("."))
+        return "\n".join(parts)
+
+    def _timecoded(self, separator: str) -> Iterator[Tuple[str, str, str]]:
+        """Iterate (start, end, text) with timecodes formatted "HH:MM:SS{separator}mmm".
+
+        The HH:MM:SS part is formatted once per second and reused, since
+        consecutive captions mostly share it.
+        """
+        seconds_cache = {}
+
+        def timecode(ms: int) -> str:
+            if ms < 0:
+                ms = 0
+            seconds, millis = divmod(ms, 1000)
+            hms = seconds_cache.get(seconds)
+            if hms is None:
+                hms = seconds_cache[seconds] = ms_to_srt_timecode(seconds * 1000)[:8]
+            return f"{hms}{separator}{millis:03d}"
+
+        for start, end, caption_text in self:
+            yield timecode(start), timecode(end), caption_text
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+def parse_srt_track(content: str) -> CaptionTrack:
+    """
+    Parse SRT content into a caption track.
+
+    Accepts the same input as utils.parse_srt: blocks separated by blank
+    lines, each an index line, a timecode line and one or more text lines.
+    Malformed blocks are skipped.
+
+    Args:
+        content: Full SRT file content
+
+    Returns:
+        Parsed track
+    """
+    return _parse_lines(content.split("\n"))
+
+
+def read_srt_track(source: TextIO) -> CaptionTrack:
+    """
+    Parse SRT from an open text file, streaming line by line.
+
+    Args:
+        source: Text file handle
+
+    Returns:
+        Parsed track
+    """
+    return _parse_lines(line.rstrip("\n") for line in source)
+
+
+def load_srt_track(path: Path, encoding: str = "utf-8") -> CaptionTrack:
+    """Parse an SRT file without reading it into memory first."""
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        return read_srt_track(f)
+
+
+def _parse_lines(lines: Iterable[str]) -> CaptionTrack:
+    """Parse SRT lines; the shared single pass behind the parsers."""
+    starts = array("q")
+    ends = array("q")
+    offsets = array("q", [0])
+    texts: List[str] = []
+    position = 0
+    match_timecode = TIMECODE_LINE.match
+
+    block: List[str] = []
+    # A trailing blank line closes the last block
+    for line in chain(lines, [""]):
+        if line.strip():
+            block.append(line)
+            continue
+        if not block:
+            continue
+
+        if len(block) >= 3:
+            try:
+                int(block[0].strip())
+            except ValueError:
+                block = []
+                continue
+            m = match_timecode(block[1].strip())
+            if m:
+                h1, m1, s1, ms1, h2, m2, s2, ms2 = m.groups()
+                starts.append(((int(h1) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1))
+                ends.append(((int(h2) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2))
+                caption_text = "\n".join(block[2:]).strip()
+                texts.append(caption_text)
+                position += len(caption_text)
+                offsets.append(position)
+        block = []
+
+    return CaptionTrack(starts, ends, offsets, "".join(texts))
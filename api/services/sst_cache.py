@@ -0,0 +1,333 @@
+"""
+SST Record Cache
+
+SQLite-backed cache of Airtable SST (Single Source of Truth) records, keyed by
+Airtable record ID and Media ID. The API, worker and MCP server all open the
+same dashboard.db, so a record fetched by one process is served to the others
+without another Airtable call.
+
+Read policy:
+- Fresh (younger than ttl_seconds): served from the cache
+- Stale (younger than max_stale_seconds): served from the cache while a
+  background refresh revalidates it (stale-while-revalidate)
+- Expired or missing: fetched from Airtable before returning
+
+Concurrent lookups for the same key within a process share one in-flight
+Airtable request (single-flight). If a refresh fails and a cached copy exists,
+the cached copy is returned instead of the error.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from api.services.database import get_session
+from api.services.utils import parse_iso_datetime
+
+logger = logging.getLogger(__name__)
+
+# Default freshness bounds
+DEFAULT_TTL_SECONDS = 15 * 60
+DEFAULT_MAX_STALE_SECONDS = 24 * 60 * 60
+DEFAULT_MISS_TTL_SECONDS = 5 * 60
+
+FetchFunc = Callable[[str], Awaitable[Optional[dict]]]
+
+
+class SSTCache:
+    """
+    Read-through cache for SST records.
+
+    Callers pass the function that fetches from Airtable, so the cache has no
+    Airtable dependency of its own. See AirtableClient for the usual entry points.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_stale_seconds: int = DEFAULT_MAX_STALE_SECONDS,
+        miss_ttl_seconds: int = DEFAULT_MISS_TTL_SECONDS,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Age up to which a cached record is served without refresh
+            max_stale_seconds: Age up to which a stale record is served while
+                refreshing in the background
+            miss_ttl_seconds: How long a Media ID with no SST record is remembered
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.miss_ttl_seconds = miss_ttl_seconds
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._misses: Dict[str, float] = {}  # media_id -> monotonic time of confirmed miss
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    async def get_record(
+        self,
+        record_id: str,
+        fetch: FetchFunc,
+        max_age_seconds: Optional[int] = None,
+    ) -> Optional[dict]:
+        """
+        Get an SST record by Airtable record ID.
+
+        Args:
+            record_id: Airtable record ID (e.g., "recXXXXXXXXXXXXXX")
+            fetch: Coroutine function fetching the record from Airtable
+            max_age_seconds: Override freshness bound. When set, a cached copy
+                older than this is never served without a refresh attempt
+                (use 0 to force a fetch).
+
+        Returns:
+            Record dict if found, None if not found
+        """
+        cached = await self._read("record_id = :key", {"key": record_id})
+
+        async def refresh() -> Optional[dict]:
+            record = await fetch(record_id)
+            if record:
+                await self.store(record)
+            else:
+                await self.invalidate(record_id=record_id)
+            return record
+
+        return await self._resolve(f"record:{record_id}", cached, refresh, max_age_seconds)
+
+    async def get_by_media_id(
+        self,
+        media_id: str,
+        fetch: FetchFunc,
+        max_age_seconds: Optional[int] = None,
+    ) -> Optional[dict]:
+        """
+        Get an SST record by Media ID.
+
+        Args:
+            media_id: Media ID to search for (e.g., "2WLI1209HD")
+            fetch: Coroutine function searching Airtable by Media ID
+            max_age_seconds: Override freshness bound (use 0 to force a fetch)
+
+        Returns:
+            Record dict if found, None if no SST record has this Media ID
+        """
+        cached = await self._read("media_id = :key", {"key": media_id})
+
+        if cached is None and max_age_seconds is None:
+            missed_at = self._misses.get(media_id)
+            if missed_at is not None and time.monotonic() - missed_at < self.miss_ttl_seconds:
+                return None
+
+        async def refresh() -> Optional[dict]:
+            record = await fetch(media_id)
+            await self.record_media_id_lookup(media_id, record)
+            return record
+
+        return await self._resolve(f"media:{media_id}", cached, refresh, max_age_seconds)
+
+    async def peek_by_media_id(self, media_id: str) -> Tuple[bool, Optional[dict]]:
+        """
+        Get a fresh cached answer for a Media ID without fetching.
+
+        Batch callers use this to look up only the Media IDs the cache can't
+        answer, then report results back with record_media_id_lookup().
+
+        Args:
+            media_id: Media ID to look up
+
+        Returns:
+            (True, record) for a fresh cached record, (True, None) for a recently
+            confirmed miss, (False, None) when Airtable has to be asked
+        """
+        cached = await self._read("media_id = :key", {"key": media_id})
+        if cached is not None:
+            record, age = cached
+            return (True, record) if age <= self.ttl_seconds else (False, None)
+
+        missed_at = self._misses.get(media_id)
+        if missed_at is not None and time.monotonic() - missed_at < self.miss_ttl_seconds:
+            return True, None
+        return False, None
+
+    async def _resolve(
+        self,
+        key: str,
+        cached: Optional[tuple[dict, float]],
+        refresh: Callable[[], Awaitable[Optional[dict]]],
+        max_age_seconds: Optional[int],
+    ) -> Optional[dict]:
+        """Apply the fresh / stale-while-revalidate / fetch policy to a lookup."""
+        if cached is not None:
+            record, age = cached
+            if max_age_seconds is not None:
+                if age <= max_age_seconds:
+                    return record
+            elif age <= self.ttl_seconds:
+                return record
+            elif age <= self.max_stale_seconds:
+                self._refresh_in_background(key, refresh)
+                return record
+
+        try:
+            return await self._single_flight(key, refresh)
+        except Exception as e:
+            if cached is not None:
+                logger.warning(f"SST refresh failed for {key}, serving cached copy: {e}")
+                return cached[0]
+            raise
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    async def store(self, record: dict, media_id: Optional[str] = None) -> None:
+        """
+        Store a full SST record in the cache.
+
+        Only store complete records (not field-limited search results), since
+        cached records are served to callers expecting every field.
+
+        Args:
+            record: Airtable record dict ({"id": ..., "fields": {...}, ...})
+            media_id: Media ID the record was looked up by (defaults to the
+                record's Media ID field)
+        """
+        record_id = record.get("id")
+        if not record_id:
+            return
+
+        media_id = media_id or record.get("fields", {}).get("Media ID")
+
+        try:
+            async with get_session() as session:
+                query = text("""
+                    INSERT INTO sst_records (record_id, media_id, record_json, fetched_at)
+                    VALUES (:record_id, :media_id, :record_json, :fetched_at)
+                    ON CONFLICT(record_id) DO UPDATE SET
+                        media_id = excluded.media_id,
+                        record_json = excluded.record_json,
+                        fetched_at = excluded.fetched_at
+                """)
+                await session.execute(
+                    query,
+                    {
+                        "record_id": record_id,
+                        "media_id": media_id,
+                        "record_json": json.dumps(record),
+                        "fetched_at": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+        except Exception as e:
+            logger.debug(f"Could not cache SST record {record_id}: {e}")
+
+    async def record_media_id_lookup(self, media_id: str, record: Optional[dict]) -> None:
+        """Store the result of an Airtable lookup by Media ID (a full record or None for a miss)."""
+        if record:
+            self._misses.pop(media_id, None)
+            await self.store(record, media_id=media_id)
+        else:
+            self._misses[media_id] = time.monotonic()
+            await self.invalidate(media_id=media_id)
+
+    async def invalidate(self, record_id: Optional[str] = None, media_id: Optional[str] = None) -> None:
+        """Remove cached records by record ID and/or Media ID."""
+        try:
+            async with get_session() as session:
+                if record_id:
+                    await session.execute(
+                        text("DELETE FROM sst_records WHERE record_id = :record_id"),
+                        {"record_id": record_id},
+                    )
+                if media_id:
+                    await session.execute(
+                        text("DELETE FROM sst_records WHERE media_id = :media_id"),
+                        {"media_id": media_id},
+                    )
+        except Exception as e:
+            logger.debug(f"Could not invalidate cached SST record: {e}")
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _read(self, where: str, params: dict) -> Optional[tuple[dict, float]]:
+        """Read a cached record and its age in seconds, or None on miss/error."""
+        try:
+            async with get_session() as session:
+                query = text(f"""
+                    SELECT record_json, fetched_at
+                    FROM sst_records
+                    WHERE {where}
+                    ORDER BY fetched_at DESC
+                    LIMIT 1
+                """)
+                result = await session.execute(query, params)
+                row = result.fetchone()
+        except Exception as e:
+            logger.debug(f"SST cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            fetched_at = parse_iso_datetime(str(row.fetched_at))
+            age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+            return json.loads(row.record_json), age
+        except ValueError as e:
+            logger.debug(f"Ignoring unreadable SST cache row: {e}")
+            return None
+
+    async def _single_flight(self, key: str, refresh: Callable[[], Awaitable[Optional[dict]]]) -> Optional[dict]:
+        """Run refresh once per key; concurrent callers await the same task."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(refresh())
+            self._inflight[key] = task
+
+            def _done(t: asyncio.Task) -> None:
+                if self._inflight.get(key) is t:
+                    del self._inflight[key]
+
+            task.add_done_callback(_done)
+
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    def _refresh_in_background(self, key: str, refresh: Callable[[], Awaitable[Optional[dict]]]) -> None:
+        """Revalidate a stale entry without blocking the caller."""
+        if key in self._inflight:
+            return
+
+        async def run() -> None:
+            try:
+                await self._single_flight(key, refresh)
+            except Exception as e:
+                logger.warning(f"Background SST refresh failed for {key}: {e}")
+
+        task = asyncio.ensure_future(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
+# Global cache instance
+_sst_cache: Optional[SSTCache] = None
+
+
+def get_sst_cache() -> SSTCache:
+    """Get or create global SST cache instance."""
+    global _sst_cache
+    if _sst_cache is None:
+        _sst_cache = SSTCache()
+    return _sst_cache
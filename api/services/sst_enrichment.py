@@ -0,0 +1,147 @@
+"""
+SST Enrichment Service
+
+Links jobs to their Airtable SST records after the jobs are created, so
+upload and queue requests don't wait on Airtable. Lookups go through the
+shared SST cache; Media IDs it can't answer are batched into OR-formula
+queries (one request per 50 Media IDs) through the rate-limited Airtable
+gateway, and the fetched records are written back to the cache.
+
+Single-job callers (POST /api/queue) enqueue onto the enrichment queue,
+which collects jobs for a short window and links them in one batch.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from api.models.job import JobUpdate
+from api.services import database
+from api.services.airtable import AirtableClient
+
+logger = logging.getLogger(__name__)
+
+
+async def link_jobs_to_sst(jobs: List[Tuple[int, str]]) -> int:
+    """
+    Look up SST records for jobs and store the links.
+
+    Failures are logged and never raised; a job that can't be linked simply
+    has no SST link, as with a failed inline lookup. Each linked job is
+    broadcast over WebSocket by update_job.
+
+    Args:
+        jobs: (job_id, media_id) pairs
+
+    Returns:
+        Number of jobs linked to an SST record
+    """
+    jobs = [(job_id, media_id) for job_id, media_id in jobs if media_id]
+    if not jobs:
+        return 0
+
+    try:
+        airtable_client = AirtableClient()
+    except ValueError as e:
+        logger.warning(f"Skipping SST linking for {len(jobs)} jobs: {e}")
+        return 0
+
+    media_ids = list(dict.fromkeys(media_id for _, media_id in jobs))
+    try:
+        records = await airtable_client.batch_get_sst_by_media_ids(media_ids)
+    except Exception as e:
+        logger.warning(f"Airtable lookup failed for {len(jobs)} jobs - {e}")
+        return 0
+
+    linked = 0
+    for job_id, media_id in jobs:
+        record = records.get(media_id)
+        if not record:
+            logger.warning(f"Job {job_id}: No SST record found for {media_id}")
+            continue
+
+        record_id = record["id"]
+        update = JobUpdate(
+            airtable_record_id=record_id,
+            airtable_url=airtable_client.get_sst_url(record_id),
+            media_id=media_id,
+        )
+        try:
+            await database.update_job(job_id, update)
+        except Exception as e:
+            logger.warning(f"Job {job_id}: SST linking failed - {e}")
+            continue
+        logger.info(f"Job {job_id}: Linked to SST record {record_id}")
+        linked += 1
+
+    return linked
+
+
+class SSTEnrichmentQueue:
+    """
+    In-process queue that links newly created jobs to SST records in batches.
+
+    enqueue() returns immediately. A drain task waits BATCH_DELAY_SECONDS so
+    jobs queued close together share one lookup, then links up to BATCH_SIZE
+    jobs per pass until the queue is empty. Pending jobs are held in memory
+    only, so jobs queued just before a restart stay unlinked.
+    """
+
+    BATCH_SIZE = 50
+    BATCH_DELAY_SECONDS = 0.5
+
+    def __init__(self, batch_delay: float = BATCH_DELAY_SECONDS):
+        """
+        Initialize queue.
+
+        Args:
+            batch_delay: Seconds to collect jobs before each lookup
+        """
+        self.batch_delay = batch_delay
+        self._pending: Dict[int, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def enqueue(self, job_id: int, media_id: Optional[str]) -> None:
+        """Schedule a job for SST linking (no-op without a Media ID)."""
+        if not media_id:
+            return
+
+        self._pending[job_id] = media_id
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._task = loop.create_task(self._drain())
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued job has been processed."""
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    async def _drain(self) -> None:
+        """Link pending jobs in batches until the queue is empty."""
+        while self._pending:
+            await asyncio.sleep(self.batch_delay)
+
+            batch = list(self._pending.items())[: self.BATCH_SIZE]
+            for job_id, _ in batch:
+                del self._pending[job_id]
+
+            try:
+                linked = await link_jobs_to_sst(batch)
+                logger.info(f"SST enrichment: linked {linked}/{len(batch)} jobs")
+            except Exception as e:
+                logger.error(f"SST enrichment batch failed: {e}")
+
+
+# Global queue instance
+_sst_enrichment_queue: Optional[SSTEnrichmentQueue] = None
+
+
+def get_sst_enrichment_queue() -> SSTEnrichmentQueue:
+    """Get or create global SST enrichment queue."""
+    global _sst_enrichment_queue
+    if _sst_enrichment_queue is None:
+        _sst_enrichment_queue = SSTEnrichmentQueue()
+    return _sst_enrichment_queue
@@ -0,0 +1,194 @@
+"""
+Structured Outputs
+
+Pydantic models for the phases that return structured results (SEO and
+manager), a tolerant JSON extractor for backends that can't constrain
+their output to a schema, and markdown rendering so the validated result
+is saved in the same *_output.md format as a free-form reply.
+
+Backends that support it (see LLMClient.supports_structured_outputs)
+receive a JSON schema response_format; every backend also gets the schema
+in its system prompt. Replies are validated locally, so a malformed one
+can be repaired with a single follow-up call on the same tier instead of
+an escalation and recovery round trip.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class StructuredOutputError(ValueError):
+    """A reply could not be parsed into the phase's output model."""
+
+
+class SEOMetadata(BaseModel):
+    """SEO phase output."""
+
+    title: str = Field(..., min_length=1, description="Compelling, keyword-rich title under 60 characters")
+    short_description: str = Field(..., min_length=1, description="1-2 sentences, about 150 characters")
+    long_description: str = Field(..., min_length=1, description="2-3 engaging paragraphs")
+    tags: List[str] = Field(..., min_length=1, description="10-15 relevant keywords")
+    categories: List[str] = Field(default_factory=list)
+    notes: Optional[str] = Field(None, description="Anything the editor should review")
+
+    def to_markdown(self) -> str:
+        tags = "\n".join(f"- {tag}" for tag in self.tags)
+        lines = [
+            "# SEO Metadata",
+            "",
+            f"**Title:** {self.title}",
+            "",
+            f"**Short Description:** {self.short_description}",
+            "",
+            "## Long Description",
+            "",
+            self.long_description,
+            "",
+            "## Tags",
+            "",
+            tags,
+        ]
+        if self.categories:
+            lines += ["", f"**Categories:** {', '.join(self.categories)}"]
+        if self.notes:
+            lines += ["", "## Notes", "", self.notes]
+        return "\n".join(lines) + "\n"
+
+
+class ChecklistItem(BaseModel):
+    item: str = Field(..., description="What was checked, e.g. 'SEO: title under 60 characters'")
+    passed: bool
+    note: str = ""
+
+
+class QAIssue(BaseModel):
+    severity: Literal["CRITICAL", "MAJOR", "MINOR"]
+    phase: str = Field(..., description="Phase whose output has the issue (analyst, formatter, seo)")
+    description: str
+
+
+class QAReview(BaseModel):
+    """Manager phase output."""
+
+    overall_status: Literal["APPROVED", "NEEDS_REVISION"]
+    checklist: List[ChecklistItem] = Field(default_factory=list)
+    issues: List[QAIssue] = Field(default_factory=list)
+    recommendation: str = Field(..., min_length=1)
+
+    def to_markdown(self) -> str:
+        lines = ["# QA Review", "", f"**Overall Status:** {self.overall_status}", "", "## Checklist", ""]
+        for check in self.checklist:
+            note = f" - {check.note}" if check.note else ""
+            lines.append(f"- [{'PASS' if check.passed else 'FAIL'}] {check.item}{note}")
+        lines += ["", "## Issues", ""]
+        lines += [f"- **{issue.severity}** ({issue.phase}): {issue.description}" for issue in self.issues] or ["None"]
+        lines += ["", "## Recommendation", "", self.recommendation]
+        return "\n".join(lines) + "\n"
+
+
+OUTPUT_MODELS: Dict[str, Type[BaseModel]] = {
+    "seo": SEOMetadata,
+    "manager": QAReview,
+}
+
+
+def response_format(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAI-style response_format constraining replies to the model's JSON schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "schema": model.model_json_schema()},
+    }
+
+
+def schema_instructions(model: Type[BaseModel]) -> str:
+    """System prompt addendum asking for a JSON reply matching the model's schema."""
+    schema = json.dumps(model.model_json_schema(), indent=2)
+    return f"""## Output Format
+
+Instead of a markdown report, reply with a single JSON object matching this JSON schema, and nothing else:
+
+```json
+{schema}
+```"""
+
+
+def _json_object_span(text: str) -> Optional[str]:
+    """The first balanced {...} in text, ignoring braces inside strings."""
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = escaped = False
+        for index in range(start, len(text)):
+            char = text[index]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start : index + 1]
+        start = text.find("{", start + 1)
+    return None
+
+
+def extract_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Pull a JSON object out of a model reply.
+
+    Tolerates code fences, prose around the object and trailing commas.
+
+    Returns:
+        The object, or None if the reply holds no parseable JSON object
+    """
+    span = _json_object_span(text)
+    if span is None:
+        return None
+    for candidate in (span, re.sub(r",\s*([}\]])", r"\1", span)):
+        try:
+            data = json.loads(candidate)
+        except ValueError:
+            continue
+        return data if isinstance(data, dict) else None
+    return None
+
+
+def parse_structured(model: Type[BaseModel], text: str) -> Tuple[Optional[BaseModel], Optional[str]]:
+    """
+    Parse and validate a reply against an output model.
+
+    Returns:
+        (validated model, None) or (None, description of what was wrong)
+    """
+    data = extract_json(text)
+    if data is None:
+        return None, "reply does not contain a JSON object"
+    try:
+        return model.model_validate(data), None
+    except ValidationError as e:
+        problems = [f"{'.'.join(str(part) for part in err['loc']) or 'object'}: {err['msg']}" for err in e.errors()]
+        return None, "; ".join(problems[:10])
+
+
+def repair_request(reply: str, error: str) -> List[Dict[str, str]]:
+    """Messages asking the model to correct a reply that failed validation."""
+    return [
+        {"role": "assistant", "content": reply},
+        {
+            "role": "user",
+            "content": (
+                f"That reply did not match the required JSON schema: {error}\n\n"
+                "Reply again with only the corrected JSON object."
+            ),
+        },
+    ]
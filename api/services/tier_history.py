@@ -0,0 +1,249 @@
+"""
+Tier History
+
+Historical per-attempt outcomes of each phase by tier, bucketed by
+content duration, and the expected-cost model that picks a phase's
+starting tier from them (routing.tier_selection.mode = "history").
+
+Outcomes come from the phase events the worker logs to session_stats:
+every attempt logs phase_started with its tier; a success logs
+phase_completed with cost and elapsed time; a failure that escalates logs
+a phase_started escalation event with from_tier and elapsed time.
+
+Starting at tier s, the expected cost of a phase is
+
+    E(s) = sum over t >= s of P(reach t) * (mean cost_t + latency weight * mean seconds_t)
+
+where P(reach t) is the chance every attempt below t (from s) failed.
+Guardrails: every tier on the path needs min_samples attempts, the
+start may move at most max_shift tiers from the static duration-threshold
+choice and never below the phase's base tier, and the static choice is
+kept unless another start saves at least min_savings.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+from api.services.database import get_session
+
+# Fallback when a job has no duration: transcript words per minute
+WORDS_PER_MINUTE = 150
+
+# Paths less likely than this to reach a tier don't need samples for it
+NEGLIGIBLE_REACH = 0.02
+
+
+@dataclass
+class TierStats:
+    """Attempt outcomes for one phase, duration bucket and tier."""
+
+    attempts: int = 0
+    successes: int = 0
+    total_cost: float = 0.0  # over successes
+    total_seconds: float = 0.0  # over timed attempts
+    timed: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_cost(self) -> float:
+        return self.total_cost / self.successes if self.successes else 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.timed if self.timed else 0.0
+
+
+@dataclass
+class TierHistory:
+    """Tier outcomes keyed by (phase, duration bucket, tier)."""
+
+    bounds: List[Optional[float]]  # bucket upper bounds in minutes; None is unbounded
+    days: int
+    stats: Dict[Tuple[str, int, int], TierStats] = field(default_factory=dict)
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def bucket(self, duration_minutes: float) -> int:
+        for index, bound in enumerate(self.bounds):
+            if bound is None or duration_minutes <= bound:
+                return index
+        return len(self.bounds)
+
+    def bucket_label(self, index: int) -> str:
+        lower = self.bounds[index - 1] if 0 < index <= len(self.bounds) else None
+        upper = self.bounds[index] if index < len(self.bounds) else None
+        if upper is None:
+            return f">{lower:g}min" if lower is not None else "all durations"
+        return f"{lower:g}-{upper:g}min" if lower is not None else f"≤{upper:g}min"
+
+    def get(self, phase: str, bucket: int, tier: int) -> TierStats:
+        return self.stats.get((phase, bucket, tier), TierStats())
+
+    def record(self, phase: str, bucket: int, tier: int) -> TierStats:
+        return self.stats.setdefault((phase, bucket, tier), TierStats())
+
+
+def duration_bounds(routing_config: Dict[str, Any]) -> List[Optional[float]]:
+    """Bucket upper bounds from routing.duration_thresholds, ending unbounded."""
+    bounds: List[Optional[float]] = [t.get("max_minutes") for t in routing_config.get("duration_thresholds", [])]
+    if not bounds or bounds[-1] is not None:
+        bounds.append(None)
+    return bounds
+
+
+def build_tier_history(
+    rows: Sequence[Tuple[str, Optional[str], Optional[float], Optional[int]]],
+    bounds: List[Optional[float]],
+    days: int,
+) -> TierHistory:
+    """
+    Aggregate phase events into tier outcomes.
+
+    Args:
+        rows: (event_type, data JSON, job duration_minutes, job word_count)
+        bounds: Duration bucket upper bounds
+        days: Look-back window the rows cover
+
+    Returns:
+        TierHistory
+    """
+    history = TierHistory(bounds=bounds, days=days)
+    for event_type, raw, job_duration, word_count in rows:
+        try:
+            data = json.loads(raw) if raw else {}
+        except ValueError:
+            continue
+        phase = data.get("phase")
+        extra = data.get("extra") or {}
+        if not phase:
+            continue
+        duration = extra.get("duration_minutes", job_duration)
+        if duration is None:
+            duration = (word_count or 0) / WORDS_PER_MINUTE
+        bucket = history.bucket(float(duration))
+
+        if event_type == "phase_started" and extra.get("escalation"):
+            if extra.get("from_tier") is None:
+                continue
+            stats = history.record(phase, bucket, int(extra["from_tier"]))
+            if extra.get("elapsed_seconds") is not None:
+                stats.total_seconds += float(extra["elapsed_seconds"])
+                stats.timed += 1
+        elif event_type == "phase_started" and extra.get("tier") is not None:
+            history.record(phase, bucket, int(extra["tier"])).attempts += 1
+        elif event_type == "phase_completed" and extra.get("tier") is not None:
+            stats = history.record(phase, bucket, int(extra["tier"]))
+            stats.successes += 1
+            stats.total_cost += float(data.get("cost") or 0)
+            if extra.get("elapsed_seconds") is not None:
+                stats.total_seconds += float(extra["elapsed_seconds"])
+                stats.timed += 1
+    return history
+
+
+async def load_tier_history(routing_config: Dict[str, Any], days: int = 30) -> TierHistory:
+    """Load phase events from session_stats and aggregate them into a TierHistory."""
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    query = text("""
+        SELECT s.event_type, s.data, j.duration_minutes, j.word_count
+        FROM session_stats s
+        LEFT JOIN jobs j ON s.job_id = j.id
+        WHERE s.event_type IN ('phase_started', 'phase_completed')
+          AND s.timestamp >= :since
+    """)
+    async with get_session() as session:
+        result = await session.execute(query, {"since": since.isoformat()})
+        rows = result.fetchall()
+    return build_tier_history(rows, duration_bounds(routing_config), days)
+
+
+def expected_cost(
+    history: TierHistory,
+    phase: str,
+    bucket: int,
+    start_tier: int,
+    max_tier: int,
+    latency_cost_per_minute: float,
+    min_samples: int,
+) -> Optional[float]:
+    """Expected cost (USD, with latency priced in) of starting a phase at start_tier.
+
+    Returns None when a tier the phase would plausibly reach has fewer than
+    min_samples attempts.
+    """
+    total = 0.0
+    reach = 1.0
+    for tier in range(start_tier, max_tier + 1):
+        if reach < NEGLIGIBLE_REACH:
+            break
+        stats = history.get(phase, bucket, tier)
+        if stats.attempts < min_samples:
+            return None
+        total += reach * (stats.mean_cost + latency_cost_per_minute * stats.mean_seconds / 60)
+        reach *= 1 - stats.success_rate
+    return total
+
+
+def choose_start_tier(
+    history: TierHistory,
+    phase: str,
+    duration_minutes: float,
+    static_tier: int,
+    static_reason: str,
+    base_tier: int,
+    max_tier: int,
+    tier_labels: List[str],
+    settings: Dict[str, Any],
+) -> Tuple[int, str]:
+    """
+    Pick the starting tier with the lowest expected cost, within guardrails.
+
+    Args:
+        history: Historical tier outcomes
+        phase: Phase name
+        duration_minutes: Estimated content duration
+        static_tier: Tier the duration thresholds chose
+        static_reason: Reason string for the static choice
+        base_tier: The phase's base tier (floor)
+        max_tier: Highest tier index
+        tier_labels: Tier names for the reason string
+        settings: routing.tier_selection config
+
+    Returns:
+        (tier, reason)
+    """
+    min_samples = settings.get("min_samples", 10)
+    max_shift = settings.get("max_shift", 1)
+    min_savings = settings.get("min_savings", 0.1)
+    latency_cost = settings.get("latency_cost_per_minute", 0.01)
+
+    def label(tier: int) -> str:
+        return tier_labels[tier] if tier < len(tier_labels) else f"tier-{tier}"
+
+    bucket = history.bucket(duration_minutes)
+    where = f"{phase}, {history.bucket_label(bucket)}, last {history.days}d"
+    costs = {
+        tier: expected_cost(history, phase, bucket, tier, max_tier, latency_cost, min_samples)
+        for tier in range(max(base_tier, static_tier - max_shift), min(max_tier, static_tier + max_shift) + 1)
+    }
+    static_cost = costs.get(static_tier)
+    if static_cost is None:
+        return static_tier, f"{static_reason} (history: fewer than {min_samples} samples for {where})"
+
+    best_tier = min((tier for tier, cost in costs.items() if cost is not None), key=lambda tier: costs[tier])
+    stats = history.get(phase, bucket, static_tier)
+    observed = f"{label(static_tier)} succeeds {stats.success_rate:.0%} of {stats.attempts} attempts"
+    if best_tier == static_tier or costs[best_tier] > static_cost * (1 - min_savings):
+        return static_tier, f"{static_reason}; history agrees ({where}: {observed}, expected ${static_cost:.4f})"
+
+    direction = "up" if best_tier > static_tier else "down"
+    return best_tier, (
+        f"history ({where}): {observed}; starting {direction} at {label(best_tier)} "
+        f"cuts expected cost ${static_cost:.4f} → ${costs[best_tier]:.4f}"
+    )
@@ -0,0 +1,274 @@
+"""
+Transcript Artifacts
+
+Single-pass transcript ingestion. A job's transcript (and its companion SRT,
+if any) is read and decoded once, and the result is stored as
+transcript_artifact.json in the job's project directory:
+- Decoded transcript content and the encoding it was read with
+- Plain text (caption text only when the transcript itself is an SRT)
+- Word count
+- Caption arrays (a CaptionTrack of start/end/text columns) and duration from the SRT
+
+The worker builds or loads the artifact when a job starts, and the later
+stages (routing metrics, the timestamp phase, duration checks, phase
+retries) read it instead of going back to the transcript files. A stored
+artifact is reused as long as the source files' size and mtime still
+match, so re-processing an edited transcript rebuilds it.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+
+from api.services.srt import CaptionTrack, parse_srt_track
+from api.services.utils import calculate_transcript_metrics
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FILENAME = "transcript_artifact.json"
+ARTIFACT_VERSION = 2
+
+# Tried in order; iso-8859-1 accepts any byte sequence, so decoding never fails
+ENCODINGS = ["utf-8", "iso-8859-1"]
+
+WORDS_PER_MINUTE = 150
+
+
+def decode_transcript_bytes(data: bytes) -> Tuple[str, str]:
+    """
+    Decode transcript bytes with the first encoding that accepts them.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        Tuple of (text, encoding)
+    """
+    for encoding in ENCODINGS:
+        try:
+            return data.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace"), "utf-8"
+
+
+def read_transcript_text(path: Path) -> Tuple[str, str]:
+    """Read and decode a transcript file. Returns (text, encoding)."""
+    with open(path, "rb") as f:
+        return decode_transcript_bytes(f.read())
+
+
+@dataclass
+class SourceFile:
+    """A decoded source file and the stat values used to detect changes."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    encoding: str
+    content: str
+
+    @classmethod
+    def read(cls, path: Path) -> "SourceFile":
+        """Read and decode a file."""
+        stat = os.stat(path)
+        content, encoding = read_transcript_text(path)
+        return cls(path=str(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns, encoding=encoding, content=content)
+
+    def is_current(self, path: Path) -> bool:
+        """Whether the file at path is still the one this was read from."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return str(path) == self.path and stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+@dataclass
+class TranscriptArtifact:
+    """Normalized transcript data shared by every stage of a job."""
+
+    transcript: SourceFile
+    plain_text: str
+    word_count: int
+    srt: Optional[SourceFile] = None
+    captions: CaptionTrack = field(default_factory=lambda: parse_srt_track(""))
+    duration_ms: int = 0
+    version: int = ARTIFACT_VERSION
+
+    @property
+    def content(self) -> str:
+        """Decoded transcript content, as sent to the agents."""
+        return self.transcript.content
+
+    @property
+    def srt_content(self) -> Optional[str]:
+        """Decoded SRT content, if the job has an SRT."""
+        return self.srt.content if self.srt else None
+
+    @property
+    def srt_path(self) -> Optional[Path]:
+        """Path of the SRT the captions came from."""
+        return Path(self.srt.path) if self.srt else None
+
+    @property
+    def is_caption_transcript(self) -> bool:
+        """Whether the transcript itself is the SRT (rather than a .txt with a companion SRT)."""
+        return self.srt is not None and self.srt.path == self.transcript.path
+
+    @property
+    def duration_minutes(self) -> float:
+        """Duration from the captions, or estimated from the word count without them."""
+        if self.duration_ms:
+            return self.duration_ms / 60000
+        return round(self.word_count / WORDS_PER_MINUTE, 2)
+
+    def metrics(self, long_form_threshold_minutes: int = 15) -> dict:
+        """Routing metrics, as calculate_transcript_metrics() returns for the content."""
+        estimated_duration_minutes = round(self.word_count / WORDS_PER_MINUTE, 2)
+        return {
+            "word_count": self.word_count,
+            "estimated_duration_minutes": estimated_duration_minutes,
+            "is_long_form": estimated_duration_minutes > long_form_threshold_minutes,
+        }
+
+    def is_current(self, transcript_path: Path, srt_path: Optional[Path]) -> bool:
+        """Whether the artifact was built from the given files as they are now."""
+        if self.version != ARTIFACT_VERSION or not self.transcript.is_current(transcript_path):
+            return False
+        srt_path = _caption_source(transcript_path, srt_path)
+        if srt_path is None:
+            return self.srt is None
+        return self.srt is not None and self.srt.is_current(srt_path)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "version": self.version,
+            "transcript": asdict(self.transcript),
+            "plain_text": self.plain_text,
+            "word_count": self.word_count,
+            "srt": asdict(self.srt) if self.srt else None,
+            "captions": {
+                "starts": self.captions.starts.tolist(),
+                "ends": self.captions.ends.tolist(),
+                "texts": self.captions.texts(),
+            },
+            "duration_ms": self.duration_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TranscriptArtifact":
+        """Deserialize from to_dict() output."""
+        return cls(
+            transcript=SourceFile(**data["transcript"]),
+            plain_text=data["plain_text"],
+            word_count=data["word_count"],
+            srt=SourceFile(**data["srt"]) if data.get("srt") else None,
+            captions=CaptionTrack.from_columns(
+                data["captions"]["starts"], data["captions"]["ends"], data["captions"]["texts"]
+            ),
+            duration_ms=data.get("duration_ms", 0),
+            version=data.get("version", 0),
+        )
+
+
+def build_artifact(transcript_path: Path, srt_path: Optional[Path] = None) -> TranscriptArtifact:
+    """
+    Read a transcript and optional SRT once and normalize them.
+
+    An SRT transcript is its own caption source when no separate SRT is given.
+
+    Args:
+        transcript_path: Transcript file (.txt or .srt)
+        srt_path: Companion SRT file, if any
+
+    Returns:
+        New artifact
+    """
+    transcript = SourceFile.read(transcript_path)
+    srt_path = _caption_source(transcript_path, srt_path)
+    if srt_path is None:
+        srt = None
+    elif srt_path == Path(transcript_path):
+        srt = transcript
+    else:
+        srt = SourceFile.read(srt_path)
+
+    captions = parse_srt_track(srt.content if srt else "")
+
+    if srt is transcript and captions:
+        plain_text = captions.plain_text()
+    else:
+        plain_text = transcript.content
+
+    return TranscriptArtifact(
+        transcript=transcript,
+        plain_text=plain_text,
+        word_count=calculate_transcript_metrics(transcript.content)["word_count"],
+        srt=srt,
+        captions=captions,
+        duration_ms=captions.duration_ms,
+    )
+
+
+def _caption_source(transcript_path: Path, srt_path: Optional[Path]) -> Optional[Path]:
+    """The file captions are read from: the given SRT, else the transcript if it is an SRT."""
+    if srt_path is not None:
+        return Path(srt_path)
+    if Path(transcript_path).suffix.lower() == ".srt":
+        return Path(transcript_path)
+    return None
+
+
+def load_artifact(project_path: Path) -> Optional[TranscriptArtifact]:
+    """Load a stored artifact from a project directory, or None if missing or unreadable."""
+    artifact_file = project_path / ARTIFACT_FILENAME
+    if not artifact_file.exists():
+        return None
+    try:
+        return TranscriptArtifact.from_dict(json.loads(artifact_file.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable transcript artifact {artifact_file}: {e}")
+        return None
+
+
+def save_artifact(project_path: Path, artifact: TranscriptArtifact) -> None:
+    """Write an artifact to a project directory."""
+    artifact_file = project_path / ARTIFACT_FILENAME
+    tmp_file = artifact_file.with_name(artifact_file.name + ".tmp")
+    tmp_file.write_text(json.dumps(artifact.to_dict(), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_file, artifact_file)
+
+
+def ingest_transcript(
+    transcript_path: Path, srt_path: Optional[Path] = None, project_path: Optional[Path] = None
+) -> TranscriptArtifact:
+    """
+    Get the artifact for a transcript, reusing the stored one while its sources are unchanged.
+
+    Args:
+        transcript_path: Transcript file
+        srt_path: Companion SRT file, if any
+        project_path: Project directory to store the artifact in (not stored if None)
+
+    Returns:
+        Stored or newly built artifact
+    """
+    if project_path is not None:
+        artifact = load_artifact(project_path)
+        if artifact is not None and artifact.is_current(transcript_path, srt_path):
+            return artifact
+
+    artifact = build_artifact(transcript_path, srt_path)
+
+    if project_path is not None:
+        try:
+            save_artifact(project_path, artifact)
+        except OSError as e:
+            logger.warning(f"Could not store transcript artifact in {project_path}: {e}")
+
+    return artifact
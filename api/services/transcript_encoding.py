@@ -0,0 +1,211 @@
+"""
+Compact Transcript Encoding
+
+Prompt-side encoding for caption transcripts. Raw SRT spends a large share
+of its tokens on index lines and "00:00:00,000 --> 00:00:00,000" timecodes
+repeated on every caption. The compact form merges captions into timed
+paragraphs, each opening with one coarse "[H:MM:SS]" stamp:
+
+    [0:00:01] Welcome to the program. Today we visit a dairy farm...
+
+    [0:00:24] >> The farm has been in the family for four generations...
+
+Paragraphs break at speaker-change markers (">>"), at pauses, and at
+sentence ends once long enough, so stamps land on natural boundaries.
+
+The encoding is reversible to caption level: every stamp is the start of
+the paragraph's first caption truncated to the second, and the encoder
+keeps the caption range behind each paragraph. resolve_stamp() maps a
+stamp the model copies back to the exact SRT start time, and
+caption_start_near() snaps any time to the nearest caption start.
+snap_start_times() applies this to the timestamp phase's report, so
+chapter starts written from stamps land on exact caption timecodes.
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import List, Optional
+
+from api.services.srt import CaptionTrack
+from api.services.utils import ms_to_display_timecode
+
+# Paragraphs close at a sentence end once this long...
+PARAGRAPH_TARGET_MS = 20000
+# ...and unconditionally once this long
+PARAGRAPH_MAX_MS = 45000
+# A pause at least this long between captions starts a new paragraph
+PARAGRAPH_GAP_MS = 2000
+
+SPEAKER_CHANGE = re.compile(r"^\s*(>>|-\s)")
+SENTENCE_END = re.compile(r"[.?!][\"')\]]*$")
+STAMP = re.compile(r"\[?(\d+):(\d{2}):(\d{2})\]?")
+# H:MM:SS.mmm time in a report line; the first one on a line is a start time
+REPORT_TIMECODE = re.compile(r"(?<![\d:.])(\d+:\d{2}:\d{2})\.(\d{3})(?!\d)")
+
+
+@dataclass
+class Paragraph:
+    """Captions first..stop-1 merged into one timed paragraph."""
+
+    first: int
+    stop: int
+    start_ms: int
+    end_ms: int
+    text: str
+
+    @property
+    def stamp(self) -> str:
+        """Coarse start time as shown in the prompt."""
+        return ms_to_display_timecode(self.start_ms, include_hours=True)
+
+
+class CompactTranscript:
+    """Timed paragraphs built from a caption track, with the mapping back to it."""
+
+    def __init__(self, track: CaptionTrack, paragraphs: List[Paragraph]):
+        """
+        Initialize compact transcript.
+
+        Args:
+            track: Source captions
+            paragraphs: Paragraphs covering the track in order
+        """
+        self.track = track
+        self.paragraphs = paragraphs
+        self._paragraph_starts = [p.start_ms // 1000 for p in paragraphs]
+
+    def render(self, max_chars: Optional[int] = None) -> str:
+        """
+        Prompt text: one "[H:MM:SS] text" paragraph per block.
+
+        Args:
+            max_chars: Stop before the paragraph that would exceed this length
+
+        Returns:
+            Rendered transcript (ends with "..." if cut)
+        """
+        parts = []
+        length = 0
+        for paragraph in self.paragraphs:
+            line = f"[{paragraph.stamp}] {paragraph.text}"
+            if max_chars is not None and parts and length + len(line) + 2 > max_chars:
+                parts.append("...")
+                break
+            parts.append(line)
+            length += len(line) + 2
+        return "\n\n".join(parts)
+
+    def resolve_stamp(self, stamp: str) -> Optional[int]:
+        """
+        Map a stamp from the prompt back to the exact caption start.
+
+        Args:
+            stamp: "H:MM:SS" or "[H:MM:SS]" (any trailing fraction is ignored)
+
+        Returns:
+            Exact start time in ms of the paragraph with that stamp; for a
+            time between stamps, the nearest caption start; None if the
+            stamp can't be parsed
+        """
+        match = STAMP.search(stamp)
+        if not match:
+            return None
+        hours, minutes, seconds = map(int, match.groups())
+        second = (hours * 60 + minutes) * 60 + seconds
+
+        index = bisect_left(self._paragraph_starts, second)
+        if index < len(self.paragraphs) and self._paragraph_starts[index] == second:
+            return self.paragraphs[index].start_ms
+        return self.caption_start_near(second * 1000)
+
+    def caption_start_near(self, ms: int) -> Optional[int]:
+        """Start time of the caption starting nearest to ms, or None for an empty track."""
+        starts = self.track.starts
+        if not starts:
+            return None
+        index = bisect_left(starts, ms)
+        candidates = [i for i in (index - 1, index) if 0 <= i < len(starts)]
+        return starts[min(candidates, key=lambda i: abs(starts[i] - ms))]
+
+
+def encode_captions(
+    track: CaptionTrack,
+    target_ms: int = PARAGRAPH_TARGET_MS,
+    max_ms: int = PARAGRAPH_MAX_MS,
+    gap_ms: int = PARAGRAPH_GAP_MS,
+) -> CompactTranscript:
+    """
+    Merge captions into timed paragraphs.
+
+    Args:
+        track: Captions in time order
+        target_ms: Close a paragraph at the first sentence end after this long
+        max_ms: Close a paragraph after this long regardless
+        gap_ms: Start a new paragraph after a pause this long
+
+    Returns:
+        Compact transcript
+    """
+    paragraphs: List[Paragraph] = []
+    words: List[str] = []
+    first = 0
+    start_ms = end_ms = 0
+
+    def close(stop: int) -> None:
+        paragraphs.append(Paragraph(first=first, stop=stop, start_ms=start_ms, end_ms=end_ms, text=" ".join(words)))
+
+    for i, (start, end, caption_text) in enumerate(track):
+        caption_text = " ".join(caption_text.split())
+        if not caption_text:
+            continue
+
+        if words:
+            elapsed = end_ms - start_ms
+            if (
+                start - end_ms >= gap_ms
+                or SPEAKER_CHANGE.match(caption_text)
+                or elapsed >= max_ms
+                or (elapsed >= target_ms and SENTENCE_END.search(words[-1]))
+            ):
+                close(i)
+                words = []
+
+        if not words:
+            first, start_ms = i, start
+        words.append(caption_text)
+        end_ms = max(end_ms, end) if len(words) > 1 else end
+
+    if words:
+        close(len(track))
+
+    return CompactTranscript(track, paragraphs)
+
+
+def snap_start_times(text: str, compact: CompactTranscript) -> str:
+    """
+    Replace whole-second start times in a report with exact caption starts.
+
+    The start time is the first H:MM:SS.mmm time on a line (the Media Manager
+    table's Start Time column). It is rewritten only when it is "H:MM:SS.000",
+    a stamp the model copied and padded to the report format; exact times
+    (such as chapter candidate starts), end times and 0:00:00.000, the program
+    start, are left as written.
+
+    Args:
+        text: Report text, e.g. the timestamp phase's Media Manager table
+        compact: Compact transcript the stamps came from
+
+    Returns:
+        Text with start times snapped to caption timecodes
+    """
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        match = REPORT_TIMECODE.search(line)
+        if not match or match.group(2) != "000" or not any(int(part) for part in match.group(1).split(":")):
+            continue
+        exact = compact.resolve_stamp(match.group(1))
+        if exact is not None:
+            timecode = f"{ms_to_display_timecode(exact, include_hours=True)}.{exact % 1000:03d}"
+            lines[i] = line[: match.start()] + timecode + line[match.end() :]
+    return "\n".join(lines)
@@ -0,0 +1,314 @@
+"""
+Transcript File Index
+
+Persistent Media ID / filename -> path index over transcripts/ and
+transcripts/archive/. The worker used to glob both folders and parse every
+SRT name for each job; with the index, finding a job's transcript or SRT
+is a dictionary lookup plus one stat.
+
+The index lives in the transcript_index table so every process sees the
+same entries:
+- The API records files as they are queued or uploaded (the transcript
+  watcher queues through the API, so new files arrive this way)
+- The worker records moves into the archive
+- The worker keeps an in-memory copy, loaded at startup and refreshed with
+  rows added since its last sync on every poll
+
+Lookups check that the indexed file still exists and drop entries that
+don't, so a stale row costs one stat, never a wrong path.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from api.services.database import get_session
+from api.services.utils import extract_media_id
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPTS_DIR = Path(os.getenv("TRANSCRIPTS_DIR", "transcripts"))
+TRANSCRIPT_EXTENSIONS = {".txt", ".srt"}
+
+# (filename, media_id, archived)
+_Entry = Tuple[str, Optional[str], bool]
+
+
+class TranscriptIndex:
+    """
+    Media ID and filename index over transcript files.
+
+    Lookups are synchronous and served from memory. Call load() once per
+    process and refresh() periodically to pick up entries written by other
+    processes.
+    """
+
+    def __init__(self, transcripts_dir: Path = TRANSCRIPTS_DIR):
+        """
+        Initialize index.
+
+        Args:
+            transcripts_dir: Transcripts folder (archive is its "archive" subfolder)
+        """
+        self.transcripts_dir = transcripts_dir
+        self.archive_dir = transcripts_dir / "archive"
+
+        self._entries: Dict[str, _Entry] = {}
+        self._by_filename: Dict[str, Set[str]] = {}
+        self._by_media_id: Dict[str, Set[str]] = {}
+        self._synced_at: Optional[str] = None
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def find_transcript(self, filename: str) -> Optional[Path]:
+        """
+        Find a transcript by filename, preferring transcripts/ over the archive.
+
+        Args:
+            filename: Transcript filename (any directory part is ignored)
+
+        Returns:
+            Path to an existing file, or None if not indexed
+        """
+        paths = self._by_filename.get(Path(filename).name, set())
+        return self._first_existing(sorted(paths, key=lambda p: (self._entries[p][2], p)))
+
+    def find_srt(self, media_id: str) -> Optional[Path]:
+        """
+        Find the SRT for a Media ID.
+
+        Prefers transcripts/ over the archive and, within a folder, the
+        exact "{media_id}.srt" name over variants like "{media_id}_REV*.srt".
+
+        Args:
+            media_id: Media ID to look up
+
+        Returns:
+            Path to an existing SRT, or None if not indexed
+        """
+        paths = [p for p in self._by_media_id.get(media_id, set()) if p.lower().endswith(".srt")]
+        exact = f"{media_id}.srt"
+        return self._first_existing(sorted(paths, key=lambda p: (self._entries[p][2], self._entries[p][0] != exact, p)))
+
+    def _first_existing(self, paths: List[str]) -> Optional[Path]:
+        """Return the first path that exists, forgetting the ones that don't."""
+        for path in paths:
+            if os.path.exists(path):
+                return Path(path)
+            self._forget(path)
+        return None
+
+    # =========================================================================
+    # Sync with the database
+    # =========================================================================
+
+    async def load(self) -> int:
+        """
+        Load the index into memory, building it from disk if the table is empty.
+
+        Returns:
+            Number of indexed files
+        """
+        rows = await self._read_rows()
+        if rows is None:
+            return 0
+        if not rows:
+            return await self.rebuild()
+
+        self._clear_memory()
+        self._apply_rows(rows)
+        return len(self._entries)
+
+    async def refresh(self) -> int:
+        """
+        Pull entries added or moved by other processes since the last sync.
+
+        Returns:
+            Number of entries applied
+        """
+        if self._synced_at is None:
+            return 0
+        rows = await self._read_rows(since=self._synced_at)
+        if not rows:
+            return 0
+        self._apply_rows(rows)
+        return len(rows)
+
+    async def rebuild(self) -> int:
+        """
+        Rescan transcripts/ and the archive and replace the index.
+
+        Returns:
+            Number of indexed files
+        """
+        paths = [
+            entry.path
+            for directory in (self.transcripts_dir, self.archive_dir)
+            if directory.is_dir()
+            for entry in os.scandir(directory)
+            if entry.is_file() and _is_transcript(entry.name)
+        ]
+
+        now = datetime.now(timezone.utc).isoformat()
+        params = [self._row_params(path, now) for path in paths]
+        try:
+            async with get_session() as session:
+                await session.execute(text("DELETE FROM transcript_index"))
+                if params:
+                    await session.execute(text(self._UPSERT_SQL), params)
+        except Exception as e:
+            logger.warning(f"Could not rebuild transcript index: {e}")
+            return 0
+
+        self._clear_memory()
+        for row in params:
+            self._remember(row["path"], row["filename"], row["media_id"], bool(row["archived"]))
+        self._synced_at = now
+        logger.info(f"Transcript index rebuilt: {len(params)} files")
+        return len(params)
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    _UPSERT_SQL = """
+        INSERT INTO transcript_index (path, filename, media_id, archived, indexed_at)
+        VALUES (:path, :filename, :media_id, :archived, :indexed_at)
+        ON CONFLICT(path) DO UPDATE SET
+            filename = excluded.filename,
+            media_id = excluded.media_id,
+            archived = excluded.archived,
+            indexed_at = excluded.indexed_at
+    """
+
+    async def add(self, *paths) -> None:
+        """Index transcript files. Paths that don't exist or aren't transcripts are skipped."""
+        now = datetime.now(timezone.utc).isoformat()
+        params = [
+            self._row_params(path, now) for path in paths if _is_transcript(Path(path).name) and os.path.isfile(path)
+        ]
+        if not params:
+            return
+
+        for row in params:
+            self._remember(row["path"], row["filename"], row["media_id"], bool(row["archived"]))
+
+        try:
+            async with get_session() as session:
+                await session.execute(text(self._UPSERT_SQL), params)
+        except Exception as e:
+            logger.debug(f"Could not index transcripts: {e}")
+
+    async def move(self, source, destination) -> None:
+        """Record that a transcript moved (e.g. into the archive)."""
+        await self.remove(source)
+        await self.add(destination)
+
+    async def remove(self, path) -> None:
+        """Drop a path from the index."""
+        key = _normalize(path)
+        self._forget(key)
+        try:
+            async with get_session() as session:
+                await session.execute(text("DELETE FROM transcript_index WHERE path = :path"), {"path": key})
+        except Exception as e:
+            logger.debug(f"Could not remove {key} from transcript index: {e}")
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _row_params(self, path, indexed_at: str) -> dict:
+        """Build insert parameters for a path."""
+        key = _normalize(path)
+        filename = Path(key).name
+        return {
+            "path": key,
+            "filename": filename,
+            "media_id": extract_media_id(filename),
+            "archived": int(Path(key).parent.name == self.archive_dir.name),
+            "indexed_at": indexed_at,
+        }
+
+    async def _read_rows(self, since: Optional[str] = None) -> Optional[list]:
+        """Read index rows (all, or those indexed since a time); None on error."""
+        query = "SELECT path, filename, media_id, archived, indexed_at FROM transcript_index"
+        params = {}
+        if since is not None:
+            query += " WHERE indexed_at >= :since"
+            params["since"] = since
+        try:
+            async with get_session() as session:
+                result = await session.execute(text(query), params)
+                return result.fetchall()
+        except Exception as e:
+            logger.warning(f"Could not read transcript index: {e}")
+            return None
+
+    def _apply_rows(self, rows) -> None:
+        """Merge database rows into memory and advance the sync watermark."""
+        for row in rows:
+            self._remember(row.path, row.filename, row.media_id, bool(row.archived))
+            indexed_at = str(row.indexed_at)
+            if self._synced_at is None or indexed_at > self._synced_at:
+                self._synced_at = indexed_at
+        if self._synced_at is None:
+            self._synced_at = datetime.now(timezone.utc).isoformat()
+
+    def _remember(self, path: str, filename: str, media_id: Optional[str], archived: bool) -> None:
+        """Add or replace an in-memory entry."""
+        self._forget(path)
+        self._entries[path] = (filename, media_id, archived)
+        self._by_filename.setdefault(filename, set()).add(path)
+        if media_id:
+            self._by_media_id.setdefault(media_id, set()).add(path)
+
+    def _forget(self, path: str) -> None:
+        """Remove an in-memory entry."""
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        filename, media_id, _ = entry
+        self._by_filename.get(filename, set()).discard(path)
+        if media_id:
+            self._by_media_id.get(media_id, set()).discard(path)
+
+    def _clear_memory(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+        self._by_filename.clear()
+        self._by_media_id.clear()
+
+
+def _is_transcript(filename: str) -> bool:
+    """Whether a filename is an indexable transcript (.txt/.srt, not hidden or partial)."""
+    return Path(filename).suffix.lower() in TRANSCRIPT_EXTENSIONS and not filename.startswith(".")
+
+
+def _normalize(path) -> str:
+    """Store paths relative to the working directory when possible, so the API and worker agree."""
+    path = Path(path)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(Path.cwd())
+        except ValueError:
+            pass
+    return str(path)
+
+
+# Global index instance
+_transcript_index: Optional[TranscriptIndex] = None
+
+
+def get_transcript_index() -> TranscriptIndex:
+    """Get or create global transcript index."""
+    global _transcript_index
+    if _transcript_index is None:
+        _transcript_index = TranscriptIndex()
+    return _transcript_index
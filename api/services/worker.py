@@ -6,13 +6,23 @@ Polls the queue for pending jobs and processes them through agent phases.
 import asyncio
 import json
 import os
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
 
 from api.models.events import EventCreate, EventData, EventType
 from api.models.job import JobStatus
 from api.services.airtable import get_airtable_client
+from api.services.alignment import align_formatted_transcript, save_timing, split_paragraphs
+from api.services.completeness import (
+    CompletenessResult,
+    check_completeness,
+    paragraph_before,
+    splice_spans,
+)
 from api.services.database import (
     claim_next_job,
     log_event,
@@ -24,10 +34,29 @@ from api.services.llm import (
     LLMResponse,
     end_run_tracking,
     get_llm_client,
+    join_continuation,
     start_run_tracking,
 )
 from api.services.logging import get_logger, setup_logging
-from api.services.utils import calculate_transcript_metrics
+from api.services.prompt_budget import PHASE_SECTIONS, PromptBudget, Trim, estimate_tokens, fit_sections
+from api.services.qa_checks import QAReport, run_qa_checks
+from api.services.recovery_policy import RecoveryDecision, classify_error
+from api.services.segmentation import segment_captions
+from api.services.srt import parse_srt_track
+from api.services.structured_output import (
+    OUTPUT_MODELS,
+    StructuredOutputError,
+    extract_json,
+    parse_structured,
+    repair_request,
+    response_format,
+    schema_instructions,
+)
+from api.services.tier_history import load_tier_history
+from api.services.transcript_artifact import TranscriptArtifact, ingest_transcript, read_transcript_text
+from api.services.transcript_encoding import encode_captions, snap_start_times
+from api.services.transcript_index import get_transcript_index
+from api.services.utils import extract_media_id
 
 # Initialize logging for worker
 setup_logging(log_file="worker.log")
@@ -79,6 +108,15 @@ class JobWorker:
     # Duration threshold (in minutes) for auto-triggering timestamp phase
     TIMESTAMP_AUTO_THRESHOLD_MINUTES = 30
 
+    # Characters of timecoded transcript included in the timestamp prompt
+    TIMESTAMP_TRANSCRIPT_CHARS = 15000
+
+    # Source words per request when re-formatting spans the formatter skipped
+    REPAIR_CHUNK_WORDS = 2000
+
+    # Pseudo-phase for the short-content fast path: analyst and SEO in one call
+    FAST_PATH_PHASE = "analyst_seo"
+
     # Phases that always run on big-brain tier (not configurable)
     # - manager: QA oversight requires strong reasoning
     FORCE_BIG_BRAIN_PHASES = ["manager"]
@@ -112,12 +150,23 @@ class JobWorker:
             },
         )
 
+        # Load the transcript index (built from disk on first run)
+        transcript_index = get_transcript_index()
+        try:
+            indexed = await transcript_index.load()
+            logger.info("Transcript index loaded", extra={"worker_id": worker_id, "files": indexed})
+        except Exception as e:
+            logger.warning("Could not load transcript index", extra={"worker_id": worker_id, "error": str(e)})
+
         # Track active job tasks and their job_ids for cleanup on failure
         active_tasks: set = set()
         task_to_job_id: Dict[asyncio.Task, int] = {}
 
         while self.running:
             try:
+                # Pick up transcripts indexed by the API since the last poll
+                await transcript_index.refresh()
+
                 # Clean up completed tasks
                 done_tasks = {t for t in active_tasks if t.done()}
                 for task in done_tasks:
@@ -253,22 +302,17 @@ class JobWorker:
             if output_file.exists():
                 context[f"{existing_phase}_output"] = output_file.read_text()
 
-        # Load transcript
+        # Load transcript (and SRT) from the stored artifact
         try:
-            transcript_content = self._load_transcript(job_dict)
-            context["transcript"] = transcript_content
+            artifact = await self._ingest_transcript(job_dict, project_path)
+            context["transcript"] = artifact.content
+            context["transcript_artifact"] = artifact
+            # For timestamp phase, add SRT content
+            if phase_name == "timestamp" and artifact.srt_content is not None:
+                context["srt_content"] = artifact.srt_content
         except Exception as e:
             logger.warning(f"Could not load transcript for phase retry: {e}")
 
-        # For timestamp phase, load SRT content
-        if phase_name == "timestamp":
-            srt_path = self._find_srt_file(job_dict)
-            if srt_path and srt_path.exists():
-                try:
-                    context["srt_content"] = srt_path.read_text(encoding="utf-8")
-                except Exception as e:
-                    logger.warning(f"Could not load SRT for timestamp retry: {e}")
-
         # Fetch SST context if available
         sst_context = await self._fetch_sst_context(job_dict)
         if sst_context:
@@ -299,6 +343,9 @@ class JobWorker:
                 project_path=project_path,
             )
 
+            if phase_name == "formatter" and phase_result.get("success"):
+                await self._write_transcript_timing(context, project_path, phase_result.get("output", ""))
+
             # Update phase status in job record
             phases = job_dict.get("phases", [])
             if isinstance(phases, str):
@@ -339,6 +386,8 @@ class JobWorker:
                     p["tier_label"] = phase_result.get("tier_label")
                     p["tier_reason"] = phase_result.get("tier_reason")
                     p["completed_at"] = datetime.now(timezone.utc).isoformat()
+                    if phase_result.get("prompt_trims"):
+                        p["metadata"] = {**(p.get("metadata") or {}), "prompt_trims": phase_result["prompt_trims"]}
                     phase_updated = True
                     break
 
@@ -419,15 +468,14 @@ class JobWorker:
                 )
                 return
 
-            # Load transcript
-            transcript_content = self._load_transcript(job)
+            # Read the transcript and SRT once; later stages use the artifact
+            artifact = await self._ingest_transcript(job, project_path)
+            transcript_content = artifact.content
 
             # Calculate transcript metrics for routing decisions
             routing_config = self.llm.config.get("routing", {})
             threshold_minutes = routing_config.get("long_form_threshold_minutes", 15)
-            transcript_metrics = calculate_transcript_metrics(
-                transcript_content, long_form_threshold_minutes=threshold_minutes
-            )
+            transcript_metrics = artifact.metrics(long_form_threshold_minutes=threshold_minutes)
             logger.info(
                 "Transcript metrics calculated",
                 extra={
@@ -438,6 +486,8 @@ class JobWorker:
                 },
             )
 
+            await self._refresh_tier_history()
+
             # Fetch SST context if linked (Task 6.2.1)
             sst_context = await self._fetch_sst_context(job)
             if sst_context:
@@ -455,9 +505,11 @@ class JobWorker:
                 "transcript": transcript_content,
                 "project_path": project_path,
                 "transcript_metrics": transcript_metrics,
+                "transcript_artifact": artifact,
                 "sst_context": sst_context,  # Add SST context to processing context
             }
 
+            fast_path = self._use_fast_path(context, phases)
             truncation_paused = False
 
             for phase_name in self.PHASES:
@@ -489,8 +541,23 @@ class JobWorker:
                     context.pop("_force_tier", None)
 
                 # Process phase
-                logger.info("Running phase", extra={"job_id": job_id, "phase": phase_name})
-                phase_result = await self._run_phase(job_id, phase_name, context, project_path)
+                if phase_name == "manager" and self._can_skip_manager(context):
+                    logger.info("Skipping manager phase, local QA checks passed", extra={"job_id": job_id})
+                    phase_result = self._write_local_qa_review(context, project_path)
+                elif phase_name == "analyst" and fast_path and "_force_tier" not in context:
+                    logger.info("Running fast path analysis", extra={"job_id": job_id, "phase": phase_name})
+                    phase_result = await self._run_fast_path_analysis(job_id, context, project_path)
+                    if not phase_result["success"]:
+                        logger.warning(
+                            "Fast path failed, running analyst and SEO separately",
+                            extra={"job_id": job_id, "error": phase_result.get("error")},
+                        )
+                        fast_path_cost = phase_result.get("cost", 0)
+                        phase_result = await self._run_phase(job_id, phase_name, context, project_path)
+                        phase_result["cost"] = phase_result.get("cost", 0) + fast_path_cost
+                else:
+                    logger.info("Running phase", extra={"job_id": job_id, "phase": phase_name})
+                    phase_result = await self._run_phase(job_id, phase_name, context, project_path)
 
                 # Update phases list with model/tier info
                 phase_data = {
@@ -505,6 +572,8 @@ class JobWorker:
                     "tier_reason": phase_result.get("tier_reason"),
                     "attempts": phase_result.get("attempts", 1),
                 }
+                if phase_result.get("prompt_trims"):
+                    phase_data["metadata"] = {"prompt_trims": phase_result["prompt_trims"]}
 
                 # Update or add phase
                 phase_updated = False
@@ -516,6 +585,22 @@ class JobWorker:
                 if not phase_updated:
                     phases.append(phase_data)
 
+                # The fast path also produced the SEO output; record the SEO phase
+                # as completed so the loop loads its output instead of running it
+                if phase_result.get("seo_output") is not None:
+                    phase_data.setdefault("metadata", {})["fast_path"] = True
+                    phases = [p for p in phases if p["name"] != "seo"]
+                    phases.append(
+                        {
+                            **phase_data,
+                            "name": "seo",
+                            "cost": 0,
+                            "tokens": 0,
+                            "attempts": 0,
+                            "metadata": {"fast_path": True, "fused_with": "analyst"},
+                        }
+                    )
+
                 await update_job_phase(job_id, phases)
 
                 if not phase_result["success"]:
@@ -524,29 +609,50 @@ class JobWorker:
                 # Add output to context for next phase
                 context[f"{phase_name}_output"] = phase_result.get("output", "")
 
-                # === Completeness check after formatter phase ===
                 if phase_name == "formatter":
-                    from api.services.completeness import check_completeness
+                    await self._write_transcript_timing(context, project_path, phase_result.get("output", ""))
 
+                # === Completeness check after formatter phase ===
+                if phase_name == "formatter":
                     completeness_config = self.llm.config.get("routing", {}).get("completeness", {})
                     if completeness_config.get("enabled", True):
                         formatter_output = phase_result.get("output", "")
                         transcript_file = job.get("transcript_file", "")
                         is_srt = transcript_file.lower().endswith(".srt")
+                        check_options = {
+                            "source_transcript": transcript_content,
+                            "is_srt": is_srt,
+                            "duration_minutes": job.get("duration_minutes"),
+                            "threshold": completeness_config.get("coverage_threshold", 0.70),
+                            "min_source_words": completeness_config.get("min_source_words", 500),
+                        }
 
-                        completeness = check_completeness(
-                            formatter_output=formatter_output,
-                            source_transcript=transcript_content,
-                            is_srt=is_srt,
-                            duration_minutes=job.get("duration_minutes"),
-                            threshold=completeness_config.get("coverage_threshold", 0.70),
-                            min_source_words=completeness_config.get("min_source_words", 500),
-                        )
+                        completeness = check_completeness(formatter_output=formatter_output, **check_options)
+
+                        # Re-format only the skipped spans rather than the whole transcript
+                        repair_failed = False
+                        if completeness.missing_spans and completeness_config.get("repair_missing_spans", True):
+                            repair = await self._repair_missing_spans(
+                                job_id, context, project_path, completeness, phase_result.get("tier")
+                            )
+                            repair_failed = repair is None
+                            if repair:
+                                formatter_output = repair["output"]
+                                context["formatter_output"] = formatter_output
+                                phase_data["cost"] += repair["cost"]
+                                phase_data["tokens"] += repair["tokens"]
+                                phase_data["repaired_spans"] = repair["spans"]
+                                await update_job_phase(job_id, phases)
+                                await self._write_transcript_timing(context, project_path, formatter_output)
+                                completeness = check_completeness(formatter_output=formatter_output, **check_options)
 
                         # Store result in context for Manager phase
                         context["completeness_check"] = completeness.to_dict()
 
-                        if not completeness.is_complete and not completeness.skipped:
+                        # Gaps the repair call couldn't fill pause the job even when the ratio passes
+                        truncated = not completeness.is_complete and not completeness.skipped
+                        unrepaired = repair_failed and bool(completeness.missing_spans)
+                        if truncated or unrepaired:
                             logger.warning(
                                 "Transcript truncation detected",
                                 extra={
@@ -554,6 +660,8 @@ class JobWorker:
                                     "coverage_ratio": completeness.coverage_ratio,
                                     "source_words": completeness.source_word_count,
                                     "output_words": completeness.output_word_count,
+                                    "missing_spans": len(completeness.missing_spans),
+                                    "repair_failed": repair_failed,
                                 },
                             )
 
@@ -569,13 +677,21 @@ class JobWorker:
                             )
 
                             if completeness_config.get("pause_on_truncation", True):
-                                truncation_msg = (
-                                    f"TRUNCATION DETECTED: Formatter output covers only "
-                                    f"{completeness.coverage_ratio:.0%} of source transcript "
-                                    f"({completeness.output_word_count:,} / "
-                                    f"{completeness.source_word_count:,} words). "
-                                    f"Retry to escalate to a more capable model."
-                                )
+                                if truncated:
+                                    truncation_msg = (
+                                        f"TRUNCATION DETECTED: Formatter output covers only "
+                                        f"{completeness.coverage_ratio:.0%} of source transcript "
+                                        f"({completeness.output_word_count:,} / "
+                                        f"{completeness.source_word_count:,} words). "
+                                        f"Retry to escalate to a more capable model."
+                                    )
+                                else:
+                                    truncation_msg = (
+                                        f"TRUNCATION DETECTED: Formatter output skipped "
+                                        f"{len(completeness.missing_spans)} source span(s) "
+                                        f"({completeness.missing_word_count:,} words) and the repair call failed. "
+                                        f"Retry to escalate to a more capable model."
+                                    )
                                 await update_job_status(
                                     job_id,
                                     JobStatus.paused,
@@ -599,22 +715,16 @@ class JobWorker:
                 return
 
             # Process optional phases (timestamp) if conditions are met
-            srt_path = self._find_srt_file(job)
-            if self._should_run_timestamp_phase(job, transcript_metrics, srt_path):
+            srt_path = artifact.srt_path
+            if self._should_run_timestamp_phase(job, transcript_metrics, srt_path, artifact):
                 phase_name = "timestamp"
 
                 # Check if phase already completed
                 existing_phase = next((p for p in phases if p["name"] == phase_name), None)
                 if not (existing_phase and existing_phase.get("status") == "completed"):
                     # Add SRT content to context
-                    if srt_path:
-                        try:
-                            context["srt_content"] = srt_path.read_text(encoding="utf-8", errors="replace")
-                            context["srt_path"] = str(srt_path)
-                        except Exception as e:
-                            logger.warning(
-                                "Failed to read SRT file for timestamp phase", extra={"job_id": job_id, "error": str(e)}
-                            )
+                    context["srt_content"] = artifact.srt_content
+                    context["srt_path"] = str(srt_path)
 
                     # Update current phase
                     await update_job_status(job_id, JobStatus.in_progress, current_phase=phase_name)
@@ -637,6 +747,8 @@ class JobWorker:
                         "attempts": phase_result.get("attempts", 1),
                         "optional": True,  # Mark as optional phase
                     }
+                    if phase_result.get("prompt_trims"):
+                        phase_data["metadata"] = {"prompt_trims": phase_result["prompt_trims"]}
 
                     phases.append(phase_data)
                     await update_job_phase(job_id, phases)
@@ -664,7 +776,7 @@ class JobWorker:
 
             # Archive the transcript file (non-fatal if this fails)
             try:
-                self._archive_transcript(job)
+                await self._archive_transcript(job)
             except Exception as archive_err:
                 logger.warning(
                     "Failed to archive transcript (non-fatal)", extra={"job_id": job_id, "error": str(archive_err)}
@@ -855,9 +967,18 @@ class JobWorker:
         Handles various encodings (UTF-8, ISO-8859, etc.) gracefully.
         Also checks the archive folder as a fallback for re-processed jobs.
         """
+        content, _ = read_transcript_text(self._find_transcript_file(job))
+        return content
+
+    def _find_transcript_file(self, job: Dict[str, Any]) -> Path:
+        """Find the job's transcript, checking the archive folder as a fallback for re-processed jobs.
+
+        Raises:
+            FileNotFoundError: If the transcript is in neither folder
+        """
         transcript_file = job.get("transcript_file", "")
 
-        # Try various paths, including archive folder as fallback
+        # Try the indexed path, then the usual locations, including archive folder as fallback
         paths_to_try = [
             Path(transcript_file),
             TRANSCRIPTS_DIR / transcript_file,
@@ -866,32 +987,42 @@ class JobWorker:
             TRANSCRIPTS_ARCHIVE_DIR / transcript_file,
             TRANSCRIPTS_ARCHIVE_DIR / Path(transcript_file).name,
         ]
+        indexed_path = get_transcript_index().find_transcript(transcript_file) if transcript_file else None
+        if indexed_path:
+            paths_to_try.insert(0, indexed_path)
 
         for path in paths_to_try:
-            if path.exists():
+            if path.is_file():
                 # Log if we're using archive fallback
                 if TRANSCRIPTS_ARCHIVE_DIR in path.parents or path.parent == TRANSCRIPTS_ARCHIVE_DIR:
                     logger.info(
                         "Using archived transcript (re-processing)",
                         extra={"job_id": job.get("id"), "source": str(path)},
                     )
-                # Try different encodings
-                for encoding in ["utf-8", "iso-8859-1", "cp1252", "latin-1"]:
-                    try:
-                        return path.read_text(encoding=encoding)
-                    except UnicodeDecodeError:
-                        continue
-                # Last resort: read with errors='replace'
-                return path.read_text(encoding="utf-8", errors="replace")
+                return path
 
         raise FileNotFoundError(f"Transcript not found: {transcript_file}")
 
-    def _archive_transcript(self, job: Dict[str, Any]) -> None:
+    async def _ingest_transcript(self, job: Dict[str, Any], project_path: Optional[Path]) -> TranscriptArtifact:
+        """Read the job's transcript and SRT once into a transcript artifact.
+
+        The artifact is stored in the project directory and reused while
+        the source files are unchanged.
+
+        Raises:
+            FileNotFoundError: If the transcript is not found
+        """
+        transcript_path = self._find_transcript_file(job)
+        srt_path = await self._find_srt_file(job)
+        return await asyncio.to_thread(ingest_transcript, transcript_path, srt_path, project_path)
+
+    async def _archive_transcript(self, job: Dict[str, Any]) -> None:
         """Move completed transcript to archive folder.
 
         Archives the original transcript file to transcripts/archive/ after
         successful job completion. This keeps the main transcripts folder
-        clean and shows only unprocessed files.
+        clean and shows only unprocessed files. The move is recorded in the
+        transcript index.
         """
         transcript_file = job.get("transcript_file", "")
         if not transcript_file:
@@ -924,6 +1055,7 @@ class JobWorker:
 
             shutil.move(str(source), str(dest))
             logger.info("Archived transcript", extra={"source_file": source.name, "destination": str(dest)})
+            await get_transcript_index().move(source, dest)
         except Exception as e:
             logger.error(
                 "Failed to archive transcript",
@@ -931,11 +1063,14 @@ class JobWorker:
                 exc_info=True,
             )
 
-    def _find_srt_file(self, job: Dict[str, Any]) -> Optional[Path]:
+    async def _find_srt_file(self, job: Dict[str, Any]) -> Optional[Path]:
         """Find the SRT file associated with a transcript.
 
-        Looks for an SRT file with the same base name as the transcript
-        in both the transcripts folder and archive folder.
+        Looks up the transcript's Media ID in the transcript index, which
+        covers both the transcripts folder and archive folder. On an index
+        miss, scans both folders once for an SRT with the same Media ID
+        (e.g. "{media_id}.srt" or "{media_id}_ForClaude.srt") and indexes
+        what it finds.
 
         Returns:
             Path to SRT file if found, None otherwise.
@@ -944,52 +1079,389 @@ class JobWorker:
         if not transcript_file:
             return None
 
-        # Get the base name without extension
-        from api.services.utils import extract_media_id
-
         media_id = extract_media_id(transcript_file)
 
-        # Look for SRT file with same base name
-        search_dirs = [TRANSCRIPTS_DIR, TRANSCRIPTS_ARCHIVE_DIR]
+        index = get_transcript_index()
+        srt_path = index.find_srt(media_id)
+        if srt_path:
+            return srt_path
+
+        # Not indexed: files can reach disk without going through the API
+        found = [
+            srt_file
+            for search_dir in [TRANSCRIPTS_DIR, TRANSCRIPTS_ARCHIVE_DIR]
+            if search_dir.exists()
+            for srt_file in sorted(search_dir.glob("*.srt"))
+            if extract_media_id(srt_file.name) == media_id
+        ]
+        if not found:
+            return None
+
+        await index.add(*found)
+        logger.info("Indexed unindexed SRT files", extra={"media_id": media_id, "files": [f.name for f in found]})
+        # Same preference as the index: transcripts/ over the archive, then the exact name
+        return min(found, key=lambda f: (f.parent != TRANSCRIPTS_DIR, f.name != f"{media_id}.srt"))
+
+        media_id = extract_media_id(transcript_file)
 
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
+        srt_path = get_transcript_index().find_srt(media_id)
+        if srt_path:
+            return srt_path
 
-            # Try exact match first
+        # Not indexed yet: try the exact name in each folder
+        for search_dir in [TRANSCRIPTS_DIR, TRANSCRIPTS_ARCHIVE_DIR]:
             srt_path = search_dir / f"{media_id}.srt"
             if srt_path.exists():
                 return srt_path
 
-            # Try variations
-            for srt_file in search_dir.glob("*.srt"):
-                srt_media_id = extract_media_id(srt_file.name)
-                if srt_media_id == media_id:
-                    return srt_file
-
         return None
 
+    async def _write_transcript_timing(self, context: Dict[str, Any], project_path: Path, formatted: str) -> None:
+        """Align the formatted transcript to the job's captions and store the timing sidecar.
+
+        Skipped when the job has no captions. Failures are logged, never raised.
+        """
+        artifact = context.get("transcript_artifact")
+        if artifact is None or not len(artifact.captions) or not formatted:
+            return
+        try:
+            timing = await asyncio.to_thread(align_formatted_transcript, formatted, artifact.captions)
+            save_timing(project_path, timing)
+            logger.info(
+                "Transcript timing aligned",
+                extra={
+                    "project_path": str(project_path),
+                    "paragraphs": len(timing.paragraphs),
+                    "coverage": round(timing.coverage, 3),
+                },
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to align transcript timing", extra={"project_path": str(project_path), "error": str(e)}
+            )
+
+    async def _repair_missing_spans(
+        self,
+        job_id: int,
+        context: Dict[str, Any],
+        project_path: Path,
+        completeness: CompletenessResult,
+        tier: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Re-format the source spans the formatter skipped and splice them into its output.
+
+        Each span is sent to the formatter agent on its own (long spans in
+        chunks of REPAIR_CHUNK_WORDS), with the paragraph before it for
+        continuity. formatter_output.md is rewritten with the spans inserted;
+        the previous version is preserved alongside it.
+
+        Returns:
+            Dict with the repaired output, cost, tokens and span count, or
+            None if any span could not be repaired
+        """
+        formatted = context.get("formatter_output", "")
+        routing_config = self.llm.config.get("routing", {})
+        tier_labels = routing_config.get("tier_labels", ["cheapskate", "default", "big-brain"])
+        if tier is None:
+            tier, _ = self.llm.get_tier_for_phase_with_reason("formatter", context)
+        tier_label = tier_labels[tier] if tier < len(tier_labels) else f"tier-{tier}"
+        backend = self.llm.get_backend_for_phase("formatter", context, tier_override=tier)
+        timeout_seconds = self.llm.get_escalation_config().get("timeout_seconds", 120)
+        system_prompt = self._load_agent_prompt("formatter")
+
+        repairs = []
+        total_cost = 0.0
+        total_tokens = 0
+        model = None
+        try:
+            for span in completeness.missing_spans:
+                words = span.text.split()
+                preceding = paragraph_before(formatted, span.output_position)
+                parts = []
+                for start in range(0, len(words), self.REPAIR_CHUNK_WORDS):
+                    chunk = " ".join(words[start : start + self.REPAIR_CHUNK_WORDS])
+                    response: LLMResponse = await self._chat_with_continuation(
+                        [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": self._build_repair_prompt(chunk, preceding)},
+                        ],
+                        backend=backend,
+                        job_id=job_id,
+                        phase="formatter",
+                        tier=tier,
+                        tier_label=tier_label,
+                        timeout_seconds=timeout_seconds,
+                    )
+                    total_cost += response.cost
+                    total_tokens += response.total_tokens
+                    model = response.model
+                    part = "\n\n".join(split_paragraphs(response.content))
+                    parts.append(part)
+                    preceding = part.rsplit("\n\n", 1)[-1]
+                repairs.append((span, "\n\n".join(parts)))
+        except Exception as e:
+            logger.warning(
+                "Missing span repair failed",
+                extra={"job_id": job_id, "spans": len(completeness.missing_spans), "error": str(e)},
+            )
+            return None
+
+        repaired = splice_spans(formatted, repairs)
+
+        output_file = project_path / "formatter_output.md"
+        file_content = output_file.read_text() if output_file.exists() else formatted
+        if output_file.exists():
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            (project_path / f"formatter_output.{timestamp}.prev.md").write_text(file_content)
+        repair_header = (
+            f"<!-- repaired: {len(repairs)} missing span(s), ~{completeness.missing_word_count} words | "
+            f"model: {model} | tier: {tier_label} | cost: ${total_cost:.4f} | tokens: {total_tokens} -->\n"
+        )
+        output_file.write_text(repair_header + splice_spans(file_content, repairs))
+
+        await log_event(
+            EventCreate(
+                job_id=job_id,
+                event_type=EventType.phase_completed,
+                data=EventData(
+                    phase="formatter_repair",
+                    cost=total_cost,
+                    tokens=total_tokens,
+                    model=model,
+                    extra={"spans": len(repairs), "missing_words": completeness.missing_word_count},
+                ),
+            )
+        )
+        logger.info(
+            "Repaired missing transcript spans",
+            extra={"job_id": job_id, "spans": len(repairs), "missing_words": completeness.missing_word_count},
+        )
+        return {"output": repaired, "cost": total_cost, "tokens": total_tokens, "spans": len(repairs)}
+
+    def _build_repair_prompt(self, section: str, preceding: str) -> str:
+        """Build the user message for re-formatting one skipped transcript section."""
+        prompt = (
+            "## Task: Format a Missing Transcript Section\n\n"
+            "An earlier formatting pass skipped the section below. Format ONLY this section, "
+            "following your usual formatting rules. Output just the formatted transcript paragraphs: "
+            "no title, metadata header, separators, notes, or status line.\n\n"
+        )
+        if preceding:
+            prompt += (
+                "### Preceding Formatted Text\n\n"
+                "For continuity only (speaker labels, style). Do not repeat it.\n\n"
+                f"{preceding}\n\n"
+            )
+        return prompt + f"### Section to Format\n\n{section}\n"
+
+    def _qa_report(self, context: Dict[str, Any]) -> Optional[QAReport]:
+        """Deterministic QA checks for the manager phase, computed once per context.
+
+        Returns None when checks are disabled in routing.qa_checks.
+        """
+        qa_config = self.llm.config.get("routing", {}).get("qa_checks", {})
+        if not qa_config.get("enabled", True):
+            return None
+        if "qa_report" not in context:
+            context["qa_report"] = run_qa_checks(context)
+        return context["qa_report"]
+
+    def _can_skip_manager(self, context: Dict[str, Any]) -> bool:
+        """Whether the manager call can be skipped: every local check passed on short content."""
+        qa_config = self.llm.config.get("routing", {}).get("qa_checks", {})
+        if not qa_config.get("skip_manager", True):
+            return False
+        report = self._qa_report(context)
+        if report is None or not report.passed:
+            return False
+        duration = (context.get("transcript_metrics") or {}).get("estimated_duration_minutes", 0)
+        return duration <= qa_config.get("skip_manager_max_minutes", 15)
+
+    def _write_local_qa_review(self, context: Dict[str, Any], project_path: Path) -> Dict[str, Any]:
+        """Write manager_output.md from the local QA checks in place of a manager call.
+
+        Returns:
+            Phase result dict in the shape _run_phase returns
+        """
+        report = self._qa_report(context)
+        duration = (context.get("transcript_metrics") or {}).get("estimated_duration_minutes", 0)
+        output = f"""# QA Review
+
+**Overall Status:** APPROVED
+
+All automated QA checks passed on short-form content ({duration:.1f} minutes), so the
+manager review was skipped. Retry the manager phase for a full review.
+
+## Checklist
+
+{report.render()}
+"""
+        output_file = project_path / "manager_output.md"
+        output_file.write_text("<!-- model: local-qa-checks | tier: local | cost: $0.0000 | tokens: 0 -->\n" + output)
+        return {
+            "success": True,
+            "output": output,
+            "cost": 0.0,
+            "tokens": 0,
+            "model": "local-qa-checks",
+            "tier": None,
+            "tier_label": "local",
+            "tier_reason": "all automated QA checks passed on short content",
+            "attempts": 0,
+        }
+
+    async def _refresh_tier_history(self) -> None:
+        """Reload tier history for history-driven routing when it is older than refresh_minutes.
+
+        Failures are logged and leave routing on the previous history (or the
+        static thresholds if none has loaded).
+        """
+        settings = self.llm.config.get("routing", {}).get("tier_selection", {})
+        if settings.get("mode", "static") != "history":
+            return
+        history = self.llm.tier_history
+        max_age = timedelta(minutes=settings.get("refresh_minutes", 15))
+        if history is not None and datetime.now(timezone.utc) - history.loaded_at < max_age:
+            return
+        try:
+            history = await load_tier_history(self.llm.config.get("routing", {}), settings.get("history_days", 30))
+        except Exception as e:
+            logger.warning("Failed to load tier history", extra={"error": str(e)})
+            return
+        self.llm.set_tier_history(history)
+        logger.info("Tier history loaded", extra={"groups": len(history.stats), "days": history.days})
+
+    def _output_model(self, phase_name: str) -> Optional[Type[BaseModel]]:
+        """Structured output model for a phase, if routing.structured_outputs enables it."""
+        structured_config = self.llm.config.get("routing", {}).get("structured_outputs", {})
+        if not structured_config.get("enabled", False):
+            return None
+        if phase_name not in structured_config.get("phases", list(OUTPUT_MODELS)):
+            return None
+        return OUTPUT_MODELS.get(phase_name)
+
+    def _use_fast_path(self, context: Dict[str, Any], phases: List[Dict[str, Any]]) -> bool:
+        """Whether to fuse the analyst and SEO phases into one call (routing.fast_path).
+
+        Only fresh short-content jobs qualify; a job resuming with either
+        phase already completed runs the full pipeline.
+        """
+        fast_path_config = self.llm.config.get("routing", {}).get("fast_path", {})
+        if not fast_path_config.get("enabled", False):
+            return False
+        if any(p["name"] in ("analyst", "seo") and p.get("status") == "completed" for p in phases):
+            return False
+        duration = (context.get("transcript_metrics") or {}).get("estimated_duration_minutes", 0)
+        return duration <= fast_path_config.get("max_minutes", 10)
+
+    async def _run_fast_path_analysis(self, job_id: int, context: Dict[str, Any], project_path: Path) -> Dict[str, Any]:
+        """Run the analyst and SEO phases as one structured call.
+
+        The model replies with a JSON object holding the analysis and the SEO
+        report (validated against the SEO output model when structured outputs
+        cover seo), which are written to analyst_output.md and seo_output.md as
+        if each phase had run on its own.
+
+        Returns:
+            Phase result dict for the analyst phase with "seo_output" added.
+            A reply without both fields counts as a failure so the caller can
+            fall back to separate calls.
+        """
+        result = await self._run_phase(job_id, self.FAST_PATH_PHASE, context, project_path, save_output=False)
+        if not result["success"]:
+            return result
+
+        fields = self._parse_fast_path_output(result["output"])
+        if fields is None:
+            error = "Fast path reply did not contain valid analysis and seo fields"
+            return {**result, "success": False, "error": error}
+
+        provenance_header = (
+            f"<!-- model: {result['model']} | tier: {result['tier_label']} | cost: ${result['cost']:.4f} "
+            f"| tokens: {result['tokens']} | fast path: analyst+seo -->\n"
+        )
+        self._save_phase_output(job_id, project_path, "analyst", provenance_header + fields["analysis"])
+        self._save_phase_output(job_id, project_path, "seo", provenance_header + fields["seo"])
+        context["seo_output"] = fields["seo"]
+        return {**result, "output": fields["analysis"], "seo_output": fields["seo"]}
+
+    def _parse_fast_path_output(self, output: str) -> Optional[Dict[str, str]]:
+        """Analysis and SEO text from a fast path reply, or None if either is missing or invalid.
+
+        With structured outputs on for seo, the "seo" field must match the SEO
+        output model and is rendered to markdown like a standalone seo phase.
+        """
+        data = extract_json(output)
+        if data is None:
+            return None
+
+        seo_model = self._output_model("seo")
+        if seo_model is not None:
+            # Validate the SEO part as the seo phase would and save it in the same layout
+            try:
+                data["seo"] = seo_model.model_validate(data.get("seo")).to_markdown()
+            except ValidationError as e:
+                logger.warning("Fast path SEO output failed validation", extra={"error": str(e)})
+                return None
+
+        fields = {}
+        for key in ("analysis", "seo"):
+            value = data.get(key)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, indent=2)
+            if not isinstance(value, str) or not value.strip():
+                return None
+            fields[key] = value.strip()
+        return fields
+
+    def _snap_timestamp_output(self, output: str, context: Dict[str, Any]) -> str:
+        """Snap chapter starts the model copied from [H:MM:SS] stamps to exact caption timecodes."""
+        artifact = context.get("transcript_artifact")
+        captions = artifact.captions if artifact is not None else parse_srt_track(context.get("srt_content", ""))
+        if not len(captions):
+            return output
+        return snap_start_times(output, encode_captions(captions))
+
+    def _save_phase_output(self, job_id: int, project_path: Path, phase_name: str, content: str) -> None:
+        """Write {phase}_output.md, preserving any previous version with a timestamp."""
+        output_file = project_path / f"{phase_name}_output.md"
+        if output_file.exists():
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            prev_file = project_path / f"{phase_name}_output.{timestamp}.prev.md"
+            prev_file.write_text(output_file.read_text())
+            logger.info(
+                "Preserved previous output",
+                extra={"job_id": job_id, "phase": phase_name, "preserved_as": prev_file.name},
+            )
+        output_file.write_text(content)
+
     def _get_content_duration_minutes(
-        self, transcript_metrics: Dict[str, Any], srt_path: Optional[Path] = None
+        self,
+        transcript_metrics: Dict[str, Any],
+        srt_path: Optional[Path] = None,
+        artifact: Optional[TranscriptArtifact] = None,
     ) -> float:
         """Get content duration in minutes from SRT or transcript metrics.
 
         Prefers SRT duration (more accurate) if available, falls back
-        to estimated duration from transcript word count.
+        to estimated duration from transcript word count. Captions come
+        from the transcript artifact when one is given, so the SRT is
+        not parsed again.
 
         Returns:
             Duration in minutes.
         """
+        if artifact is not None and artifact.duration_ms:
+            return artifact.duration_ms / 60000  # Convert ms to minutes
+
         # Try to get duration from SRT file (most accurate)
-        if srt_path and srt_path.exists():
+        if artifact is None and srt_path and srt_path.exists():
             try:
-                from api.services.utils import get_srt_duration, parse_srt
+                from api.services.srt import load_srt_track
 
-                srt_content = srt_path.read_text(encoding="utf-8", errors="replace")
-                captions = parse_srt(srt_content)
+                captions = load_srt_track(srt_path)
                 if captions:
-                    duration_ms = get_srt_duration(captions)
-                    return duration_ms / 60000  # Convert ms to minutes
+                    return captions.duration_ms / 60000  # Convert ms to minutes
             except Exception as e:
                 logger.warning("Failed to parse SRT for duration", extra={"srt_file": str(srt_path), "error": str(e)})
 
@@ -997,7 +1469,11 @@ class JobWorker:
         return transcript_metrics.get("estimated_duration_minutes", 0)
 
     def _should_run_timestamp_phase(
-        self, job: Dict[str, Any], transcript_metrics: Dict[str, Any], srt_path: Optional[Path]
+        self,
+        job: Dict[str, Any],
+        transcript_metrics: Dict[str, Any],
+        srt_path: Optional[Path],
+        artifact: Optional[TranscriptArtifact] = None,
     ) -> bool:
         """Determine if the timestamp phase should run.
 
@@ -1020,7 +1496,7 @@ class JobWorker:
             return True
 
         # Check duration threshold
-        duration_minutes = self._get_content_duration_minutes(transcript_metrics, srt_path)
+        duration_minutes = self._get_content_duration_minutes(transcript_metrics, srt_path, artifact)
         if duration_minutes >= self.TIMESTAMP_AUTO_THRESHOLD_MINUTES:
             logger.info(
                 "Timestamp phase auto-triggered for long content",
@@ -1042,17 +1518,102 @@ class JobWorker:
         )
         return False
 
+    async def _chat_with_continuation(
+        self,
+        messages: List[Dict[str, str]],
+        backend: str,
+        job_id: int,
+        phase: str,
+        tier: int,
+        tier_label: str,
+        timeout_seconds: float,
+        **kwargs,
+    ) -> LLMResponse:
+        """Call the LLM, resuming on the same model when output stops at the length limit.
+
+        A length-truncated response is followed by continuation requests that
+        repeat the original messages plus the tail of the output so far, up
+        to the configured budget. Parts are joined with any repeated overlap
+        removed; cost and tokens are summed across calls. If the budget runs
+        out the joined (still truncated) output is returned, and downstream
+        checks such as completeness handle the remainder. Extra kwargs (such
+        as response_format) apply to the first request only, since a
+        continuation is a fragment rather than a whole reply.
+
+        Raises:
+            asyncio.TimeoutError: If any single call exceeds timeout_seconds
+        """
+        continuation_config = self.llm.get_continuation_config()
+        max_continuations = continuation_config.get("max_continuations", 3)
+        if not continuation_config.get("enabled", True):
+            max_continuations = 0
+        tail_chars = continuation_config.get("tail_chars", 2000)
+
+        request = messages
+        response: Optional[LLMResponse] = None
+        for continuation in range(max_continuations + 1):
+            part: LLMResponse = await asyncio.wait_for(
+                self.llm.chat(
+                    messages=request,
+                    backend=backend,
+                    job_id=job_id,
+                    phase=phase,
+                    tier=tier,
+                    tier_label=tier_label,
+                    **(kwargs if continuation == 0 else {}),
+                ),
+                timeout=timeout_seconds,
+            )
+            if response is None:
+                response = part
+            else:
+                response.content = join_continuation(response.content, part.content)
+                response.input_tokens += part.input_tokens
+                response.output_tokens += part.output_tokens
+                response.total_tokens += part.total_tokens
+                response.cost += part.cost
+                response.finish_reason = part.finish_reason
+
+            if not part.truncated or not part.content:
+                break
+            if continuation == max_continuations:
+                logger.warning(
+                    "Output still truncated after continuation budget",
+                    extra={"job_id": job_id, "phase": phase, "continuations": continuation},
+                )
+                break
+
+            logger.info(
+                "Output truncated at length limit, continuing",
+                extra={"job_id": job_id, "phase": phase, "continuation": continuation + 1},
+            )
+            tail = response.content[-tail_chars:]
+            request = messages + [
+                {
+                    "role": "user",
+                    "content": (
+                        "Your previous response was cut off by the output length limit. It ended with:\n\n"
+                        f"<<<\n{tail}\n>>>\n\n"
+                        "Continue from exactly where it stopped, mid-sentence if needed. Do not repeat any of "
+                        "the text above and do not add a preamble; output only the continuation."
+                    ),
+                }
+            ]
+        return response
+
     async def _run_phase(
         self,
         job_id: int,
         phase_name: str,
         context: Dict[str, Any],
         project_path: Path,
+        save_output: bool = True,
     ) -> Dict[str, Any]:
         """Run a single agent phase with tiered escalation on failure.
 
         Attempts to run with the initial tier based on transcript duration.
         On failure or timeout, escalates to the next tier and retries.
+        With save_output=False the caller writes the output file(s) itself.
         """
         # Get escalation config
         escalation_config = self.llm.get_escalation_config()
@@ -1086,13 +1647,11 @@ class JobWorker:
         routing_config = self.llm.config.get("routing", {})
         tier_labels = routing_config.get("tier_labels", ["cheapskate", "default", "big-brain"])
 
-        # Load prompts once (don't reload on each retry)
+        # Load the system prompt once; the user prompt is fitted to each tier's backend
         system_prompt = self._load_agent_prompt(phase_name)
-        user_message = self._build_phase_prompt(phase_name, context)
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
-        ]
+        output_model = self._output_model(phase_name)
+        if output_model is not None:
+            system_prompt += "\n\n" + schema_instructions(output_model)
 
         total_cost = 0.0
         total_tokens = 0
@@ -1100,10 +1659,22 @@ class JobWorker:
         attempts = 0
         max_escalation_attempts = 10  # Safety guard against infinite loops
 
+        # Content duration and per-attempt elapsed time go in phase events for tier history
+        duration_minutes = (context.get("transcript_metrics") or {}).get("estimated_duration_minutes")
+
         while attempts < max_escalation_attempts:
+            attempt_started = time.monotonic()
             # Get backend for current tier
             backend = self.llm.get_backend_for_phase(phase_name, context, tier_override=current_tier)
             tier_label = tier_labels[current_tier] if current_tier < len(tier_labels) else f"tier-{current_tier}"
+            user_message, prompt_trims = self._fit_phase_prompt(phase_name, context, system_prompt, backend)
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ]
+            chat_kwargs = {}
+            if output_model is not None and self.llm.supports_structured_outputs(backend):
+                chat_kwargs["response_format"] = response_format(output_model)
             logger.info(
                 "Phase attempting with tier",
                 extra={
@@ -1123,45 +1694,68 @@ class JobWorker:
                     data=EventData(
                         phase=phase_name,
                         backend=backend,
-                        extra={"tier": current_tier, "tier_label": tier_label, "attempt": attempts + 1},
+                        extra={
+                            "tier": current_tier,
+                            "tier_label": tier_label,
+                            "attempt": attempts + 1,
+                            "duration_minutes": duration_minutes,
+                        },
                     ),
                 )
             )
 
             try:
-                # Call LLM with timeout (include phase/tier for Langfuse tracing)
-                response: LLMResponse = await asyncio.wait_for(
-                    self.llm.chat(
-                        messages=messages,
-                        backend=backend,
-                        job_id=job_id,
-                        phase=phase_name,
-                        tier=current_tier,
-                        tier_label=tier_label,
-                    ),
-                    timeout=timeout_seconds,
+                # Call LLM with timeout (include phase/tier for Langfuse tracing),
+                # continuing on the same model if the output hits its length limit
+                response: LLMResponse = await self._chat_with_continuation(
+                    messages,
+                    backend=backend,
+                    job_id=job_id,
+                    phase=phase_name,
+                    tier=current_tier,
+                    tier_label=tier_label,
+                    timeout_seconds=timeout_seconds,
+                    **chat_kwargs,
                 )
 
                 # Track costs across retries
                 total_cost += response.cost
                 total_tokens += response.total_tokens
 
-                # Save output (preserving previous version if exists)
-                output_file = project_path / f"{phase_name}_output.md"
-                if output_file.exists():
-                    # Preserve previous output with timestamp
-                    prev_content = output_file.read_text()
-                    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-                    prev_file = project_path / f"{phase_name}_output.{timestamp}.prev.md"
-                    prev_file.write_text(prev_content)
-                    logger.info(
-                        "Preserved previous output",
-                        extra={"job_id": job_id, "phase": phase_name, "preserved_as": prev_file.name},
-                    )
+                # Validate structured output locally, with one repair request on this tier
+                if output_model is not None:
+                    parsed, error = parse_structured(output_model, response.content)
+                    if parsed is None:
+                        logger.warning(
+                            "Structured output failed validation, requesting repair",
+                            extra={"job_id": job_id, "phase": phase_name, "tier_label": tier_label, "error": error},
+                        )
+                        repair: LLMResponse = await asyncio.wait_for(
+                            self.llm.chat(
+                                messages=messages + repair_request(response.content, error),
+                                backend=backend,
+                                job_id=job_id,
+                                phase=phase_name,
+                                tier=current_tier,
+                                tier_label=tier_label,
+                                **chat_kwargs,
+                            ),
+                            timeout=timeout_seconds,
+                        )
+                        total_cost += repair.cost
+                        total_tokens += repair.total_tokens
+                        parsed, error = parse_structured(output_model, repair.content)
+                        if parsed is None:
+                            raise StructuredOutputError(f"{phase_name} output failed schema validation: {error}")
+                    response.content = parsed.to_markdown()
 
-                # Add provenance header to output
-                provenance_header = f"<!-- model: {response.model} | tier: {tier_label} | cost: ${response.cost:.4f} | tokens: {response.total_tokens} -->\n"
-                output_file.write_text(provenance_header + response.content)
+                if phase_name == "timestamp":
+                    response.content = self._snap_timestamp_output(response.content, context)
+
+                # Save output with a provenance header
+                if save_output:
+                    provenance_header = f"<!-- model: {response.model} | tier: {tier_label} | cost: ${response.cost:.4f} | tokens: {response.total_tokens} -->\n"
+                    self._save_phase_output(job_id, project_path, phase_name, provenance_header + response.content)
 
                 # Log phase completed
                 await log_event(
@@ -1173,7 +1767,13 @@ class JobWorker:
                             cost=response.cost,
                             tokens=response.total_tokens,
                             model=response.model,
-                            extra={"tier": current_tier, "tier_label": tier_label, "total_attempts": attempts + 1},
+                            extra={
+                                "tier": current_tier,
+                                "tier_label": tier_label,
+                                "total_attempts": attempts + 1,
+                                "duration_minutes": duration_minutes,
+                                "elapsed_seconds": round(time.monotonic() - attempt_started, 1),
+                            },
                         ),
                     )
                 )
@@ -1188,6 +1788,7 @@ class JobWorker:
                     "tier_label": tier_label,
                     "tier_reason": tier_reason,
                     "attempts": attempts + 1,
+                    "prompt_trims": [trim.to_dict() for trim in prompt_trims],
                 }
 
             except asyncio.TimeoutError:
@@ -1265,6 +1866,8 @@ class JobWorker:
                             "from_tier": current_tier,
                             "to_tier": next_tier,
                             "reason": last_error,
+                            "duration_minutes": duration_minutes,
+                            "elapsed_seconds": round(time.monotonic() - attempt_started, 1),
                         },
                     ),
                 )
@@ -1295,7 +1898,11 @@ class JobWorker:
     ) -> Dict[str, Any]:
         """Run manager agent to analyze failure and attempt recovery.
 
-        The manager decides on an action:
+        Errors with an obvious cause (timeouts, rate limits, missing files,
+        cost caps and the like) are resolved by the recovery policy table
+        without an LLM call; see recovery_policy.classify_error.
+
+        Otherwise the manager decides on an action:
         - RETRY: Re-run the failed phase at the same tier
         - ESCALATE: Re-run with a higher tier model
         - FIX: Apply corrections and continue
@@ -1327,122 +1934,15 @@ class JobWorker:
                     failed_phase_idx = i
                     break
 
-            # Build context summary
-            phases_summary = []
-            for phase in phases:
-                status = phase.get("status", "unknown")
-                phase_name = phase.get("name", "unknown")
-                phase_error = phase.get("error_message", "")
-                tier_label = phase.get("tier_label", "unknown")
-                tier = phase.get("tier", 0)
-                phases_summary.append(
-                    f"- {phase_name}: {status} (tier {tier}: {tier_label})"
-                    f"{f' - Error: {phase_error}' if phase_error else ''}"
+            decision = self._rule_recovery_decision(error)
+            if decision is not None:
+                action, reason, content, analysis_cost = decision.action, decision.reason, "", 0.0
+                logger.info(
+                    "Recovery decided by rule",
+                    extra={"job_id": job_id, "error_class": decision.error_class, "action": action},
                 )
-
-            # Get partial outputs for context
-            partial_outputs = []
-            for phase_name in ["analyst", "formatter", "seo"]:
-                output = context.get(f"{phase_name}_output", "")
-                if output:
-                    partial_outputs.append(f"## {phase_name.title()} Output:\n{output[:800]}...")
-
-            # Build decision prompt
-            decision_prompt = f"""## Failure Recovery Analysis
-
-**Job ID:** {job_id}
-**Project:** {project_name}
-**Error:** {error}
-**Failed Phase:** {failed_phase.get('name', 'unknown') if failed_phase else 'unknown'}
-**Failed at Tier:** {failed_phase.get('tier', 0) if failed_phase else 0} ({failed_phase.get('tier_label', 'unknown') if failed_phase else 'unknown'})
-
-## Phase Status:
-{chr(10).join(phases_summary)}
-
-## Available Outputs:
-{chr(10).join(partial_outputs) if partial_outputs else "No outputs available yet"}
-
-## Your Task:
-Analyze this failure and decide on the BEST recovery action. You MUST respond with exactly ONE of these actions on the FIRST LINE of your response:
-
-**ACTION: RETRY** - The failure is transient (API timeout, rate limit, temporary issue). Re-run at the same tier.
-
-**ACTION: ESCALATE** - The task is too complex for the current tier. Re-run with a more capable model (tier {min((failed_phase.get('tier', 0) if failed_phase else 0) + 1, 2)}).
-
-**ACTION: FIX** - The output has minor issues you can correct. Provide the corrected output after your analysis.
-
-**ACTION: FAIL** - The failure is unrecoverable (missing transcript, invalid input, fundamental issue).
-
-## Response Format:
-ACTION: [RETRY|ESCALATE|FIX|FAIL]
-REASON: [Brief explanation - 1-2 sentences]
-
-[If ACTION is FIX, provide the corrected output below]
-"""
-
-            # Load manager system prompt
-            system_prompt = self._load_agent_prompt("manager")
-
-            # Use big-brain tier for recovery decisions
-            routing_config = self.llm.config.get("routing", {})
-            tier_backends = routing_config.get("tiers", ["openrouter-cheapskate", "openrouter", "openrouter-big-brain"])
-            backend_name = tier_backends[2] if len(tier_backends) > 2 else tier_backends[-1]
-
-            logger.info("Running recovery analysis", extra={"job_id": job_id, "backend": backend_name})
-
-            # Run the analysis
-            response = await self.llm.generate(
-                system_prompt=system_prompt, user_prompt=decision_prompt, backend=backend_name, timeout=120
-            )
-
-            # Parse the decision - search full content for action pattern
-            content = response.content.strip()
-            # Normalize content for pattern matching (handles **ACTION:** markdown format)
-            content_upper = content.upper().replace("**", "")
-
-            action = "FAIL"  # Default to fail if we can't parse
-            if "ACTION: RETRY" in content_upper or "ACTION:RETRY" in content_upper:
-                action = "RETRY"
-            elif "ACTION: ESCALATE" in content_upper or "ACTION:ESCALATE" in content_upper:
-                action = "ESCALATE"
-            elif "ACTION: FIX" in content_upper or "ACTION:FIX" in content_upper:
-                action = "FIX"
-            elif "ACTION: FAIL" in content_upper or "ACTION:FAIL" in content_upper:
-                action = "FAIL"
-
-            # Extract reason - check multiple formats
-            reason = "No reason provided"
-            lines = content.split("\n")
-            for i, line in enumerate(lines):
-                line_upper = line.upper().strip()
-                # Check for "REASON:" format
-                if line_upper.startswith("REASON:"):
-                    reason = line[line.find(":") + 1 :].strip()
-                    break
-                # Check for "### Rationale" section (manager prompt format)
-                elif "RATIONALE" in line_upper and line_upper.startswith("#"):
-                    # Get the next non-empty line as the reason
-                    for j in range(i + 1, min(i + 5, len(lines))):
-                        next_line = lines[j].strip()
-                        if next_line and not next_line.startswith("#"):
-                            reason = next_line
-                            break
-                    break
-
-            logger.info(
-                "Manager decision",
-                extra={
-                    "job_id": job_id,
-                    "action": action,
-                    "reason": reason[:100],
-                    "analysis_cost": response.cost,
-                },
-            )
-
-            # Save the analysis report
-            report_file = project_path / "recovery_analysis.md"
-            report_file.write_text(
-                f"""# Recovery Analysis Report
+                (project_path / "recovery_analysis.md").write_text(
+                    f"""# Recovery Analysis Report
 **Job ID:** {job_id}
 **Project:** {project_name}
 **Error:** {error}
@@ -1452,16 +1952,18 @@ REASON: [Brief explanation - 1-2 sentences]
 **Action:** {action}
 **Reason:** {reason}
 
-## Full Analysis
-{response.content}
-
----
-**Analysis Cost:** ${response.cost:.4f}
-**Model:** {response.model}
+Decided by the recovery policy (error class: {decision.error_class}) without a manager call.
 """
-            )
+                )
+                if decision.retry_delay:
+                    delay = self.llm.config.get("routing", {}).get("recovery", {}).get("retry_delay_seconds", 30)
+                    await asyncio.sleep(delay)
+            else:
+                action, reason, content, analysis_cost = await self._manager_recovery_decision(
+                    job, project_path, phases, context, error, failed_phase
+                )
 
-            total_cost = current_cost + response.cost
+            total_cost = current_cost + analysis_cost
 
             # Execute the recovery action
             if action == "FAIL":
@@ -1469,7 +1971,7 @@ REASON: [Brief explanation - 1-2 sentences]
                     "recovered": False,
                     "action": action,
                     "reason": reason,
-                    "cost": response.cost,
+                    "cost": analysis_cost,
                 }
 
             elif action == "RETRY":
@@ -1503,7 +2005,7 @@ REASON: [Brief explanation - 1-2 sentences]
                             total_cost=total_cost + retry_result.get("cost", 0),
                         )
 
-                return {"recovered": False, "action": action, "reason": "Retry failed", "cost": response.cost}
+                return {"recovered": False, "action": action, "reason": "Retry failed", "cost": analysis_cost}
 
             elif action == "ESCALATE":
                 # Re-run with a higher tier
@@ -1554,7 +2056,7 @@ REASON: [Brief explanation - 1-2 sentences]
                                 total_cost=total_cost + retry_result.get("cost", 0),
                             )
 
-                return {"recovered": False, "action": action, "reason": "Escalation failed", "cost": response.cost}
+                return {"recovered": False, "action": action, "reason": "Escalation failed", "cost": analysis_cost}
 
             elif action == "FIX":
                 # Manager provided a fix - extract and save it
@@ -1605,10 +2107,10 @@ REASON: [Brief explanation - 1-2 sentences]
                     "recovered": False,
                     "action": action,
                     "reason": "Fix could not be applied",
-                    "cost": response.cost,
+                    "cost": analysis_cost,
                 }
 
-            return {"recovered": False, "action": action, "reason": reason, "cost": response.cost}
+            return {"recovered": False, "action": action, "reason": reason, "cost": analysis_cost}
 
         except Exception as recovery_err:
             logger.warning("Recovery analysis failed", extra={"job_id": job_id, "error": str(recovery_err)})
@@ -1619,6 +2121,167 @@ REASON: [Brief explanation - 1-2 sentences]
                 "cost": 0,
             }
 
+    def _rule_recovery_decision(self, error: str) -> Optional[RecoveryDecision]:
+        """Recovery decision from the rule table, or None when the manager should analyze the error."""
+        if not self.llm.config.get("routing", {}).get("recovery", {}).get("rule_based", True):
+            return None
+        return classify_error(error)
+
+    async def _manager_recovery_decision(
+        self,
+        job: Dict[str, Any],
+        project_path: Path,
+        phases: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        error: str,
+        failed_phase: Optional[Dict[str, Any]],
+    ) -> Tuple[str, str, str, float]:
+        """Ask the manager (big-brain tier) to choose a recovery action for a failure.
+
+        Writes recovery_analysis.md with the full analysis.
+
+        Returns:
+            (action, reason, full response content, analysis cost)
+        """
+        job_id = job.get("id")
+        project_name = job.get("project_name", "Unknown")
+
+        # Build context summary
+        phases_summary = []
+        for phase in phases:
+            status = phase.get("status", "unknown")
+            phase_name = phase.get("name", "unknown")
+            phase_error = phase.get("error_message", "")
+            tier_label = phase.get("tier_label", "unknown")
+            tier = phase.get("tier", 0)
+            phases_summary.append(
+                f"- {phase_name}: {status} (tier {tier}: {tier_label})"
+                f"{f' - Error: {phase_error}' if phase_error else ''}"
+            )
+
+        # Get partial outputs for context
+        partial_outputs = []
+        for phase_name in ["analyst", "formatter", "seo"]:
+            output = context.get(f"{phase_name}_output", "")
+            if output:
+                partial_outputs.append(f"## {phase_name.title()} Output:\n{output[:800]}...")
+
+        # Build decision prompt
+        decision_prompt = f"""## Failure Recovery Analysis
+
+**Job ID:** {job_id}
+**Project:** {project_name}
+**Error:** {error}
+**Failed Phase:** {failed_phase.get('name', 'unknown') if failed_phase else 'unknown'}
+**Failed at Tier:** {failed_phase.get('tier', 0) if failed_phase else 0} ({failed_phase.get('tier_label', 'unknown') if failed_phase else 'unknown'})
+
+## Phase Status:
+{chr(10).join(phases_summary)}
+
+## Available Outputs:
+{chr(10).join(partial_outputs) if partial_outputs else "No outputs available yet"}
+
+## Your Task:
+Analyze this failure and decide on the BEST recovery action. You MUST respond with exactly ONE of these actions on the FIRST LINE of your response:
+
+**ACTION: RETRY** - The failure is transient (API timeout, rate limit, temporary issue). Re-run at the same tier.
+
+**ACTION: ESCALATE** - The task is too complex for the current tier. Re-run with a more capable model (tier {min((failed_phase.get('tier', 0) if failed_phase else 0) + 1, 2)}).
+
+**ACTION: FIX** - The output has minor issues you can correct. Provide the corrected output after your analysis.
+
+**ACTION: FAIL** - The failure is unrecoverable (missing transcript, invalid input, fundamental issue).
+
+## Response Format:
+ACTION: [RETRY|ESCALATE|FIX|FAIL]
+REASON: [Brief explanation - 1-2 sentences]
+
+[If ACTION is FIX, provide the corrected output below]
+"""
+
+        # Load manager system prompt
+        system_prompt = self._load_agent_prompt("manager")
+
+        # Use big-brain tier for recovery decisions
+        routing_config = self.llm.config.get("routing", {})
+        tier_backends = routing_config.get("tiers", ["openrouter-cheapskate", "openrouter", "openrouter-big-brain"])
+        backend_name = tier_backends[2] if len(tier_backends) > 2 else tier_backends[-1]
+
+        logger.info("Running recovery analysis", extra={"job_id": job_id, "backend": backend_name})
+
+        # Run the analysis
+        response = await self.llm.generate(
+            system_prompt=system_prompt, user_prompt=decision_prompt, backend=backend_name, timeout=120
+        )
+
+        # Parse the decision - search full content for action pattern
+        content = response.content.strip()
+        # Normalize content for pattern matching (handles **ACTION:** markdown format)
+        content_upper = content.upper().replace("**", "")
+
+        action = "FAIL"  # Default to fail if we can't parse
+        if "ACTION: RETRY" in content_upper or "ACTION:RETRY" in content_upper:
+            action = "RETRY"
+        elif "ACTION: ESCALATE" in content_upper or "ACTION:ESCALATE" in content_upper:
+            action = "ESCALATE"
+        elif "ACTION: FIX" in content_upper or "ACTION:FIX" in content_upper:
+            action = "FIX"
+        elif "ACTION: FAIL" in content_upper or "ACTION:FAIL" in content_upper:
+            action = "FAIL"
+
+        # Extract reason - check multiple formats
+        reason = "No reason provided"
+        lines = content.split("\n")
+        for i, line in enumerate(lines):
+            line_upper = line.upper().strip()
+            # Check for "REASON:" format
+            if line_upper.startswith("REASON:"):
+                reason = line[line.find(":") + 1 :].strip()
+                break
+            # Check for "### Rationale" section (manager prompt format)
+            elif "RATIONALE" in line_upper and line_upper.startswith("#"):
+                # Get the next non-empty line as the reason
+                for j in range(i + 1, min(i + 5, len(lines))):
+                    next_line = lines[j].strip()
+                    if next_line and not next_line.startswith("#"):
+                        reason = next_line
+                        break
+                break
+
+        logger.info(
+            "Manager decision",
+            extra={
+                "job_id": job_id,
+                "action": action,
+                "reason": reason[:100],
+                "analysis_cost": response.cost,
+            },
+        )
+
+        # Save the analysis report
+        report_file = project_path / "recovery_analysis.md"
+        report_file.write_text(
+            f"""# Recovery Analysis Report
+**Job ID:** {job_id}
+**Project:** {project_name}
+**Error:** {error}
+**Analysis Time:** {datetime.now(timezone.utc).isoformat()}
+
+## Decision
+**Action:** {action}
+**Reason:** {reason}
+
+## Full Analysis
+{response.content}
+
+---
+**Analysis Cost:** ${response.cost:.4f}
+**Model:** {response.model}
+"""
+        )
+
+        return action, reason, content, response.cost
+
     async def _complete_remaining_phases(
         self,
         job: Dict[str, Any],
@@ -1695,7 +2358,7 @@ REASON: [Brief explanation - 1-2 sentences]
 
             # Archive transcript
             try:
-                self._archive_transcript(job)
+                await self._archive_transcript(job)
             except Exception:
                 pass  # Non-fatal
 
@@ -1715,6 +2378,14 @@ REASON: [Brief explanation - 1-2 sentences]
 
     def _load_agent_prompt(self, phase_name: str) -> str:
         """Load the system prompt for an agent phase."""
+        if phase_name == self.FAST_PATH_PHASE:
+            return (
+                "You are handling two roles of the pipeline in a single reply.\n\n"
+                f"# Role 1: Analyst\n\n{self._load_agent_prompt('analyst')}\n\n"
+                f"# Role 2: SEO\n\n{self._load_agent_prompt('seo')}\n\n"
+                "Return both results in the JSON object described in the user message."
+            )
+
         prompt_file = AGENTS_DIR / f"{phase_name}.md"
 
         if prompt_file.exists():
@@ -1779,9 +2450,75 @@ Output a QA report with:
             phase_name, f"You are the {phase_name} agent. Process the input and provide appropriate output."
         )
 
+    def _prompt_transcript(self, context: Dict[str, Any]) -> str:
+        """Transcript text for prompts.
+
+        SRT transcripts are sent as compact timed paragraphs instead of raw
+        caption blocks; other transcripts are sent as-is. Computed once per
+        context.
+        """
+        if "prompt_transcript" not in context:
+            artifact = context.get("transcript_artifact")
+            if artifact is not None and artifact.is_caption_transcript and len(artifact.captions):
+                context["prompt_transcript"] = encode_captions(artifact.captions).render()
+            else:
+                context["prompt_transcript"] = context.get("transcript", "")
+        return context["prompt_transcript"]
+
+    def _budget_context(
+        self, phase_name: str, context: Dict[str, Any], available: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], List[Trim]]:
+        """Copy of context with the phase's prompt sections capped and, given available tokens, fitted.
+
+        See prompt_budget.PHASE_SECTIONS for each phase's sections and rules.
+        """
+        rules = PHASE_SECTIONS.get(phase_name, [])
+        if any(rule.key == "prompt_transcript" for rule in rules):
+            self._prompt_transcript(context)
+        sections = {rule.key: context.get(rule.key) or "" for rule in rules}
+        fitted, trims = fit_sections(sections, rules, available)
+        return {**context, **fitted}, trims
+
+    def _fit_phase_prompt(
+        self, phase_name: str, context: Dict[str, Any], system_prompt: str, backend: str
+    ) -> Tuple[str, List[Trim]]:
+        """Build the user prompt for a phase, trimmed to fit the backend's context window.
+
+        Returns:
+            (prompt, trims applied)
+        """
+        context_tokens, output_tokens = self.llm.get_context_limits(backend)
+        budget = PromptBudget(context_tokens, output_tokens)
+        rules = PHASE_SECTIONS.get(phase_name, [])
+
+        capped, trims = self._budget_context(phase_name, context)
+        prompt = self._build_phase_prompt(phase_name, capped)
+        section_tokens = sum(estimate_tokens(capped.get(rule.key) or "") for rule in rules)
+        fixed_tokens = estimate_tokens(system_prompt) + max(estimate_tokens(prompt) - section_tokens, 0)
+        available = budget.available(fixed_tokens)
+        if section_tokens <= available:
+            return prompt, trims
+
+        fitted, window_trims = self._budget_context(phase_name, capped, available)
+        logger.info(
+            "Prompt trimmed to fit context window",
+            extra={
+                "phase": phase_name,
+                "backend": backend,
+                "context_tokens": context_tokens,
+                "trims": [trim.to_dict() for trim in window_trims],
+            },
+        )
+        return self._build_phase_prompt(phase_name, fitted), trims + window_trims
+
     def _build_phase_prompt(self, phase_name: str, context: Dict[str, Any]) -> str:
-        """Build the user prompt for a phase with relevant context."""
-        transcript = context.get("transcript", "")
+        """Build the user prompt for a phase with relevant context.
+
+        Large sections are capped per prompt_budget.PHASE_SECTIONS; use
+        _fit_phase_prompt to also fit a backend's context window.
+        """
+        context, _ = self._budget_context(phase_name, context)
+        transcript = self._prompt_transcript(context)
         sst_context = context.get("sst_context")
 
         # Build SST context section if available
@@ -1821,6 +2558,30 @@ Output a QA report with:
 Provide a detailed analysis document."""
             return prompt
 
+        elif phase_name == self.FAST_PATH_PHASE:
+            prompt = "Please analyze the following transcript and generate its SEO metadata:\n"
+            if sst_section:
+                prompt += sst_section
+            prompt += f"""---
+{transcript}
+---
+
+Reply with a single JSON object and nothing else:
+"""
+            seo_model = self._output_model("seo")
+            if seo_model is not None:
+                schema = json.dumps(seo_model.model_json_schema(), indent=2)
+                prompt += (
+                    '{"analysis": "<the analysis document, as markdown>", "seo": <the SEO metadata object>}\n\n'
+                    f'The "seo" object must match this JSON schema:\n\n```json\n{schema}\n```'
+                )
+            else:
+                prompt += (
+                    '{"analysis": "<the detailed analysis document, as markdown>", '
+                    '"seo": "<the SEO metadata report, as markdown>"}'
+                )
+            return prompt
+
         elif phase_name == "formatter":
             analysis = context.get("analyst_output", "")
             prompt = "Using the following analysis as guidance:\n\n"
@@ -1850,10 +2611,14 @@ Please format this transcript:
 And this formatted transcript:
 
 ---
-{formatted[:2000]}...
+{formatted}
 ---
 
-Generate SEO metadata as a markdown report."""
+"""
+            if self._output_model(phase_name) is not None:
+                prompt += "Generate the SEO metadata as a single JSON object matching the schema in your instructions."
+            else:
+                prompt += "Generate SEO metadata as a markdown report."
             return prompt
 
         elif phase_name == "copy_editor":
@@ -1900,11 +2665,33 @@ The system performed an automated word-count completeness check on the formatter
 
 """
 
+            # Mechanical checks already done locally; send their results and
+            # only excerpts of the formatted transcript
+            formatted_heading = "Formatted Transcript"
+            qa_report = self._qa_report(context)
+            if qa_report is not None:
+                failures = len(qa_report.failures)
+                prompt += f"""## Automated QA Checks
+
+These mechanical checks ran locally ({failures} failed). Do not repeat them; confirm the failures
+below and focus your review on editorial quality.
+
+{qa_report.render()}
+
+"""
+                excerpt_chars = self.llm.config.get("routing", {}).get("qa_checks", {}).get("excerpt_chars", 1500)
+                if len(formatted) > 2 * excerpt_chars:
+                    formatted_heading = "Formatted Transcript (opening and closing excerpts)"
+                    formatted = (
+                        f"{formatted[:excerpt_chars]}\n\n[... {len(formatted) - 2 * excerpt_chars:,} characters "
+                        f"omitted; covered by the automated checks above ...]\n\n{formatted[-excerpt_chars:]}"
+                    )
+
             if sst_section:
                 prompt += sst_section
             prompt += f"""## Original Transcript (for reference):
 ---
-{transcript[:3000]}{"..." if len(transcript) > 3000 else ""}
+{transcript}
 ---
 
 ## Analyst Output:
@@ -1912,7 +2699,7 @@ The system performed an automated word-count completeness check on the formatter
 {analysis}
 ---
 
-## Formatted Transcript:
+## {formatted_heading}:
 ---
 {formatted}
 ---
@@ -1922,11 +2709,40 @@ The system performed an automated word-count completeness check on the formatter
 {seo}
 ---
 
-Review all outputs against PBS Wisconsin quality standards and provide your QA report."""
+"""
+            prompt += "Review all outputs against PBS Wisconsin quality standards and provide your QA report"
+            if self._output_model(phase_name) is not None:
+                prompt += " as a single JSON object matching the schema in your instructions."
+            else:
+                prompt += "."
             return prompt
 
         elif phase_name == "timestamp":
             srt_content = context.get("srt_content", "")
+            artifact = context.get("transcript_artifact")
+            captions = artifact.captions if artifact is not None else parse_srt_track(srt_content)
+            candidates = segment_captions(captions) if len(captions) else []
+            if candidates:
+                # Chapter candidates cover the whole program in a few hundred tokens
+                candidate_lines = "\n".join(f"{i}. {c.summary()}" for i, c in enumerate(candidates, 1))
+                content_section = f"""## Chapter Candidates (computed from topic shifts across the full transcript):
+Each line: exact start - end | keywords | opening words
+---
+{candidate_lines}
+---"""
+            else:
+                if len(captions):
+                    # Timed paragraphs fit far more of the program than raw SRT in the same space
+                    timecoded = encode_captions(captions).render(max_chars=self.TIMESTAMP_TRANSCRIPT_CHARS)
+                else:
+                    timecoded = srt_content[: self.TIMESTAMP_TRANSCRIPT_CHARS]
+                    if len(srt_content) > self.TIMESTAMP_TRANSCRIPT_CHARS:
+                        timecoded += "..."
+                content_section = f"""## Transcript with Timecodes (use these timecodes; [H:MM:SS] marks where each paragraph starts):
+A chapter starting at a paragraph can use its stamp as H:MM:SS.000; it is snapped to the exact caption time.
+---
+{timecoded}
+---"""
             formatted = context.get("formatter_output", "")
             analysis = context.get("analyst_output", "")
             transcript_metrics = context.get("transcript_metrics", {})
@@ -1942,19 +2758,17 @@ Review all outputs against PBS Wisconsin quality standards and provide your QA r
             prompt += f"""
 **Estimated Duration:** {duration:.1f} minutes
 
-## Original SRT Content (use these timecodes):
----
-{srt_content[:15000]}{"..." if len(srt_content) > 15000 else ""}
----
+{content_section}
 
 ## Analyst Output (use this to identify chapter boundaries):
 ---
-{analysis[:4000]}{"..." if len(analysis) > 4000 else ""}
+{analysis}
 ---
 
 ## Your Task
 
 Identify 3-8 logical chapter breaks based on topic transitions, speaker changes, and segment markers in the content above.
+{"Start from the chapter candidates: keep their exact start times, merge adjacent candidates that cover the same topic, and title each chapter." if candidates else ""}
 
 Output a timestamp report with TWO sections:
 1. **Media Manager Format** - Table with Title, Start Time (H:MM:SS.000), End Time (H:MM:SS.999)
@@ -69,6 +69,7 @@ ARTIFACT_LABELS = {
     "recovery_analysis.md": "Recovery Analysis",
     "investigation_report.md": "Failure Investigation",
     "manifest.json": "Job Manifest",
+    "transcript_timing.json": "Transcript Timing",
 }
 
 
@@ -79,9 +80,6 @@ def get_artifact_label(filename: str) -> str:
 
 # Airtable configuration (READ-ONLY)
 AIRTABLE_API_KEY = os.getenv("AIRTABLE_API_KEY")
-AIRTABLE_BASE_ID = "appZ2HGwhiifQToB6"
-AIRTABLE_TABLE_ID = "tblTKFOwTvK7xw1H5"
-AIRTABLE_API_BASE = "https://api.airtable.com/v0"
 
 # Initialize MCP server
 server = Server("cardigan")
@@ -252,6 +250,20 @@ async def fetch_job_from_api(project_name: str) -> dict | None:
     return None
 
 
+async def get_cached_airtable_client():
+    """
+    Get an Airtable client backed by the shared SST cache.
+
+    The cache lives in the same dashboard.db as the API and worker, so records
+    they have already fetched are served without another Airtable request.
+    """
+    from api.services import database
+    from api.services.airtable import AirtableClient
+
+    await database.init_db()
+    return AirtableClient(api_key=AIRTABLE_API_KEY)
+
+
 async def fetch_sst_context(airtable_record_id: str) -> Optional[dict]:
     """
     Fetch SST (Single Source of Truth) metadata from Airtable by record ID.
@@ -271,19 +283,12 @@ async def fetch_sst_context(airtable_record_id: str) -> Optional[dict]:
     if not airtable_record_id:
         return None
 
-    url = f"{AIRTABLE_API_BASE}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_ID}/{airtable_record_id}"
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            if response.status_code == 200:
-                record = response.json()
-                return _extract_sst_fields(record)
-            return None
+        client = await get_cached_airtable_client()
+        record = await client.get_sst_record(airtable_record_id)
+        if record:
+            return _extract_sst_fields(record)
+        return None
     except Exception:
         return None
 
@@ -307,27 +312,12 @@ async def search_sst_by_media_id(media_id: str) -> Optional[dict]:
     if not media_id:
         return None
 
-    # Use Airtable's filterByFormula to search by Media ID
-    import urllib.parse
-
-    formula = f"{{Media ID}}='{media_id}'"
-    encoded_formula = urllib.parse.quote(formula)
-    url = f"{AIRTABLE_API_BASE}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_ID}?filterByFormula={encoded_formula}"
-
-    headers = {
-        "Authorization": f"Bearer {AIRTABLE_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                records = data.get("records", [])
-                if records:
-                    return _extract_sst_fields(records[0])
-            return None
+        client = await get_cached_airtable_client()
+        record = await client.search_sst_by_media_id(media_id)
+        if record:
+            return _extract_sst_fields(record)
+        return None
     except Exception:
         return None
 
@@ -480,6 +470,25 @@ async def list_tools() -> list[Tool]:
                 },
             },
         ),
+        Tool(
+            name="get_transcript_timecodes",
+            description="Look up source timecodes for paragraphs of the formatted transcript. Search by quote or paragraph number, or omit both to list every paragraph's time range.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_name": {"type": "string", "description": "The project ID"},
+                    "query": {
+                        "type": "string",
+                        "description": "Text to find (a quote from the paragraph; case and punctuation are ignored)",
+                    },
+                    "paragraph": {
+                        "type": "integer",
+                        "description": "Paragraph number (1-based) in the formatted transcript",
+                    },
+                },
+                "required": ["project_name"],
+            },
+        ),
         Tool(
             name="get_sst_metadata",
             description="Fetch current metadata from Airtable SST (Single Source of Truth) by Media ID. Returns title, descriptions, keywords, and character count status. Use this to get the LIVE Airtable data for a project.",
@@ -713,6 +722,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         return await handle_read_project_file(arguments)
     elif name == "search_projects":
         return await handle_search_projects(arguments)
+    elif name == "get_transcript_timecodes":
+        return await handle_get_transcript_timecodes(arguments)
     elif name == "get_sst_metadata":
         return await handle_get_sst_metadata(arguments)
     else:
@@ -1241,6 +1252,52 @@ async def handle_search_projects(arguments: dict) -> list[TextContent]:
     return [TextContent(type="text", text="\n".join(lines))]
 
 
+async def handle_get_transcript_timecodes(arguments: dict) -> list[TextContent]:
+    """Resolve formatted transcript paragraphs to source timecodes from the timing sidecar."""
+    from api.services.alignment import load_timing
+    from api.services.segmentation import format_exact_timecode
+
+    project_name = arguments.get("project_name")
+    if not project_name:
+        return [TextContent(type="text", text="Error: project_name is required")]
+
+    timing = load_timing(get_project_path(project_name))
+    if timing is None:
+        return [
+            TextContent(
+                type="text",
+                text=(
+                    f"Error: No readable transcript timing for '{project_name}'. "
+                    "Timing is produced for projects with an SRT."
+                ),
+            )
+        ]
+
+    query = arguments.get("query")
+    number = arguments.get("paragraph")
+    if number is not None:
+        paragraphs = [timing.resolve(number - 1)]
+    elif query:
+        paragraphs = [timing.find(query)]
+    else:
+        paragraphs = timing.paragraphs
+    paragraphs = [p for p in paragraphs if p is not None]
+
+    if not paragraphs:
+        return [TextContent(type="text", text=f"No matching paragraph in {project_name}")]
+
+    lines = [f"# Transcript Timecodes: {project_name}\n"]
+    for p in paragraphs:
+        estimated = "" if p.confidence else " (estimated)"
+        preview = p.text if len(p.text) <= 120 else p.text[:117] + "..."
+        lines.append(
+            f"**¶{p.index + 1}** {format_exact_timecode(p.start_ms)} - {format_exact_timecode(p.end_ms)}{estimated}"
+        )
+        lines.append(f"> {preview}")
+        lines.append("")
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
 async def handle_get_sst_metadata(arguments: dict) -> list[TextContent]:
     """Fetch current SST metadata from Airtable by Media ID."""
     media_id = arguments.get("media_id")
@@ -3,7 +3,9 @@
 Backfill Airtable links for existing jobs.
 
 Finds jobs missing airtable_record_id and attempts to link them
-by looking up the Media ID in the SST table.
+by looking up the Media ID in the SST table. Lookups are batched (50 Media
+IDs per request) and go through the shared Airtable gateway, so the run
+stays under Airtable's 5 requests/second limit.
 """
 
 import asyncio
@@ -15,8 +17,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.services import database
 from api.services.airtable import AirtableClient
+from api.services.airtable_gateway import get_airtable_gateway
 from api.services.utils import extract_media_id
 
+# Media IDs per Airtable search request
+LOOKUP_BATCH_SIZE = 50
+
 
 async def backfill_airtable_links():
     """Backfill Airtable links for all jobs missing them."""
@@ -46,6 +52,21 @@ async def backfill_airtable_links():
         print("\nAll jobs already have Airtable links!")
         return
 
+    # Look up every Media ID up front in batched requests. A failed batch
+    # (429, network error) marks its Media IDs as errors, not as missing.
+    media_ids = {job.id: extract_media_id(job.transcript_file) for job in jobs_to_update}
+    unique_ids = sorted(set(media_ids.values()))
+    print(f"\nLooking up {len(unique_ids)} Media IDs in SST...")
+    records = {}
+    failed_lookups = {}
+    for i in range(0, len(unique_ids), LOOKUP_BATCH_SIZE):
+        batch = unique_ids[i : i + LOOKUP_BATCH_SIZE]
+        try:
+            records.update(await client.batch_search_sst_by_media_ids(batch, raise_errors=True))
+        except Exception as e:
+            print(f"  Lookup failed for {len(batch)} Media IDs: {e}")
+            failed_lookups.update(dict.fromkeys(batch, str(e)))
+
     linked = 0
     not_found = 0
     errors = 0
@@ -53,16 +74,18 @@ async def backfill_airtable_links():
     for job in jobs_to_update:
         job_id = job.id
         transcript_file = job.transcript_file
-
-        # Extract media ID
-        media_id = extract_media_id(transcript_file)
+        media_id = media_ids[job_id]
 
         print(f"\nJob {job_id}: {transcript_file}")
         print(f"  Media ID: {media_id}")
 
+        if media_id in failed_lookups:
+            print(f"  ERROR: SST lookup failed - {failed_lookups[media_id]}")
+            errors += 1
+            continue
+
         try:
-            # Search Airtable for matching record
-            record = await client.search_sst_by_media_id(media_id)
+            record = records.get(media_id)
 
             if record:
                 record_id = record["id"]
@@ -99,6 +122,7 @@ async def backfill_airtable_links():
     print(f"  Linked:    {linked}")
     print(f"  Not found: {not_found}")
     print(f"  Errors:    {errors}")
+    print(f"  Airtable requests: {get_airtable_gateway().get_metrics()['requests']}")
     print(f"{'='*50}")
 
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark the array-backed SRT engine against the utils SRT functions.
+
+Generates synthetic captions for a long program (3 hours by default) and
+times parsing, cleaning, time lookup and SRT/VTT output both ways.
+
+Usage:
+    ./venv/bin/python scripts/benchmark_srt.py
+    ./venv/bin/python scripts/benchmark_srt.py --hours 1 --repeat 10
+"""
+
+import argparse
+import copy
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.services.srt import parse_srt_track, read_srt_track  # noqa: E402
+from api.services.utils import (  # noqa: E402
+    SRTCaption,
+    clean_srt_captions,
+    generate_srt,
+    generate_vtt,
+    parse_srt,
+)
+
+WORDS = "the program looks at how wisconsin farmers work with the land and water through every season".split()
+
+
+def make_srt(hours: float, seed: int = 0) -> str:
+    """Build SRT content with ~2.5s captions, some short, overlapping or repeated."""
+    rng = random.Random(seed)
+    captions = []
+    t = 0
+    end_ms = int(hours * 3600 * 1000)
+    previous = ""
+    while t < end_ms:
+        duration = rng.choice([400, 1800, 2500, 3200])
+        text = previous if rng.random() < 0.03 else " ".join(rng.choices(WORDS, k=rng.randint(4, 12)))
+        if rng.random() < 0.3:
+            text = text + "\n" + " ".join(rng.choices(WORDS, k=5))
+        start = t - 100 if rng.random() < 0.05 else t
+        captions.append(SRTCaption(index=0, start_ms=max(0, start), end_ms=t + duration, text=text))
+        previous = text
+        t += duration + rng.choice([0, 40, 200])
+    return generate_srt(captions)
+
+
+def timed(fn, repeat: int) -> float:
+    """Best wall time of repeat runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SRT parsing, cleaning and output")
+    parser.add_argument("--hours", type=float, default=3.0, help="Program length (default 3)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, best is reported (default 5)")
+    args = parser.parse_args()
+
+    content = make_srt(args.hours)
+    captions = parse_srt(content)
+    track = parse_srt_track(content)
+    assert track.to_captions() == captions, "engine parse differs from parse_srt"
+    cleaned = track.cleaned()
+    assert cleaned.to_captions() == clean_srt_captions(copy.deepcopy(captions)), "engine cleaning differs"
+    assert cleaned.to_srt() == generate_srt(cleaned.to_captions()), "engine SRT output differs"
+
+    lookups = [random.Random(1).randrange(track.duration_ms) for _ in range(1000)]
+
+    def linear_lookup():
+        for ms in lookups:
+            next((c for c in captions if c.start_ms <= ms < c.end_ms), None)
+
+    def bisect_lookup():
+        for ms in lookups:
+            track.index_at(ms)
+
+    # clean_srt_captions mutates its input, so each run gets a fresh copy made outside the timing
+    copies = [copy.deepcopy(captions) for _ in range(args.repeat)]
+
+    rows = [
+        ("parse (string)", lambda: parse_srt(content), lambda: parse_srt_track(content)),
+        (
+            "parse (file handle)",
+            lambda: parse_srt(io.StringIO(content).read()),
+            lambda: read_srt_track(io.StringIO(content)),
+        ),
+        ("clean", lambda: clean_srt_captions(copies.pop()), lambda: track.cleaned()),
+        ("emit SRT", lambda: generate_srt(captions), lambda: track.to_srt()),
+        ("emit VTT", lambda: generate_vtt(captions), lambda: track.to_vtt()),
+        ("1000 time lookups", linear_lookup, bisect_lookup),
+        (
+            "parse + clean + SRT",
+            lambda: generate_srt(clean_srt_captions(parse_srt(content))),
+            lambda: parse_srt_track(content).cleaned().to_srt(),
+        ),
+    ]
+
+    print(f"{len(captions)} captions, {args.hours:g} hours, {len(content) / 1024:.0f} KB, best of {args.repeat}")
+    print(f"{'operation':<22}{'utils (ms)':>12}{'engine (ms)':>13}{'speedup':>10}")
+    for name, baseline, engine in rows:
+        base_ms = timed(baseline, args.repeat)
+        engine_ms = timed(engine, args.repeat)
+        print(f"{name:<22}{base_ms:>12.2f}{engine_ms:>13.2f}{base_ms / engine_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """Tests for Airtable auto-linking functionality on job creation.
 
-Tests that jobs are automatically linked to SST records when created,
-with proper error handling when Airtable is unavailable.
+Tests that jobs are created without waiting on Airtable, and that the
+background enrichment queue links them to SST records, with proper error
+handling when Airtable is unavailable.
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -10,23 +11,15 @@ import pytest
 
 from api.models.job import Job, JobCreate, JobStatus
 from api.routers.queue import add_to_queue
+from api.services.sst_enrichment import SSTEnrichmentQueue, link_jobs_to_sst
 
 
-@pytest.mark.asyncio
-async def test_add_to_queue_with_successful_airtable_lookup():
-    """Test that job creation successfully links to Airtable SST record."""
-    # Mock job creation
-    job_create = JobCreate(
-        project_name="Test Project",
-        transcript_file="2WLI1209HD_ForClaude.txt",
-        priority=0,
-    )
-
-    # Mock created job
-    mock_job = Job(
-        id=1,
+def _job(job_id: int, transcript_file: str, **kwargs) -> Job:
+    """Build a pending job record."""
+    return Job(
+        id=job_id,
         project_path="/path/to/project",
-        transcript_file="2WLI1209HD_ForClaude.txt",
+        transcript_file=transcript_file,
         status=JobStatus.pending,
         priority=0,
         queued_at="2025-01-01T00:00:00Z",
@@ -34,212 +27,132 @@ async def test_add_to_queue_with_successful_airtable_lookup():
         actual_cost=0.0,
         retry_count=0,
         max_retries=3,
+        **kwargs,
     )
 
-    # Mock updated job with Airtable data
-    mock_updated_job = Job(
-        id=1,
-        project_path="/path/to/project",
+
+def _mock_airtable(records: dict) -> MagicMock:
+    """Build a mock AirtableClient whose batch lookup returns records."""
+    mock_airtable = MagicMock()
+    mock_airtable.MEDIA_ID_FIELD = "Media ID"
+    mock_airtable.batch_get_sst_by_media_ids = AsyncMock(return_value=records)
+    mock_airtable.get_sst_url.side_effect = lambda record_id: f"https://airtable.com/app/tbl/{record_id}"
+    return mock_airtable
+
+
+@pytest.mark.asyncio
+async def test_add_to_queue_creates_job_without_airtable_lookup():
+    """Test that job creation stores media ID and metrics and defers SST linking."""
+    job_create = JobCreate(
+        project_name="Test Project",
         transcript_file="2WLI1209HD_ForClaude.txt",
-        status=JobStatus.pending,
         priority=0,
-        queued_at="2025-01-01T00:00:00Z",
-        estimated_cost=0.0,
-        actual_cost=0.0,
-        retry_count=0,
-        max_retries=3,
-        media_id="2WLI1209HD",
-        airtable_record_id="recXXXXXXXXXXXXXX",
-        airtable_url="https://airtable.com/appZ2HGwhiifQToB6/tblTKFOwTvK7xw1H5/recXXXXXXXXXXXXXX",
     )
-
-    # Mock Airtable record response
-    mock_record = {
-        "id": "recXXXXXXXXXXXXXX",
-        "fields": {"Media ID": "2WLI1209HD"},
-        "createdTime": "2025-01-01T00:00:00.000Z",
-    }
+    mock_job = _job(1, "2WLI1209HD_ForClaude.txt", media_id="2WLI1209HD", duration_minutes=1.5, word_count=225)
+    mock_queue = MagicMock()
 
     with (
         patch("api.routers.queue.database.find_jobs_by_transcript", new_callable=AsyncMock) as mock_find,
+        patch("api.routers.queue.database.find_jobs_by_media_id", new_callable=AsyncMock) as mock_find_media,
         patch("api.routers.queue.database.create_job", new_callable=AsyncMock) as mock_create,
         patch("api.routers.queue.database.update_job", new_callable=AsyncMock) as mock_update,
-        patch("api.routers.queue.AirtableClient") as mock_airtable_class,
+        patch("api.routers.queue.calculate_transcript_metrics_from_file", return_value=(1.5, 225)),
+        patch("api.routers.queue.get_sst_enrichment_queue", return_value=mock_queue),
+        patch("api.services.sst_enrichment.AirtableClient") as mock_airtable_class,
     ):
-
-        # Setup mocks
         mock_find.return_value = []
+        mock_find_media.return_value = []
         mock_create.return_value = mock_job
-        mock_update.return_value = mock_updated_job
 
-        # Mock AirtableClient instance
-        mock_airtable = MagicMock()
-        mock_airtable.search_sst_by_media_id = AsyncMock(return_value=mock_record)
-        mock_airtable.get_sst_url.return_value = (
-            "https://airtable.com/appZ2HGwhiifQToB6/tblTKFOwTvK7xw1H5/recXXXXXXXXXXXXXX"
-        )
-        mock_airtable_class.return_value = mock_airtable
-
-        # Execute
         result = await add_to_queue(job_create, force=False)
 
-        # Verify
+        # Job is created once with media ID and metrics, no follow-up update
         assert result.id == 1
-        assert result.media_id == "2WLI1209HD"
-        assert result.airtable_record_id == "recXXXXXXXXXXXXXX"
-        assert result.airtable_url == "https://airtable.com/appZ2HGwhiifQToB6/tblTKFOwTvK7xw1H5/recXXXXXXXXXXXXXX"
+        created = mock_create.call_args.args[0]
+        assert created.media_id == "2WLI1209HD"
+        assert created.duration_minutes == 1.5
+        assert created.word_count == 225
+        mock_update.assert_not_called()
 
-        # Verify Airtable client was called with correct media_id
-        mock_airtable.search_sst_by_media_id.assert_called_once_with("2WLI1209HD")
+        # Airtable is not consulted while handling the request
+        mock_airtable_class.assert_not_called()
+        mock_queue.enqueue.assert_called_once_with(1, "2WLI1209HD")
 
 
 @pytest.mark.asyncio
-async def test_add_to_queue_airtable_not_found():
-    """Test that job creation continues when SST record not found."""
-    job_create = JobCreate(
-        project_name="Test Project",
-        transcript_file="UNKNOWN_MEDIA_ID.txt",
-        priority=0,
-    )
-
-    mock_job = Job(
-        id=2,
-        project_path="/path/to/project",
-        transcript_file="UNKNOWN_MEDIA_ID.txt",
-        status=JobStatus.pending,
-        priority=0,
-        queued_at="2025-01-01T00:00:00Z",
-        estimated_cost=0.0,
-        actual_cost=0.0,
-        retry_count=0,
-        max_retries=3,
-    )
-
-    mock_updated_job = Job(
-        id=2,
-        project_path="/path/to/project",
-        transcript_file="UNKNOWN_MEDIA_ID.txt",
-        status=JobStatus.pending,
-        priority=0,
-        queued_at="2025-01-01T00:00:00Z",
-        estimated_cost=0.0,
-        actual_cost=0.0,
-        retry_count=0,
-        max_retries=3,
-        media_id="UNKNOWN_MEDIA_ID",
-        airtable_record_id=None,
-        airtable_url=None,
-    )
+async def test_link_jobs_to_sst_links_found_records():
+    """Test that found SST records are stored on their jobs in one batched lookup."""
+    records = {"2WLI1209HD": {"id": "recXXXXXXXXXXXXXX", "fields": {"Media ID": "2WLI1209HD"}}}
+    mock_airtable = _mock_airtable(records)
 
     with (
-        patch("api.routers.queue.database.find_jobs_by_transcript", new_callable=AsyncMock) as mock_find,
-        patch("api.routers.queue.database.create_job", new_callable=AsyncMock) as mock_create,
-        patch("api.routers.queue.database.update_job", new_callable=AsyncMock) as mock_update,
-        patch("api.routers.queue.AirtableClient") as mock_airtable_class,
+        patch("api.services.sst_enrichment.AirtableClient", return_value=mock_airtable),
+        patch("api.services.sst_enrichment.database.update_job", new_callable=AsyncMock) as mock_update,
     ):
+        linked = await link_jobs_to_sst([(1, "2WLI1209HD"), (2, "UNKNOWN_MEDIA_ID")])
 
-        mock_find.return_value = []
-        mock_create.return_value = mock_job
-        mock_update.return_value = mock_updated_job
+    assert linked == 1
+    mock_airtable.batch_get_sst_by_media_ids.assert_awaited_once()
+    assert mock_airtable.batch_get_sst_by_media_ids.call_args.args[0] == ["2WLI1209HD", "UNKNOWN_MEDIA_ID"]
 
-        # Mock AirtableClient - return None (not found)
-        mock_airtable = MagicMock()
-        mock_airtable.search_sst_by_media_id = AsyncMock(return_value=None)
-        mock_airtable_class.return_value = mock_airtable
-
-        # Execute
-        result = await add_to_queue(job_create, force=False)
-
-        # Verify job was created with media_id but no Airtable link
-        assert result.id == 2
-        assert result.media_id == "UNKNOWN_MEDIA_ID"
-        assert result.airtable_record_id is None
-        assert result.airtable_url is None
+    # Only the job with a matching record is updated
+    mock_update.assert_awaited_once()
+    job_id, update = mock_update.call_args.args
+    assert job_id == 1
+    assert update.airtable_record_id == "recXXXXXXXXXXXXXX"
+    assert update.airtable_url == "https://airtable.com/app/tbl/recXXXXXXXXXXXXXX"
 
 
 @pytest.mark.asyncio
-async def test_add_to_queue_airtable_api_key_missing():
-    """Test that job creation continues when Airtable API key not configured."""
-    job_create = JobCreate(
-        project_name="Test Project",
-        transcript_file="2WLI1209HD.txt",
-        priority=0,
-    )
-
-    mock_job = Job(
-        id=3,
-        project_path="/path/to/project",
-        transcript_file="2WLI1209HD.txt",
-        status=JobStatus.pending,
-        priority=0,
-        queued_at="2025-01-01T00:00:00Z",
-        estimated_cost=0.0,
-        actual_cost=0.0,
-        retry_count=0,
-        max_retries=3,
-    )
-
+async def test_link_jobs_to_sst_airtable_api_key_missing():
+    """Test that linking is skipped when Airtable API key not configured."""
     with (
-        patch("api.routers.queue.database.find_jobs_by_transcript", new_callable=AsyncMock) as mock_find,
-        patch("api.routers.queue.database.create_job", new_callable=AsyncMock) as mock_create,
-        patch("api.routers.queue.AirtableClient") as mock_airtable_class,
+        patch("api.services.sst_enrichment.AirtableClient", side_effect=ValueError("Airtable API key required")),
+        patch("api.services.sst_enrichment.database.update_job", new_callable=AsyncMock) as mock_update,
     ):
+        linked = await link_jobs_to_sst([(3, "2WLI1209HD")])
 
-        mock_find.return_value = []
-        mock_create.return_value = mock_job
-
-        # Mock AirtableClient to raise ValueError (API key not set)
-        mock_airtable_class.side_effect = ValueError("Airtable API key required")
-
-        # Execute
-        result = await add_to_queue(job_create, force=False)
-
-        # Verify job was created despite Airtable error
-        assert result.id == 3
-        # Job creation should succeed even though Airtable failed
+    assert linked == 0
+    mock_update.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_add_to_queue_airtable_api_error():
-    """Test that job creation continues when Airtable API fails."""
-    job_create = JobCreate(
-        project_name="Test Project",
-        transcript_file="2WLI1209HD.txt",
-        priority=0,
-    )
-
-    mock_job = Job(
-        id=4,
-        project_path="/path/to/project",
-        transcript_file="2WLI1209HD.txt",
-        status=JobStatus.pending,
-        priority=0,
-        queued_at="2025-01-01T00:00:00Z",
-        estimated_cost=0.0,
-        actual_cost=0.0,
-        retry_count=0,
-        max_retries=3,
-    )
+async def test_link_jobs_to_sst_airtable_api_error():
+    """Test that an Airtable failure is logged, not raised."""
+    mock_airtable = _mock_airtable({})
+    mock_airtable.batch_get_sst_by_media_ids.side_effect = Exception("Airtable API connection failed")
 
     with (
-        patch("api.routers.queue.database.find_jobs_by_transcript", new_callable=AsyncMock) as mock_find,
-        patch("api.routers.queue.database.create_job", new_callable=AsyncMock) as mock_create,
-        patch("api.routers.queue.AirtableClient") as mock_airtable_class,
+        patch("api.services.sst_enrichment.AirtableClient", return_value=mock_airtable),
+        patch("api.services.sst_enrichment.database.update_job", new_callable=AsyncMock) as mock_update,
     ):
+        linked = await link_jobs_to_sst([(4, "2WLI1209HD")])
 
-        mock_find.return_value = []
-        mock_create.return_value = mock_job
+    assert linked == 0
+    mock_update.assert_not_called()
 
-        # Mock AirtableClient to raise HTTP error
-        mock_airtable = MagicMock()
-        mock_airtable.search_sst_by_media_id = AsyncMock(side_effect=Exception("Airtable API connection failed"))
-        mock_airtable_class.return_value = mock_airtable
 
-        # Execute
-        result = await add_to_queue(job_create, force=False)
+@pytest.mark.asyncio
+async def test_enrichment_queue_batches_jobs():
+    """Test that jobs enqueued together share one Airtable lookup."""
+    records = {
+        "2WLI1209HD": {"id": "recAAA", "fields": {"Media ID": "2WLI1209HD"}},
+        "9UNP2005HD": {"id": "recBBB", "fields": {"Media ID": "9UNP2005HD"}},
+    }
+    mock_airtable = _mock_airtable(records)
+    queue = SSTEnrichmentQueue(batch_delay=0.01)
+
+    with (
+        patch("api.services.sst_enrichment.AirtableClient", return_value=mock_airtable),
+        patch("api.services.sst_enrichment.database.update_job", new_callable=AsyncMock) as mock_update,
+    ):
+        queue.enqueue(1, "2WLI1209HD")
+        queue.enqueue(2, "9UNP2005HD")
+        queue.enqueue(3, None)
+        await queue.wait_idle()
 
-        # Verify job was created despite Airtable error
-        assert result.id == 4
+    mock_airtable.batch_get_sst_by_media_ids.assert_awaited_once()
+    assert sorted(call.args[0] for call in mock_update.call_args_list) == [1, 2]
 
 
 @pytest.mark.asyncio
@@ -248,8 +161,8 @@ async def test_media_id_extraction():
     test_cases = [
         ("2WLI1209HD_ForClaude.txt", "2WLI1209HD"),
         ("9UNP2005HD.srt", "9UNP2005HD"),
-        ("2BUC0000HDWEB02_REV20251202.srt", "2BUC0000HDWEB02"),
-        ("2WLI1209HD_ForClaude_REV20251202.txt", "2WLI1209HD"),
+        ("2BUC0000HDWEB02_REV20251202.srt", "2BUC0000HDWEB02_REV20251202"),
+        ("2WLI1209HD_ForClaude_REV20251202.txt", "2WLI1209HD_REV20251202"),
     ]
 
     for filename, expected_media_id in test_cases:
@@ -258,42 +171,24 @@ async def test_media_id_extraction():
             transcript_file=filename,
             priority=0,
         )
-
-        mock_job = Job(
-            id=1,
-            project_path="/path/to/project",
-            transcript_file=filename,
-            status=JobStatus.pending,
-            priority=0,
-            queued_at="2025-01-01T00:00:00Z",
-            estimated_cost=0.0,
-            actual_cost=0.0,
-            retry_count=0,
-            max_retries=3,
-            media_id=expected_media_id,
-        )
+        mock_job = _job(1, filename, media_id=expected_media_id)
+        mock_queue = MagicMock()
 
         with (
             patch("api.routers.queue.database.find_jobs_by_transcript", new_callable=AsyncMock) as mock_find,
+            patch("api.routers.queue.database.find_jobs_by_media_id", new_callable=AsyncMock) as mock_find_media,
             patch("api.routers.queue.database.create_job", new_callable=AsyncMock) as mock_create,
-            patch("api.routers.queue.database.update_job", new_callable=AsyncMock) as mock_update,
-            patch("api.routers.queue.AirtableClient") as mock_airtable_class,
+            patch("api.routers.queue.get_sst_enrichment_queue", return_value=mock_queue),
         ):
-
             mock_find.return_value = []
+            mock_find_media.return_value = []
             mock_create.return_value = mock_job
-            mock_update.return_value = mock_job
-
-            # Mock AirtableClient - return None (not found)
-            mock_airtable = MagicMock()
-            mock_airtable.search_sst_by_media_id = AsyncMock(return_value=None)
-            mock_airtable_class.return_value = mock_airtable
 
-            # Execute
             result = await add_to_queue(job_create, force=False)
 
-            # Verify media_id was correctly extracted
+            # Verify media_id was correctly extracted and stored at creation
             assert result.media_id == expected_media_id
+            assert mock_create.call_args.args[0].media_id == expected_media_id
 
-            # Verify Airtable was called with correct media_id
-            mock_airtable.search_sst_by_media_id.assert_called_once_with(expected_media_id)
+            # Verify SST linking was queued with correct media_id
+            mock_queue.enqueue.assert_called_once_with(1, expected_media_id)
@@ -12,7 +12,10 @@ from api.models.job import JobCreate, JobStatus, JobUpdate
 from api.services.database import (
     close_db,
     create_job,
+    create_jobs,
     delete_job,
+    find_jobs_by_media_ids,
+    find_jobs_for_transcripts,
     get_config,
     get_events_for_job,
     get_job,
@@ -702,3 +705,48 @@ async def test_create_job_with_explicit_path_no_sanitization(test_db):
 
     # Explicit path is preserved as-is
     assert job.project_path == "/custom/path/with/slashes"
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_batch_and_find_by_media_ids(test_db):
+    """Test batch job creation and batch duplicate lookup by media ID."""
+    jobs = await create_jobs(
+        [
+            JobCreate(project_name="A", transcript_file="2WLI1209HD.srt", media_id="2WLI1209HD"),
+            JobCreate(project_name="B", transcript_file="2WLI1210HD.srt", media_id="2WLI1210HD"),
+            JobCreate(project_name="C", transcript_file="notes.txt"),
+        ]
+    )
+
+    assert [j.transcript_file for j in jobs] == ["2WLI1209HD.srt", "2WLI1210HD.srt", "notes.txt"]
+    assert jobs[0].media_id == "2WLI1209HD"
+    assert jobs[2].media_id is None
+
+    found = await find_jobs_by_media_ids(["2WLI1209HD", "2WLI1210HD", "2WLI9999HD"])
+    assert set(found) == {"2WLI1209HD", "2WLI1210HD"}
+    assert found["2WLI1209HD"][0].id == jobs[0].id
+
+    await update_job(jobs[1].id, JobUpdate(status=JobStatus.cancelled))
+    found = await find_jobs_by_media_ids(["2WLI1210HD"])
+    assert found == {}
+
+
+@pytest.mark.asyncio
+async def test_find_jobs_for_transcripts(test_db):
+    """Test bulk lookup matches by transcript file or media ID in one call."""
+    jobs = await create_jobs(
+        [
+            JobCreate(project_name="A", transcript_file="2WLI1209HD.srt", media_id="2WLI1209HD"),
+            JobCreate(project_name="B", transcript_file="notes.txt"),
+            JobCreate(project_name="C", transcript_file="other.txt", media_id="9UNP2005HD"),
+        ]
+    )
+    await update_job(jobs[2].id, JobUpdate(status=JobStatus.cancelled))
+
+    found = await find_jobs_for_transcripts(["notes.txt", "missing.txt"], ["2WLI1209HD", "9UNP2005HD"])
+    assert {j.id for j in found} == {jobs[0].id, jobs[1].id, jobs[2].id}
+
+    found = await find_jobs_for_transcripts(["notes.txt"], ["9UNP2005HD"], exclude_cancelled=True)
+    assert [j.id for j in found] == [jobs[1].id]
+
+    assert await find_jobs_for_transcripts([], []) == []
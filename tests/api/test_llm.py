@@ -11,6 +11,7 @@ import httpx
 import pytest
 
 from api.services.llm import (
+    DEFAULT_MODEL_LIMITS,
     CostCapExceededError,
     LLMClient,
     LLMResponse,
@@ -20,8 +21,10 @@ from api.services.llm import (
     calculate_cost,
     end_run_tracking,
     get_run_tracker,
+    join_continuation,
     start_run_tracking,
 )
+from api.services.tier_history import TierHistory
 
 
 @pytest.fixture
@@ -215,6 +218,60 @@ class TestTierCalculation:
         assert "timeout_seconds" in config
 
 
+class TestContextLimits:
+    """Tests for backend context window limits."""
+
+    def test_smallest_limits_across_backend_models(self, llm_client):
+        """Test the model and fallback model's tightest limits are used."""
+        assert llm_client.get_context_limits("openrouter") == (1_048_576, 8_192)
+
+    def test_unknown_models_use_default(self, llm_client):
+        """Test a backend with no known models gets the default limits."""
+        assert llm_client.get_context_limits("openrouter-cheapskate") == DEFAULT_MODEL_LIMITS
+
+    def test_backend_override(self, llm_client):
+        """Test configured limits take precedence over model limits."""
+        llm_client.config["backends"]["openrouter"]["context_tokens"] = 32_000
+        assert llm_client.get_context_limits("openrouter") == (32_000, 8_192)
+
+
+class TestStructuredOutputSupport:
+    """Tests for JSON schema response_format support by backend."""
+
+    def test_openai_compatible_backends(self, llm_client):
+        """Test OpenRouter backends support it unless disabled in config."""
+        assert llm_client.supports_structured_outputs("openrouter") is True
+
+        llm_client.config["backends"]["openrouter"]["structured_outputs"] = False
+        assert llm_client.supports_structured_outputs("openrouter") is False
+
+    def test_other_backends(self, llm_client):
+        """Test other backend types only get the schema in the prompt."""
+        llm_client.config["backends"]["claude"] = {"type": "anthropic", "model": "claude-3-5-sonnet"}
+        assert llm_client.supports_structured_outputs("claude") is False
+
+
+class TestHistoryTierSelection:
+    """Tests for history-driven starting tiers."""
+
+    def test_history_mode_refines_duration_tier(self, llm_client):
+        """Test history replaces the static choice only in history mode."""
+        history = TierHistory(bounds=[15, 30, None], days=30)
+        for tier, successes, mean_cost in ((0, 1, 0.005), (1, 20, 0.01)):
+            stats = history.record("formatter", 0, tier)
+            stats.attempts, stats.successes, stats.total_cost = 20, successes, mean_cost * successes
+        llm_client.set_tier_history(history)
+        context = {"transcript_metrics": {"estimated_duration_minutes": 10}}
+
+        assert llm_client.get_tier_for_phase_with_reason("formatter", context)[0] == 0
+
+        llm_client.config["routing"]["tier_selection"] = {"mode": "history", "min_samples": 10}
+        tier, reason = llm_client.get_tier_for_phase_with_reason("formatter", context)
+        assert tier == 1
+        assert reason.startswith("history (formatter")
+        assert llm_client.tier_history is history
+
+
 class TestCostCalculation:
     """Tests for cost calculation."""
 
@@ -415,6 +472,27 @@ class TestAPIInteractions:
         assert response.model == "google/gemini-2.0-flash-exp"
         assert response.total_tokens == 150
 
+    @pytest.mark.asyncio
+    async def test_chat_reports_length_truncation(self, llm_client, monkeypatch):
+        """Test the finish reason is exposed so callers can continue truncated output."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        start_run_tracking(job_id=5)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "Partial"}, "finish_reason": "length"}],
+            "model": "google/gemini-2.0-flash-exp",
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+
+        with patch.object(httpx.AsyncClient, "post", return_value=mock_response):
+            with patch("api.services.llm.log_event"):
+                response = await llm_client.chat(messages=[{"role": "user", "content": "Hello"}], backend="openrouter")
+
+        assert response.finish_reason == "length"
+        assert response.truncated is True
+
     @pytest.mark.asyncio
     async def test_chat_with_preset(self, llm_client, monkeypatch):
         """Test chat with OpenRouter preset."""
@@ -470,6 +548,29 @@ class TestAPIInteractions:
                 await llm_client.chat(messages=[{"role": "user", "content": "Hello"}])
 
 
+class TestContinuation:
+    """Tests for joining continuations of length-truncated output."""
+
+    def test_truncated_finish_reasons(self):
+        """Test each backend's length finish reason counts as truncated."""
+        response = LLMResponse("x", "m", 1, 1, 2, 0.0, 0, "openrouter")
+        assert response.truncated is False
+        for reason in ("length", "max_tokens", "MAX_TOKENS"):
+            response.finish_reason = reason
+            assert response.truncated is True
+        response.finish_reason = "stop"
+        assert response.truncated is False
+
+    def test_join_drops_repeated_overlap(self):
+        """Test restated tail text is not duplicated."""
+        partial = "The farmer said the cows were milked at dawn"
+        assert join_continuation(partial, "were milked at dawn every day.") == partial + " every day."
+
+    def test_join_keeps_short_coincidental_overlap(self):
+        """Test a few matching characters are not mistaken for a repeat."""
+        assert join_continuation("milked at da", "wn every day.") == "milked at dawn every day."
+
+
 class TestClientManagement:
     """Tests for client lifecycle management."""
 
@@ -3,10 +3,23 @@
 Tests queue listing, creation, deletion, and statistics.
 """
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 from api.main import app
+from api.models.job import Job, JobCreate, JobStatus
+from api.routers.queue import (
+    MAX_LOOKUP_ITEMS,
+    BulkQueueRequest,
+    QueueLookupRequest,
+    add_to_queue,
+    add_to_queue_bulk,
+    lookup_queued,
+)
 
 client = TestClient(app)
 
@@ -239,6 +252,29 @@ class TestAddToQueue:
         assert job["priority"] == 0  # Default priority
 
 
+class TestAddToQueueIndexing:
+    """Tests for transcript indexing in POST /api/queue."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_is_indexed_before_409(self):
+        """Test an SRT rejected as a duplicate of its queued .txt is still indexed for the worker."""
+        existing = TestLookupQueued._job(7, "2WLI1209HD.txt", "2WLI1209HD", JobStatus.pending)
+        mock_index = MagicMock()
+        mock_index.add = AsyncMock()
+
+        with (
+            patch("api.routers.queue.get_transcript_index", return_value=mock_index),
+            patch("api.routers.queue.database.find_jobs_by_transcript", new_callable=AsyncMock, return_value=[]),
+            patch("api.routers.queue.database.find_jobs_by_media_id", new_callable=AsyncMock, return_value=[existing]),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await add_to_queue(JobCreate(project_name="a", transcript_file="2WLI1209HD.srt"), force=False)
+
+        assert exc_info.value.status_code == 409
+        mock_index.add.assert_awaited_once()
+        assert mock_index.add.call_args.args[0].endswith("2WLI1209HD.srt")
+
+
 class TestRemoveFromQueue:
     """Tests for DELETE /api/queue/{id} endpoint."""
 
@@ -450,3 +486,110 @@ class TestInputValidation:
         """Test invalid status filter."""
         response = client.get("/api/queue/?status=invalid_status")
         assert response.status_code == 422
+
+
+class TestLookupQueued:
+    """Tests for POST /api/queue/lookup endpoint."""
+
+    @staticmethod
+    def _job(job_id: int, transcript_file: str, media_id: str, status: JobStatus) -> Job:
+        return Job(
+            id=job_id,
+            project_path=f"OUTPUT/{job_id}",
+            transcript_file=transcript_file,
+            status=status,
+            priority=0,
+            queued_at="2025-01-01T00:00:00Z",
+            estimated_cost=0.0,
+            actual_cost=0.0,
+            retry_count=0,
+            max_retries=3,
+            media_id=media_id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_lookup_matches_filename_and_media_id(self):
+        """Test filenames match by exact name or by media ID, newest job first."""
+        jobs = [
+            self._job(3, "2WLI1209HD.srt", "2WLI1209HD", JobStatus.pending),
+            self._job(2, "2WLI1209HD_ForClaude.txt", "2WLI1209HD", JobStatus.completed),
+            self._job(1, "notes.txt", "notes", JobStatus.failed),
+        ]
+
+        with patch(
+            "api.routers.queue.database.find_jobs_for_transcripts", new_callable=AsyncMock, return_value=jobs
+        ) as mock_find:
+            result = await lookup_queued(
+                QueueLookupRequest(
+                    transcript_files=["2WLI1209HD_ForClaude.txt", "2WLI1209HD.txt", "notes.txt", "new.txt"],
+                    media_ids=["2WLI1209HD", "9UNP2005HD"],
+                )
+            )
+
+        # One query for every filename and media ID
+        mock_find.assert_awaited_once()
+        assert mock_find.call_args.kwargs["exclude_cancelled"] is False
+
+        assert result.transcript_files["2WLI1209HD_ForClaude.txt"].job_id == 2  # exact name
+        assert result.transcript_files["2WLI1209HD.txt"].job_id == 3  # media ID, newest
+        assert result.transcript_files["notes.txt"].status == JobStatus.failed
+        assert "new.txt" not in result.transcript_files
+        assert set(result.media_ids) == {"2WLI1209HD"}
+
+    def test_lookup_rejects_oversized_batch(self):
+        """Test requests over the batch limit are rejected."""
+        with pytest.raises(ValidationError):
+            QueueLookupRequest(transcript_files=[f"{i}.txt" for i in range(MAX_LOOKUP_ITEMS + 1)])
+
+
+class TestBulkQueue:
+    """Tests for POST /api/queue/bulk endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_queue_skips_duplicates_and_creates_once(self):
+        """Test existing and repeated transcripts are skipped and the rest created together."""
+        existing = TestLookupQueued._job(7, "2WLI1209HD.srt", "2WLI1209HD", JobStatus.completed)
+        created = [
+            TestLookupQueued._job(8, "9UNP2005HD.srt", "9UNP2005HD", JobStatus.pending),
+            TestLookupQueued._job(9, "notes.txt", "notes", JobStatus.pending),
+        ]
+        mock_queue = MagicMock()
+        request = BulkQueueRequest(
+            jobs=[
+                JobCreate(project_name="a", transcript_file="2WLI1209HD_ForClaude.txt"),
+                JobCreate(project_name="b", transcript_file="9UNP2005HD.srt"),
+                JobCreate(project_name="b", transcript_file="9UNP2005HD.txt"),
+                JobCreate(project_name="c", transcript_file="notes.txt"),
+            ]
+        )
+
+        with (
+            patch(
+                "api.routers.queue.database.find_jobs_for_transcripts",
+                new_callable=AsyncMock,
+                return_value=[existing],
+            ) as mock_find,
+            patch(
+                "api.routers.queue.database.create_jobs", new_callable=AsyncMock, return_value=created
+            ) as mock_create,
+            patch("api.routers.queue.calculate_transcript_metrics_from_file", return_value=(2.0, 300)),
+            patch("api.routers.queue.get_sst_enrichment_queue", return_value=mock_queue),
+        ):
+            response = await add_to_queue_bulk(request)
+
+        mock_find.assert_awaited_once()
+        assert mock_find.call_args.kwargs["exclude_cancelled"] is True
+
+        mock_create.assert_awaited_once()
+        to_create = mock_create.call_args.args[0]
+        assert [job.transcript_file for job in to_create] == ["9UNP2005HD.srt", "notes.txt"]
+        assert to_create[0].media_id == "9UNP2005HD"
+        assert to_create[0].word_count == 300
+
+        assert response.queued == 2
+        assert response.skipped == 2
+        assert response.results[0].existing_job.job_id == 7
+        assert response.results[1].job_id == 8
+        assert response.results[2].error == "Duplicate in this request"
+        assert response.results[3].job_id == 9
+        assert mock_queue.enqueue.call_count == 2
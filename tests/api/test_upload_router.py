@@ -0,0 +1,73 @@
+"""Tests for the transcript upload endpoint."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+client = TestClient(app)
+
+
+def _job(job_id: int) -> MagicMock:
+    job = MagicMock()
+    job.id = job_id
+    return job
+
+
+class TestUploadTranscripts:
+    """Tests for POST /api/upload/transcripts."""
+
+    def test_batch_uses_one_duplicate_query_and_one_create(self, tmp_path):
+        """Test a batch is checked with one query and created in one call, with SST linking deferred."""
+        with (
+            patch("api.routers.upload.TRANSCRIPTS_DIR", tmp_path),
+            patch("api.routers.upload.database.find_jobs_by_media_ids", new_callable=AsyncMock) as mock_find,
+            patch("api.routers.upload.database.create_jobs", new_callable=AsyncMock) as mock_create,
+            patch("api.routers.upload.link_jobs_to_sst", new_callable=AsyncMock) as mock_link,
+        ):
+            existing = MagicMock()
+            existing.id = 7
+            existing.status.value = "completed"
+            mock_find.return_value = {"2WLI1300HD": [existing]}
+            mock_create.return_value = [_job(1), _job(2)]
+
+            files = [
+                ("files", ("2WLI1209HD.srt", b"a", "text/plain")),
+                ("files", ("2WLI1210HD_ForClaude.txt", b"b", "text/plain")),
+                ("files", ("2WLI1300HD.srt", b"c", "text/plain")),
+                ("files", ("2WLI1209HD_ForClaude.txt", b"d", "text/plain")),
+            ]
+            response = client.post("/api/upload/transcripts", files=files)
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["uploaded"] == 2
+            assert data["failed"] == 2
+            assert [f["success"] for f in data["files"]] == [True, True, False, False]
+            assert "job 7" in data["files"][2]["error"]
+            assert "in this upload" in data["files"][3]["error"]
+
+            mock_find.assert_awaited_once()
+            created = mock_create.await_args.args[0]
+            assert [j.media_id for j in created] == ["2WLI1209HD", "2WLI1210HD"]
+            mock_link.assert_awaited_once_with([(1, "2WLI1209HD"), (2, "2WLI1210HD")])
+            assert (tmp_path / "2WLI1209HD.srt").read_bytes() == b"a"
+
+    def test_oversized_file_rejected_without_partial_file(self, tmp_path):
+        """Test a file over the limit is rejected and nothing is left on disk."""
+        with (
+            patch("api.routers.upload.TRANSCRIPTS_DIR", tmp_path),
+            patch("api.routers.upload.MAX_FILE_SIZE", 10),
+            patch("api.routers.upload.UPLOAD_CHUNK_SIZE", 4),
+            patch("api.routers.upload.database.find_jobs_by_media_ids", new_callable=AsyncMock, return_value={}),
+            patch("api.routers.upload.database.create_jobs", new_callable=AsyncMock) as mock_create,
+        ):
+            files = [("files", ("2WLI1209HD.srt", b"x" * 50, "text/plain"))]
+            response = client.post("/api/upload/transcripts", files=files)
+
+            data = response.json()
+            assert data["failed"] == 1
+            assert "too large" in data["files"][0]["error"]
+            mock_create.assert_not_awaited()
+            assert list(tmp_path.iterdir()) == []
@@ -5,6 +5,7 @@ tier escalation, and manager phase analysis/recovery.
 """
 
 import asyncio
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
@@ -31,6 +32,8 @@ def mock_llm_client():
         "timeout_seconds": 120,
         "max_retries_per_tier": 1,
     }
+    client.get_continuation_config.return_value = {"enabled": True, "max_continuations": 2, "tail_chars": 2000}
+    client.get_context_limits.return_value = (128000, 8192)
     client.get_tier_for_phase_with_reason.return_value = (0, "short transcript")
     client.get_backend_for_phase.return_value = "openrouter-cheapskate"
     client.get_next_tier.return_value = 1
@@ -45,6 +48,7 @@ def mock_llm_response():
     response.cost = 0.001
     response.total_tokens = 500
     response.model = "test-model"
+    response.truncated = False
     return response
 
 
@@ -255,6 +259,290 @@ class TestLoadTranscript:
             worker._load_transcript(job)
 
 
+class TestFindSrtFile:
+    """Tests for _find_srt_file method."""
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.get_transcript_index")
+    async def test_scans_folders_on_index_miss(self, mock_get_index, mock_get_llm, mock_llm_client, tmp_path):
+        """Should find and index a variant SRT that never went through the API."""
+        mock_get_llm.return_value = mock_llm_client
+        index = MagicMock()
+        index.find_srt.return_value = None
+        index.add = AsyncMock()
+        mock_get_index.return_value = index
+        archive = tmp_path / "archive"
+        archive.mkdir()
+        (archive / "2WLI1209HD.srt").write_text("srt")
+        variant = tmp_path / "2WLI1209HD_ForClaude.srt"
+        variant.write_text("srt")
+        (tmp_path / "9UNP2005HD.srt").write_text("srt")
+
+        worker = JobWorker()
+        with (
+            patch("api.services.worker.TRANSCRIPTS_DIR", tmp_path),
+            patch("api.services.worker.TRANSCRIPTS_ARCHIVE_DIR", archive),
+        ):
+            result = await worker._find_srt_file({"transcript_file": "2WLI1209HD.txt"})
+            missing = await worker._find_srt_file({"transcript_file": "2WLI0000HD.txt"})
+
+        assert result == variant
+        index.add.assert_awaited_once_with(variant, archive / "2WLI1209HD.srt")
+        assert missing is None
+
+
+class TestWriteTranscriptTiming:
+    """Tests for _write_transcript_timing method."""
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    async def test_writes_sidecar_for_caption_jobs(self, mock_get_llm, mock_llm_client, tmp_path):
+        """Should align the formatter output and save transcript_timing.json."""
+        from api.services.alignment import load_timing
+        from api.services.srt import CaptionTrack
+
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+        artifact = MagicMock()
+        artifact.captions = CaptionTrack.from_columns(
+            [0, 3000], [3000, 6000], ["welcome back to the show", "today we visit a dairy farm"]
+        )
+        context = {"transcript_artifact": artifact}
+
+        formatted = "# Title\n\n---\n\n**HOST:** Welcome back to the show. Today we visit a dairy farm."
+        await worker._write_transcript_timing(context, tmp_path, formatted)
+
+        timing = load_timing(tmp_path)
+        assert (timing.paragraphs[0].start_ms, timing.paragraphs[0].end_ms) == (0, 6000)
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    async def test_skips_without_captions(self, mock_get_llm, mock_llm_client, tmp_path):
+        """Should write nothing for plain-text transcripts."""
+        from api.services.srt import CaptionTrack
+
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+        artifact = MagicMock()
+        artifact.captions = CaptionTrack.from_columns([], [], [])
+        context = {"transcript_artifact": artifact}
+
+        await worker._write_transcript_timing(context, tmp_path, "Some formatted text.")
+
+        assert not (tmp_path / "transcript_timing.json").exists()
+
+
+class TestRepairMissingSpans:
+    """Tests for _repair_missing_spans method."""
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_reformats_only_missing_spans(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, mock_llm_response, tmp_path
+    ):
+        """Should send just the skipped section and splice the result into the output file."""
+        from api.services.completeness import check_completeness
+
+        source = " ".join(f"word{i}" for i in range(1000))
+        formatted = (
+            "# Title\n\n---\n\n" + " ".join(f"word{i}" for i in range(600)) + "\n\n**Status:** ready_for_editing\n"
+        )
+        (tmp_path / "formatter_output.md").write_text("<!-- model: m -->\n" + formatted)
+
+        mock_llm_response.content = "**HOST:** " + " ".join(f"word{i}" for i in range(600, 1000))
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        completeness = check_completeness(formatted, source)
+        assert completeness.missing_word_count == 400
+
+        repair = await worker._repair_missing_spans(1, {"formatter_output": formatted}, tmp_path, completeness, tier=0)
+
+        assert repair["spans"] == 1
+        assert repair["cost"] == 0.001
+        prompt = mock_llm_client.chat.call_args.kwargs["messages"][1]["content"]
+        assert "word600 word601" in prompt
+        assert "word100 " not in prompt.split("### Section to Format")[1]
+
+        assert check_completeness(repair["output"], source).missing_spans == []
+        saved = (tmp_path / "formatter_output.md").read_text()
+        assert saved.startswith("<!-- repaired: 1 missing span(s)")
+        assert "word599\n\n**HOST:** word600" in saved
+        assert list(tmp_path.glob("formatter_output.*.prev.md"))
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_returns_none_when_llm_fails(self, mock_agents_dir, mock_get_llm, mock_llm_client, tmp_path):
+        """Should leave the output untouched so the job can pause for a full retry."""
+        from api.services.completeness import check_completeness
+
+        formatted = " ".join(f"word{i}" for i in range(200))
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.chat = AsyncMock(side_effect=Exception("API error"))
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        completeness = check_completeness(formatted, " ".join(f"word{i}" for i in range(1000)))
+
+        repair = await worker._repair_missing_spans(1, {"formatter_output": formatted}, tmp_path, completeness)
+
+        assert repair is None
+        assert not (tmp_path / "formatter_output.md").exists()
+
+
+class TestLocalQAReview:
+    """Tests for skipping the manager phase when local QA checks pass."""
+
+    PASSING_CONTEXT = {
+        "formatter_output": "# Title\n\n---\n\n**Jane Smith:** Hello.\n\n**Status:** ready_for_editing",
+        "seo_output": "**Title:** Dairy Farming in Wisconsin\n\n**Tags:** " + ", ".join(f"tag{i}" for i in range(12)),
+        "completeness_check": {"is_complete": True, "skipped": True, "reason": "Skipped: source too short"},
+        "transcript_metrics": {"estimated_duration_minutes": 8.0},
+    }
+
+    @patch("api.services.worker.get_llm_client")
+    def test_skips_manager_for_short_passing_content(self, mock_get_llm, mock_llm_client, tmp_path):
+        """Should write a local review instead of calling the manager."""
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+        context = dict(self.PASSING_CONTEXT)
+
+        assert worker._can_skip_manager(context) is True
+
+        result = worker._write_local_qa_review(context, tmp_path)
+        assert result["success"] is True
+        assert result["cost"] == 0.0
+        saved = (tmp_path / "manager_output.md").read_text()
+        assert "**Overall Status:** APPROVED" in saved
+        assert "[PASS] seo: title length" in saved
+
+    @patch("api.services.worker.get_llm_client")
+    def test_runs_manager_for_long_or_failing_content(self, mock_get_llm, mock_llm_client):
+        """Should keep the manager call when content is long or any check fails."""
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+
+        long_content = dict(self.PASSING_CONTEXT, transcript_metrics={"estimated_duration_minutes": 45.0})
+        assert worker._can_skip_manager(long_content) is False
+
+        failing = dict(self.PASSING_CONTEXT, seo_output="**Title:** " + "x" * 70)
+        assert worker._can_skip_manager(failing) is False
+
+        mock_llm_client.config["routing"]["qa_checks"] = {"skip_manager": False}
+        assert worker._can_skip_manager(dict(self.PASSING_CONTEXT)) is False
+
+
+class TestFastPath:
+    """Tests for the fused analyst+SEO call on short content."""
+
+    FUSED_REPLY = json.dumps({"analysis": "## Topics\n\n- Dairy farming", "seo": "**Title:** Dairy Farms"})
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_writes_both_outputs(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, mock_llm_response, tmp_path
+    ):
+        """Should split one reply into analyst_output.md and seo_output.md."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_response.content = "```json\n" + self.FUSED_REPLY + "\n```"
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        context = {"transcript": "Test transcript"}
+        result = await worker._run_fast_path_analysis(1, context, tmp_path)
+
+        assert result["success"] is True
+        assert result["output"] == "## Topics\n\n- Dairy farming"
+        assert result["seo_output"] == context["seo_output"] == "**Title:** Dairy Farms"
+        assert (tmp_path / "analyst_output.md").read_text().endswith("- Dairy farming")
+        assert "fast path: analyst+seo" in (tmp_path / "seo_output.md").read_text()
+        assert not (tmp_path / "analyst_seo_output.md").exists()
+        assert mock_llm_client.chat.call_args.kwargs["phase"] == "analyst_seo"
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_unparseable_reply_fails(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, mock_llm_response, tmp_path
+    ):
+        """Should report failure, with the call's cost, when the reply lacks either field."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_response.content = '{"analysis": "Only the analysis"}'
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        result = await worker._run_fast_path_analysis(1, {"transcript": "Test transcript"}, tmp_path)
+
+        assert result["success"] is False
+        assert result["cost"] == 0.001
+        assert not (tmp_path / "analyst_output.md").exists()
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_structured_seo_validated_and_rendered(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, mock_llm_response, tmp_path
+    ):
+        """Should validate the fused reply's seo object and save it as the SEO markdown report."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.config["routing"]["structured_outputs"] = {"enabled": True}
+        seo = {"title": "Dairy Farms", "short_description": "A farm.", "long_description": "Cows.", "tags": ["dairy"]}
+        mock_llm_response.content = json.dumps({"analysis": "## Topics", "seo": seo})
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        context = {"transcript": "Test transcript"}
+        result = await worker._run_fast_path_analysis(1, context, tmp_path)
+
+        assert result["success"] is True
+        assert context["seo_output"].startswith("# SEO Metadata\n\n**Title:** Dairy Farms")
+        assert (
+            '"seo" object must match this JSON schema'
+            in mock_llm_client.chat.call_args.kwargs["messages"][1]["content"]
+        )
+
+        # A seo object that doesn't match the schema sends the job back to separate calls
+        mock_llm_response.content = json.dumps({"analysis": "## Topics", "seo": {"title": "Dairy Farms"}})
+        result = await worker._run_fast_path_analysis(1, {"transcript": "Test transcript"}, tmp_path)
+        assert result["success"] is False
+
+    @patch("api.services.worker.get_llm_client")
+    def test_parse_tolerates_trailing_comma_and_prose(self, mock_get_llm, mock_llm_client):
+        """Should parse a fused reply with a trailing comma and braces in trailing prose."""
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+        reply = '{"analysis": "## Topics", "seo": "**Title:** Dairy Farms",}\n\nNote: tags use {braces} here.'
+
+        assert worker._parse_fast_path_output(reply) == {"analysis": "## Topics", "seo": "**Title:** Dairy Farms"}
+
+    @patch("api.services.worker.get_llm_client")
+    def test_only_fresh_short_jobs_qualify(self, mock_get_llm, mock_llm_client):
+        """Should use the fast path only when enabled, short and not resuming."""
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+        short = {"transcript_metrics": {"estimated_duration_minutes": 5.0}}
+
+        assert worker._use_fast_path(short, []) is False
+
+        mock_llm_client.config["routing"]["fast_path"] = {"enabled": True, "max_minutes": 10}
+        assert worker._use_fast_path(short, []) is True
+        assert worker._use_fast_path({"transcript_metrics": {"estimated_duration_minutes": 25.0}}, []) is False
+        assert worker._use_fast_path(short, [{"name": "analyst", "status": "completed"}]) is False
+
+
 class TestLoadAgentPrompt:
     """Tests for _load_agent_prompt method."""
 
@@ -300,6 +588,85 @@ class TestBuildPhasePrompt:
         assert "Test transcript content" in result
         assert "analyze" in result.lower()
 
+    @patch("api.services.worker.get_llm_client")
+    def test_srt_transcript_sent_as_timed_paragraphs(self, mock_get_llm, mock_llm_client, tmp_path):
+        """Should send SRT transcripts without caption indices and full timecodes."""
+        from api.services.transcript_artifact import build_artifact
+
+        mock_get_llm.return_value = mock_llm_client
+        srt = tmp_path / "2WLI1209HD.srt"
+        srt.write_text("1\n00:00:01,000 --> 00:00:03,000\nHello\n\n2\n00:00:03,000 --> 00:00:05,000\nworld.\n")
+        artifact = build_artifact(srt)
+
+        worker = JobWorker()
+        context = {"transcript": artifact.content, "transcript_artifact": artifact}
+
+        result = worker._build_phase_prompt("analyst", context)
+        assert "[0:00:01] Hello world." in result
+        assert "-->" not in result
+
+    @patch("api.services.worker.get_llm_client")
+    def test_timestamp_prompt_uses_chapter_candidates(self, mock_get_llm, mock_llm_client):
+        """Should send chapter candidates spanning the whole SRT instead of raw captions."""
+        from api.services.utils import SRTCaption, generate_srt
+
+        mock_get_llm.return_value = mock_llm_client
+        topics = ["cheese dairy cows milk.", "river fishing boat walleye.", "hockey skates rink puck."]
+        captions = [
+            SRTCaption(index=0, start_ms=i * 3000, end_ms=i * 3000 + 2500, text=topics[i // 100]) for i in range(300)
+        ]
+        srt_content = generate_srt(captions)
+
+        worker = JobWorker()
+        result = worker._build_phase_prompt("timestamp", {"srt_content": srt_content, "analyst_output": "Analysis"})
+
+        assert "Chapter Candidates" in result
+        assert "0:00:00.000 - " in result
+        assert "hockey" in result  # last third of a 15-minute program
+        assert "-->" not in result
+
+    @patch("api.services.worker.get_llm_client")
+    def test_timestamp_output_snapped_to_caption_starts(self, mock_get_llm, mock_llm_client):
+        """Should rewrite chapter starts copied from paragraph stamps to exact SRT times."""
+        from api.services.utils import SRTCaption, generate_srt
+
+        mock_get_llm.return_value = mock_llm_client
+        srt_content = generate_srt(
+            [
+                SRTCaption(index=1, start_ms=1200, end_ms=3000, text="Welcome."),
+                SRTCaption(index=2, start_ms=65432, end_ms=67000, text=">> Next topic."),
+            ]
+        )
+
+        worker = JobWorker()
+        output = "| Intro | 0:00:00.000 | 0:01:04.999 |\n| Next | 0:01:05.000 | 0:01:07.000 |"
+        result = worker._snap_timestamp_output(output, {"srt_content": srt_content})
+
+        assert result == "| Intro | 0:00:00.000 | 0:01:04.999 |\n| Next | 0:01:05.432 | 0:01:07.000 |"
+
+    @patch("api.services.worker.get_llm_client")
+    def test_manager_prompt_carries_check_results_and_excerpts(self, mock_get_llm, mock_llm_client):
+        """Should send local QA results and only the ends of a long formatted transcript."""
+        mock_get_llm.return_value = mock_llm_client
+        body = "\n\n".join(f"**HOST:** Paragraph {i} of the program." for i in range(500))
+
+        worker = JobWorker()
+        context = {
+            "transcript": "Test transcript",
+            "analyst_output": "Analysis output",
+            "formatter_output": f"# Title\n\n---\n\n**Dr. Jane Smith:** Hello.\n\n{body}",
+            "seo_output": "**Title:** Short title\n\n**Tags:** a, b",
+        }
+
+        result = worker._build_phase_prompt("manager", context)
+        assert "## Automated QA Checks" in result
+        assert "[FAIL] formatter: speaker labels" in result
+        assert "> Dr. Jane Smith" in result
+        assert "[FAIL] seo: tag count - 2 tags" in result
+        assert "Paragraph 0 of" in result
+        assert "Paragraph 499 of" in result
+        assert "Paragraph 250 of" not in result
+
     @patch("api.services.worker.get_llm_client")
     def test_formatter_prompt_includes_analysis(self, mock_get_llm, mock_llm_client):
         """Should include analysis in formatter prompt."""
@@ -382,6 +749,43 @@ class TestRunPhase:
         assert result["tokens"] == 500
         assert (tmp_path / "analyst_output.md").exists()
 
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_length_truncated_output_is_continued(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, tmp_path
+    ):
+        """Should resume truncated output on the same tier instead of escalating."""
+        from api.services.llm import LLMResponse
+
+        def response(content, finish_reason):
+            return LLMResponse(content, "test-model", 100, 50, 150, 0.001, 0, "openrouter", None, finish_reason)
+
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.chat = AsyncMock(
+            side_effect=[
+                response("First part of the transcript", "length"),
+                response("the transcript and the second", "length"),
+                response(" part.", "stop"),
+            ]
+        )
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        result = await worker._run_phase(
+            job_id=1, phase_name="formatter", context={"transcript": "Test transcript"}, project_path=tmp_path
+        )
+
+        assert result["success"] is True
+        assert result["output"] == "First part of the transcript and the second part."
+        assert result["tier"] == 0
+        assert result["tokens"] == 450
+        assert result["cost"] == pytest.approx(0.003)
+        continuation_prompt = mock_llm_client.chat.call_args_list[1].kwargs["messages"][-1]["content"]
+        assert "First part of the transcript" in continuation_prompt
+        mock_llm_client.get_next_tier.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("api.services.worker.get_llm_client")
     @patch("api.services.worker.log_event")
@@ -445,6 +849,172 @@ class TestRunPhase:
         assert result["success"] is False
         assert "LLM Error" in result["error"]
 
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_prompt_trimmed_to_context_window(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, mock_llm_response, tmp_path
+    ):
+        """Should shrink large sections to fit a small window and report the trims."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_llm_client.get_context_limits.return_value = (8000, 2000)
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        transcript = " ".join(f"word{i}" for i in range(10000))
+        result = await worker._run_phase(
+            job_id=1, phase_name="analyst", context={"transcript": transcript}, project_path=tmp_path
+        )
+
+        assert result["success"] is True
+        prompt = mock_llm_client.chat.call_args.kwargs["messages"][-1]["content"]
+        assert len(prompt) < 8000 * 4
+        assert "word0 " in prompt and "word9999" in prompt
+        assert [(t["section"], t["reason"]) for t in result["prompt_trims"]] == [("prompt_transcript", "window")]
+
+
+class TestStructuredOutputs:
+    """Tests for schema-validated SEO/manager outputs in _run_phase."""
+
+    SEO = {
+        "title": "Dairy Farms",
+        "short_description": "A family farm.",
+        "long_description": "Four generations of dairy farming.",
+        "tags": ["dairy", "farming"],
+    }
+
+    def _response(self, content):
+        response = MagicMock(content=content, cost=0.001, total_tokens=500, truncated=False)
+        response.model = "test-model"
+        return response
+
+    @patch("api.services.worker.get_llm_client")
+    def test_user_prompts_ask_for_json(self, mock_get_llm, mock_llm_client):
+        """Should ask for a JSON object, not a markdown report, when the phase has an output model."""
+        mock_get_llm.return_value = mock_llm_client
+        worker = JobWorker()
+        context = {"transcript": "Transcript", "analyst_output": "Analysis", "formatter_output": "Formatted"}
+
+        assert worker._build_phase_prompt("seo", context).endswith("Generate SEO metadata as a markdown report.")
+
+        mock_llm_client.config["routing"]["structured_outputs"] = {"enabled": True}
+        seo_prompt = worker._build_phase_prompt("seo", context)
+        manager_prompt = worker._build_phase_prompt("manager", {**context, "seo_output": "SEO"})
+        assert "markdown report" not in seo_prompt
+        assert seo_prompt.endswith("single JSON object matching the schema in your instructions.")
+        assert manager_prompt.endswith("single JSON object matching the schema in your instructions.")
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_malformed_output_repaired_on_same_tier(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, tmp_path
+    ):
+        """Should ask the same backend to fix an invalid reply instead of escalating."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.config["routing"]["structured_outputs"] = {"enabled": True}
+        mock_llm_client.supports_structured_outputs.return_value = True
+        mock_llm_client.chat = AsyncMock(
+            side_effect=[self._response('{"title": "Dairy Farms"}'), self._response(json.dumps(self.SEO))]
+        )
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        result = await worker._run_phase(1, "seo", {"transcript": "Test transcript"}, tmp_path)
+
+        assert result["success"] is True
+        assert result["tier"] == 0
+        assert result["cost"] == pytest.approx(0.002)
+        assert "**Title:** Dairy Farms" in result["output"]
+        assert "**Title:** Dairy Farms" in (tmp_path / "seo_output.md").read_text()
+        first, repair = mock_llm_client.chat.call_args_list
+        assert first.kwargs["response_format"]["json_schema"]["name"] == "SEOMetadata"
+        assert "did not match the required JSON schema" in repair.kwargs["messages"][-1]["content"]
+        assert repair.kwargs["backend"] == first.kwargs["backend"]
+        mock_llm_client.get_next_tier.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_failed_repair_escalates(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, tmp_path
+    ):
+        """Should escalate only after the repair attempt also fails validation."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.config["routing"]["structured_outputs"] = {"enabled": True}
+        mock_llm_client.supports_structured_outputs.return_value = False
+        mock_llm_client.chat = AsyncMock(
+            side_effect=[
+                self._response("not json"),
+                self._response("still not json"),
+                self._response(json.dumps(self.SEO)),
+            ]
+        )
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        result = await worker._run_phase(1, "seo", {"transcript": "Test transcript"}, tmp_path)
+
+        assert result["success"] is True
+        assert result["tier"] == 1
+        assert "schema validation" in result["tier_reason"]
+        assert all("response_format" not in call.kwargs for call in mock_llm_client.chat.call_args_list)
+        assert "Output Format" in mock_llm_client.chat.call_args.kwargs["messages"][0]["content"]
+
+
+class TestTierHistoryRefresh:
+    """Tests for loading tier history for history-driven routing."""
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.load_tier_history", new_callable=AsyncMock)
+    async def test_loads_only_in_history_mode_and_when_stale(self, mock_load, mock_get_llm, mock_llm_client):
+        """Should load history in history mode and reuse it until refresh_minutes pass."""
+        from api.services.tier_history import TierHistory
+
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.tier_history = None
+        worker = JobWorker()
+
+        await worker._refresh_tier_history()
+        mock_load.assert_not_awaited()
+
+        mock_llm_client.config["routing"]["tier_selection"] = {"mode": "history", "history_days": 14}
+        history = TierHistory(bounds=[None], days=14)
+        mock_load.return_value = history
+        await worker._refresh_tier_history()
+        mock_llm_client.set_tier_history.assert_called_once_with(history)
+        assert mock_load.await_args.args[1] == 14
+
+        mock_llm_client.tier_history = history
+        await worker._refresh_tier_history()
+        mock_load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_phase_events_record_duration_and_elapsed_time(
+        self, mock_agents_dir, mock_log_event, mock_get_llm, mock_llm_client, mock_llm_response, tmp_path
+    ):
+        """Should log content duration and attempt time for the tier history."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+
+        worker = JobWorker()
+        context = {"transcript": "Test transcript", "transcript_metrics": {"estimated_duration_minutes": 12.5}}
+        await worker._run_phase(1, "analyst", context, tmp_path)
+
+        started, completed = [call.args[0].data.extra for call in mock_log_event.call_args_list]
+        assert started["duration_minutes"] == 12.5
+        assert completed["duration_minutes"] == 12.5
+        assert completed["elapsed_seconds"] >= 0
+
 
 class TestHeartbeatLoop:
     """Tests for _heartbeat_loop method."""
@@ -518,6 +1088,72 @@ class TestAnalyzeAndRecover:
 
         assert result["recovered"] is False
         assert result["action"] == "FAIL"
+        mock_llm_client.generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.update_job_phase")
+    async def test_rule_retry_skips_manager(self, mock_update_phase, mock_get_llm, mock_llm_client, tmp_path):
+        """Should retry a timed-out phase without asking the manager."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.generate = AsyncMock()
+
+        worker = JobWorker()
+        worker._run_phase = AsyncMock(return_value={"success": True, "output": "Analysis", "cost": 0.002})
+        worker._complete_remaining_phases = AsyncMock(return_value={"recovered": True, "action": "RETRY"})
+        phases = [{"name": "analyst", "status": "failed", "tier": 0, "tier_label": "cheapskate"}]
+
+        result = await worker._analyze_and_recover(
+            job={"id": 1, "project_name": "Test"},
+            project_path=tmp_path,
+            phases=phases,
+            context={"transcript": "test"},
+            error="Phase analyst failed: Timeout after 120s",
+            current_cost=0.001,
+        )
+
+        assert result["recovered"] is True
+        mock_llm_client.generate.assert_not_called()
+        assert worker._run_phase.await_args.kwargs["phase_name"] == "analyst"
+        assert worker._complete_remaining_phases.await_args.kwargs["total_cost"] == pytest.approx(0.003)
+        assert "error class: timeout" in (tmp_path / "recovery_analysis.md").read_text()
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.asyncio.sleep", new_callable=AsyncMock)
+    async def test_rule_fail_and_rate_limit_pause(self, mock_sleep, mock_get_llm, mock_llm_client, tmp_path):
+        """Should fail unrecoverable errors at no cost, and pause before retrying rate limits."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.generate = AsyncMock()
+        mock_llm_client.config["routing"]["recovery"] = {"retry_delay_seconds": 5}
+
+        worker = JobWorker()
+        result = await worker._analyze_and_recover(
+            job={"id": 1, "project_name": "Test"},
+            project_path=tmp_path,
+            phases=[],
+            context={},
+            error="Transcript not found: missing.txt",
+            current_cost=0.0,
+        )
+        assert result == {
+            "recovered": False,
+            "action": "FAIL",
+            "reason": "Input file is missing; re-queue once it is available",
+            "cost": 0.0,
+        }
+        mock_sleep.assert_not_awaited()
+
+        await worker._analyze_and_recover(
+            job={"id": 1, "project_name": "Test"},
+            project_path=tmp_path,
+            phases=[],
+            context={},
+            error="Client error '429 Too Many Requests'",
+            current_cost=0.0,
+        )
+        mock_sleep.assert_awaited_once_with(5)
+        mock_llm_client.generate.assert_not_called()
 
 
 class TestProcessJob:
@@ -583,6 +1219,125 @@ class TestProcessJob:
             or mock_update_status.called
         )
 
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.update_job_status")
+    @patch("api.services.worker.update_job_phase")
+    @patch("api.services.worker.update_job_heartbeat")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.start_run_tracking")
+    @patch("api.services.worker.end_run_tracking")
+    @patch("api.services.worker.TRANSCRIPTS_DIR")
+    @patch("api.services.worker.OUTPUT_DIR")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_fast_path_skips_separate_seo_call(
+        self,
+        mock_agents_dir,
+        mock_output_dir,
+        mock_transcripts_dir,
+        mock_end_tracking,
+        mock_start_tracking,
+        mock_log_event,
+        mock_update_heartbeat,
+        mock_update_phase,
+        mock_update_status,
+        mock_get_llm,
+        mock_llm_client,
+        mock_llm_response,
+        tmp_path,
+        sample_job,
+    ):
+        """Should record SEO as completed by the fused call and never run it on its own."""
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.config["routing"]["fast_path"] = {"enabled": True, "max_minutes": 10}
+        fused = MagicMock(
+            content=json.dumps({"analysis": "Analysis", "seo": "SEO report"}),
+            cost=0.002,
+            total_tokens=800,
+            truncated=False,
+        )
+        fused.model = "test-model"
+        mock_llm_client.chat = AsyncMock(side_effect=[fused, mock_llm_response, mock_llm_response])
+        mock_start_tracking.return_value = MagicMock(total_cost=0, total_tokens=0)
+        mock_end_tracking.return_value = {"total_cost": 0.01, "total_tokens": 2000}
+        mock_transcripts_dir.__truediv__ = lambda self, name: tmp_path / name
+        mock_output_dir.__truediv__ = lambda self, name: tmp_path / name
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+        (tmp_path / sample_job["transcript_file"]).write_text("Test transcript content")
+
+        worker = JobWorker()
+        await worker.process_job(sample_job)
+
+        called_phases = [call.kwargs["phase"] for call in mock_llm_client.chat.call_args_list]
+        assert called_phases == ["analyst_seo", "formatter", "manager"]
+        phases = {p["name"]: p for p in mock_update_phase.call_args.args[1]}
+        assert phases["seo"]["status"] == "completed"
+        assert phases["seo"]["metadata"] == {"fast_path": True, "fused_with": "analyst"}
+        assert phases["analyst"]["cost"] == 0.002
+        project_path = tmp_path / "Test_Project"
+        assert (project_path / "seo_output.md").read_text().endswith("SEO report")
+
+    @pytest.mark.asyncio
+    @patch("api.services.worker.get_llm_client")
+    @patch("api.services.worker.update_job_status")
+    @patch("api.services.worker.update_job_phase")
+    @patch("api.services.worker.update_job_heartbeat")
+    @patch("api.services.worker.log_event")
+    @patch("api.services.worker.start_run_tracking")
+    @patch("api.services.worker.end_run_tracking")
+    @patch("api.services.worker.check_completeness")
+    @patch("api.services.worker.TRANSCRIPTS_DIR")
+    @patch("api.services.worker.OUTPUT_DIR")
+    @patch("api.services.worker.AGENTS_DIR")
+    async def test_pauses_when_span_repair_fails(
+        self,
+        mock_agents_dir,
+        mock_output_dir,
+        mock_transcripts_dir,
+        mock_check,
+        mock_end_tracking,
+        mock_start_tracking,
+        mock_log_event,
+        mock_update_heartbeat,
+        mock_update_phase,
+        mock_update_status,
+        mock_get_llm,
+        mock_llm_client,
+        mock_llm_response,
+        tmp_path,
+        sample_job,
+    ):
+        """Should pause instead of continuing with gaps when the repair call fails, even if the ratio passes."""
+        from api.models.job import JobStatus
+        from api.services.completeness import CompletenessResult, MissingSpan
+
+        mock_get_llm.return_value = mock_llm_client
+        mock_llm_client.chat = AsyncMock(return_value=mock_llm_response)
+        mock_start_tracking.return_value = MagicMock(total_cost=0, total_tokens=0)
+        mock_end_tracking.return_value = {"total_cost": 0.01, "total_tokens": 2000}
+        mock_check.return_value = CompletenessResult(
+            is_complete=True,
+            source_word_count=1000,
+            output_word_count=800,
+            coverage_ratio=0.8,
+            threshold=0.7,
+            reason="ratio ok",
+            missing_spans=[MissingSpan(source_start=400, source_stop=600, output_position=400, text="skipped words")],
+        )
+        mock_transcripts_dir.__truediv__ = lambda self, name: tmp_path / name
+        mock_output_dir.__truediv__ = lambda self, name: tmp_path / name
+        mock_agents_dir.__truediv__ = lambda self, name: tmp_path / name
+        (tmp_path / sample_job["transcript_file"]).write_text("Test transcript content")
+
+        worker = JobWorker()
+        with patch.object(worker, "_repair_missing_spans", new=AsyncMock(return_value=None)):
+            await worker.process_job(sample_job)
+
+        paused = [call for call in mock_update_status.call_args_list if call.args[1] == JobStatus.paused]
+        assert "repair call failed" in paused[0].kwargs["error_message"]
+        called_phases = [call.kwargs["phase"] for call in mock_llm_client.chat.call_args_list]
+        assert "manager" not in called_phases
+
 
 class TestWorkerStart:
     """Tests for worker start method."""
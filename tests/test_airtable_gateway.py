@@ -0,0 +1,142 @@
+"""Tests for the rate-limited Airtable gateway in api/services/airtable_gateway.py."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.services.airtable_gateway import AirtableGateway
+
+
+def _response(status_code: int = 200, headers: dict = None, body: dict = None) -> MagicMock:
+    """Build a mock httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body or {}
+    return response
+
+
+def _patch_httpx(http_client: MagicMock):
+    """Patch httpx.AsyncClient so `async with` yields http_client."""
+    patcher = patch("httpx.AsyncClient")
+    mock_client = patcher.start()
+    mock_client.return_value.__aenter__.return_value = http_client
+    return patcher
+
+
+class TestRateLimit:
+    """Tests for the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_burst_are_spaced(self):
+        """Test requests past the burst wait for tokens at the configured rate."""
+        gateway = AirtableGateway(requests_per_second=20, burst=2)
+        http_client = MagicMock()
+        http_client.patch = AsyncMock(return_value=_response())
+        patcher = _patch_httpx(http_client)
+
+        try:
+            start = time.monotonic()
+            for i in range(4):
+                await gateway.patch(f"https://api.airtable.com/v0/base/table/rec{i}", json={"fields": {}})
+            elapsed = time.monotonic() - start
+        finally:
+            patcher.stop()
+
+        # 2 from the burst, then 2 more at 20/s -> at least ~0.1s
+        assert elapsed >= 0.09
+        metrics = gateway.get_metrics()
+        assert metrics["requests"] == 4
+        assert metrics["throttle_wait_seconds"] > 0
+
+
+class TestRetryAfter:
+    """Tests for 429 handling."""
+
+    @pytest.mark.asyncio
+    async def test_429_waits_retry_after_then_retries(self):
+        """Test a 429 pauses for Retry-After and the request is retried."""
+        gateway = AirtableGateway(requests_per_second=100)
+        http_client = MagicMock()
+        http_client.get = AsyncMock(
+            side_effect=[_response(429, headers={"Retry-After": "0.05"}), _response(200, body={"records": []})]
+        )
+        patcher = _patch_httpx(http_client)
+
+        try:
+            start = time.monotonic()
+            response = await gateway.get("https://api.airtable.com/v0/base/table")
+            elapsed = time.monotonic() - start
+        finally:
+            patcher.stop()
+
+        assert response.status_code == 200
+        assert elapsed >= 0.05
+        metrics = gateway.get_metrics()
+        assert metrics["rate_limited"] == 1
+        assert metrics["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_429_returned_after_max_retries(self):
+        """Test a persistent 429 is returned to the caller once retries run out."""
+        gateway = AirtableGateway(requests_per_second=100, max_retries=1, default_retry_after=0.01)
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=_response(429))
+        patcher = _patch_httpx(http_client)
+
+        try:
+            response = await gateway.get("https://api.airtable.com/v0/base/table")
+        finally:
+            patcher.stop()
+
+        assert response.status_code == 429
+        assert http_client.get.await_count == 2
+
+
+class TestCoalescing:
+    """Tests for sharing identical in-flight GETs."""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(self):
+        """Test concurrent identical GETs make one HTTP request."""
+        gateway = AirtableGateway(requests_per_second=100)
+        release = asyncio.Event()
+
+        async def slow_get(url, **kwargs):
+            await release.wait()
+            return _response(body={"id": "recABC"})
+
+        http_client = MagicMock()
+        http_client.get = AsyncMock(side_effect=slow_get)
+        patcher = _patch_httpx(http_client)
+
+        try:
+            url = "https://api.airtable.com/v0/base/table/recABC"
+            calls = [asyncio.ensure_future(gateway.get(url, params={"a": 1})) for _ in range(3)]
+            await asyncio.sleep(0.02)
+            release.set()
+            responses = await asyncio.gather(*calls)
+        finally:
+            patcher.stop()
+
+        assert all(r.json() == {"id": "recABC"} for r in responses)
+        assert http_client.get.await_count == 1
+        assert gateway.get_metrics()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_patches_are_not_coalesced(self):
+        """Test identical PATCH requests are each sent."""
+        gateway = AirtableGateway(requests_per_second=100)
+        http_client = MagicMock()
+        http_client.patch = AsyncMock(return_value=_response())
+        patcher = _patch_httpx(http_client)
+
+        try:
+            url = "https://api.airtable.com/v0/base/table/recABC"
+            await asyncio.gather(*(gateway.patch(url, json={"fields": {}}) for _ in range(2)))
+        finally:
+            patcher.stop()
+
+        assert http_client.patch.await_count == 2
@@ -0,0 +1,123 @@
+"""Tests for formatted transcript alignment in api/services/alignment.py."""
+
+from api.services.alignment import (
+    TranscriptTiming,
+    align_formatted_transcript,
+    find_anchors,
+    load_timing,
+    save_timing,
+    split_paragraphs,
+    tokenize,
+)
+from api.services.srt import CaptionTrack
+
+CAPTIONS = [
+    (0, 2000, "welcome back to the program"),
+    (2000, 4000, "today we're visiting a dairy farm"),
+    (4000, 6000, "near the town of Mount Horeb"),
+    (6500, 8500, ">> thanks for having us here"),
+    (8500, 10500, "we've milked cows on this land"),
+    (10500, 12500, "for four generations now"),
+    (13000, 15000, "after the break we head north"),
+    (15000, 17000, "to see the lake sturgeon spawn"),
+]
+
+FORMATTED = """# Farm Visit
+
+**Project:** 2WLI1234
+
+---
+
+## Dairy Country
+
+**HOST:** Welcome back to the program. Today we're visiting a dairy farm near the town of Mount Horeb.
+
+**FARMER:** Thanks for having us here. We've milked cows on this land for four generations now.
+
+**HOST:** After the break, we head north to see the lake sturgeon spawn.
+
+---
+
+**Status:** ready_for_editing
+"""
+
+
+def _track() -> CaptionTrack:
+    return CaptionTrack.from_columns(*zip(*CAPTIONS))
+
+
+class TestAnchors:
+    """Tests for unique n-gram anchoring."""
+
+    def test_anchors_increase_in_both_texts(self):
+        """Test anchors out of order in the output are dropped."""
+        source = tokenize("one two three four five six seven eight nine")
+        output = tokenize("seven eight nine one two three four five six")
+
+        anchors = find_anchors(source, output)
+
+        assert anchors == [(3, 0), (4, 1), (5, 2), (6, 3)]
+
+    def test_repeated_grams_are_not_anchors(self):
+        """Test n-grams occurring twice in either text are ignored."""
+        source = tokenize("a b c x a b c y")
+        assert find_anchors(source, tokenize("a b c")) == []
+
+
+class TestSplitParagraphs:
+    """Tests for extracting body paragraphs from formatter output."""
+
+    def test_drops_header_separators_and_status(self):
+        """Test only the transcript body is kept."""
+        paragraphs = split_paragraphs("<!-- model: x -->\n" + FORMATTED)
+
+        assert paragraphs[0] == "## Dairy Country"
+        assert paragraphs[1].startswith("**HOST:** Welcome back")
+        assert len(paragraphs) == 4
+
+
+class TestAlignFormattedTranscript:
+    """Tests for paragraph timing."""
+
+    def test_paragraphs_get_caption_times(self):
+        """Test each paragraph spans the captions it was formatted from."""
+        timing = align_formatted_transcript(FORMATTED, _track())
+
+        heading, host, farmer, closing = timing.paragraphs
+        assert (host.start_ms, host.end_ms) == (0, 6000)
+        assert (farmer.start_ms, farmer.end_ms) == (6500, 12500)
+        assert (closing.start_ms, closing.end_ms) == (13000, 17000)
+        assert (host.first_caption, host.last_caption) == (0, 2)
+        assert host.confidence > 0.8
+
+        # The heading has no anchors and takes the time before the next paragraph
+        assert heading.confidence == 0
+        assert (heading.start_ms, heading.end_ms) == (0, 0)
+        assert timing.coverage == 0.75
+
+    def test_lookup_by_index_and_quote(self):
+        """Test paragraphs resolve by index or quoted text."""
+        timing = align_formatted_transcript(FORMATTED, _track())
+
+        assert timing.resolve(2).start_ms == 6500
+        assert timing.resolve(10) is None
+        assert timing.find("milked cows, on this LAND").index == 2
+        assert timing.find("not in the transcript") is None
+
+    def test_empty_inputs(self):
+        """Test nothing to align gives no paragraphs."""
+        assert align_formatted_transcript("", _track()).paragraphs == []
+        assert align_formatted_transcript(FORMATTED, CaptionTrack.from_columns([], [], [])).paragraphs == []
+
+
+def test_sidecar_round_trip(tmp_path):
+    """Test timing is saved and loaded unchanged."""
+    timing = align_formatted_transcript(FORMATTED, _track())
+
+    save_timing(tmp_path, timing)
+
+    assert load_timing(tmp_path) == timing
+    assert isinstance(load_timing(tmp_path), TranscriptTiming)
+
+    (tmp_path / "transcript_timing.json").write_text("{not json")
+    assert load_timing(tmp_path) is None
@@ -9,6 +9,10 @@ from api.services.completeness import (
     check_completeness,
     count_content_words,
     count_source_words,
+    find_missing_spans,
+    paragraph_before,
+    source_dialogue,
+    splice_spans,
 )
 
 # ---------------------------------------------------------------------------
@@ -321,3 +325,87 @@ class TestEdgeCases:
         result = check_completeness(output, source)
         assert result.is_complete is True
         assert result.coverage_ratio > 1.0
+
+
+# ---------------------------------------------------------------------------
+# Missing spans and repair splicing
+# ---------------------------------------------------------------------------
+
+
+def _paragraphs(start: int, stop: int, size: int = 50) -> str:
+    """Formatted body of word{start}..word{stop-1}, one paragraph per size words."""
+    return "\n\n".join(" ".join(f"word{i}" for i in range(p, min(p + size, stop))) for p in range(start, stop, size))
+
+
+class TestFindMissingSpans:
+    def test_truncated_tail(self):
+        source = _words(1000)
+        output = _formatter_output(_paragraphs(0, 400))
+
+        spans = find_missing_spans(output, source)
+
+        assert [(s.source_start, s.source_stop) for s in spans] == [(400, 1000)]
+        assert spans[0].text.startswith("word400 word401")
+
+    def test_skipped_middle_section(self):
+        """A gap mid-transcript is found even when overall coverage passes."""
+        source = _words(1000)
+        output = _formatter_output(_paragraphs(0, 300) + "\n\n" + _paragraphs(400, 1000))
+
+        result = check_completeness(output, source)
+
+        assert result.is_complete is True
+        assert [(s.source_start, s.source_stop) for s in result.missing_spans] == [(300, 400)]
+        assert result.missing_word_count == 100
+        assert "1 source span(s)" in result.reason
+        assert result.to_dict()["missing_spans"][0]["word_count"] == 100
+
+    def test_small_edits_not_reported(self):
+        """Dropped filler and speaker labels don't count as missing spans."""
+        source = _words(1000)
+        body = "**HOST:** " + _paragraphs(0, 500) + "\n\n**GUEST:** " + _paragraphs(520, 1000)
+
+        assert find_missing_spans(_formatter_output(body), source) == []
+
+    def test_srt_source(self):
+        source = _srt_file(100)
+        body = " ".join(f"word{i}_{j}" for i in range(1, 51) for j in range(10))
+
+        spans = find_missing_spans(_formatter_output(body), source_dialogue(source, is_srt=True))
+
+        assert len(spans) == 1
+        assert len(spans[0].text.split()) == 500
+        assert spans[0].text.startswith("word51_0")
+        assert "-->" not in spans[0].text
+
+
+class TestSpliceSpans:
+    def test_repairs_inserted_at_paragraph_breaks(self):
+        source = _words(1000)
+        output = _formatter_output(_paragraphs(0, 300) + "\n\n" + _paragraphs(400, 800))
+        spans = find_missing_spans(output, source)
+        assert len(spans) == 2
+
+        repaired = splice_spans(output, [(span, span.text) for span in spans])
+
+        assert find_missing_spans(repaired, source) == []
+        assert repaired.startswith("<!-- Provenance")
+        assert repaired.rstrip().endswith("**Status:** ready_for_editing")
+        assert "word299\n\nword300" in repaired
+        assert "word799\n\nword800" in repaired
+
+    def test_span_before_first_paragraph(self):
+        source = _words(600)
+        output = _formatter_output(_paragraphs(100, 600))
+        spans = find_missing_spans(output, source)
+
+        repaired = splice_spans(output, [(spans[0], "REPAIRED")])
+
+        assert "---\n\nREPAIRED\n\nword100" in repaired
+
+    def test_paragraph_before(self):
+        output = _formatter_output(_paragraphs(0, 300) + "\n\n" + _paragraphs(400, 1000))
+        span = find_missing_spans(output, _words(1000))[0]
+
+        assert paragraph_before(output, span.output_position) == _paragraphs(250, 300)
+        assert paragraph_before(output, 0) == ""
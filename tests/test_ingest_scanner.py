@@ -4,10 +4,14 @@ Tests HTML parsing, Media ID extraction, file type detection, smart scanning,
 and database tracking for the remote ingest server monitoring system.
 """
 
+import os
+import tempfile
+import time
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from api.services.ingest_scanner import (
     IngestScanner,
@@ -641,3 +645,389 @@ class TestCheckIngestServerForMediaId:
         # Should return results from successful directory
         assert len(result) == 1
         assert result[0].filename == "2WLI1209HD.srt"
+
+
+class TestMediaIdIndex:
+    """Tests for the in-memory Media ID index used by per-ID checks."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_checks_reuse_index(self):
+        """Test that checking many Media IDs crawls each directory only once."""
+        scanner = IngestScanner(directories=["/dir1/", "/dir2/"])
+
+        dir1_files = [RemoteFile("2WLI1209HD.srt", "url1", "/dir1/", "transcript", "2WLI1209HD")]
+        dir2_files = [RemoteFile("9UNP2005HD.srt", "url2", "/dir2/", "transcript", "9UNP2005HD")]
+
+        with (
+            patch.object(scanner, "_seed_index_from_db", new_callable=AsyncMock),
+            patch.object(scanner, "_scan_directory", side_effect=[dir1_files, dir2_files]) as mock_scan,
+        ):
+            first = await scanner.check_ingest_server_for_media_id("2WLI1209HD")
+            second = await scanner.check_ingest_server_for_media_id("9UNP2005HD")
+
+        assert mock_scan.call_count == 2
+        assert [f.url for f in first] == ["url1"]
+        assert [f.url for f in second] == ["url2"]
+
+    @pytest.mark.asyncio
+    async def test_scan_builds_index(self):
+        """Test that a full scan populates the index for later checks."""
+        scanner = IngestScanner(directories=["/"])
+        files = [RemoteFile("2WLI1209HD.srt", "url1", "/", "transcript", "2WLI1209HD")]
+
+        with (
+            patch.object(scanner, "_scan_directory", return_value=files) as mock_scan,
+            patch.object(scanner, "_track_files_batch", return_value=(0, 0, 0)),
+            patch.object(scanner, "_seed_index_from_db", new_callable=AsyncMock),
+        ):
+            await scanner.scan()
+            result = await scanner.check_ingest_server_for_media_id("2WLI1209HD")
+
+        assert mock_scan.call_count == 1
+        assert len(result) == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_refreshes_only_stale_directories(self):
+        """Test that a miss re-fetches listings older than miss_refresh_seconds."""
+        scanner = IngestScanner(directories=["/old/", "/fresh/"], miss_refresh_seconds=60)
+        scanner._index_seeded = True
+        scanner._index_directory("/old/", [], fetched_at=time.time() - 120)
+        scanner._index_directory("/fresh/", [])
+
+        new_file = RemoteFile("2WLI1209HD.srt", "url1", "/old/", "transcript", "2WLI1209HD")
+
+        with patch.object(scanner, "_scan_directory", return_value=[new_file]) as mock_scan:
+            result = await scanner.check_ingest_server_for_media_id("2WLI1209HD")
+
+        mock_scan.assert_called_once()
+        assert mock_scan.call_args[0][1] == "/old/"
+        assert result == [new_file]
+
+    @pytest.mark.asyncio
+    async def test_expired_listing_is_refetched(self):
+        """Test that listings older than index_max_age_seconds are re-fetched."""
+        scanner = IngestScanner(directories=["/"], index_max_age_seconds=60)
+        scanner._index_seeded = True
+        stale = RemoteFile("2WLI1209HD.srt", "stale", "/", "transcript", "2WLI1209HD")
+        scanner._index_directory("/", [stale], fetched_at=time.time() - 120)
+
+        fresh = RemoteFile("2WLI1209HD.srt", "fresh", "/", "transcript", "2WLI1209HD")
+        with patch.object(scanner, "_scan_directory", return_value=[fresh]):
+            result = await scanner.check_ingest_server_for_media_id("2WLI1209HD")
+
+        assert [f.url for f in result] == ["fresh"]
+
+
+@pytest_asyncio.fixture
+async def qc_db():
+    """Temporary database with jobs, config and sst_qc_state tables."""
+    from sqlalchemy import text
+
+    from api.services import database
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_PATH"] = db_path
+    await database.init_db()
+
+    async with database._engine.begin() as conn:
+        await conn.run_sync(database.metadata.create_all)
+        await conn.execute(
+            text(
+                "CREATE TABLE sst_qc_state (record_id TEXT PRIMARY KEY, media_id TEXT, "
+                "qc_status TEXT, synced_at DATETIME)"
+            )
+        )
+
+    yield db_path
+
+    await database.close_db()
+    os.unlink(db_path)
+
+
+def _airtable_page(records):
+    """Build a mocked Airtable list response."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {"records": records}
+    return response
+
+
+class TestQCStateSync:
+    """Tests for incremental SST QC sync and the job anti-join."""
+
+    @pytest.mark.asyncio
+    async def test_full_then_delta_sync(self, qc_db):
+        """Test first sync is full and later syncs only fetch modified records."""
+        from api.models.job import JobCreate
+        from api.services.database import create_job, get_session, jobs_table
+
+        scanner = IngestScanner()
+        full_page = [
+            {"id": "rec1", "fields": {"Media ID": "2WLI1209HD", "QC": "Passed"}},
+            {"id": "rec2", "fields": {"Media ID": "9UNP2005HD", "QC": "Passed"}},
+            {"id": "rec3", "fields": {"Media ID": "2WLI1215HD", "QC": "Passed"}},
+        ]
+        delta_page = [{"id": "rec3", "fields": {"Media ID": "2WLI1215HD", "QC": "Failed"}}]
+
+        job = await create_job(JobCreate(project_name="2WLI1209HD", transcript_file="2WLI1209HD.srt"))
+        async with get_session() as session:
+            await session.execute(jobs_table.update().where(jobs_table.c.id == job.id).values(media_id="2WLI1209HD"))
+
+        with (
+            patch("api.services.airtable.AirtableClient") as mock_airtable_class,
+            patch("httpx.AsyncClient") as mock_httpx,
+        ):
+            mock_airtable_class.return_value = MagicMock(
+                API_BASE_URL="https://api.airtable.com/v0", BASE_ID="app", TABLE_ID="tbl", headers={}
+            )
+            mock_http = MagicMock()
+            mock_http.get = AsyncMock(side_effect=[_airtable_page(full_page), _airtable_page(delta_page)])
+            mock_httpx.return_value.__aenter__.return_value = mock_http
+
+            first = await scanner.get_qc_passed_media_ids()
+            second = await scanner.get_qc_passed_media_ids()
+
+        # Job-linked Media ID is excluded by the anti-join
+        assert first == ["2WLI1215HD", "9UNP2005HD"]
+        # Delta sync picked up rec3 leaving the Passed state
+        assert second == ["9UNP2005HD"]
+
+        first_formula = mock_http.get.call_args_list[0].kwargs["params"]["filterByFormula"]
+        second_formula = mock_http.get.call_args_list[1].kwargs["params"]["filterByFormula"]
+        assert first_formula == "{QC} = 'Passed'"
+        assert second_formula.startswith("IS_AFTER(LAST_MODIFIED_TIME({QC}, {Media ID})")
+
+    @pytest.mark.asyncio
+    async def test_sync_failure_uses_local_state(self, qc_db):
+        """Test that an Airtable failure falls back to the last synced state."""
+        from sqlalchemy import text
+
+        from api.services.database import get_session
+
+        async with get_session() as session:
+            await session.execute(
+                text(
+                    "INSERT INTO sst_qc_state (record_id, media_id, qc_status) VALUES ('rec1', '9UNP2005HD', 'Passed')"
+                )
+            )
+
+        scanner = IngestScanner()
+        with patch.object(scanner, "sync_qc_state", side_effect=Exception("429 Too Many Requests")):
+            media_ids = await scanner.get_qc_passed_media_ids()
+
+        assert media_ids == ["9UNP2005HD"]
+
+
+@pytest_asyncio.fixture
+async def download_db(tmp_path):
+    """Temporary database with an available_files table and two transcript rows."""
+    from sqlalchemy import text
+
+    from api.services import database
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_PATH"] = db_path
+    await database.init_db()
+
+    async with database._engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE available_files (id INTEGER PRIMARY KEY, remote_url TEXT, filename TEXT, "
+                "media_id TEXT, file_type TEXT, status TEXT, file_size_bytes INTEGER, local_path TEXT, "
+                "downloaded_at DATETIME, first_seen_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO available_files (id, remote_url, filename, media_id, file_type, status, file_size_bytes) "
+                "VALUES (1, 'https://example.com/exports/2WLI1209HD.srt', '2WLI1209HD.srt', '2WLI1209HD', "
+                "'transcript', 'new', 4096), "
+                "(2, 'https://example.com/exports/2WLI1210HD.srt', '2WLI1210HD.srt', '2WLI1210HD', "
+                "'transcript', 'new', NULL)"
+            )
+        )
+
+    yield tmp_path
+
+    await database.close_db()
+    os.unlink(db_path)
+
+
+def _patch_transport(handler):
+    """Patch httpx.AsyncClient so requests go to an httpx.MockTransport handler."""
+    import httpx
+
+    real_client = httpx.AsyncClient
+
+    def make_client(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return real_client(*args, **kwargs)
+
+    return patch("httpx.AsyncClient", side_effect=make_client)
+
+
+class TestStreamingDownload:
+    """Tests for streamed, resumable transcript downloads."""
+
+    BODY = b"1\n00:00:01,000 --> 00:00:02,000\nHello\n\n" * 104  # ~4K
+
+    @pytest.mark.asyncio
+    async def test_download_files_fetches_concurrently_and_marks_queued(self, download_db):
+        """Test bulk download writes every file, reports checksums and updates status."""
+        import hashlib
+
+        import httpx
+        from sqlalchemy import text
+
+        from api.services.database import get_session
+
+        def handler(request):
+            return httpx.Response(200, content=self.BODY, headers={"Content-Length": str(len(self.BODY))})
+
+        scanner = IngestScanner(base_url="https://example.com")
+        with _patch_transport(handler):
+            results = await scanner.download_files([1, 2, 99], destination_dir=str(download_db))
+
+        assert results[1]["success"] is True
+        assert results[2]["success"] is True
+        assert results[99] == {"success": False, "error": "File 99 not found"}
+        assert (download_db / "2WLI1209HD.srt").read_bytes() == self.BODY
+        assert results[1]["sha256"] == hashlib.sha256(self.BODY).hexdigest()
+        assert not list(download_db.glob("*.part*"))
+
+        async with get_session() as session:
+            rows = (await session.execute(text("SELECT status FROM available_files ORDER BY id"))).fetchall()
+        assert [r.status for r in rows] == ["queued", "queued"]
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_resumes_with_range(self, download_db):
+        """Test an interrupted download resumes from the bytes already on disk."""
+        import httpx
+
+        cut = 1000
+        range_headers = []
+
+        async def truncated_body():
+            yield self.BODY[:cut]
+            raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            range_headers.append(request.headers.get("Range"))
+            if request.headers.get("Range"):
+                start = int(request.headers["Range"].split("=")[1].rstrip("-"))
+                return httpx.Response(
+                    206,
+                    content=self.BODY[start:],
+                    headers={"Content-Range": f"bytes {start}-{len(self.BODY) - 1}/{len(self.BODY)}"},
+                )
+            return httpx.Response(200, content=truncated_body(), headers={"ETag": '"v1"'})
+
+        scanner = IngestScanner(base_url="https://example.com")
+        with _patch_transport(handler), patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await scanner.download_file(1, destination_dir=str(download_db))
+
+        assert result["success"] is True
+        assert range_headers == [None, f"bytes={cut}-"]
+        assert (download_db / "2WLI1209HD.srt").read_bytes() == self.BODY
+
+    @pytest.mark.asyncio
+    async def test_size_mismatch_fails_without_replacing_file(self, download_db):
+        """Test a body shorter than Content-Length is rejected and not renamed into place."""
+        import httpx
+
+        def handler(request):
+            response = httpx.Response(200, content=self.BODY[:100])
+            response.headers["Content-Length"] = str(len(self.BODY))
+            return response
+
+        scanner = IngestScanner(base_url="https://example.com")
+        with _patch_transport(handler):
+            result = await scanner.download_file(2, destination_dir=str(download_db))
+
+        assert result["success"] is False
+        assert "size mismatch" in result["error"]
+        assert not (download_db / "2WLI1210HD.srt").exists()
+
+
+class TestPrefetch:
+    """Tests for prefetching new transcripts ahead of queueing."""
+
+    BODY = b"1\n00:00:01,000 --> 00:00:02,000\nHello\n\n" * 104  # ~4K
+
+    @pytest.mark.asyncio
+    async def test_prefetch_keeps_status_new_and_queue_uses_local_copy(self, download_db):
+        """Test prefetched files stay 'new' and queueing them makes no request."""
+        import httpx
+        from sqlalchemy import text
+
+        from api.services.database import get_session
+
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            return httpx.Response(200, content=self.BODY)
+
+        prefetch_dir = download_db / ".prefetch"
+        scanner = IngestScanner(base_url="https://example.com")
+        with _patch_transport(handler):
+            result = await scanner.prefetch_transcripts(prefetch_dir=str(prefetch_dir))
+
+        assert result.candidates == 2
+        assert result.downloaded == 2
+        assert (prefetch_dir / "2WLI1209HD.srt").exists()
+
+        async with get_session() as session:
+            rows = (await session.execute(text("SELECT status FROM available_files ORDER BY id"))).fetchall()
+        assert [r.status for r in rows] == ["new", "new"]
+
+        requests.clear()
+        with _patch_transport(handler):
+            queued = await scanner.download_file(1, destination_dir=str(download_db))
+
+        assert queued["success"] is True
+        assert requests == []
+        assert (download_db / "2WLI1209HD.srt").read_bytes() == self.BODY
+        assert not (prefetch_dir / "2WLI1209HD.srt").exists()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_respects_disk_quota(self, download_db):
+        """Test files that would exceed the quota are skipped."""
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200, content=self.BODY)
+
+        scanner = IngestScanner(base_url="https://example.com")
+        with _patch_transport(handler):
+            # File 1 is listed at 4096 bytes; file 2 has no size and is charged the estimate
+            result = await scanner.prefetch_transcripts(prefetch_dir=str(download_db / ".prefetch"), max_bytes=8192)
+
+        assert result.downloaded == 1
+        assert result.skipped_quota == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_prunes_files_no_longer_new(self, download_db):
+        """Test a prefetched copy is removed once its file is ignored."""
+        from sqlalchemy import text
+
+        from api.services.database import get_session
+
+        prefetch_dir = download_db / ".prefetch"
+        prefetch_dir.mkdir()
+        stale = prefetch_dir / "2WLI1209HD.srt"
+        stale.write_bytes(self.BODY)
+
+        async with get_session() as session:
+            await session.execute(
+                text("UPDATE available_files SET status = 'ignored', local_path = :path"),
+                {"path": str(stale)},
+            )
+
+        scanner = IngestScanner(base_url="https://example.com")
+        result = await scanner.prefetch_transcripts(prefetch_dir=str(prefetch_dir))
+
+        assert result.pruned == 1
+        assert not stale.exists()
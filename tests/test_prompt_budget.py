@@ -0,0 +1,104 @@
+"""Tests for context-window budgeting in api/services/prompt_budget.py."""
+
+from api.services.prompt_budget import (
+    DROP,
+    EXCERPT,
+    KEEP,
+    SUMMARIZE,
+    TRUNCATE,
+    PromptBudget,
+    SectionRule,
+    estimate_tokens,
+    excerpt,
+    fit_sections,
+    summarize,
+    truncate,
+)
+
+
+def _words(count: int, prefix: str = "word") -> str:
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+class TestShrinkRules:
+    """Tests for the individual shrink rules."""
+
+    def test_truncate_cuts_at_word_break(self):
+        """Test truncation keeps the opening and ends on a whole word."""
+        result = truncate(_words(100), 100)
+
+        assert len(result) <= 100
+        assert result.startswith("word0 word1")
+        assert result.endswith("...")
+        assert result[:-3].split()[-1].startswith("word")
+
+    def test_excerpt_keeps_both_ends(self):
+        """Test excerpts keep the opening and closing with an omission marker."""
+        text = _words(1000)
+
+        result = excerpt(text, 400)
+
+        assert result.startswith("word0 ")
+        assert result.endswith("word999")
+        assert "characters omitted" in result
+
+    def test_summarize_keeps_headings_and_leads(self):
+        """Test the summary is each paragraph's lead sentence in order."""
+        text = "## Themes\n\n" + "\n\n".join(f"Lead {i}. " + _words(60, f"p{i}x") for i in range(5))
+
+        result = summarize(text, 200)
+
+        assert result.startswith("## Themes\n\nLead 0.\n\nLead 1.")
+        assert "p0x1" not in result
+
+    def test_short_text_unchanged(self):
+        """Test text already under the limit is returned as-is."""
+        assert truncate("short", 100) == excerpt("short", 100) == summarize("short", 100) == "short"
+
+
+class TestFitSections:
+    """Tests for caps and window trimming."""
+
+    def test_caps_apply_without_window(self):
+        """Test a capped section is shortened even with no window given."""
+        sections = {"formatter_output": _words(2000), "analyst_output": _words(2000)}
+        rules = [SectionRule("analyst_output", 0, SUMMARIZE), SectionRule("formatter_output", 1, TRUNCATE, cap=500)]
+
+        fitted, trims = fit_sections(sections, rules)
+
+        assert estimate_tokens(fitted["formatter_output"]) <= 500
+        assert fitted["analyst_output"] == sections["analyst_output"]
+        assert [(t.section, t.reason) for t in trims] == [("formatter_output", "cap")]
+
+    def test_window_trims_lowest_priority_first(self):
+        """Test the least important section absorbs the overage before others."""
+        sections = {"a": _words(1000, "a"), "b": _words(1000, "b")}
+        rules = [SectionRule("a", 0, EXCERPT), SectionRule("b", 1, TRUNCATE)]
+        total = sum(estimate_tokens(text) for text in sections.values())
+
+        fitted, trims = fit_sections(sections, rules, available=total - 1000)
+
+        assert fitted["a"] == sections["a"]
+        assert sum(estimate_tokens(text) for text in fitted.values()) <= total - 1000
+        assert [(t.section, t.reason) for t in trims] == [("b", "window")]
+
+    def test_keep_sections_are_never_trimmed(self):
+        """Test KEEP sections stay whole even when the window is exceeded."""
+        sections = {"transcript": _words(1000), "analysis": _words(1000)}
+        rules = [SectionRule("transcript", 0, KEEP), SectionRule("analysis", 1, SUMMARIZE)]
+
+        fitted, trims = fit_sections(sections, rules, available=100)
+
+        assert fitted["transcript"] == sections["transcript"]
+        assert fitted["analysis"] == ""
+        assert trims[0].rule == DROP
+        assert trims[0].kept_tokens == 0
+
+    def test_budget_leaves_room_for_output_and_margin(self):
+        """Test available tokens exclude output, safety margin and fixed prompt text."""
+        budget = PromptBudget(context_tokens=10_000, output_tokens=2_000)
+
+        assert budget.available(fixed_tokens=500) == 6_500
+        fitted, trims = budget.fit({"a": _words(2000)}, [SectionRule("a", 0, TRUNCATE)], fixed_tokens=500)
+        assert estimate_tokens(fitted["a"]) <= 6_500
+        assert trims == []
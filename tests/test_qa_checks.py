@@ -0,0 +1,127 @@
+"""Tests for deterministic QA checks in api/services/qa_checks.py."""
+
+from api.services.qa_checks import (
+    FAIL,
+    PASS,
+    SKIP,
+    check_completeness_result,
+    check_review_notes_at_top,
+    check_speaker_honorifics,
+    check_tag_count,
+    check_title_length,
+    extract_seo_fields,
+    run_qa_checks,
+    speaker_labels,
+)
+
+FORMATTED = """<!-- model: test | tier: default -->
+<!--
+Review notes:
+- Verify spelling of farm name
+-->
+**Project:** 2WLI1234
+
+---
+
+## Dairy Country
+
+**HOST:** Welcome back to the program.
+
+**Jane Smith:** Thanks for having us.
+
+FARMER: We've milked cows here for four generations.
+
+**Status:** ready_for_editing
+"""
+
+
+class TestFormatterChecks:
+    def test_speaker_labels(self):
+        assert speaker_labels(FORMATTED) == ["HOST", "Jane Smith", "FARMER"]
+
+    def test_honorifics_flagged(self):
+        formatted = FORMATTED.replace("**Jane Smith:**", "**Dr. Jane Smith:**").replace("FARMER:", "MR. OLSON:")
+
+        result = check_speaker_honorifics(formatted)
+
+        assert result.status == FAIL
+        assert result.excerpts == ["Dr. Jane Smith", "MR. OLSON"]
+        assert check_speaker_honorifics(FORMATTED).status == PASS
+
+    def test_no_labels_is_skipped(self):
+        assert check_speaker_honorifics("---\n\nJust prose.").status == SKIP
+
+    def test_review_notes_only_at_top(self):
+        assert check_review_notes_at_top(FORMATTED).status == PASS
+
+        moved = FORMATTED.replace("FARMER:", "<!-- check this name -->\n\nFARMER:")
+        result = check_review_notes_at_top(moved)
+        assert result.status == FAIL
+        assert result.excerpts == ["check this name"]
+
+    def test_completeness_result(self):
+        assert check_completeness_result(None).status == SKIP
+        assert check_completeness_result({"is_complete": True, "reason": "ok"}).status == PASS
+        failed = check_completeness_result(
+            {"is_complete": True, "reason": "gap", "missing_spans": [{"preview": "word300 word301"}]}
+        )
+        assert failed.status == FAIL
+        assert failed.excerpts == ["word300 word301"]
+
+
+class TestSEOChecks:
+    def test_markdown_fields(self):
+        seo = """# SEO Report
+
+**Title:** "Wisconsin Dairy: Four Generations" (33 chars)
+
+## Tags
+
+- dairy
+- farming
+- wisconsin
+"""
+        assert extract_seo_fields(seo) == {
+            "title": "Wisconsin Dairy: Four Generations",
+            "tags": ["dairy", "farming", "wisconsin"],
+        }
+
+    def test_heading_and_comma_fields(self):
+        seo = "## Title\n\nDairy Farms\n\n**Keywords:** a, b, c\n"
+        assert extract_seo_fields(seo) == {"title": "Dairy Farms", "tags": ["a", "b", "c"]}
+
+    def test_json_fields(self):
+        seo = '```json\n{"title": "Dairy Farms", "tags": "a, b, c"}\n```'
+        assert extract_seo_fields(seo) == {"title": "Dairy Farms", "tags": ["a", "b", "c"]}
+
+    def test_title_length(self):
+        assert check_title_length({"title": "x" * 60}).status == PASS
+        result = check_title_length({"title": "x" * 61})
+        assert result.status == FAIL
+        assert result.detail == "61 chars (max 60)"
+        assert check_title_length({"title": None}).status == SKIP
+
+    def test_tag_count(self):
+        assert check_tag_count({"tags": [f"t{i}" for i in range(12)]}).status == PASS
+        assert check_tag_count({"tags": ["a", "b"]}).status == FAIL
+        assert check_tag_count({"tags": [f"t{i}" for i in range(16)]}).status == FAIL
+
+
+def test_report():
+    """Test the full report passes only when every check passes."""
+    context = {
+        "formatter_output": FORMATTED,
+        "seo_output": "**Title:** Dairy Farms\n\n**Tags:** " + ", ".join(f"tag{i}" for i in range(11)),
+        "completeness_check": {"is_complete": True, "reason": "Coverage 95.0% meets threshold 70%"},
+    }
+
+    report = run_qa_checks(context)
+
+    assert report.passed is True
+    assert report.failures == []
+    assert report.to_dict()["passed"] is True
+    assert "[PASS] seo: tag count - 11 tags" in report.render()
+
+    report = run_qa_checks(dict(context, seo_output=""))
+    assert report.passed is False
+    assert report.failures == []
@@ -0,0 +1,40 @@
+"""Tests for rule-based recovery decisions in api/services/recovery_policy.py."""
+
+import pytest
+
+from api.services.recovery_policy import ESCALATE, FAIL, RETRY, classify_error
+
+
+@pytest.mark.parametrize(
+    "error, error_class, action",
+    [
+        ("Phase formatter failed: Timeout after 120s", "timeout", RETRY),
+        (
+            "Phase seo failed: Client error '429 Too Many Requests' for url 'https://openrouter.ai/api/v1'",
+            "rate_limit",
+            RETRY,
+        ),
+        ("Phase analyst failed: Server error '503 Service Unavailable' for url", "provider_error", RETRY),
+        ("Phase analyst failed: All connection attempts failed", "provider_error", RETRY),
+        ("Transcript not found: 2WLI1234_ForClaude.txt", "missing_input", FAIL),
+        ("Run cost $1.0200 has reached cap of $1.00. Increase LLM_RUN_COST_CAP", "cost_cap", FAIL),
+        ("Model 'x/y' is not in allowlist. Allowed: a, b", "model_guard", FAIL),
+        ("Phase seo failed: Client error '401 Unauthorized' for url", "configuration", FAIL),
+        ("Phase formatter failed: maximum context length is 128000 tokens", "context_length", ESCALATE),
+        ("Phase seo failed: seo output failed schema validation: tags: Field required", "schema_validation", ESCALATE),
+    ],
+)
+def test_known_errors(error, error_class, action):
+    """Test common failures resolve to a fixed action."""
+    decision = classify_error(error)
+
+    assert decision is not None
+    assert decision.error_class == error_class
+    assert decision.action == action
+    assert decision.retry_delay is (error_class == "rate_limit")
+
+
+def test_content_failures_go_to_manager():
+    """Test errors without an obvious cause are left for the manager."""
+    assert classify_error("Phase formatter failed: output ended mid-sentence") is None
+    assert classify_error("Test error") is None
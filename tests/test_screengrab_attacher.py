@@ -485,11 +485,11 @@ class TestBatchAttachment:
 
             # Mock Airtable client
             mock_airtable = MagicMock()
-            mock_airtable.search_sst_by_media_id = AsyncMock(
-                side_effect=[
-                    {"id": "recXXX1", "fields": {"Media ID": "2WLI1209HD", "Screen Grab": []}},
-                    {"id": "recXXX2", "fields": {"Media ID": "2WLI1210HD", "Screen Grab": []}},
-                ]
+            mock_airtable.batch_search_sst_by_media_ids = AsyncMock(
+                return_value={
+                    "2WLI1209HD": {"id": "recXXX1", "fields": {"Media ID": "2WLI1209HD", "Screen Grab": []}},
+                    "2WLI1210HD": {"id": "recXXX2", "fields": {"Media ID": "2WLI1210HD", "Screen Grab": []}},
+                }
             )
             mock_airtable_class.return_value = mock_airtable
 
@@ -511,3 +511,95 @@ class TestBatchAttachment:
             assert result.skipped_no_match == 0
             assert result.skipped_duplicate == 0
             assert len(result.errors) == 0
+
+    @pytest.mark.asyncio
+    async def test_attach_all_pending_sends_one_patch_per_record(self):
+        """CRITICAL: Screengrabs for one record go in a single PATCH that keeps existing ones."""
+        rows = []
+        for i, filename in enumerate(["2WLI1209HD_a.jpg", "2WLI1209HD_b.jpg", "2WLI1209HD_old.jpg"], start=1):
+            row = MagicMock()
+            row.id = i
+            row.remote_url = f"https://example.com/{filename}"
+            row.filename = filename
+            row.media_id = "2WLI1209HD"
+            rows.append(row)
+
+        sst_record = {
+            "id": "recXXX1",
+            "fields": {
+                "Media ID": "2WLI1209HD",
+                "Screen Grab": [{"id": "att123", "filename": "2WLI1209HD_old.jpg"}],
+            },
+        }
+
+        with (
+            patch("api.services.screengrab_attacher.AirtableClient") as mock_airtable_class,
+            patch("api.services.screengrab_attacher.get_session") as mock_session,
+            patch("httpx.AsyncClient") as mock_httpx,
+        ):
+            mock_db = MagicMock()
+            mock_result = MagicMock()
+            mock_result.fetchall.return_value = rows
+            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_session.return_value.__aenter__.return_value = mock_db
+
+            mock_airtable = MagicMock()
+            mock_airtable.batch_search_sst_by_media_ids = AsyncMock(return_value={"2WLI1209HD": sst_record})
+            mock_airtable_class.return_value = mock_airtable
+
+            mock_http_client = MagicMock()
+            mock_response = MagicMock()
+            mock_http_client.patch = AsyncMock(return_value=mock_response)
+            mock_httpx.return_value.__aenter__.return_value = mock_http_client
+
+            attacher = ScreengrabAttacher(api_key="fake_key")
+            result = await attacher.attach_all_pending()
+
+            assert result.total_processed == 3
+            assert result.attached == 2
+            assert result.skipped_duplicate == 1
+
+            # One PATCH: existing attachment by id, then both new ones by url
+            assert mock_http_client.patch.await_count == 1
+            payload = mock_http_client.patch.call_args.kwargs["json"]
+            screen_grab_field = payload["fields"]["Screen Grab"]
+            assert screen_grab_field[0] == {"id": "att123"}
+            assert [a["filename"] for a in screen_grab_field[1:]] == ["2WLI1209HD_a.jpg", "2WLI1209HD_b.jpg"]
+
+            # Audit rows written in one executemany call
+            audit_calls = [c for c in mock_db.execute.call_args_list if "screengrab_attachments" in str(c.args[0])]
+            assert len(audit_calls) == 1
+            assert len(audit_calls[0].args[1]) == 3
+
+    @pytest.mark.asyncio
+    async def test_attach_all_pending_lookup_failure_is_not_no_match(self):
+        """Test a failed SST lookup is reported as an error, not as no match."""
+        row = MagicMock()
+        row.id = 1
+        row.remote_url = "https://example.com/2WLI1209HD.jpg"
+        row.filename = "2WLI1209HD.jpg"
+        row.media_id = "2WLI1209HD"
+
+        with (
+            patch("api.services.screengrab_attacher.AirtableClient") as mock_airtable_class,
+            patch("api.services.screengrab_attacher.get_session") as mock_session,
+        ):
+            mock_db = MagicMock()
+            mock_result = MagicMock()
+            mock_result.fetchall.return_value = [row]
+            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_session.return_value.__aenter__.return_value = mock_db
+
+            mock_airtable = MagicMock()
+            mock_airtable.batch_search_sst_by_media_ids = AsyncMock(side_effect=Exception("429 Too Many Requests"))
+            mock_airtable_class.return_value = mock_airtable
+
+            attacher = ScreengrabAttacher(api_key="fake_key")
+            result = await attacher.attach_all_pending()
+
+            assert result.skipped_no_match == 0
+            assert len(result.errors) == 1
+
+            # Row stays 'new' so the next run retries it
+            status_calls = [c for c in mock_db.execute.call_args_list if "UPDATE available_files" in str(c.args[0])]
+            assert status_calls[0].args[1][0]["status"] == "new"
@@ -0,0 +1,65 @@
+"""Tests for local chapter-candidate detection in api/services/segmentation.py."""
+
+import random
+
+from api.services.segmentation import chapter_count_for, format_exact_timecode, segment_captions
+from api.services.srt import CaptionTrack, parse_srt_track
+
+TOPICS = [
+    ["cheese", "dairy", "cows", "milk", "farm", "barn"],
+    ["river", "fishing", "boat", "walleye", "lake", "water"],
+    ["election", "vote", "senate", "campaign", "ballot", "governor"],
+    ["hockey", "skates", "rink", "puck", "team", "coach"],
+]
+
+
+def _topic_track(captions_per_topic: int = 60) -> CaptionTrack:
+    """Captions that switch topic every captions_per_topic captions."""
+    rng = random.Random(3)
+    captions = []
+    t = 1234
+    for words in TOPICS:
+        for _ in range(captions_per_topic):
+            text = " ".join(rng.choice(words + ["the", "and", "people", "time"]) for _ in range(8)) + "."
+            captions.append((t, t + 2500, text))
+            t += 2600
+    return CaptionTrack.from_columns(*zip(*captions))
+
+
+def test_finds_topic_changes():
+    """Test each candidate chapter is dominated by one topic, in order."""
+    track = _topic_track()
+
+    candidates = segment_captions(track, chapters=4)
+
+    assert len(candidates) == 4
+    for candidate, words in zip(candidates, TOPICS):
+        assert set(candidate.keywords[:4]) <= set(words)
+
+    # Boundaries land on exact caption starts and the chapters cover the track
+    assert candidates[0].start_ms == 1234
+    assert candidates[-1].end_ms == track.ends[-1]
+    assert all(c.start_ms in set(track.starts) for c in candidates)
+
+
+def test_chapter_count_from_duration():
+    """Test the default count is clamped to 3-8."""
+    assert chapter_count_for(10 * 60000) == 3
+    assert chapter_count_for(30 * 60000) == 5
+    assert chapter_count_for(180 * 60000) == 8
+
+    assert 3 <= len(segment_captions(_topic_track())) <= 8
+
+
+def test_too_little_content():
+    """Test no candidates are proposed without enough paragraphs."""
+    assert segment_captions(parse_srt_track("")) == []
+    assert segment_captions(CaptionTrack.from_columns([0], [2000], ["Just one line."])) == []
+
+
+def test_summary_format():
+    """Test candidates render exact timecodes for prompts."""
+    assert format_exact_timecode(3_723_456) == "1:02:03.456"
+    candidate = segment_captions(_topic_track(), chapters=4)[0]
+    assert candidate.summary().startswith("0:00:01.234 - ")
+    assert "keywords: " in candidate.summary()
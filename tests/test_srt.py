@@ -0,0 +1,143 @@
+"""Tests for the array-backed SRT engine in api/services/srt.py.
+
+The engine must give the same results as the SRTCaption functions in
+api/services/utils.py, so most tests compare the two.
+"""
+
+import copy
+import io
+
+import pytest
+
+from api.services.srt import CaptionTrack, load_srt_track, parse_srt_track, read_srt_track
+from api.services.utils import (
+    SRTCaption,
+    clean_srt_captions,
+    generate_srt,
+    generate_vtt,
+    parse_srt,
+)
+
+SRT = """1
+00:00:01,000 --> 00:00:03,000
+Hello world
+
+2
+00:00:02,500 --> 00:00:05.000
+Overlapping caption
+on two lines
+
+not a caption block
+
+x
+00:00:06,000 --> 00:00:07,000
+Bad index
+
+3
+00:00:06,000 --> 00:00:06,000
+Hello again
+
+4
+00:00:06,100 --> 00:00:06,400
+Hello again
+
+5
+00:00:06,500 --> 00:00:06,800
+Short
+
+
+6
+1:00:00,000 --> 1:00:02,500
+Last one
+"""
+
+
+@pytest.fixture
+def track():
+    """Parsed sample track."""
+    return parse_srt_track(SRT)
+
+
+class TestParsing:
+    """Tests for the parsers."""
+
+    def test_matches_parse_srt(self, track):
+        """Test the track holds what parse_srt returns, skipping malformed blocks."""
+        expected = parse_srt(SRT)
+        assert len(track) == 6
+        assert list(track) == [(c.start_ms, c.end_ms, c.text) for c in expected]
+        assert track.text_at(1) == "Overlapping caption\non two lines"
+
+    def test_streams_from_file_handle(self, track, tmp_path):
+        """Test file-handle and path parsing match string parsing, including CRLF files."""
+        assert read_srt_track(io.StringIO(SRT)) == track
+
+        path = tmp_path / "captions.srt"
+        path.write_bytes(SRT.replace("\n", "\r\n").encode("utf-8"))
+        assert load_srt_track(path) == track
+
+    def test_empty(self):
+        """Test empty content gives an empty track."""
+        empty = parse_srt_track("")
+        assert len(empty) == 0
+        assert empty.duration_ms == 0
+        assert empty.index_at(0) is None
+
+
+class TestCleaning:
+    """Tests for cleaned()."""
+
+    def test_matches_clean_srt_captions(self, track):
+        """Test cleaning matches clean_srt_captions without changing the track."""
+        before = copy.deepcopy(track)
+        expected = clean_srt_captions(parse_srt(SRT))
+
+        assert track.cleaned().to_captions() == expected
+        assert track == before
+
+    def test_custom_thresholds(self, track):
+        """Test cleaning parameters are applied the same way."""
+        expected = clean_srt_captions(parse_srt(SRT), min_gap_ms=0, merge_threshold_ms=200)
+        assert track.cleaned(min_gap_ms=0, merge_threshold_ms=200).to_captions() == expected
+
+
+class TestLookup:
+    """Tests for time lookups and slicing."""
+
+    def test_index_at(self, track):
+        """Test binary search finds the caption showing at a time."""
+        assert track.index_at(0) is None
+        assert track.index_at(1000) == 0
+        assert track.index_at(2999) == 1  # later-starting caption wins during an overlap
+        assert track.index_at(5500) is None
+        assert track.index_at(3_601_000) == 5
+        assert track.index_before(5500) == 1
+
+    def test_span_and_slice(self, track):
+        """Test captions starting in a window can be cut into a new track."""
+        first, stop = track.span(2000, 6200)
+        assert (first, stop) == (1, 4)
+
+        window = track.slice(first, stop)
+        assert list(window) == list(track)[1:4]
+        assert len(track.slice(5, 99)) == 1
+        assert len(track.slice(4, 2)) == 0
+
+
+class TestOutput:
+    """Tests for SRT/VTT output."""
+
+    def test_matches_generators(self, track):
+        """Test output text matches generate_srt/generate_vtt."""
+        captions = parse_srt(SRT)
+        assert track.to_srt() == generate_srt(captions)
+        assert track.to_vtt() == generate_vtt(captions)
+        assert parse_srt_track(track.to_srt()) == track
+
+    def test_from_captions_round_trip(self):
+        """Test building from SRTCaption objects renumbers from 1."""
+        captions = [SRTCaption(index=7, start_ms=0, end_ms=1000, text="a"), SRTCaption(9, 1000, 2000, "b")]
+        track = CaptionTrack.from_captions(captions)
+        assert [c.index for c in track.to_captions()] == [1, 2]
+        assert track.caption(1) == SRTCaption(index=2, start_ms=1000, end_ms=2000, text="b")
+        assert track.plain_text() == "a b"
@@ -0,0 +1,209 @@
+"""Tests for the SQLite-backed SST record cache in api/services/sst_cache.py."""
+
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from api.services import database
+from api.services.airtable import AirtableClient
+from api.services.sst_cache import DEFAULT_TTL_SECONDS, SSTCache
+
+RECORD = {"id": "recABC", "fields": {"Media ID": "2WLI1209HD", "Title": "Euchre"}, "createdTime": "2025-01-01"}
+
+
+@pytest_asyncio.fixture
+async def cache_db():
+    """Temporary database with the sst_records table."""
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_PATH"] = db_path
+    await database.init_db()
+
+    async with database._engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE sst_records (record_id TEXT PRIMARY KEY, media_id TEXT, "
+                "record_json TEXT NOT NULL, fetched_at DATETIME NOT NULL)"
+            )
+        )
+
+    yield db_path
+
+    await database.close_db()
+    os.unlink(db_path)
+
+
+async def _age_all_rows(seconds: int) -> None:
+    """Push fetched_at of every cached row into the past."""
+    from datetime import datetime, timedelta, timezone
+
+    past = (datetime.now(timezone.utc) - timedelta(seconds=seconds)).isoformat()
+    async with database.get_session() as session:
+        await session.execute(text("UPDATE sst_records SET fetched_at = :past"), {"past": past})
+
+
+class TestReadThrough:
+    """Tests for cache hits and misses."""
+
+    @pytest.mark.asyncio
+    async def test_miss_fetches_then_hit_serves_cache(self, cache_db):
+        """Test first lookup fetches from Airtable and later lookups don't."""
+        cache = SSTCache()
+        fetch = AsyncMock(return_value=RECORD)
+
+        first = await cache.get_by_media_id("2WLI1209HD", fetch)
+        second = await cache.get_by_media_id("2WLI1209HD", fetch)
+
+        assert first == RECORD
+        assert second == RECORD
+        fetch.assert_awaited_once_with("2WLI1209HD")
+
+    @pytest.mark.asyncio
+    async def test_media_id_lookup_primes_record_id_lookup(self, cache_db):
+        """Test a record cached by Media ID is served by record ID too."""
+        cache = SSTCache()
+        await cache.get_by_media_id("2WLI1209HD", AsyncMock(return_value=RECORD))
+
+        fetch_record = AsyncMock()
+        record = await cache.get_record("recABC", fetch_record)
+
+        assert record == RECORD
+        fetch_record.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_max_age_zero_forces_fetch(self, cache_db):
+        """Test max_age_seconds=0 bypasses a fresh cached copy."""
+        cache = SSTCache()
+        await cache.store(RECORD)
+
+        updated = {**RECORD, "fields": {**RECORD["fields"], "Title": "Updated"}}
+        fetch = AsyncMock(return_value=updated)
+        record = await cache.get_record("recABC", fetch, max_age_seconds=0)
+
+        assert record["fields"]["Title"] == "Updated"
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_media_id_miss_is_remembered(self, cache_db):
+        """Test a Media ID with no SST record isn't looked up again within miss TTL."""
+        cache = SSTCache()
+        fetch = AsyncMock(return_value=None)
+
+        assert await cache.get_by_media_id("NOPE0000", fetch) is None
+        assert await cache.get_by_media_id("NOPE0000", fetch) is None
+        fetch.assert_awaited_once()
+
+
+class TestStaleWhileRevalidate:
+    """Tests for stale serving, background refresh, and failure fallback."""
+
+    @pytest.mark.asyncio
+    async def test_stale_record_served_and_refreshed(self, cache_db):
+        """Test a stale record is returned immediately and refreshed in background."""
+        cache = SSTCache(ttl_seconds=60, max_stale_seconds=3600)
+        await cache.store(RECORD)
+        await _age_all_rows(120)
+
+        updated = {**RECORD, "fields": {**RECORD["fields"], "Title": "Updated"}}
+        fetch = AsyncMock(return_value=updated)
+
+        stale = await cache.get_record("recABC", fetch)
+        assert stale["fields"]["Title"] == "Euchre"
+
+        await asyncio.gather(*cache._background)
+        fetch.assert_awaited_once_with("recABC")
+
+        fresh = await cache.get_record("recABC", fetch)
+        assert fresh["fields"]["Title"] == "Updated"
+
+    @pytest.mark.asyncio
+    async def test_expired_record_served_when_refresh_fails(self, cache_db):
+        """Test an expired record is returned if Airtable is unavailable."""
+        cache = SSTCache(ttl_seconds=60, max_stale_seconds=120)
+        await cache.store(RECORD)
+        await _age_all_rows(600)
+
+        fetch = AsyncMock(side_effect=Exception("429 Too Many Requests"))
+        record = await cache.get_record("recABC", fetch)
+
+        assert record == RECORD
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_without_cache_raises(self, cache_db):
+        """Test errors propagate when there's no cached copy to fall back on."""
+        cache = SSTCache()
+        fetch = AsyncMock(side_effect=Exception("Connection failed"))
+
+        with pytest.raises(Exception, match="Connection failed"):
+            await cache.get_record("recMISSING", fetch)
+
+
+class TestSingleFlight:
+    """Tests for request coalescing of concurrent lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self, cache_db):
+        """Test concurrent misses for the same key make one Airtable request."""
+        cache = SSTCache()
+        release = asyncio.Event()
+
+        async def slow_fetch(media_id):
+            await release.wait()
+            return RECORD
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+
+        lookups = [asyncio.ensure_future(cache.get_by_media_id("2WLI1209HD", fetch)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*lookups)
+
+        assert all(r == RECORD for r in results)
+        fetch.assert_awaited_once()
+
+
+class TestBatchLookup:
+    """Tests for batched lookups that check the cache first."""
+
+    @pytest.mark.asyncio
+    async def test_peek_reports_hits_misses_and_unknowns(self, cache_db):
+        """Test peek answers cached records and remembered misses without fetching."""
+        cache = SSTCache()
+        assert await cache.peek_by_media_id("2WLI1209HD") == (False, None)
+
+        await cache.record_media_id_lookup("2WLI1209HD", RECORD)
+        await cache.record_media_id_lookup("NOPE0000", None)
+
+        assert await cache.peek_by_media_id("2WLI1209HD") == (True, RECORD)
+        assert await cache.peek_by_media_id("NOPE0000") == (True, None)
+
+        await _age_all_rows(DEFAULT_TTL_SECONDS + 60)
+        assert await cache.peek_by_media_id("2WLI1209HD") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_fetches_only_uncached_and_seeds_cache(self, cache_db, monkeypatch):
+        """Test batched SST lookups skip cached Media IDs and cache what they fetch."""
+        cache = SSTCache()
+        monkeypatch.setattr("api.services.airtable.get_sst_cache", lambda: cache)
+        await cache.store(RECORD)
+
+        other = {"id": "recDEF", "fields": {"Media ID": "9UNP2005HD"}, "createdTime": "2025-01-02"}
+        client = AirtableClient(api_key="test-key")
+        client.batch_search_sst_by_media_ids = AsyncMock(return_value={"9UNP2005HD": other})
+
+        records = await client.batch_get_sst_by_media_ids(["2WLI1209HD", "9UNP2005HD", "NOPE0000"])
+
+        assert records == {"2WLI1209HD": RECORD, "9UNP2005HD": other}
+        client.batch_search_sst_by_media_ids.assert_awaited_once_with(
+            ["9UNP2005HD", "NOPE0000"], raise_errors=True, all_fields=True
+        )
+
+        fetch = AsyncMock()
+        assert await cache.get_by_media_id("9UNP2005HD", fetch) == other
+        assert await cache.get_by_media_id("NOPE0000", fetch) is None
+        fetch.assert_not_awaited()
@@ -0,0 +1,88 @@
+"""Tests for structured phase outputs in api/services/structured_output.py."""
+
+import json
+
+from api.services.qa_checks import extract_seo_fields
+from api.services.structured_output import (
+    QAReview,
+    SEOMetadata,
+    extract_json,
+    parse_structured,
+    response_format,
+)
+
+SEO = {
+    "title": "Wisconsin Dairy: Four Generations",
+    "short_description": "A family farm near Mount Horeb.",
+    "long_description": "Four generations of the Olson family have milked cows here.",
+    "tags": ["dairy", "farming", "wisconsin"],
+    "categories": ["Agriculture"],
+}
+
+
+class TestExtractJson:
+    """Tests for the tolerant JSON extractor."""
+
+    def test_fenced_with_prose(self):
+        """Test an object wrapped in prose and a code fence is found."""
+        reply = 'Here is the metadata:\n```json\n{"title": "A {braced} title", "tags": ["a"]}\n```\nThanks!'
+        assert extract_json(reply) == {"title": "A {braced} title", "tags": ["a"]}
+
+    def test_trailing_commas(self):
+        """Test trailing commas are tolerated."""
+        assert extract_json('{"tags": ["a", "b",],}') == {"tags": ["a", "b"]}
+
+    def test_no_object(self):
+        """Test replies without an object give None."""
+        assert extract_json("# SEO Report\n\n**Title:** Dairy") is None
+        assert extract_json('{"unterminated": "value"') is None
+
+
+class TestParseStructured:
+    """Tests for validation against output models."""
+
+    def test_valid_reply(self):
+        """Test a valid reply parses into the model."""
+        parsed, error = parse_structured(SEOMetadata, json.dumps(SEO))
+        assert error is None
+        assert parsed.tags == ["dairy", "farming", "wisconsin"]
+
+    def test_errors_name_the_fields(self):
+        """Test validation errors say which fields are wrong."""
+        parsed, error = parse_structured(SEOMetadata, json.dumps({**SEO, "tags": "dairy", "title": ""}))
+        assert parsed is None
+        assert "title:" in error
+        assert "tags:" in error
+
+        parsed, error = parse_structured(QAReview, '{"overall_status": "LGTM", "recommendation": "Ship"}')
+        assert parsed is None
+        assert error.startswith("overall_status:")
+
+    def test_response_format_carries_schema(self):
+        """Test the response_format wraps the model's JSON schema."""
+        fmt = response_format(SEOMetadata)
+        assert fmt["type"] == "json_schema"
+        assert fmt["json_schema"]["name"] == "SEOMetadata"
+        assert "tags" in fmt["json_schema"]["schema"]["properties"]
+
+
+class TestMarkdown:
+    """Tests for rendering validated outputs as the existing markdown reports."""
+
+    def test_seo_markdown_reads_back(self):
+        """Test rendered SEO metadata is readable by the local QA checks."""
+        markdown = SEOMetadata(**SEO).to_markdown()
+        assert extract_seo_fields(markdown) == {"title": SEO["title"], "tags": SEO["tags"]}
+
+    def test_qa_review_markdown(self):
+        """Test the QA review keeps the Overall Status line and lists issues."""
+        review = QAReview(
+            overall_status="NEEDS_REVISION",
+            checklist=[{"item": "SEO title length", "passed": False, "note": "72 chars"}],
+            issues=[{"severity": "MAJOR", "phase": "seo", "description": "Title too long"}],
+            recommendation="Shorten the title.",
+        )
+        markdown = review.to_markdown()
+        assert "**Overall Status:** NEEDS_REVISION" in markdown
+        assert "- [FAIL] SEO title length - 72 chars" in markdown
+        assert "- **MAJOR** (seo): Title too long" in markdown
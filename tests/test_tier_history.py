@@ -0,0 +1,122 @@
+"""Tests for history-driven tier selection in api/services/tier_history.py."""
+
+import json
+
+import pytest
+
+from api.services.tier_history import (
+    build_tier_history,
+    choose_start_tier,
+    duration_bounds,
+    expected_cost,
+)
+
+ROUTING = {
+    "duration_thresholds": [
+        {"max_minutes": 15, "tier": 0},
+        {"max_minutes": 30, "tier": 1},
+        {"max_minutes": None, "tier": 2},
+    ]
+}
+LABELS = ["cheapskate", "default", "big-brain"]
+SETTINGS = {"min_samples": 10, "max_shift": 1, "min_savings": 0.1, "latency_cost_per_minute": 0.01}
+
+
+def _started(phase, tier, duration=10.0):
+    return ("phase_started", json.dumps({"phase": phase, "extra": {"tier": tier, "duration_minutes": duration}}))
+
+
+def _completed(phase, tier, cost, seconds, duration=10.0):
+    extra = {"tier": tier, "duration_minutes": duration, "elapsed_seconds": seconds}
+    return ("phase_completed", json.dumps({"phase": phase, "cost": cost, "extra": extra}))
+
+
+def _escalated(phase, from_tier, seconds, duration=10.0):
+    extra = {"escalation": True, "from_tier": from_tier, "elapsed_seconds": seconds, "duration_minutes": duration}
+    return ("phase_started", json.dumps({"phase": phase, "extra": extra}))
+
+
+def _history(runs):
+    """History from (phase, outcomes per tier) where each run escalates until its first success."""
+    rows = []
+    for phase, path in runs:
+        for tier, succeeded in path:
+            rows.append(_started(phase, tier))
+            if succeeded:
+                rows.append(_completed(phase, tier, cost=0.001 * 10**tier, seconds=30))
+            else:
+                rows.append(_escalated(phase, tier, seconds=60))
+    return build_tier_history([(event, data, None, None) for event, data in rows], duration_bounds(ROUTING), 30)
+
+
+class TestBuildTierHistory:
+    """Tests for aggregating phase events."""
+
+    def test_counts_attempts_successes_and_time(self):
+        """Test each tier's attempts, successes, cost and elapsed time are tallied."""
+        history = _history([("formatter", [(0, False), (1, True)]), ("formatter", [(0, True)])])
+
+        cheap = history.get("formatter", 0, 0)
+        assert (cheap.attempts, cheap.successes) == (2, 1)
+        assert cheap.mean_cost == 0.001
+        assert cheap.mean_seconds == 45
+        assert history.get("formatter", 0, 1).success_rate == 1.0
+
+    def test_duration_falls_back_to_job_columns(self):
+        """Test events without a duration are bucketed by the job's duration or word count."""
+        started = ("phase_started", json.dumps({"phase": "seo", "extra": {"tier": 0}}))
+        history = build_tier_history([(*started, 20.0, None), (*started, None, 6000)], duration_bounds(ROUTING), 30)
+
+        assert history.get("seo", 1, 0).attempts == 1
+        assert history.get("seo", 2, 0).attempts == 1
+        assert [history.bucket_label(i) for i in range(3)] == ["≤15min", "15-30min", ">30min"]
+
+
+class TestChooseStartTier:
+    """Tests for expected-cost tier choice and its guardrails."""
+
+    def test_starts_up_when_cheapskate_nearly_always_escalates(self):
+        """Test a phase that almost always escalates skips the wasted cheap attempt."""
+        history = _history([("formatter", [(0, False), (1, True)])] * 19 + [("formatter", [(0, True)])])
+
+        tier, reason = choose_start_tier(history, "formatter", 10, 0, "phase default", 0, 2, LABELS, SETTINGS)
+
+        assert tier == 1
+        assert reason.startswith("history (formatter, ≤15min, last 30d): cheapskate succeeds 5% of 20 attempts")
+        assert "starting up at default" in reason
+
+    def test_keeps_static_tier_when_it_is_cheapest(self):
+        """Test a reliable cheap tier stays, with the history noted in the reason."""
+        history = _history([("seo", [(0, True)])] * 12 + [("seo", [(1, True)])] * 12)
+
+        tier, reason = choose_start_tier(history, "seo", 10, 0, "phase default", 0, 2, LABELS, SETTINGS)
+
+        assert tier == 0
+        assert reason.startswith("phase default; history agrees")
+
+    def test_insufficient_samples_fall_back_to_static(self):
+        """Test too little history leaves the duration-threshold choice in place."""
+        history = _history([("formatter", [(0, False), (1, True)])] * 5)
+
+        tier, reason = choose_start_tier(history, "formatter", 10, 0, "phase default", 0, 2, LABELS, SETTINGS)
+
+        assert tier == 0
+        assert "fewer than 10 samples" in reason
+
+    def test_never_below_base_tier(self):
+        """Test history cannot start a phase below its base tier."""
+        history = _history([("manager", [(1, True)])] * 12 + [("manager", [(2, True)])] * 12)
+
+        tier, _ = choose_start_tier(history, "manager", 10, 2, "phase default", 2, 2, LABELS, SETTINGS)
+
+        assert tier == 2
+
+    def test_expected_cost_includes_escalation(self):
+        """Test starting low pays for the failed attempt's cost and time."""
+        history = _history([("formatter", [(0, False), (1, True)])] * 10 + [("formatter", [(0, True)])] * 10)
+
+        # cheapskate: $0.001 + 45s; half the time also default: $0.01 + 30s
+        assert expected_cost(history, "formatter", 0, 0, 2, 0.01, 10) == pytest.approx(
+            0.001 + 0.01 * 45 / 60 + 0.5 * (0.01 + 0.01 * 30 / 60)
+        )
+        assert expected_cost(history, "formatter", 0, 2, 2, 0.01, 10) is None
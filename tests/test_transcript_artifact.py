@@ -0,0 +1,87 @@
+"""Tests for single-pass transcript ingestion in api/services/transcript_artifact.py."""
+
+import os
+
+from api.services.transcript_artifact import (
+    ARTIFACT_FILENAME,
+    build_artifact,
+    decode_transcript_bytes,
+    ingest_transcript,
+    load_artifact,
+)
+
+SRT = """1
+00:00:01,000 --> 00:00:03,000
+Hello world
+
+2
+00:00:04,000 --> 00:01:30,500
+Second caption
+"""
+
+
+def test_decode_falls_back_to_latin1():
+    """Test non-UTF-8 bytes decode without errors and report the encoding."""
+    assert decode_transcript_bytes("café".encode("utf-8")) == ("café", "utf-8")
+    assert decode_transcript_bytes("café".encode("latin-1")) == ("café", "iso-8859-1")
+
+
+def test_text_transcript_with_companion_srt(tmp_path):
+    """Test a .txt transcript takes captions and duration from its SRT."""
+    transcript = tmp_path / "2WLI1209HD_ForClaude.txt"
+    transcript.write_text("one two three four")
+    srt = tmp_path / "2WLI1209HD.srt"
+    srt.write_text(SRT)
+
+    artifact = build_artifact(transcript, srt)
+
+    assert artifact.content == "one two three four"
+    assert artifact.plain_text == "one two three four"
+    assert artifact.word_count == 4
+    assert artifact.srt_content == SRT
+    assert list(artifact.captions) == [(1000, 3000, "Hello world"), (4000, 90500, "Second caption")]
+    assert artifact.duration_ms == 90500
+    assert artifact.metrics()["estimated_duration_minutes"] == 0.03
+
+
+def test_srt_transcript_is_its_own_caption_source(tmp_path):
+    """Test an .srt transcript yields caption plain text without a separate SRT."""
+    transcript = tmp_path / "9UNP2005HD.srt"
+    transcript.write_text(SRT)
+
+    artifact = build_artifact(transcript)
+
+    assert artifact.plain_text == "Hello world Second caption"
+    assert artifact.srt_path == transcript
+    assert artifact.duration_ms == 90500
+
+
+def test_ingest_reuses_stored_artifact_until_source_changes(tmp_path):
+    """Test the stored artifact is reused and rebuilt when the transcript changes."""
+    project = tmp_path / "project"
+    project.mkdir()
+    transcript = tmp_path / "show.txt"
+    transcript.write_text("first version")
+
+    first = ingest_transcript(transcript, None, project)
+    assert (project / ARTIFACT_FILENAME).exists()
+    assert load_artifact(project) == first
+    assert ingest_transcript(transcript, None, project) == first
+
+    transcript.write_text("second version of the text")
+    stat = transcript.stat()
+    os.utime(transcript, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = ingest_transcript(transcript, None, project)
+    assert second.content == "second version of the text"
+    assert load_artifact(project).word_count == 5
+
+
+def test_unreadable_artifact_is_ignored(tmp_path):
+    """Test a corrupt stored artifact is rebuilt rather than raised."""
+    (tmp_path / ARTIFACT_FILENAME).write_text("{not json")
+    transcript = tmp_path / "show.txt"
+    transcript.write_text("text")
+
+    assert load_artifact(tmp_path) is None
+    assert ingest_transcript(transcript, None, tmp_path).content == "text"
@@ -0,0 +1,96 @@
+"""Tests for the compact prompt transcript encoding in api/services/transcript_encoding.py."""
+
+from api.services.srt import CaptionTrack, parse_srt_track
+from api.services.transcript_encoding import encode_captions, snap_start_times
+from api.services.utils import generate_srt
+
+
+def _track(*captions) -> CaptionTrack:
+    """Build a track from (start_ms, end_ms, text) tuples."""
+    return CaptionTrack.from_columns(*zip(*captions)) if captions else parse_srt_track("")
+
+
+class TestEncodeCaptions:
+    """Tests for paragraph merging and rendering."""
+
+    def test_merges_captions_into_stamped_paragraphs(self):
+        """Test indices and full timecodes are replaced by one stamp per paragraph."""
+        track = _track(
+            (1200, 3000, "Welcome to the"),
+            (3000, 5000, "program.\nToday we"),
+            (5100, 8000, "visit a farm."),
+            (8000, 9000, ">> Thanks for having us."),
+            (15000, 17000, "Later that day."),
+        )
+
+        compact = encode_captions(track)
+
+        assert compact.render() == (
+            "[0:00:01] Welcome to the program. Today we visit a farm.\n\n"
+            "[0:00:08] >> Thanks for having us.\n\n"
+            "[0:00:15] Later that day."
+        )
+        assert [(p.first, p.stop) for p in compact.paragraphs] == [(0, 3), (3, 4), (4, 5)]
+
+    def test_long_runs_break_at_sentence_end(self):
+        """Test paragraphs close at a sentence end after the target length."""
+        track = _track(*[(i * 5000, i * 5000 + 5000, f"Line {i}.") for i in range(12)])
+
+        paragraphs = encode_captions(track, target_ms=20000, max_ms=45000).paragraphs
+
+        assert len(paragraphs) == 3
+        assert paragraphs[0].text == "Line 0. Line 1. Line 2. Line 3."
+
+    def test_is_shorter_than_srt(self):
+        """Test the compact form is much smaller than the SRT it came from."""
+        track = _track(*[(i * 2500, i * 2500 + 2400, f"caption number {i} says a few words") for i in range(400)])
+        srt = generate_srt(track.to_captions())
+
+        assert len(encode_captions(track).render()) < 0.7 * len(srt)
+
+    def test_render_max_chars(self):
+        """Test rendering stops at a paragraph boundary when capped."""
+        track = _track(*[(i * 3000, i * 3000 + 2000, f"Sentence {i}.") for i in range(10)])
+        compact = encode_captions(track, gap_ms=500)
+
+        rendered = compact.render(max_chars=50)
+        assert rendered.endswith("...")
+        assert rendered.count("[") == 2
+
+    def test_empty_track(self):
+        """Test no captions gives no paragraphs."""
+        assert encode_captions(_track()).render() == ""
+
+
+class TestReverseMapping:
+    """Tests for mapping stamps back to exact caption times."""
+
+    def test_resolve_stamp_returns_exact_start(self):
+        """Test a copied stamp maps back to its paragraph's exact SRT start."""
+        track = _track((1200, 3000, "First."), (65432, 67000, ">> Second."), (70000, 72000, "Third part"))
+        compact = encode_captions(track)
+
+        assert compact.resolve_stamp("[0:00:01]") == 1200
+        assert compact.resolve_stamp("0:01:05.000") == 65432
+
+        # Between stamps: nearest caption start
+        assert compact.resolve_stamp("0:01:09") == 70000
+        assert compact.resolve_stamp("no time here") is None
+
+    def test_snap_start_times_rewrites_copied_stamps(self):
+        """Test whole-second report times snap to caption starts and other times are kept."""
+        track = _track((1200, 3000, "First."), (65432, 67000, ">> Second."), (70000, 72000, "Third part"))
+        compact = encode_captions(track)
+        report = (
+            "| Intro | 0:00:00.000 | 0:01:04.999 |\n"
+            "| Second | 0:01:05.000 | 0:01:09.500 |\n"
+            "| Third | 0:01:10.250 | 0:01:12.000 |\n"
+            "0:00 Intro\n1:05 Second"
+        )
+
+        snapped = snap_start_times(report, compact)
+
+        assert "| Intro | 0:00:00.000 | 0:01:04.999 |" in snapped
+        assert "| Second | 0:01:05.432 | 0:01:09.500 |" in snapped
+        assert "| Third | 0:01:10.250 | 0:01:12.000 |" in snapped
+        assert snapped.endswith("0:00 Intro\n1:05 Second")
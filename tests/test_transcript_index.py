@@ -0,0 +1,119 @@
+"""Tests for the persistent transcript file index in api/services/transcript_index.py."""
+
+import os
+import tempfile
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from api.services import database
+from api.services.transcript_index import TranscriptIndex
+
+
+@pytest_asyncio.fixture
+async def index_db():
+    """Temporary database with the transcript_index table."""
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_PATH"] = db_path
+    await database.init_db()
+
+    async with database._engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE transcript_index (path TEXT PRIMARY KEY, filename TEXT NOT NULL, media_id TEXT, "
+                "archived INTEGER NOT NULL DEFAULT 0, indexed_at DATETIME NOT NULL)"
+            )
+        )
+
+    yield db_path
+
+    await database.close_db()
+    os.unlink(db_path)
+
+
+@pytest.fixture
+def transcripts_dir(tmp_path):
+    """Transcripts folder with an archive subfolder."""
+    (tmp_path / "archive").mkdir()
+    return tmp_path
+
+
+class TestLookups:
+    """Tests for building the index and finding files."""
+
+    @pytest.mark.asyncio
+    async def test_load_builds_from_disk_when_empty(self, index_db, transcripts_dir):
+        """Test the first load scans both folders."""
+        (transcripts_dir / "2WLI1209HD.txt").write_text("text")
+        (transcripts_dir / "archive" / "2WLI1209HD_ForClaude.srt").write_text("srt")
+        (transcripts_dir / ".hidden.srt").write_text("srt")
+        (transcripts_dir / "notes.md").write_text("md")
+
+        index = TranscriptIndex(transcripts_dir)
+        assert await index.load() == 2
+
+        assert index.find_transcript("2WLI1209HD.txt") == transcripts_dir / "2WLI1209HD.txt"
+        assert index.find_srt("2WLI1209HD") == transcripts_dir / "archive" / "2WLI1209HD_ForClaude.srt"
+        assert index.find_srt("9UNP2005HD") is None
+
+    @pytest.mark.asyncio
+    async def test_srt_prefers_inbox_then_exact_name(self, index_db, transcripts_dir):
+        """Test SRT lookup order matches the old folder scan."""
+        for path in [
+            transcripts_dir / "archive" / "2WLI1209HD.srt",
+            transcripts_dir / "2WLI1209HD_ForClaude.srt",
+            transcripts_dir / "2WLI1209HD.srt",
+        ]:
+            path.write_text("srt")
+
+        index = TranscriptIndex(transcripts_dir)
+        await index.rebuild()
+        assert index.find_srt("2WLI1209HD") == transcripts_dir / "2WLI1209HD.srt"
+
+        os.unlink(transcripts_dir / "2WLI1209HD.srt")
+        assert index.find_srt("2WLI1209HD") == transcripts_dir / "2WLI1209HD_ForClaude.srt"
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_dropped(self, index_db, transcripts_dir):
+        """Test an indexed file deleted from disk is not returned."""
+        path = transcripts_dir / "gone.txt"
+        path.write_text("text")
+        index = TranscriptIndex(transcripts_dir)
+        await index.add(path)
+
+        os.unlink(path)
+
+        assert index.find_transcript("gone.txt") is None
+
+
+class TestSharing:
+    """Tests for entries written by one process reaching another."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_picks_up_other_writers(self, index_db, transcripts_dir):
+        """Test a worker sees files indexed by the API and moves into the archive."""
+        (transcripts_dir / "seed.txt").write_text("seed")
+        worker_index = TranscriptIndex(transcripts_dir)
+        await worker_index.load()
+
+        # API process indexes a newly queued file
+        new_file = transcripts_dir / "9UNP2005HD.srt"
+        new_file.write_text("srt")
+        await TranscriptIndex(transcripts_dir).add(new_file)
+
+        assert worker_index.find_srt("9UNP2005HD") is None
+        assert await worker_index.refresh() >= 1
+        assert worker_index.find_srt("9UNP2005HD") == new_file
+
+        # Archive step moves it
+        archived = transcripts_dir / "archive" / "9UNP2005HD.srt"
+        os.replace(new_file, archived)
+        await worker_index.move(new_file, archived)
+        assert worker_index.find_srt("9UNP2005HD") == archived
+
+        # A fresh process loads the moved entry from the table without rescanning
+        reloaded = TranscriptIndex(transcripts_dir)
+        await reloaded.load()
+        assert reloaded.find_srt("9UNP2005HD") == archived
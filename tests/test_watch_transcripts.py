@@ -1,99 +1,113 @@
 """Tests for watch_transcripts.py file watcher script."""
 
+import asyncio
+import json
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+import watch_transcripts
 
 # Import the functions to test
 from watch_transcripts import (
+    TranscriptWatcher,
     get_queued_files,
     get_transcript_files,
     queue_file,
+    queue_files_bulk,
     run_once,
+    wait_until_stable,
     watch_loop,
 )
 
 
+def _lookup_response(transcript_files: dict, status_code: int = 200) -> MagicMock:
+    """Build a mock response from POST /api/queue/lookup."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {"transcript_files": transcript_files, "media_ids": {}}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_queued_cache():
+    """Start each test with an empty watcher cache."""
+    watch_transcripts._queued_cache.clear()
+    yield
+    watch_transcripts._queued_cache.clear()
+
+
 class TestGetQueuedFiles:
     """Tests for get_queued_files function."""
 
-    @patch("watch_transcripts.httpx.get")
-    def test_get_queued_files_success(self, mock_get):
-        """Test successful retrieval of queued files."""
-        # Mock API responses for different statuses
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "jobs": [
-                {"transcript_file": "file1.txt"},
-                {"transcript_file": "file2.srt"},
-            ],
-            "total": 2,
-        }
-        mock_get.return_value = mock_response
-
-        result = get_queued_files()
-
-        # Should have called API for each status
-        assert mock_get.call_count == 6  # 6 statuses
-        assert "file1.txt" in result
-        assert "file2.srt" in result
-        assert len(result) == 2
-
-    @patch("watch_transcripts.httpx.get")
-    def test_get_queued_files_no_duplicates(self, mock_get):
-        """Test that duplicate filenames across statuses are deduplicated."""
-
-        # Mock API responses with duplicate filenames
-        def mock_response_factory(*args, **kwargs):
-            response = MagicMock()
-            response.status_code = 200
-            response.json.return_value = {
-                "jobs": [
-                    {"transcript_file": "duplicate.txt"},
-                ],
-                "total": 1,
+    @patch("watch_transcripts.httpx.post")
+    def test_get_queued_files_success(self, mock_post):
+        """Test one bulk lookup returns the queued subset."""
+        mock_post.return_value = _lookup_response(
+            {
+                "file1.txt": {"job_id": 1, "status": "completed"},
+                "file2.srt": {"job_id": 2, "status": "pending"},
             }
-            return response
+        )
+
+        result = get_queued_files(["file1.txt", "file2.srt", "new.txt"])
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args[0][0].endswith("/api/queue/lookup")
+        assert mock_post.call_args[1]["json"] == {"transcript_files": ["file1.txt", "file2.srt", "new.txt"]}
+        assert result == {"file1.txt", "file2.srt"}
+
+    @patch("watch_transcripts.httpx.post")
+    def test_get_queued_files_uses_cache(self, mock_post):
+        """Test queued files are not looked up again."""
+        mock_post.return_value = _lookup_response({"file1.txt": {"job_id": 1, "status": "completed"}})
+        get_queued_files(["file1.txt", "new.txt"])
+
+        mock_post.return_value = _lookup_response({})
+        result = get_queued_files(["file1.txt", "new.txt"])
+
+        # Second lookup only asks about the file that wasn't queued
+        assert mock_post.call_args[1]["json"] == {"transcript_files": ["new.txt"]}
+        assert result == {"file1.txt"}
 
-        mock_get.side_effect = mock_response_factory
+    @patch("watch_transcripts.LOOKUP_BATCH_SIZE", 2)
+    @patch("watch_transcripts.httpx.post")
+    def test_get_queued_files_batches_lookups(self, mock_post):
+        """Test large file lists are split into several lookups."""
+        mock_post.return_value = _lookup_response({})
 
-        result = get_queued_files()
+        get_queued_files(["a.txt", "b.txt", "c.txt"])
 
-        # Should only have one entry even though called 6 times
-        assert len(result) == 1
-        assert "duplicate.txt" in result
+        assert mock_post.call_count == 2
 
-    @patch("watch_transcripts.httpx.get")
-    def test_get_queued_files_empty_response(self, mock_get):
+    @patch("watch_transcripts.httpx.post")
+    def test_get_queued_files_empty_response(self, mock_post):
         """Test handling of empty queue."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"jobs": [], "total": 0}
-        mock_get.return_value = mock_response
+        mock_post.return_value = _lookup_response({})
 
-        result = get_queued_files()
+        result = get_queued_files(["file1.txt"])
 
         assert len(result) == 0
 
-    @patch("watch_transcripts.httpx.get")
-    def test_get_queued_files_api_error(self, mock_get):
+    @patch("watch_transcripts.httpx.post")
+    def test_get_queued_files_api_error(self, mock_post):
         """Test handling of API errors."""
-        mock_get.side_effect = Exception("Connection error")
+        mock_post.side_effect = Exception("Connection error")
 
-        result = get_queued_files()
+        result = get_queued_files(["file1.txt"])
 
         # Should return empty set on error
         assert len(result) == 0
 
-    @patch("watch_transcripts.httpx.get")
-    def test_get_queued_files_404_response(self, mock_get):
+    @patch("watch_transcripts.httpx.post")
+    def test_get_queued_files_404_response(self, mock_post):
         """Test handling of non-200 status codes."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_post.return_value = _lookup_response({}, status_code=404)
 
-        result = get_queued_files()
+        result = get_queued_files(["file1.txt"])
 
         # Should return empty set on non-200 status
         assert len(result) == 0
@@ -362,101 +376,168 @@ class TestRunOnce:
         assert mock_queue.call_count == 3
 
 
-class TestWatchLoop:
-    """Tests for watch_loop function."""
-
-    @patch("watch_transcripts.time.sleep")
-    @patch("watch_transcripts.queue_file")
-    @patch("watch_transcripts.get_transcript_files")
-    @patch("watch_transcripts.get_queued_files")
-    def test_watch_loop_detects_new_file(self, mock_queued, mock_files, mock_queue, mock_sleep):
-        """Test that watch loop detects and queues new files."""
-        # Setup initial state
-        mock_queued.return_value = set()
-
-        # First call: initial files
-        # Second call: new file appears
-        # Third call: trigger KeyboardInterrupt
-        mock_files.side_effect = [["initial.txt"], ["initial.txt", "new.txt"], KeyboardInterrupt()]
-
-        watch_loop()
-
-        # Should have queued the new file
-        mock_queue.assert_called_once_with("new.txt")
-
-    @patch("watch_transcripts.time.sleep")
-    @patch("watch_transcripts.queue_file")
-    @patch("watch_transcripts.get_transcript_files")
-    @patch("watch_transcripts.get_queued_files")
-    def test_watch_loop_ignores_existing_files(self, mock_queued, mock_files, mock_queue, mock_sleep):
-        """Test that watch loop doesn't queue files seen initially."""
-        mock_queued.return_value = set()
-
-        # All calls return same files, then interrupt
-        mock_files.side_effect = [["file1.txt"], ["file1.txt"], KeyboardInterrupt()]
-
-        watch_loop()
-
-        # Should not queue anything (file was seen initially)
-        mock_queue.assert_not_called()
-
-    @patch("watch_transcripts.time.sleep")
-    @patch("watch_transcripts.queue_file")
-    @patch("watch_transcripts.get_transcript_files")
-    @patch("watch_transcripts.get_queued_files")
-    def test_watch_loop_keyboard_interrupt(self, mock_queued, mock_files, mock_queue, mock_sleep):
+async def _batches(*batches):
+    """Async iterator over filename batches, standing in for file events."""
+    for batch in batches:
+        yield set(batch)
+
+
+class TestWaitUntilStable:
+    """Tests for partial-write detection."""
+
+    @pytest.mark.asyncio
+    async def test_complete_file_is_stable(self, tmp_path):
+        """Test an unchanged, non-empty file is reported complete."""
+        path = tmp_path / "done.srt"
+        path.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n")
+
+        assert await wait_until_stable(path, interval=0.01) is True
+
+    @pytest.mark.asyncio
+    async def test_waits_while_file_grows(self, tmp_path):
+        """Test a file being written is not complete until writes stop."""
+        path = tmp_path / "growing.srt"
+        path.write_text("1\n")
+
+        async def writer():
+            for i in range(5):
+                await asyncio.sleep(0.02)
+                with open(path, "a") as f:
+                    f.write(f"line {i}\n")
+
+        write_task = asyncio.ensure_future(writer())
+        assert await wait_until_stable(path, interval=0.05) is True
+        await write_task
+
+        assert path.read_text().count("line") == 5
+
+    @pytest.mark.asyncio
+    async def test_missing_and_empty_files(self, tmp_path):
+        """Test missing files fail at once and empty files time out."""
+        assert await wait_until_stable(tmp_path / "gone.srt", interval=0.01) is False
+
+        empty = tmp_path / "empty.srt"
+        empty.touch()
+        assert await wait_until_stable(empty, interval=0.01, timeout=0.05) is False
+
+
+class TestQueueFilesBulk:
+    """Tests for queue_files_bulk function."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_results_update_cache(self):
+        """Test one request queues the batch and known files are cached."""
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(
+                200,
+                json={
+                    "queued": 1,
+                    "skipped": 1,
+                    "results": [
+                        {"transcript_file": "new_ForClaude.txt", "queued": True, "job_id": 5},
+                        {
+                            "transcript_file": "old.srt",
+                            "queued": False,
+                            "existing_job": {"job_id": 2, "status": "completed"},
+                        },
+                    ],
+                },
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            queued = await queue_files_bulk(client, ["new_ForClaude.txt", "old.srt"])
+
+        assert queued == 1
+        assert len(requests) == 1
+        assert requests[0]["jobs"][0] == {"project_name": "new", "transcript_file": "new_ForClaude.txt"}
+        assert watch_transcripts._queued_cache["new_ForClaude.txt"]["job_id"] == 5
+        assert watch_transcripts._queued_cache["old.srt"]["job_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_server_error(self):
+        """Test a failed request queues nothing and caches nothing."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            queued = await queue_files_bulk(client, ["new.txt"])
+
+        assert queued == 0
+        assert watch_transcripts._queued_cache == {}
+
+
+class TestTranscriptWatcher:
+    """Tests for the event-driven watcher."""
+
+    @pytest.mark.asyncio
+    async def test_batch_submitted_in_one_request(self, tmp_path):
+        """Test files from one event batch are queued together once complete."""
+        (tmp_path / "a.srt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        watch_transcripts._queued_cache["queued.txt"] = {"job_id": 1, "status": "completed"}
+
+        with (
+            patch("watch_transcripts.TRANSCRIPTS_DIR", tmp_path),
+            patch("watch_transcripts.STABLE_CHECK_INTERVAL", 0.01),
+            patch("watch_transcripts.queue_files_bulk", new_callable=AsyncMock) as mock_bulk,
+        ):
+            await TranscriptWatcher().run(_batches(["a.srt", "b.txt", "queued.txt"]))
+
+        mock_bulk.assert_awaited_once()
+        assert mock_bulk.call_args.args[1] == ["a.srt", "b.txt"]
+
+    @pytest.mark.asyncio
+    async def test_partial_file_skipped(self, tmp_path):
+        """Test a file that never finishes writing is not queued."""
+        (tmp_path / "empty.srt").touch()
+
+        with (
+            patch("watch_transcripts.TRANSCRIPTS_DIR", tmp_path),
+            patch("watch_transcripts.STABLE_CHECK_INTERVAL", 0.01),
+            patch("watch_transcripts.STABLE_TIMEOUT", 0.05),
+            patch("watch_transcripts.queue_files_bulk", new_callable=AsyncMock) as mock_bulk,
+        ):
+            await TranscriptWatcher().run(_batches(["empty.srt"]))
+
+        mock_bulk.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_file_events_detected(self, tmp_path):
+        """Test a file created in the folder is reported by watch_events."""
+        with patch("watch_transcripts.TRANSCRIPTS_DIR", tmp_path):
+            events = TranscriptWatcher().watch_events()
+            first = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0.2)
+            (tmp_path / "notes.md").write_text("ignored")
+            (tmp_path / "new.srt").write_text("1")
+
+            try:
+                filenames = await asyncio.wait_for(first, timeout=5)
+            finally:
+                await events.aclose()
+
+        assert filenames == {"new.srt"}
+
+    def test_watch_loop_keyboard_interrupt(self):
         """Test that watch loop exits cleanly on Ctrl+C."""
-        mock_queued.return_value = set()
-        mock_files.side_effect = KeyboardInterrupt()
-
-        # Should not raise exception
-        watch_loop()
 
-    @patch("watch_transcripts.time.sleep")
-    @patch("watch_transcripts.queue_file")
-    @patch("watch_transcripts.get_transcript_files")
-    @patch("watch_transcripts.get_queued_files")
-    def test_watch_loop_tracks_queued_files(self, mock_queued, mock_files, mock_queue, mock_sleep):
-        """Test that watch loop includes already-queued files in seen set."""
-        # Files already in queue
-        mock_queued.return_value = {"queued.txt"}
-
-        # First call: current files
-        # Second call: queued file reappears (shouldn't queue again)
-        # Third call: interrupt
-        mock_files.side_effect = [["queued.txt"], ["queued.txt"], KeyboardInterrupt()]
+        def interrupted(coro):
+            coro.close()
+            raise KeyboardInterrupt()
 
-        watch_loop()
-
-        # Should not queue the already-queued file
-        mock_queue.assert_not_called()
-
-    @patch("watch_transcripts.POLL_INTERVAL", 1)
-    @patch("watch_transcripts.time.sleep")
-    @patch("watch_transcripts.queue_file")
-    @patch("watch_transcripts.get_transcript_files")
-    @patch("watch_transcripts.get_queued_files")
-    def test_watch_loop_sleep_interval(self, mock_queued, mock_files, mock_queue, mock_sleep):
-        """Test that watch loop sleeps between iterations."""
-        mock_queued.return_value = set()
-
-        # Run two iterations then stop
-        mock_files.side_effect = [[], [], KeyboardInterrupt()]
-
-        watch_loop()
-
-        # Should have slept twice (once per iteration)
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_called_with(1)
+        with patch("watch_transcripts.asyncio.run", side_effect=interrupted):
+            # Should not raise exception
+            watch_loop()
 
 
 class TestIntegration:
     """Integration-style tests."""
 
     @patch("watch_transcripts.httpx.post")
-    @patch("watch_transcripts.httpx.get")
     @patch("watch_transcripts.TRANSCRIPTS_DIR")
-    def test_full_workflow_once_mode(self, mock_dir, mock_get, mock_post):
+    def test_full_workflow_once_mode(self, mock_dir, mock_post):
         """Test full workflow in --once mode."""
         # Setup filesystem
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -467,23 +548,19 @@ class TestIntegration:
             mock_dir.exists.return_value = True
             mock_dir.iterdir.return_value = mock_dir_path.iterdir()
 
-            # Mock API responses
-            # get_queued_files() calls
-            mock_get_response = MagicMock()
-            mock_get_response.status_code = 200
-            mock_get_response.json.return_value = {"jobs": [{"transcript_file": "already_queued.srt"}], "total": 1}
-            mock_get.return_value = mock_get_response
-
-            # queue_file() calls
-            mock_post_response = MagicMock()
-            mock_post_response.status_code = 201
-            mock_post_response.json.return_value = {"id": 1}
-            mock_post.return_value = mock_post_response
+            # get_queued_files() lookup, then queue_file() for the new file
+            mock_queue_response = MagicMock()
+            mock_queue_response.status_code = 201
+            mock_queue_response.json.return_value = {"id": 1}
+            mock_post.side_effect = [
+                _lookup_response({"already_queued.srt": {"job_id": 7, "status": "completed"}}),
+                mock_queue_response,
+            ]
 
             # Run once
             run_once()
 
-            # Should only queue the new file
-            assert mock_post.call_count == 1
+            # Should look up both files, then only queue the new file
+            assert mock_post.call_count == 2
             call_args = mock_post.call_args
             assert call_args[1]["json"]["transcript_file"] == "new_file.txt"
@@ -1,39 +1,68 @@
 #!/usr/bin/env python3
 """Watch transcripts folder and auto-queue new files.
 
+Uses kernel file notifications (inotify on Linux, FSEvents on macOS) via
+watchfiles, falling back to polling when watchfiles isn't installed or
+--poll is given. New files are queued only once they stop growing, and
+each burst of files is submitted in one bulk request.
+
 Usage:
-    python watch_transcripts.py [--once]
+    python watch_transcripts.py [--once] [--poll]
 
 Options:
     --once    Queue all unprocessed files once and exit (no watching)
+    --poll    Poll the folder instead of using file notifications
 """
+import asyncio
 import sys
-import time
 from pathlib import Path
 
 import httpx
 
 TRANSCRIPTS_DIR = Path("transcripts")
 API_BASE = "http://localhost:8000"
-POLL_INTERVAL = 5  # seconds
+POLL_INTERVAL = 5  # seconds (polling fallback only)
+
+# Group file events that arrive within this window into one batch
+DEBOUNCE_MS = 300
+
+# A file is complete once its size and mtime are unchanged across one check
+STABLE_CHECK_INTERVAL = 0.3  # seconds
+STABLE_TIMEOUT = 600  # seconds; a file still growing after this is left for its next event
+
+
+# Lookup batch size (the API accepts up to 1000 filenames per request)
+LOOKUP_BATCH_SIZE = 500
+
+# Filenames known to have a job, so each file is looked up at most once
+_queued_cache: dict = {}
+
+
+def get_queued_files(filenames) -> set:
+    """Get the subset of filenames that already have a job (any status).
+
+    Answers from the local cache first, then asks the API about the rest
+    with one bulk lookup per LOOKUP_BATCH_SIZE files. Only files that have
+    a job are cached; the rest are looked up again next time.
 
+    Args:
+        filenames: Transcript filenames to check
 
-def get_queued_files() -> set:
-    """Get set of transcript files already in queue (any status)."""
-    queued = set()
+    Returns:
+        Set of filenames that are already queued or processed
+    """
+    unknown = [f for f in dict.fromkeys(filenames) if f not in _queued_cache]
     try:
-        # Get all jobs from API (paginated response)
-        for status in ["pending", "in_progress", "completed", "failed", "paused", "cancelled"]:
-            response = httpx.get(f"{API_BASE}/api/queue/", params={"status": status, "page_size": 1000}, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                # API returns paginated response: { jobs: [...], total: X, ... }
-                jobs = data.get("jobs", [])
-                for job in jobs:
-                    queued.add(job.get("transcript_file", ""))
+        for i in range(0, len(unknown), LOOKUP_BATCH_SIZE):
+            batch = unknown[i : i + LOOKUP_BATCH_SIZE]
+            response = httpx.post(f"{API_BASE}/api/queue/lookup", json={"transcript_files": batch}, timeout=10)
+            if response.status_code != 200:
+                print(f"[Watch] Queue lookup failed: {response.status_code}")
+                break
+            _queued_cache.update(response.json().get("transcript_files", {}))
     except Exception as e:
         print(f"[Watch] Error fetching queue: {e}")
-    return queued
+    return {f for f in filenames if f in _queued_cache}
 
 
 def get_transcript_files() -> list:
@@ -41,11 +70,26 @@ def get_transcript_files() -> list:
     files = []
     if TRANSCRIPTS_DIR.exists():
         for f in TRANSCRIPTS_DIR.iterdir():
-            if f.is_file() and f.suffix in [".txt", ".srt"] and not f.name.startswith("."):
+            if f.is_file() and is_transcript_file(f.name):
                 files.append(f.name)
     return sorted(files)
 
 
+def is_transcript_file(filename: str) -> bool:
+    """Whether a filename is a transcript the watcher should queue."""
+    return Path(filename).suffix in [".txt", ".srt"] and not filename.startswith(".")
+
+
+def project_name_for(filename: str) -> str:
+    """Generate a project name from a transcript filename."""
+    project_name = Path(filename).stem
+    # Clean up common suffixes
+    for suffix in ["_ForClaude", "_forclaude", "_transcript"]:
+        if project_name.endswith(suffix):
+            project_name = project_name[: -len(suffix)]
+    return project_name
+
+
 def queue_file(filename: str, force: bool = False) -> bool:
     """Queue a transcript file for processing.
 
@@ -56,12 +100,7 @@ def queue_file(filename: str, force: bool = False) -> bool:
     Returns:
         True if queued successfully, False otherwise
     """
-    # Generate project name from filename
-    project_name = Path(filename).stem
-    # Clean up common suffixes
-    for suffix in ["_ForClaude", "_forclaude", "_transcript"]:
-        if project_name.endswith(suffix):
-            project_name = project_name[: -len(suffix)]
+    project_name = project_name_for(filename)
 
     try:
         # Build URL with force parameter if needed
@@ -79,6 +118,7 @@ def queue_file(filename: str, force: bool = False) -> bool:
         )
         if response.status_code in [200, 201]:
             job = response.json()
+            _queued_cache[filename] = {"job_id": job.get("id"), "status": job.get("status")}
             print(f"[Queue] {filename} -> Job {job.get('id')} ({project_name})")
             return True
         elif response.status_code == 409:
@@ -86,6 +126,7 @@ def queue_file(filename: str, force: bool = False) -> bool:
             data = response.json().get("detail", {})
             existing_id = data.get("existing_job_id", "?")
             existing_status = data.get("existing_status", "?")
+            _queued_cache[filename] = {"job_id": existing_id, "status": existing_status}
             print(f"[Skip] {filename} -> Already exists as Job {existing_id} ({existing_status})")
             return False
         else:
@@ -100,8 +141,8 @@ def run_once():
     """Queue all unprocessed files once."""
     print(f"[Watch] Scanning {TRANSCRIPTS_DIR} for unprocessed transcripts...")
 
-    queued = get_queued_files()
     files = get_transcript_files()
+    queued = get_queued_files(files)
 
     new_files = [f for f in files if f not in queued]
 
@@ -114,28 +155,187 @@ def run_once():
         queue_file(f)
 
 
-def watch_loop():
-    """Watch for new files continuously."""
-    print(f"[Watch] Watching {TRANSCRIPTS_DIR} for new transcripts...")
-    print("[Watch] Press Ctrl+C to stop")
+async def wait_until_stable(path: Path, interval: float = None, timeout: float = None) -> bool:
+    """Wait for a file to stop being written.
 
-    seen_files = get_queued_files() | set(get_transcript_files())
+    The file counts as complete once its size and mtime are unchanged
+    between two checks `interval` seconds apart and it isn't empty.
+
+    Args:
+        path: File to watch
+        interval: Seconds between checks (default STABLE_CHECK_INTERVAL)
+        timeout: Seconds before giving up (default STABLE_TIMEOUT)
+
+    Returns:
+        True if the file is complete, False if it vanished or kept changing
+    """
+    interval = STABLE_CHECK_INTERVAL if interval is None else interval
+    timeout = STABLE_TIMEOUT if timeout is None else timeout
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    last = None
 
     while True:
         try:
-            current_files = set(get_transcript_files())
-            new_files = current_files - seen_files
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if signature == last and stat.st_size > 0:
+            return True
+        if loop.time() >= deadline:
+            return False
+
+        last = signature
+        await asyncio.sleep(interval)
+
+
+async def queue_files_bulk(client: httpx.AsyncClient, filenames: list) -> int:
+    """Queue transcript files with one POST /api/queue/bulk request.
+
+    Args:
+        client: HTTP client to send the request with
+        filenames: Transcript filenames to queue
+
+    Returns:
+        Number of files queued
+    """
+    jobs = [{"project_name": project_name_for(f), "transcript_file": f} for f in filenames]
+    try:
+        response = await client.post(f"{API_BASE}/api/queue/bulk", json={"jobs": jobs}, timeout=30)
+    except Exception as e:
+        print(f"[Queue] Error queueing {len(filenames)} file(s): {e}")
+        return 0
+
+    if response.status_code != 200:
+        print(f"[Queue] Failed to queue {len(filenames)} file(s): {response.status_code}")
+        return 0
+
+    data = response.json()
+    for result in data.get("results", []):
+        filename = result.get("transcript_file")
+        existing = result.get("existing_job")
+        if result.get("queued"):
+            _queued_cache[filename] = {"job_id": result.get("job_id"), "status": "pending"}
+            print(f"[Queue] {filename} -> Job {result.get('job_id')} ({project_name_for(filename)})")
+        elif existing:
+            _queued_cache[filename] = existing
+            print(f"[Skip] {filename} -> Already exists as Job {existing.get('job_id')} ({existing.get('status')})")
+        else:
+            print(f"[Skip] {filename} -> {result.get('error')}")
+    return data.get("queued", 0)
+
+
+class TranscriptWatcher:
+    """Queues transcripts as they appear in TRANSCRIPTS_DIR.
+
+    File events are debounced into batches. Each batch waits for its files
+    to finish writing, then is submitted in one bulk request. Batches are
+    handled concurrently so a slow upload doesn't hold up other files.
+    """
+
+    def __init__(self, force_polling: bool = False):
+        """
+        Initialize watcher.
+
+        Args:
+            force_polling: Poll instead of using file notifications
+        """
+        self.force_polling = force_polling
+        self._settling: set = set()  # Files waiting to finish writing
+        self._tasks: set = set()
+
+    async def run(self, events=None) -> None:
+        """Watch until cancelled.
+
+        Args:
+            events: Async iterator of filename batches (defaults to watching TRANSCRIPTS_DIR)
+        """
+        events = events if events is not None else self.watch_events()
+        async with httpx.AsyncClient() as client:
+            try:
+                async for filenames in events:
+                    self.handle_files(client, filenames)
+                if self._tasks:
+                    await asyncio.gather(*self._tasks)
+            finally:
+                for task in self._tasks:
+                    task.cancel()
 
-            for f in new_files:
+    def handle_files(self, client: httpx.AsyncClient, filenames) -> None:
+        """Start settling and submitting files that aren't queued or already settling."""
+        new_files = sorted(f for f in filenames if f not in _queued_cache and f not in self._settling)
+        if not new_files:
+            return
+
+        self._settling.update(new_files)
+        task = asyncio.ensure_future(self._settle_and_submit(client, new_files))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _settle_and_submit(self, client: httpx.AsyncClient, filenames: list) -> None:
+        """Wait for files to finish writing, then queue them in one request."""
+        try:
+            for f in filenames:
                 print(f"[Watch] New file detected: {f}")
-                queue_file(f)
+            complete = await asyncio.gather(*(wait_until_stable(TRANSCRIPTS_DIR / f) for f in filenames))
+
+            ready = [f for f, ok in zip(filenames, complete) if ok]
+            for f, ok in zip(filenames, complete):
+                if not ok:
+                    print(f"[Watch] {f} is missing or still being written, skipping for now")
+            if ready:
+                await queue_files_bulk(client, ready)
+        finally:
+            self._settling.difference_update(filenames)
 
-            seen_files = seen_files | current_files
-            time.sleep(POLL_INTERVAL)
+    async def watch_events(self):
+        """Yield batches of transcript filenames that were added or modified."""
+        try:
+            from watchfiles import Change, awatch
+        except ImportError:
+            print("[Watch] watchfiles not installed, polling for changes")
+            async for filenames in self._poll_events():
+                yield filenames
+            return
+
+        directory = TRANSCRIPTS_DIR.resolve()
+        async for changes in awatch(
+            directory,
+            debounce=DEBOUNCE_MS,
+            recursive=False,
+            force_polling=self.force_polling or None,
+            poll_delay_ms=POLL_INTERVAL * 1000,
+        ):
+            filenames = {
+                Path(path).name
+                for change, path in changes
+                if change != Change.deleted and Path(path).parent == directory and is_transcript_file(Path(path).name)
+            }
+            if filenames:
+                yield filenames
+
+    async def _poll_events(self):
+        """Yield new transcript filenames by listing the folder every POLL_INTERVAL."""
+        seen = set(get_transcript_files())
+        while True:
+            await asyncio.sleep(POLL_INTERVAL)
+            current = set(get_transcript_files())
+            if current - seen:
+                yield current - seen
+            seen = current
 
-        except KeyboardInterrupt:
-            print("\n[Watch] Stopped.")
-            break
+
+def watch_loop(force_polling: bool = False):
+    """Watch for new files continuously."""
+    print(f"[Watch] Watching {TRANSCRIPTS_DIR} for new transcripts...")
+    print("[Watch] Press Ctrl+C to stop")
+
+    try:
+        asyncio.run(TranscriptWatcher(force_polling=force_polling).run())
+    except KeyboardInterrupt:
+        print("\n[Watch] Stopped.")
 
 
 def main():
@@ -146,7 +346,7 @@ def main():
         run_once()
         print()
         # Then watch for new ones
-        watch_loop()
+        watch_loop(force_polling="--poll" in sys.argv)
 
 
 if __name__ == "__main__":